@@ -25,6 +25,7 @@ export interface Paper {
 
 export interface PapersListResponse {
     total_count: number
+    next_cursor?: string | null
     items: Paper[]
 }
 
@@ -33,6 +34,56 @@ export interface UniversityListResponse {
     items: University[]
 }
 
+export interface LaboratoryNode {
+    id: string
+    name?: string
+    name_ko?: string
+    research_areas?: string[]
+    member_count?: number
+    paper_count?: number
+}
+
+export interface ProfessorNode {
+    id: string
+    name?: string
+    name_ko?: string
+    title?: string
+    email?: string
+    h_index?: number
+    publications_count?: number
+    research_interests?: string[]
+    lab_count?: number
+    research_preview?: {
+        topic_easy: string
+        explanation_preview: string
+    }
+    laboratories?: LaboratoryNode[]
+}
+
+export interface DepartmentNode {
+    id: string
+    name?: string
+    name_ko?: string
+    faculty_count?: number
+    website?: string
+    professor_count?: number
+    professors?: ProfessorNode[]
+}
+
+export interface CollegeNode {
+    id: string
+    name?: string
+    name_ko?: string
+    department_count?: number
+    departments?: DepartmentNode[]
+}
+
+export interface UniversityTree extends Partial<University> {
+    id: string
+    college_count?: number
+    colleges?: CollegeNode[]
+}
+
 export interface CrawlResponse {
     status: string
     university_id: string
@@ -57,6 +108,20 @@ export const universityService = {
         return response.data
     },
 
+    /**
+     * Get the whole university hierarchy (colleges down to labs) in one request.
+     * depth limits the levels (0-4), fields limits the properties kept on each node.
+     */
+    getUniversityTree: async (id: string, depth?: number, fields?: string[]): Promise<UniversityTree> => {
+        const response = await apiClient.get(`/universities/${id}/tree`, {
+            params: {
+                depth,
+                fields: fields?.length ? fields.join(',') : undefined
+            }
+        })
+        return response.data
+    },
+
     /**
      * Get papers for a university
      */
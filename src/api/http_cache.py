@@ -0,0 +1,139 @@
+"""
+HTTP response caching for read routes.
+
+Provides:
+- cached_response(): serves a GET route's JSON body from the response
+  cache, keyed by route name plus validated parameters
+- Strong ETags on every cached response; If-None-Match answers 304
+- Bodies rendered with src.api.serialization.dumps (orjson when
+  installed), which embeds cached fragments without re-encoding them
+- Entity tags collected from the response body (the entity itself, the
+  parents it references and the children it lists), so writers can
+  invalidate by entity id when they commit
+"""
+
+import functools
+import inspect
+from typing import Optional, Set
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from src.api.serialization import Fragment, dumps
+from src.services.response_cache import entity_tag, get_response_cache
+
+# Keys holding lists/objects of another entity kind
+CHILD_KINDS = {
+    "universities": "university",
+    "colleges": "college",
+    "departments": "department",
+    "department": "department",
+    "professors": "professor",
+    "laboratories": "laboratory",
+    "papers": "paper",
+}
+
+# Reference fields -> kind of the referenced entity
+REFERENCE_KINDS = {
+    "university_id": "university",
+    "college_id": "college",
+    "department_id": "department",
+    "professor_id": "professor",
+    "lab_id": "laboratory",
+    "paper_id": "paper",
+    "report_id": "report",
+    "user_id": "user",
+}
+
+# Responses must be revalidated, which costs a 304 while nothing changed
+CACHE_CONTROL = "no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header covers the given (quoted) ETag"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def response_tags(kind: str, body) -> Set[str]:
+    """
+    Entity tags for a response body.
+
+    The top-level object (or each item of a list response) is of `kind`;
+    nested lists are typed by their key (CHILD_KINDS) and reference fields
+    such as college_id by REFERENCE_KINDS.
+    """
+    tags = set()
+
+    def walk(value, value_kind):
+        if isinstance(value, Fragment):
+            walk(value.value, value_kind)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item, value_kind)
+        elif isinstance(value, dict):
+            if value_kind and value.get("id") is not None:
+                tags.add(entity_tag(value_kind, value["id"]))
+            for key, child in value.items():
+                if key in REFERENCE_KINDS and isinstance(child, (str, int)):
+                    tags.add(entity_tag(REFERENCE_KINDS[key], child))
+                elif isinstance(child, (dict, list, Fragment)):
+                    walk(child, kind if key == "items" else CHILD_KINDS.get(key))
+
+    walk(body, kind)
+    return tags
+
+
+def cached_response(kind: str, *collections: str):
+    """
+    Serve a read route from the response cache.
+
+    The wrapped endpoint's result is rendered once, tagged with the
+    entities it contains (plus `collections`, e.g. "papers" for listings
+    that change when any paper is added) and reused until one of those
+    tags is invalidated or the cache TTL passes. Errors are not cached.
+
+    Usage in routes (outside async_session_route):
+        @router.get("/professors/{prof_id}")
+        @cached_response("professor", "analyses")
+        @async_session_route
+        def get_professor(prof_id: str, db: Session = Depends(get_db)):
+            ...
+
+    Args:
+        kind: Entity kind of the response (or of the items of a list response)
+        collections: Collection tags the response also depends on
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        parameters = [*signature.parameters.values(),
+                      inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)]
+
+        @functools.wraps(func)
+        async def endpoint(*args, request: Request, **kwargs):
+            cache = get_response_cache()
+            key = cache.make_key(func.__name__, {name: value for name, value in kwargs.items() if name != "db"})
+
+            entry = cache.get(key)
+            if entry is None:
+                # Recorded before reading, so writes committed meanwhile invalidate this entry
+                epoch = cache.epoch()
+                result = func(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                if isinstance(result, Response):
+                    return result
+                body = dumps(result)
+                entry = cache.put(key, body, response_tags(kind, result) | set(collections), epoch)
+
+            headers = {"ETag": f'"{entry.etag}"', "Cache-Control": CACHE_CONTROL}
+            if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            return Response(content=entry.body, media_type="application/json", headers=headers)
+
+        endpoint.__signature__ = signature.replace(parameters=parameters)
+        return endpoint
+
+    return decorator
@@ -6,8 +6,13 @@ Main server configuration and route registration.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from src.core.database import init_db
+from src.core.middleware import request_metrics_middleware
 from src.api import routes
+from src.api.serialization import FastJSONResponse
+from src.services.response_cache import RESPONSE_CACHE_TTL, get_response_cache
+from src.services.metrics import CONTENT_TYPE, get_metrics_registry
 
 
 def create_app() -> FastAPI:
@@ -20,7 +25,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Univ-Insight API",
         description="AI-powered university research curation and career design agent",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=FastJSONResponse
     )
 
     # Initialize database on startup
@@ -29,6 +35,11 @@ def create_app() -> FastAPI:
         print("[FastAPI] Initializing database...")
         init_db()
         print("[FastAPI] Database initialized")
+        if get_response_cache().store is None:
+            print(
+                "[FastAPI] WARNING: RESPONSE_CACHE_STORE is off; writes from ingest/analysis processes "
+                f"reach cached responses only after the {RESPONSE_CACHE_TTL:.0f}s TTL"
+            )
 
     # Add CORS middleware
     app.add_middleware(
@@ -39,12 +50,21 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Per-route latency, response size and SQL statement metrics
+    app.middleware("http")(request_metrics_middleware)
+
     # Health check endpoint
     @app.get("/health")
     def health_check():
         """Health check endpoint"""
         return {"status": "ok"}
 
+    # Prometheus metrics endpoint
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def metrics():
+        """Prometheus text exposition of the process metrics registry"""
+        return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
     # Include routers
     app.include_router(routes.router, prefix="/api/v1")
 
@@ -0,0 +1,123 @@
+"""
+Keyset pagination and cached counts for list endpoints.
+
+Provides:
+- Opaque cursors over (crawled_at, id), so every page is an index range
+  scan instead of OFFSET skipping
+- A short-lived count cache, so list calls do not run an exact COUNT(*)
+  over the filtered table on every request
+"""
+
+import base64
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+from src.domain.models import ResearchPaper
+
+# Cached total_count lifetime (seconds)
+COUNT_CACHE_TTL = 60.0
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+
+def encode_cursor(crawled_at: datetime, paper_id: str) -> str:
+    """Cursor pointing just after the given row."""
+    payload = json.dumps([crawled_at.isoformat(), paper_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Parse a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        crawled_at, paper_id = json.loads(payload)
+        return datetime.fromisoformat(crawled_at), str(paper_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def paginate_papers(query: Query, limit: int, cursor: Optional[str] = None,
+                    offset: int = 0) -> Tuple[List[ResearchPaper], Optional[str]]:
+    """
+    Fetch one page of papers, newest first.
+
+    With a cursor the page starts after the cursor row using a row-value
+    comparison on (crawled_at, id), served by ix_research_papers_crawled_at_id.
+    Without one, offset is applied as before (for backward compatibility).
+
+    Args:
+        query: Query over ResearchPaper (filters applied, no ordering)
+        limit: Page size
+        cursor: Cursor from a previous page's next_cursor
+        offset: Legacy offset (ignored when cursor is given)
+
+    Returns:
+        (papers, next_cursor); next_cursor is None on the last page
+    """
+    query = query.order_by(ResearchPaper.crawled_at.desc(), ResearchPaper.id.desc())
+    if cursor:
+        query = query.filter(tuple_(ResearchPaper.crawled_at, ResearchPaper.id) < tuple_(*decode_cursor(cursor)))
+    elif offset:
+        query = query.offset(offset)
+
+    # One extra row tells us whether another page exists without counting
+    rows = query.limit(limit + 1).all()
+    papers = rows[:limit]
+    next_cursor = encode_cursor(papers[-1].crawled_at, papers[-1].id) if len(rows) > limit else None
+    return papers, next_cursor
+
+
+class CountCache:
+    """Time-bounded cache of COUNT(*) results keyed by endpoint and filters."""
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL, max_entries: int = COUNT_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            ttl: Seconds a count stays valid
+            max_entries: Entries kept before the oldest are evicted
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_count(self, key: Hashable, query: Query, exact: bool = False) -> int:
+        """
+        Return a cached count, running the query on a miss or when exact is requested.
+
+        Args:
+            key: Cache key (endpoint plus filter values)
+            query: Count source (ordering and paging are stripped)
+            exact: Bypass the cache and refresh it
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and not exact and now - entry[0] < self.ttl:
+            return entry[1]
+
+        count = query.order_by(None).count()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                for stale in sorted(self._entries, key=lambda k: self._entries[k][0])[:self.max_entries // 4]:
+                    del self._entries[stale]
+            self._entries[key] = (now, count)
+        return count
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache()
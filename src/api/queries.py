@@ -0,0 +1,191 @@
+"""
+Query layer for the hierarchy and report endpoints.
+
+Each loader fetches exactly what its endpoint serializes, with explicit
+loader strategies, so a request costs a fixed number of SQL statements
+regardless of how many children the entity has:
+- joinedload for many-to-one parents (one row each)
+- selectinload for collections (one IN (...) query per level)
+- GROUP BY counts instead of loading a collection just to take len()
+- PaperAnalysis fetched in one batch by paper_id IN (...)
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from src.domain.models import (
+    University, College, Department, Professor, Laboratory,
+    ResearchPaper, PaperAnalysis, Report, ReportPaper, ReportProfessor
+)
+
+# Papers are only needed for ids/titles/counts on hierarchy pages;
+# skip abstract and full_text
+_PAPER_SUMMARY = (ResearchPaper.id, ResearchPaper.lab_id, ResearchPaper.title)
+
+
+def count_by(db: Session, column, keys: Iterable[str]) -> Dict[str, int]:
+    """
+    Count rows per foreign key value in one GROUP BY query.
+
+    Args:
+        db: Database session
+        column: Foreign key column to group on (e.g. Department.college_id)
+        keys: Parent ids to count children for
+
+    Returns:
+        Mapping of parent id to child count (missing ids have no children)
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    rows = db.query(column, func.count()).filter(column.in_(keys)).group_by(column).all()
+    return {key: count for key, count in rows}
+
+
+def load_analyses(db: Session, paper_ids: Iterable[str]) -> Dict[str, PaperAnalysis]:
+    """
+    Fetch analyses for several papers in one query.
+
+    Args:
+        db: Database session
+        paper_ids: ResearchPaper ids
+
+    Returns:
+        Mapping of paper id to its PaperAnalysis
+    """
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if not paper_ids:
+        return {}
+    analyses = db.query(PaperAnalysis).filter(PaperAnalysis.paper_id.in_(paper_ids)).all()
+    return {analysis.paper_id: analysis for analysis in analyses}
+
+
+def list_universities(db: Session) -> List[University]:
+    """All universities ordered by ranking."""
+    return db.query(University).order_by(University.ranking).all()
+
+
+def load_university(db: Session, uni_id: str) -> Optional[University]:
+    """University with its colleges."""
+    return (
+        db.query(University)
+        .options(selectinload(University.colleges))
+        .filter(University.id == uni_id)
+        .first()
+    )
+
+
+def load_college(db: Session, college_id: str) -> Optional[College]:
+    """College with its university and departments."""
+    return (
+        db.query(College)
+        .options(joinedload(College.university), selectinload(College.departments))
+        .filter(College.id == college_id)
+        .first()
+    )
+
+
+def load_department(db: Session, dept_id: str) -> Optional[Department]:
+    """Department with college, university and professors → labs → paper summaries."""
+    return (
+        db.query(Department)
+        .options(
+            joinedload(Department.college).joinedload(College.university),
+            selectinload(Department.professors)
+            .selectinload(Professor.laboratories)
+            .selectinload(Laboratory.papers)
+            .load_only(*_PAPER_SUMMARY),
+        )
+        .filter(Department.id == dept_id)
+        .first()
+    )
+
+
+def load_professor(db: Session, prof_id: str) -> Optional[Professor]:
+    """Professor with department and labs → paper summaries."""
+    return (
+        db.query(Professor)
+        .options(
+            joinedload(Professor.department),
+            selectinload(Professor.laboratories)
+            .selectinload(Laboratory.papers)
+            .load_only(*_PAPER_SUMMARY),
+        )
+        .filter(Professor.id == prof_id)
+        .first()
+    )
+
+
+def load_laboratory(db: Session, lab_id: str) -> Optional[Laboratory]:
+    """Laboratory with professor, department, members and papers."""
+    return (
+        db.query(Laboratory)
+        .options(
+            joinedload(Laboratory.professor),
+            joinedload(Laboratory.department),
+            selectinload(Laboratory.members),
+            selectinload(Laboratory.papers),
+        )
+        .filter(Laboratory.id == lab_id)
+        .first()
+    )
+
+
+def load_report(db: Session, report_id: str) -> Optional[Report]:
+    """Report with its papers and professors."""
+    return (
+        db.query(Report)
+        .options(
+            selectinload(Report.papers).joinedload(ReportPaper.paper),
+            selectinload(Report.professors).joinedload(ReportProfessor.professor),
+        )
+        .filter(Report.id == report_id)
+        .first()
+    )
+
+
+def load_report_professors(db: Session, prof_ids: List[str]) -> List[Professor]:
+    """Professors with department → college → university and labs → papers."""
+    if not prof_ids:
+        return []
+    return (
+        db.query(Professor)
+        .options(
+            joinedload(Professor.department).joinedload(Department.college).joinedload(College.university),
+            selectinload(Professor.laboratories).selectinload(Laboratory.papers),
+        )
+        .filter(Professor.id.in_(prof_ids))
+        .all()
+    )
+
+
+def _with_university_path():
+    return joinedload(Laboratory.department).joinedload(Department.college).joinedload(College.university)
+
+
+def load_laboratory_with_university(db: Session, lab_id: str) -> Optional[Laboratory]:
+    """Laboratory with department → college → university."""
+    return (
+        db.query(Laboratory)
+        .options(_with_university_path())
+        .filter(Laboratory.id == lab_id)
+        .first()
+    )
+
+
+def find_plan_b_labs(db: Session, laboratory: Laboratory, limit: int = 5) -> List[Laboratory]:
+    """Labs at other universities, with professor and university path loaded."""
+    return (
+        db.query(Laboratory)
+        .options(_with_university_path(), joinedload(Laboratory.professor))
+        .filter(
+            Laboratory.id != laboratory.id,
+            Laboratory.department.has(
+                Department.college.has(College.university_id != laboratory.department.college.university_id)
+            ),
+        )
+        .limit(limit)
+        .all()
+    )
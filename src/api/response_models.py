@@ -0,0 +1,132 @@
+"""
+Response models for the hot read routes.
+
+These document the response shapes in the OpenAPI schema and are
+attached with `responses=` rather than `response_model=`: the routes
+return pre-rendered bodies through cached_response, so FastAPI never
+validates or re-serializes them against these models.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+# ==================== Papers ====================
+
+class PaperSummary(BaseModel):
+    id: str
+    title: str
+    authors: List[str] = []
+    lab_id: Optional[str] = None
+    publication_year: Optional[int] = None
+    venue: Optional[str] = None
+    citation_count: int = 0
+    keywords: List[str] = []
+
+
+class PaperPage(BaseModel):
+    total_count: int
+    next_cursor: Optional[str] = None
+    items: List[PaperSummary]
+
+
+class CrawledPaperSummary(BaseModel):
+    id: str
+    title: str
+    url: Optional[str] = None
+    abstract: Optional[str] = None
+    crawled_at: Optional[str] = None
+    keywords: List[str] = []
+
+
+class CrawledPaperPage(BaseModel):
+    total_count: int
+    next_cursor: Optional[str] = None
+    items: List[CrawledPaperSummary]
+
+
+class AnalysisDetail(BaseModel):
+    easy_summary: str
+    technical_summary: Optional[str] = None
+    core_technologies: List[Any] = []
+    required_skills: List[Any] = []
+    math_concepts: List[Any] = []
+    application_fields: List[Any] = []
+    industry_relevance: Optional[str] = None
+    career_paths: List[Any] = []
+    recommended_companies: List[Any] = []
+    job_roles: List[Any] = []
+    recommended_subjects: List[Any] = []
+    action_items: Dict[str, Any] = {}
+    learning_path: List[Any] = []
+    limitations: Optional[str] = None
+    challenges: List[Any] = []
+
+
+class PaperAnalysisResponse(BaseModel):
+    paper_id: str
+    title: str
+    authors: List[str] = []
+    analysis: AnalysisDetail
+
+
+# ==================== Department Research ====================
+
+class DepartmentRef(BaseModel):
+    id: str
+    name: str
+    name_ko: str
+    website: Optional[str] = None
+
+
+class ProfessorSummary(BaseModel):
+    id: str
+    name: str
+    name_ko: str
+    email: Optional[str] = None
+    profile_url: Optional[str] = None
+    research_interests: List[str] = []
+
+
+class LaboratorySummary(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    professor_name: Optional[str] = None
+
+
+class DepartmentResearchResponse(BaseModel):
+    department: DepartmentRef
+    professors: List[ProfessorSummary]
+    laboratories: List[LaboratorySummary]
+
+
+# ==================== Reports ====================
+
+class ReportPaperItem(BaseModel):
+    paper_id: str
+    title: str
+    authors: List[str] = []
+    publication_year: Optional[int] = None
+    venue: Optional[str] = None
+    order: Optional[int] = None
+
+
+class ReportProfessorItem(BaseModel):
+    professor_id: str
+    name: str
+    name_ko: str
+    relevance_score: Optional[float] = None
+    reason: Optional[str] = None
+
+
+class ReportResponse(BaseModel):
+    id: str
+    user_id: str
+    status: str
+    sent_at: str
+    content: Optional[str] = None
+    report_type: Optional[str] = None
+    papers: List[ReportPaperItem]
+    professors: List[ReportProfessorItem]
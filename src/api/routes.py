@@ -8,22 +8,37 @@ Implements endpoints for:
 - Plan B suggestions
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response
 from src.services.pdf_generator import PDFGenerator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import List, Optional
+import asyncio
 import uuid
 import ollama
 
-from src.core.database import get_db
+from src.core.database import async_session_route, get_async_db, get_db
+from src.core.search import apply_topic_search
+from src.api import queries
+from src.api.http_cache import cached_response, etag_matches
+from src.api.pagination import count_cache, paginate_papers
+from src.api.response_models import (
+    CrawledPaperPage, DepartmentResearchResponse, PaperAnalysisResponse, PaperPage, ReportResponse
+)
+from src.api.serialization import fragment_cache
 from src.domain.models import (
     University, College, Department, Professor, Laboratory, LabMember,
     ResearchPaper, PaperAnalysis, User, Report, UserRole, ReportStatus, ReportPaper, ReportProfessor
 )
 from src.services.recommendation import RecommendationService
 from src.services.vector_store import VectorStore
+from src.services.tracing import span, traced
+from src.services.interest_index import match_professors
+from src.services.hierarchy_snapshot import (
+    MAX_DEPTH, get_snapshot_etag, get_tree_renderer, parse_fields, variant_etag
+)
 
 router = APIRouter()
 
@@ -35,6 +50,8 @@ recommendation_service = RecommendationService(vector_store)
 # ==================== Hierarchical Navigation ====================
 
 @router.get("/universities")
+@cached_response("university", "universities")
+@async_session_route
 def list_universities(
     db: Session = Depends(get_db)
 ):
@@ -43,7 +60,8 @@ def list_universities(
 
     Returns list of universities with basic information.
     """
-    universities = db.query(University).order_by(University.ranking).all()
+    universities = queries.list_universities(db)
+    college_counts = queries.count_by(db, College.university_id, [u.id for u in universities])
 
     return {
         "total_count": len(universities),
@@ -56,7 +74,7 @@ def list_universities(
                 "ranking": u.ranking,
                 "tier": u.tier.name,
                 "established_year": u.established_year,
-                "college_count": len(u.colleges)
+                "college_count": college_counts.get(u.id, 0)
             }
             for u in universities
         ]
@@ -64,16 +82,20 @@ def list_universities(
 
 
 @router.get("/universities/{uni_id}")
+@cached_response("university")
+@async_session_route
 def get_university(
     uni_id: str,
     db: Session = Depends(get_db)
 ):
     """Get detailed university information"""
-    university = db.query(University).filter(University.id == uni_id).first()
+    university = queries.load_university(db, uni_id)
 
     if not university:
         raise HTTPException(status_code=404, detail="University not found")
 
+    department_counts = queries.count_by(db, Department.college_id, [c.id for c in university.colleges])
+
     return {
         "id": university.id,
         "name": university.name,
@@ -89,24 +111,65 @@ def get_university(
                 "id": c.id,
                 "name": c.name,
                 "name_ko": c.name_ko,
-                "department_count": len(c.departments)
+                "department_count": department_counts.get(c.id, 0)
             }
             for c in university.colleges
         ]
     }
 
 
+@router.get("/universities/{uni_id}/tree")
+@async_session_route
+def get_university_tree(
+    uni_id: str,
+    request: Request,
+    depth: int = Query(MAX_DEPTH, ge=0, le=MAX_DEPTH),
+    fields: Optional[str] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a university's whole College → Department → Professor → Lab tree in one response.
+
+    Served from a precomputed snapshot with counts and research previews
+    included; writes to the tree's rows mark it stale and the next request
+    rebuilds it. Send If-None-Match to get 304
+    while the snapshot is unchanged.
+
+    Args:
+        depth: Levels to include below the university (0-4; 4 = down to laboratories)
+        fields: Comma-separated node fields to keep (id and child lists are always kept)
+    """
+    etag = get_snapshot_etag(db, uni_id)
+    if etag is None:
+        raise HTTPException(status_code=404, detail="University not found")
+
+    field_set = parse_fields(fields)
+    headers = {
+        "ETag": f'"{variant_etag(etag, depth, field_set)}"',
+        "Cache-Control": "public, max-age=60"
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    body = get_tree_renderer().render(db, uni_id, etag, depth, field_set)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/colleges/{college_id}")
+@cached_response("college")
+@async_session_route
 def get_college(
     college_id: str,
     db: Session = Depends(get_db)
 ):
     """Get college and its departments"""
-    college = db.query(College).filter(College.id == college_id).first()
+    college = queries.load_college(db, college_id)
 
     if not college:
         raise HTTPException(status_code=404, detail="College not found")
 
+    professor_counts = queries.count_by(db, Professor.department_id, [d.id for d in college.departments])
+
     return {
         "id": college.id,
         "name": college.name,
@@ -121,7 +184,7 @@ def get_college(
                 "name": d.name,
                 "name_ko": d.name_ko,
                 "faculty_count": d.faculty_count,
-                "professor_count": len(d.professors)
+                "professor_count": professor_counts.get(d.id, 0)
             }
             for d in college.departments
         ]
@@ -129,16 +192,20 @@ def get_college(
 
 
 @router.get("/departments/{dept_id}")
+@cached_response("department", "analyses")
+@async_session_route
 def get_department(
     dept_id: str,
     db: Session = Depends(get_db)
 ):
     """Get department and its professors"""
-    department = db.query(Department).filter(Department.id == dept_id).first()
+    department = queries.load_department(db, dept_id)
 
     if not department:
         raise HTTPException(status_code=404, detail="Department not found")
 
+    analyses = queries.load_analyses(db, _preview_paper_ids(department.professors))
+
     return {
         "id": department.id,
         "name": department.name,
@@ -160,19 +227,27 @@ def get_department(
                 "h_index": p.h_index,
                 "publications_count": p.publications_count,
                 "lab_count": len(p.laboratories),
-                "research_preview": _get_research_preview(p, db)  # NEW: Easy preview
+                "research_preview": _get_research_preview(p, db, analyses)  # NEW: Easy preview
             }
             for p in department.professors
         ]
     }
 
 
-def _get_research_preview(professor: Professor, db: Session) -> dict:
+def _preview_paper_ids(professors: List[Professor]) -> List[str]:
+    """Ids of the papers _get_research_preview looks at (first paper per lab)"""
+    return [lab.papers[0].id for p in professors for lab in p.laboratories if lab.papers]
+
+
+def _get_research_preview(professor: Professor, db: Session, analyses: Optional[dict] = None) -> dict:
     """Get a preview of professor's research in easy-to-understand language"""
+    if analyses is None:
+        analyses = queries.load_analyses(db, _preview_paper_ids([professor]))
+
     # Find the first analyzed paper
     for lab in professor.laboratories:
         for paper in lab.papers[:1]:  # Just the first paper
-            analysis = db.query(PaperAnalysis).filter(PaperAnalysis.paper_id == paper.id).first()
+            analysis = analyses.get(paper.id)
             if analysis and analysis.topic_easy:
                 return {
                     "topic_easy": analysis.topic_easy,
@@ -193,23 +268,28 @@ def _get_research_preview(professor: Professor, db: Session) -> dict:
 
 
 @router.get("/professors/{prof_id}")
+@cached_response("professor", "analyses")
+@async_session_route
 def get_professor(
     prof_id: str,
     db: Session = Depends(get_db)
 ):
     """Get professor and their laboratories with easy-to-understand research explanations"""
-    professor = db.query(Professor).filter(Professor.id == prof_id).first()
+    professor = queries.load_professor(db, prof_id)
 
     if not professor:
         raise HTTPException(status_code=404, detail="Professor not found")
 
-    # Get research analysis for this professor's papers
+    # Get research analysis for this professor's papers (top 3 papers per lab, one query)
     research_explanations = []
-    
+    analyses = queries.load_analyses(
+        db, [paper.id for lab in professor.laboratories for paper in lab.papers[:3]]
+    )
+
     for lab in professor.laboratories:
         for paper in lab.papers[:3]:  # Top 3 papers per lab
             # Check if we have analysis
-            analysis = db.query(PaperAnalysis).filter(PaperAnalysis.paper_id == paper.id).first()
+            analysis = analyses.get(paper.id)
             
             if analysis and analysis.topic_easy:
                 research_explanations.append({
@@ -253,12 +333,14 @@ def get_professor(
 
 
 @router.get("/laboratories/{lab_id}")
+@cached_response("laboratory")
+@async_session_route
 def get_laboratory(
     lab_id: str,
     db: Session = Depends(get_db)
 ):
     """Get laboratory details with members and papers"""
-    laboratory = db.query(Laboratory).filter(Laboratory.id == lab_id).first()
+    laboratory = queries.load_laboratory(db, lab_id)
 
     if not laboratory:
         raise HTTPException(status_code=404, detail="Laboratory not found")
@@ -355,6 +437,7 @@ def create_or_update_user(
 
 
 @router.get("/users/{user_id}")
+@async_session_route
 def get_user_profile(
     user_id: str,
     db: Session = Depends(get_db)
@@ -376,12 +459,30 @@ def get_user_profile(
 
 # ==================== Research Data ====================
 
-@router.get("/papers")
+def _paper_summary(paper: ResearchPaper):
+    """Encoded list item for a paper (reused until the paper's updated_at changes)"""
+    return fragment_cache.encode("paper_summary", paper.id, paper.updated_at, lambda: {
+        "id": paper.id,
+        "title": paper.title,
+        "authors": paper.authors,
+        "lab_id": paper.lab_id,
+        "publication_year": paper.publication_year,
+        "venue": paper.venue,
+        "citation_count": paper.citation_count,
+        "keywords": paper.keywords
+    })
+
+
+@router.get("/papers", responses={200: {"model": PaperPage}})
+@cached_response("paper", "papers")
+@async_session_route
 def list_research_papers(
     lab_id: Optional[str] = Query(None),
     topic: Optional[str] = Query(None),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    exact_count: bool = Query(False),
     db: Session = Depends(get_db)
 ):
     """
@@ -389,10 +490,15 @@ def list_research_papers(
 
     Args:
         lab_id: Filter by laboratory ID
-        topic: Filter by topic (searches in title and keywords)
+        topic: Full-text topic search (title, abstract, keywords, analysis); best matches first
         limit: Number of results to return
-        offset: Pagination offset
+        offset: Pagination offset (legacy; prefer cursor)
+        cursor: next_cursor from the previous page (newest-first listing only, not with topic)
+        exact_count: Recount instead of using the cached total_count
     """
+    if cursor and topic:
+        raise HTTPException(status_code=400, detail="cursor pagination is not available for topic search; use offset")
+
     query = db.query(ResearchPaper)
 
     # Apply filters
@@ -400,36 +506,24 @@ def list_research_papers(
         query = query.filter(ResearchPaper.lab_id == lab_id)
 
     if topic:
-        query = query.filter(
-            (ResearchPaper.title.ilike(f"%{topic}%")) |
-            (ResearchPaper.abstract.ilike(f"%{topic}%"))
-        )
+        query = apply_topic_search(query, db, topic)
 
-    # Get total count
-    total_count = query.count()
+    # Cached count (refreshed at most every COUNT_CACHE_TTL seconds unless exact_count)
+    total_count = count_cache.get_count(("papers", lab_id, topic), query, exact=exact_count)
 
     # Apply pagination
-    papers = query.order_by(ResearchPaper.crawled_at.desc()).offset(offset).limit(limit).all()
+    papers, next_cursor = paginate_papers(query, limit, cursor=cursor, offset=offset)
 
     return {
         "total_count": total_count,
-        "items": [
-            {
-                "id": p.id,
-                "title": p.title,
-                "authors": p.authors,
-                "lab_id": p.lab_id,
-                "publication_year": p.publication_year,
-                "venue": p.venue,
-                "citation_count": p.citation_count,
-                "keywords": p.keywords
-            }
-            for p in papers
-        ]
+        "next_cursor": None if topic else next_cursor,
+        "items": [_paper_summary(p) for p in papers]
     }
 
 
 @router.get("/papers/{paper_id}")
+@cached_response("paper")
+@async_session_route
 def get_research_paper(
     paper_id: str,
     db: Session = Depends(get_db)
@@ -457,15 +551,22 @@ def get_research_paper(
     }
 
 
-@router.get("/universities/{uni_id}/papers")
+@router.get("/universities/{uni_id}/papers", responses={200: {"model": CrawledPaperPage}})
+@cached_response("paper", "papers")
+@async_session_route
 def get_university_papers(
     uni_id: str,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    exact_count: bool = Query(False),
     db: Session = Depends(get_db)
 ):
     """
     Get papers crawled for a specific university.
+
+    Pass next_cursor back as cursor for constant-cost paging; total_count
+    is cached unless exact_count is set.
     
     Note: Currently papers are not directly linked to universities,
     so we return all recently crawled papers as a demo.
@@ -473,28 +574,31 @@ def get_university_papers(
     """
     # For now, return all papers ordered by crawl date
     # TODO: Filter by university when schema is updated
-    query = db.query(ResearchPaper).order_by(ResearchPaper.crawled_at.desc())
+    query = db.query(ResearchPaper)
     
-    total_count = query.count()
-    papers = query.offset(offset).limit(limit).all()
+    total_count = count_cache.get_count(("university_papers",), query, exact=exact_count)
+    papers, next_cursor = paginate_papers(query, limit, cursor=cursor, offset=offset)
     
     return {
         "total_count": total_count,
+        "next_cursor": next_cursor,
         "items": [
-            {
+            fragment_cache.encode("crawled_paper_summary", p.id, p.updated_at, lambda p=p: {
                 "id": p.id,
                 "title": p.title,
                 "url": p.url,
                 "abstract": p.abstract[:200] if p.abstract else None,
                 "crawled_at": p.crawled_at.isoformat() if p.crawled_at else None,
                 "keywords": p.keywords
-            }
+            })
             for p in papers
         ]
     }
 
 
-@router.get("/departments/{dept_id}/research")
+@router.get("/departments/{dept_id}/research", responses={200: {"model": DepartmentResearchResponse}})
+@cached_response("department")
+@async_session_route
 def get_department_research(
     dept_id: str,
     db: Session = Depends(get_db)
@@ -543,7 +647,9 @@ def get_department_research(
 
 
 
-@router.get("/papers/{paper_id}/analysis")
+@router.get("/papers/{paper_id}/analysis", responses={200: {"model": PaperAnalysisResponse}})
+@cached_response("paper")
+@async_session_route
 def get_paper_analysis(
     paper_id: str,
     db: Session = Depends(get_db)
@@ -565,7 +671,8 @@ def get_paper_analysis(
         "paper_id": paper.id,
         "title": paper.title,
         "authors": paper.authors,
-        "analysis": {
+        # Analyses are written once per paper; reanalysis creates a new row
+        "analysis": fragment_cache.encode("analysis", analysis.id, analysis.analyzed_at, lambda: {
             "easy_summary": analysis.easy_summary,
             "technical_summary": analysis.technical_summary,
             "core_technologies": analysis.core_technologies,
@@ -581,19 +688,12 @@ def get_paper_analysis(
             "learning_path": analysis.learning_path,
             "limitations": analysis.limitations,
             "challenges": analysis.challenges
-        }
+        })
     }
 
 
-@router.post("/users/{user_id}/reports")
-def create_report(
-    user_id: str,
-    db: Session = Depends(get_db)
-):
-    """
-    Generate personalized report for a user based on interests.
-    Recommends professors and labs, and generates a summary using LLM.
-    """
+def _select_report_professors(db: Session, user_id: str):
+    """Load the user, pick matching professors and the paper to analyze for each"""
     # Get user
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -605,48 +705,18 @@ def create_report(
             detail="User has no interests set"
         )
 
-    # 1. Find Professors matching interests
-    all_profs = db.query(Professor).all()
-    matched_profs = []
-    
-    for prof in all_profs:
-        score = 0
-        prof_interests = prof.research_interests or []
-        if isinstance(prof_interests, str):
-            prof_interests = [prof_interests]
-            
-        for user_interest in user.interests:
-            for prof_interest in prof_interests:
-                if user_interest.lower() in str(prof_interest).lower():
-                    score += 1
-        
-        if score > 0:
-            matched_profs.append((prof, score))
-    
-    # Sort by score
-    matched_profs.sort(key=lambda x: x[1], reverse=True)
-    top_profs = matched_profs[:5]
+    # 1. Find Professors matching interests (top-k lookup on the keyword index)
+    matched = match_professors(db, user.interests, limit=5)
+    profs_by_id = {p.id: p for p in queries.load_report_professors(db, [pid for pid, _ in matched])}
+    top_profs = [(profs_by_id[pid], score) for pid, score in matched if pid in profs_by_id]
     
     if not top_profs:
         # Fallback: Just pick some professors if no match found (for demo)
-        top_profs = [(p, 0) for p in all_profs[:3]]
+        top_profs = [(p, 0) for p in db.query(Professor).limit(3).all()]
 
-    # 2. Generate Report Content with LLM (Progressive Disclosure)
-    from src.services.llm import OllamaLLM, MockLLM
     from src.domain.schemas import ResearchPaper as SchemaResearchPaper
-    
-    analysis_results = []
-    report_content = "" # Fallback content
-
-    try:
-        llm = OllamaLLM(model='qwen2.5:14b') # Use high quality model
-        # Check if we can connect, else fallback
-        # In production, we might want a better check or dependency injection
-    except:
-        llm = MockLLM()
-
-    print(f"Generating report for {len(top_profs)} professors...")
 
+    targets = []
     for prof, score in top_profs:
         try:
             # Try to find a real paper
@@ -681,6 +751,32 @@ def create_report(
                     content_raw=f"Research interests include: {interests_str}. {prof.bio or ''}"
                 )
 
+            targets.append((prof, target_paper))
+
+        except Exception as e:
+            print(f"Error processing professor {prof.name}: {e}")
+            continue
+
+    return user, top_profs, targets
+
+
+def _analyze_targets(targets) -> List[dict]:
+    """Run the LLM analysis for each (professor, paper); blocking, call from a worker thread"""
+    from src.services.llm import OllamaLLM, MockLLM
+
+    analysis_results = []
+
+    try:
+        llm = OllamaLLM(model='qwen2.5:14b') # Use high quality model
+        # Check if we can connect, else fallback
+        # In production, we might want a better check or dependency injection
+    except:
+        llm = MockLLM()
+
+    print(f"Generating report for {len(targets)} professors...")
+
+    for prof, target_paper in targets:
+        try:
             # Analyze
             print(f"Analyzing for {prof.name}: {target_paper.title}")
             try:
@@ -706,13 +802,14 @@ def create_report(
             print(f"Error processing professor {prof.name}: {e}")
             continue
 
-    # 3. Create report
-    # We'll store a simple summary in the content field for fallback/preview
-    report_content = f"맞춤형 리포트가 생성되었습니다. {len(analysis_results)}개의 연구 분야 분석이 포함되어 있습니다."
+    return analysis_results
+
 
+def _save_report(db: Session, user: User, top_profs, report_content: str) -> Report:
+    """Store the report and its professor links"""
     report = Report(
         id=str(uuid.uuid4()),
-        user_id=user_id,
+        user_id=user.id,
         status=ReportStatus.SENT,
         content=report_content,
         report_type="career_guide_progressive"
@@ -732,6 +829,32 @@ def create_report(
         db.add(rp)
 
     db.commit()
+    return report
+
+
+@router.post("/users/{user_id}/reports")
+@traced("create_report")
+async def create_report(
+    user_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Generate personalized report for a user based on interests.
+    Recommends professors and labs, and generates a summary using LLM.
+
+    Database work runs on the async session. The LLM calls and PDF
+    rendering block for seconds, so they run in worker threads and the
+    request holds no threadpool slot while they finish.
+    """
+    user, top_profs, targets = await db.run_sync(_select_report_professors, user_id)
+
+    # 2. Generate Report Content with LLM (Progressive Disclosure)
+    analysis_results = await asyncio.to_thread(_analyze_targets, targets)
+
+    # 3. Create report
+    # We'll store a simple summary in the content field for fallback/preview
+    report_content = f"맞춤형 리포트가 생성되었습니다. {len(analysis_results)}개의 연구 분야 분석이 포함되어 있습니다."
+    report = await db.run_sync(_save_report, user, top_profs, report_content)
 
     # 5. Generate PDF
     pdf_url = None
@@ -748,10 +871,11 @@ def create_report(
         }
         
         pdf_filename = f"report_{report.id}.pdf"
-        pdf_path = pdf_gen.generate(report_data, pdf_filename)
+        with span("pdf"):
+            pdf_path = await asyncio.to_thread(pdf_gen.generate, report_data, pdf_filename)
         
         report.pdf_path = pdf_path
-        db.commit()
+        await db.commit()
         pdf_url = f"/api/v1/reports/{report.id}/download"
         
     except Exception as e:
@@ -792,13 +916,15 @@ def download_report(
     )
 
 
-@router.get("/reports/{report_id}")
+@router.get("/reports/{report_id}", responses={200: {"model": ReportResponse}})
+@cached_response("report")
+@async_session_route
 def get_report(
     report_id: str,
     db: Session = Depends(get_db)
 ):
     """Get detailed report information"""
-    report = db.query(Report).filter(Report.id == report_id).first()
+    report = queries.load_report(db, report_id)
 
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
@@ -835,6 +961,7 @@ def get_report(
 
 
 @router.get("/laboratories/{lab_id}/plan-b")
+@async_session_route
 def get_plan_b_suggestions(
     lab_id: str,
     db: Session = Depends(get_db)
@@ -844,16 +971,13 @@ def get_plan_b_suggestions(
 
     Returns labs from other universities with similar research topics.
     """
-    laboratory = db.query(Laboratory).filter(Laboratory.id == lab_id).first()
+    laboratory = queries.load_laboratory_with_university(db, lab_id)
 
     if not laboratory:
         raise HTTPException(status_code=404, detail="Laboratory not found")
 
     # Find labs with similar research areas from different universities
-    similar_labs = db.query(Laboratory).filter(
-        Laboratory.id != lab_id,
-        Laboratory.department.has(Department.college.has(College.university_id != laboratory.department.college.university_id))
-    ).limit(5).all()
+    similar_labs = queries.find_plan_b_labs(db, laboratory, limit=5)
 
     return {
         "original_lab": {
@@ -0,0 +1,172 @@
+"""
+Fast JSON serialization for API responses.
+
+Provides:
+- dumps(): compact UTF-8 JSON, encoded by orjson when it is installed and
+  by the standard library otherwise (same output as FastAPI's JSONResponse)
+- FastJSONResponse: a JSONResponse rendered with dumps()
+- Fragment / FragmentCache: pre-encoded JSON for rows that do not change
+  within a version (a paper per updated_at, an analysis per analyzed_at),
+  embedded as-is so each row is encoded once instead of on every page
+"""
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder produces the same JSON
+    orjson = None
+
+FRAGMENT_CACHE_SIZE = 8192
+
+
+class Fragment:
+    """
+    Already-encoded JSON that dumps() embeds without re-encoding.
+
+    `value` is the object the fragment was encoded from, so response tag
+    collection (src.api.http_cache.response_tags) can still look inside it.
+    """
+
+    __slots__ = ("data", "value")
+
+    def __init__(self, data: bytes, value: Any = None):
+        self.data = data
+        self.value = value
+
+    def __repr__(self):
+        return f"Fragment({self.data!r})"
+
+
+def _default(obj):
+    """Encode the types jsonable_encoder would convert for us"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_default(obj):
+    if isinstance(obj, Fragment):
+        return orjson.Fragment(obj.data)
+    return _default(obj)
+
+
+def _stdlib_dumps(content: Any) -> bytes:
+    fragments = []
+    marker = f"\x00{uuid.uuid4().hex}:"
+
+    def default(obj):
+        if isinstance(obj, Fragment):
+            # Placeholder string, swapped for the encoded fragment afterwards
+            fragments.append(obj.data.decode("utf-8"))
+            return f"{marker}{len(fragments) - 1}"
+        return _default(obj)
+
+    encoded = json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"), default=default
+    )
+    if fragments:
+        pattern = re.escape(json.dumps(marker)[:-1]) + r'(\d+)"'
+        encoded = re.sub(pattern, lambda m: fragments[int(m.group(1))], encoded)
+    return encoded.encode("utf-8")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode a response body as compact UTF-8 JSON.
+
+    Fragments are embedded verbatim; datetimes, enums, sets and pydantic
+    models are converted the way jsonable_encoder converts them.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    return _stdlib_dumps(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with dumps() (orjson when available)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class FragmentCache:
+    """
+    LRU of encoded fragments keyed by (shape, entity id, version).
+
+    Only for rows that are immutable per version: the version (updated_at,
+    analyzed_at) must change whenever the encoded fields do, since entries
+    are never invalidated otherwise.
+    """
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Fragment]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def encode(self, shape: str, entity_id: Hashable, version: Optional[Hashable],
+               build: Callable[[], Any]) -> Fragment:
+        """
+        Cached fragment for one row.
+
+        Args:
+            shape: Name of the rendered shape (one row can render several ways)
+            entity_id: Primary key of the row
+            version: Row version; None disables caching for this row
+            build: Returns the JSON-compatible value to encode on a miss
+        """
+        key = (shape, entity_id, version)
+        if version is not None:
+            with self._lock:
+                fragment = self._entries.get(key)
+                if fragment is not None:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return fragment
+
+        value = build()
+        fragment = Fragment(dumps(value), value)
+        self.stats["misses"] += 1
+        if version is not None:
+            with self._lock:
+                self._entries[key] = fragment
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            size = len(self._entries)
+        return {**self.stats, "size": size, "encoder": "orjson" if orjson is not None else "json"}
+
+
+fragment_cache = FragmentCache()
@@ -9,20 +9,27 @@ FastAPI REST API v2 (Phase 2.5)
 3. /results - 결과 조회
 4. /workers - 워커 관리
 5. /metrics - 메트릭
+6. /admin - 프로파일링 (관리자 전용)
 """
 
+import asyncio
+import hmac
 import logging
+import os
 from typing import List, Dict, Optional
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Depends, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from src.database.db import get_db, Database
 from src.services.distributed_crawler import DistributedCrawler
 from src.services.task_queue import CrawlTask, TaskPriority
 from src.services.redis_queue import get_redis_queue
+from src.services.metrics import CONTENT_TYPE, get_metrics_registry, update_crawler_gauges
+from src.services.profiler import ProfilerBusyError, get_heap_profiler, get_sampling_profiler
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +113,13 @@ def create_app(db: Database, crawler: DistributedCrawler) -> FastAPI:
         # TODO: 실제 API 키 검증 로직
         return x_api_key
 
+    async def verify_admin_key(x_admin_key: str = Header(None)):
+        """관리자 키 검증 (V2_ADMIN_API_KEY 미설정 시 관리자 엔드포인트 비활성화)"""
+        admin_key = os.getenv("V2_ADMIN_API_KEY")
+        if not admin_key or x_admin_key is None or not hmac.compare_digest(x_admin_key, admin_key):
+            raise HTTPException(status_code=403, detail="Admin access required")
+        return x_admin_key
+
     # ===================== 작업 엔드포인트 =====================
 
     @app.post("/api/v2/tasks", response_model=Dict)
@@ -132,11 +146,17 @@ def create_app(db: Database, crawler: DistributedCrawler) -> FastAPI:
 
             logger.info(f"📝 작업 제출 (API): {task_id}")
 
-            return {
+            # 중복 제출이면 기존 작업의 실제 상태와 (신선도 윈도우 내) 결과를 반환
+            status = crawler.get_task_status(task_id) or "pending"
+            response = {
                 "task_id": task_id,
-                "status": "pending",
+                "status": status,
                 "created_at": datetime.now().isoformat(),
             }
+            if status == "completed":
+                response["result"] = crawler.get_task_result(task_id)
+
+            return response
 
         except Exception as e:
             logger.error(f"❌ 작업 제출 실패: {e}")
@@ -180,6 +200,20 @@ def create_app(db: Database, crawler: DistributedCrawler) -> FastAPI:
 
     # ===================== 상태 엔드포인트 =====================
 
+    @app.get("/api/v2/tasks/running", response_model=Dict)
+    async def get_running_tasks(api_key: str = Depends(verify_api_key)):
+        """실행 중인 작업 목록 (워커 ID, 경과 시간, 임대 잔여 시간)"""
+        try:
+            running = crawler.get_running_tasks()
+            return {
+                "running": len(running),
+                "tasks": running,
+            }
+
+        except Exception as e:
+            logger.error(f"❌ 실행 중 작업 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
     @app.get("/api/v2/tasks/{task_id}", response_model=TaskStatusResponse)
     async def get_task_status(
         task_id: str,
@@ -264,11 +298,13 @@ def create_app(db: Database, crawler: DistributedCrawler) -> FastAPI:
         """건강 상태 확인"""
         try:
             stats = crawler.get_stats()
+            # 집계 쿼리 1회, 짧은 TTL 캐시 (폴링마다 테이블을 세지 않음)
+            db_stats = db.get_db_stats()
             health = {
                 "status": "healthy" if stats["worker_pool"]["workers"]["active"] > 0 else "unhealthy",
                 "timestamp": datetime.now().isoformat(),
                 "components": {
-                    "database": "ok",
+                    "database": f"ok ({db_stats['tasks_total']} tasks, {db_stats['tasks_pending']} pending)",
                     "queue": f"{stats['queue']['pending']} pending",
                     "workers": f"{stats['worker_pool']['workers']['active']} active",
                 }
@@ -307,6 +343,71 @@ def create_app(db: Database, crawler: DistributedCrawler) -> FastAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    # ===================== 프로파일링 (관리자) =====================
+
+    @app.get("/api/v2/admin/profile", response_class=PlainTextResponse)
+    async def profile_cpu(
+        seconds: float = Query(10.0, gt=0, le=60),
+        interval_ms: float = Query(10.0, ge=1, le=1000),
+        admin_key: str = Depends(verify_admin_key)
+    ):
+        """전체 스레드 샘플링 프로파일 (flamegraph collapsed stack 형식)"""
+        profiler = get_sampling_profiler()
+        try:
+            # 샘플링은 별도 스레드에서 실행해 이벤트 루프 스택도 함께 수집
+            stacks = await asyncio.to_thread(profiler.profile, seconds, interval_ms / 1000)
+        except ProfilerBusyError:
+            raise HTTPException(status_code=409, detail="Profiler is already running")
+        return PlainTextResponse(profiler.to_collapsed(stacks))
+
+    @app.get("/api/v2/admin/heap")
+    async def heap_status(admin_key: str = Depends(verify_admin_key)):
+        """tracemalloc 추적 상태"""
+        return get_heap_profiler().get_status()
+
+    @app.post("/api/v2/admin/heap/start")
+    async def heap_start(
+        frames: int = Query(25, ge=1, le=100),
+        admin_key: str = Depends(verify_admin_key)
+    ):
+        """할당 추적 시작 (중지 전까지 모든 할당에 오버헤드 발생)"""
+        heap = get_heap_profiler()
+        heap.start(frames)
+        return heap.get_status()
+
+    @app.post("/api/v2/admin/heap/snapshots")
+    async def heap_snapshot(
+        limit: int = Query(20, ge=1, le=200),
+        admin_key: str = Depends(verify_admin_key)
+    ):
+        """스냅샷 저장 후 상위 할당 위치 반환"""
+        heap = get_heap_profiler()
+        try:
+            snapshot_id = await asyncio.to_thread(heap.take_snapshot)
+        except RuntimeError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        return {"snapshot_id": snapshot_id, "top": heap.top(snapshot_id, limit)}
+
+    @app.get("/api/v2/admin/heap/diff")
+    async def heap_diff(
+        base: str,
+        target: str,
+        limit: int = Query(20, ge=1, le=200),
+        admin_key: str = Depends(verify_admin_key)
+    ):
+        """두 스냅샷 간 할당 증감"""
+        try:
+            return {"base": base, "target": target, "diff": get_heap_profiler().diff(base, target, limit)}
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=f"Snapshot not found: {e.args[0]}")
+
+    @app.post("/api/v2/admin/heap/stop")
+    async def heap_stop(admin_key: str = Depends(verify_admin_key)):
+        """할당 추적 종료 (스냅샷 삭제)"""
+        heap = get_heap_profiler()
+        heap.stop()
+        return heap.get_status()
+
     # ===================== 헬스 체크 =====================
 
     @app.get("/health")
@@ -314,4 +415,13 @@ def create_app(db: Database, crawler: DistributedCrawler) -> FastAPI:
         """기본 헬스 체크"""
         return {"status": "ok"}
 
+    # ===================== 메트릭 =====================
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus 텍스트 형식 메트릭 (스크레이퍼용, API 키 불필요)"""
+        stats = crawler.get_stats()
+        update_crawler_gauges(stats["queue"], stats["worker_pool"]["workers"]["active"])
+        return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
     return app
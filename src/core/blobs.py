@@ -0,0 +1,215 @@
+"""
+Content-addressed, compressed storage for large text payloads.
+
+Provides:
+- BlobMixin: columns of a blob table (sha256 of the text -> compressed bytes)
+- BlobText: a model attribute that keeps only the hash in the row and
+  loads the text from the blob table on first access (deferred by design)
+- A before_flush hook that writes each new payload once per hash
+- store_blobs() / delete_orphan_blobs() for Core bulk writes and cleanup
+
+Rows stay small, so scans of the owning tables no longer read raw HTML or
+full texts, and identical payloads (re-crawls of the same page) are kept once.
+"""
+
+import hashlib
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Column, Integer, LargeBinary, String, event, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Payloads smaller than this are stored uncompressed
+COMPRESS_MIN_BYTES = 256
+ZLIB_LEVEL = 6
+
+CODEC_RAW = "raw"
+CODEC_ZLIB = "zlib"
+
+# Per-instance cache: attribute name -> (hash, text)
+_CACHE_KEY = "_blob_cache"
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def content_hash(text: str) -> str:
+    """sha256 hex digest of the UTF-8 encoded text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def encode_blob(text: str) -> Dict:
+    """Build a blob row (hash, codec, size, data) for the text."""
+    raw = text.encode("utf-8")
+    data, codec = raw, CODEC_RAW
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(raw, ZLIB_LEVEL)
+        if len(compressed) < len(raw):
+            data, codec = compressed, CODEC_ZLIB
+    return {"hash": hashlib.sha256(raw).hexdigest(), "codec": codec, "size": len(raw), "data": data}
+
+
+def decode_blob(codec: str, data: bytes) -> str:
+    """Inverse of encode_blob()."""
+    if codec == CODEC_ZLIB:
+        data = zlib.decompress(data)
+    elif codec != CODEC_RAW:
+        raise ValueError(f"Unknown blob codec: {codec}")
+    return bytes(data).decode("utf-8")
+
+
+class BlobMixin:
+    """
+    Columns of a content-addressed blob table.
+
+    Usage in models:
+        class ContentBlob(BlobMixin, Base):
+            __tablename__ = "content_blobs"
+    """
+    hash = Column(String(64), primary_key=True)  # sha256 of the uncompressed text
+    codec = Column(String(10), nullable=False)
+    size = Column(Integer, nullable=False)  # uncompressed bytes
+    data = Column(LargeBinary, nullable=False)
+
+
+class BlobText:
+    """
+    Text attribute stored out of row in a blob table.
+
+    The row only holds `hash_column`; reading the attribute loads and
+    decompresses the blob once per instance, assigning it stores the text
+    under its hash when the session flushes.
+
+    Usage in models:
+        full_text_hash = Column(String(64), nullable=True)
+        full_text = BlobText("full_text_hash", ContentBlob)
+    """
+
+    def __init__(self, hash_column: str, blob_model: type):
+        self.hash_column = hash_column
+        self.blob_model = blob_model
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        digest = getattr(instance, self.hash_column)
+        if digest is None:
+            return None
+
+        cache = instance.__dict__.setdefault(_CACHE_KEY, {})
+        cached = cache.get(self.name)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        session = object_session(instance)
+        if session is None:
+            raise DetachedInstanceError(
+                f"{type(instance).__name__}.{self.name} is stored out of row and the instance is not bound to a Session"
+            )
+        row = session.execute(
+            select(self.blob_model.codec, self.blob_model.data).where(self.blob_model.hash == digest)
+        ).first()
+        if row is None:
+            logger.warning(f"Missing blob {digest} for {type(instance).__name__}.{self.name}")
+            return None
+
+        text = decode_blob(row.codec, row.data)
+        cache[self.name] = (digest, text)
+        return text
+
+    def __set__(self, instance, value: Optional[str]):
+        cache = instance.__dict__.setdefault(_CACHE_KEY, {})
+        if value is None:
+            cache.pop(self.name, None)
+            setattr(instance, self.hash_column, None)
+            return
+        digest = content_hash(value)
+        cache[self.name] = (digest, value)
+        setattr(instance, self.hash_column, digest)
+
+    def pending(self, instance) -> Optional[Tuple[str, str]]:
+        """(hash, text) assigned or loaded on this instance and still referenced by its row."""
+        cached = instance.__dict__.get(_CACHE_KEY, {}).get(self.name)
+        if cached is not None and instance.__dict__.get(self.hash_column) == cached[0]:
+            return cached
+        return None
+
+
+def store_blobs(connection, blob_table, texts: Iterable[str]) -> int:
+    """
+    Write texts that are not stored yet (one IN lookup, one executemany).
+
+    Args:
+        connection: Connection or Session
+        blob_table: Blob model or Table
+        texts: Payloads to store
+
+    Returns:
+        Number of blobs written
+    """
+    return _store_by_hash(connection, blob_table, {content_hash(text): text for text in texts})
+
+
+def _store_by_hash(connection, blob_table, texts: Dict[str, str]) -> int:
+    blob_table = getattr(blob_table, "__table__", blob_table)
+    if not texts:
+        return 0
+
+    existing = set(connection.execute(
+        select(blob_table.c.hash).where(blob_table.c.hash.in_(list(texts)))
+    ).scalars())
+    # Only compress what is actually written
+    missing = [encode_blob(text) for digest, text in texts.items() if digest not in existing]
+    if not missing:
+        return 0
+
+    dialect = connection.get_bind().dialect if isinstance(connection, Session) else connection.dialect
+    insert_fn = _INSERTS.get(dialect.name)
+    # Another writer may store the same content concurrently
+    stmt = insert_fn(blob_table).on_conflict_do_nothing(index_elements=["hash"]) if insert_fn else insert(blob_table)
+    connection.execute(stmt, missing)
+    return len(missing)
+
+
+def delete_orphan_blobs(session: Session, blob_model: type, *hash_columns) -> int:
+    """
+    Delete blobs no longer referenced by any of the given hash columns.
+
+    Usage:
+        delete_orphan_blobs(session, ContentBlob, ResearchPaper.full_text_hash)
+    """
+    referenced = [select(column).where(column.isnot(None)) for column in hash_columns]
+    query = session.query(blob_model)
+    for subquery in referenced:
+        query = query.filter(blob_model.hash.not_in(subquery))
+    deleted = query.delete(synchronize_session=False)
+    if deleted:
+        logger.info(f"Deleted {deleted} orphaned blobs from {blob_model.__tablename__}")
+    return deleted
+
+
+@event.listens_for(Session, "before_flush")
+def _store_pending_blobs(session: Session, flush_context, instances):
+    """Store texts assigned to BlobText attributes before their rows are written."""
+    pending: Dict[type, Dict[str, str]] = {}
+    for instance in (*session.new, *session.dirty):
+        if _CACHE_KEY not in instance.__dict__:
+            continue
+        for name in instance.__dict__[_CACHE_KEY]:
+            attribute = getattr(type(instance), name)
+            entry = attribute.pending(instance)
+            if entry is not None:
+                pending.setdefault(attribute.blob_model, {})[entry[0]] = entry[1]
+
+    for blob_model, texts in pending.items():
+        _store_by_hash(session, blob_model, texts)
@@ -2,14 +2,26 @@
 Database configuration and session management.
 
 This module handles database connection, session creation, and initialization.
+Read-heavy routes use the async engine (aiosqlite / asyncpg) via get_async_db,
+so waiting on the database does not hold a threadpool slot.
 """
 
+import functools
+import inspect
 import os
-from typing import Generator
-from sqlalchemy import create_engine, event
+from typing import AsyncGenerator, Callable, Generator, Optional
+from fastapi import Depends
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from src.domain.models import Base
+from src.core.query_stats import instrument_engine
+from src.core.sqlite import create_async_sqlite_engine, create_sqlite_engine
+from src.core.search import install_paper_search
+from src.services.hierarchy_snapshot import register_snapshot_hooks
+from src.services.interest_index import ensure_index, register_index_hooks
+from src.services.response_cache import register_invalidation_hooks
 
 # Database URL (configurable via environment variable)
 # SQLite for development, PostgreSQL for production
@@ -20,11 +32,9 @@ DATABASE_URL = os.getenv(
 
 # SQLAlchemy engine configuration
 if DATABASE_URL.startswith("sqlite"):
-    # SQLite specific configuration
-    engine = create_engine(
+    # SQLite: WAL + tuned pragmas, one pooled connection per thread
+    engine = create_sqlite_engine(
         DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
         echo=os.getenv("DB_ECHO", "false").lower() == "true"
     )
 else:
@@ -35,8 +45,71 @@ else:
         echo=os.getenv("DB_ECHO", "false").lower() == "true"
     )
 
+# Statement counting per request and slow-query log (threshold: SLOW_QUERY_MS)
+instrument_engine(engine)
+
+
+
+class AppSession(Session):
+    """
+    Session class behind both SessionLocal and the async sessions.
+
+    The write hooks below are registered on this class, so commits made
+    through get_async_db run them just like commits through get_db.
+    """
+
+
+# Keep the professor keyword index in sync with crawled research interests
+register_index_hooks(AppSession)
+
+# Drop cached API responses for entities (and their parents) once writes commit
+register_invalidation_hooks(AppSession)
+
+# Mark hierarchy snapshots stale when their rows change (rebuilt on the next tree request)
+register_snapshot_hooks(AppSession)
+
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=AppSession, autocommit=False, autoflush=False, bind=engine)
+
+# Async drivers for the sync URL's database
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap a sync database URL's driver for its async counterpart."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+# Override when the async driver needs different options (e.g. asyncpg SSL)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# Created on first use, so processes that never serve async routes
+# (scripts, the crawler) do not need the async driver installed
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the shared async engine, creating it on first use."""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        echo = os.getenv("DB_ECHO", "false").lower() == "true"
+        if ASYNC_DATABASE_URL.startswith("sqlite"):
+            _async_engine = create_async_sqlite_engine(ASYNC_DATABASE_URL, echo=echo)
+        else:
+            _async_engine = create_async_engine(ASYNC_DATABASE_URL, pool_pre_ping=True, echo=echo)
+        instrument_engine(_async_engine.sync_engine)
+        # Loaded objects stay readable after commit; refreshing them would need another await
+        _async_session_factory = async_sessionmaker(
+            _async_engine, sync_session_class=AppSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
 
 
 def init_db():
@@ -46,6 +119,13 @@ def init_db():
     """
     Base.metadata.create_all(bind=engine)
 
+    # Full-text index for paper topic search (FTS5 on SQLite, tsvector on PostgreSQL)
+    install_paper_search(engine)
+
+    # Backfill the keyword index for databases created before it existed
+    with SessionLocal() as db:
+        ensure_index(db)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -61,6 +141,49 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for FastAPI to provide async database sessions.
+    Usage in routes:
+        async def my_endpoint(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+
+def async_session_route(func: Callable) -> Callable:
+    """
+    Serve a route written against a sync Session from the async engine.
+
+    FastAPI sees an async endpoint whose db parameter comes from
+    get_async_db; the body runs through AsyncSession.run_sync, so its ORM
+    calls (lazy loads included) are awaited on the event loop instead of
+    occupying a threadpool slot. The undecorated function stays available
+    as `.sync` for callers that hold a sync Session.
+
+    Usage in routes:
+        @router.get("/items/{item_id}")
+        @async_session_route
+        def get_item(item_id: str, db: Session = Depends(get_db)):
+            ...
+    """
+    signature = inspect.signature(func)
+    parameters = [
+        param.replace(annotation=AsyncSession, default=Depends(get_async_db)) if param.name == "db" else param
+        for param in signature.parameters.values()
+    ]
+
+    @functools.wraps(func)
+    async def endpoint(*args, db: AsyncSession, **kwargs):
+        return await db.run_sync(lambda session: func(*args, db=session, **kwargs))
+
+    endpoint.__signature__ = signature.replace(parameters=parameters)
+    endpoint.sync = func
+    return endpoint
+
+
 def drop_db():
     """
     Drop all tables. Use with caution - only for testing/development.
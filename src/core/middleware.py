@@ -5,8 +5,11 @@ Provides:
 - Unified error response format
 - Logging of all errors
 - Proper HTTP status codes
+- Per-route latency, response size and SQL statement metrics
 """
 
+import os
+import time
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from typing import Callable
@@ -15,10 +18,15 @@ from src.core.exceptions import (
     AuthenticationError, AuthorizationError
 )
 from src.core.logging import get_logger
+from src.core.query_stats import track_queries
+from src.services.metrics import DB_STATEMENTS_PER_REQUEST, HTTP_REQUEST_LATENCY, HTTP_RESPONSE_SIZE
 import uuid
 
 logger = get_logger(__name__)
 
+# Requests issuing more statements than this are logged as likely N+1 patterns
+STATEMENTS_WARN_THRESHOLD = int(os.getenv("STATEMENTS_WARN_THRESHOLD", "20"))
+
 
 async def exception_middleware(request: Request, call_next: Callable) -> JSONResponse:
     """
@@ -93,6 +101,55 @@ async def exception_middleware(request: Request, call_next: Callable) -> JSONRes
         )
 
 
+async def request_metrics_middleware(request: Request, call_next: Callable):
+    """
+    Middleware to record request latency, response size and SQL statement counts.
+
+    Metrics are labelled by route template (e.g. /api/v1/departments/{dept_id})
+    so that path parameters do not explode label cardinality.
+
+    Args:
+        request: FastAPI request object
+        call_next: Next middleware/route handler
+
+    Returns:
+        Response with X-Response-Time-ms and X-DB-Statements headers
+    """
+    started = time.perf_counter()
+    status_code = 500
+
+    with track_queries(route=request.url.path) as query_stats:
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            elapsed = time.perf_counter() - started
+            route = _route_template(request)
+            HTTP_REQUEST_LATENCY.observe(elapsed, method=request.method, route=route, status=str(status_code))
+            DB_STATEMENTS_PER_REQUEST.observe(query_stats.statements, route=route)
+
+    content_length = response.headers.get("content-length")
+    if content_length is not None:
+        HTTP_RESPONSE_SIZE.observe(int(content_length), route=route)
+
+    if query_stats.statements > STATEMENTS_WARN_THRESHOLD:
+        logger.warning(
+            f"{request.method} {request.url.path} issued {query_stats.statements} SQL statements "
+            f"({query_stats.db_time_ms:.1f}ms in DB) - possible N+1 query",
+            extra={"route": route, "statements": query_stats.statements}
+        )
+
+    response.headers["X-Response-Time-ms"] = f"{elapsed * 1000:.1f}"
+    response.headers["X-DB-Statements"] = str(query_stats.statements)
+    return response
+
+
+def _route_template(request: Request) -> str:
+    """Return the matched route path template, or a fixed label for unmatched paths."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
 # ==================== Error Response Models ====================
 
 def error_response(
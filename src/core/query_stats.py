@@ -0,0 +1,101 @@
+"""
+SQL statement accounting and slow-query logging.
+
+Provides:
+- Per-request statement counts and DB time (via a context variable)
+- Slow-query warnings tagged with the request route
+- SQLAlchemy engine instrumentation (before/after_cursor_execute hooks)
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Queries slower than this are logged with their route
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed while handling one request"""
+    route: str = ""
+    statements: int = 0
+    db_time_ms: float = 0.0
+    slow_queries: int = 0
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(route: str = "") -> Iterator[QueryStats]:
+    """
+    Count SQL statements executed in the current context.
+
+    Sync FastAPI handlers run in a thread pool with a copy of the request
+    context, so statements they execute are attributed to this object.
+
+    Args:
+        route: Route (or path) used to tag slow-query log lines
+
+    Yields:
+        QueryStats updated as statements run
+    """
+    stats = QueryStats(route=route)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the QueryStats of the active request, if any."""
+    return _current_stats.get()
+
+
+def instrument_engine(engine: Engine, slow_query_ms: Optional[float] = None) -> Engine:
+    """
+    Attach statement counting and slow-query logging to an engine.
+
+    Args:
+        engine: SQLAlchemy engine
+        slow_query_ms: Slow-query threshold (defaults to SLOW_QUERY_MS)
+
+    Returns:
+        The same engine
+    """
+    threshold = SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_time_ms += elapsed_ms
+
+        if elapsed_ms >= threshold:
+            if stats is not None:
+                stats.slow_queries += 1
+            logger.warning(
+                f"Slow query ({elapsed_ms:.1f}ms) on {stats.route if stats else 'n/a'}: "
+                f"{' '.join(statement.split())[:500]}",
+                extra={"route": stats.route if stats else None, "duration_ms": round(elapsed_ms, 1)}
+            )
+
+    return engine
@@ -0,0 +1,189 @@
+"""
+Full-text search over research papers.
+
+Provides:
+- SQLite: FTS5 virtual table (trigram tokenizer, works for Korean) over
+  paper title, abstract, keywords and analysis summaries, kept in sync
+  by triggers on research_papers and paper_analysis
+- PostgreSQL: GIN tsvector expression indexes over the same fields
+- apply_topic_search(): ranked topic filter for ResearchPaper queries
+  (BM25 / ts_rank), falling back to ILIKE where no index applies
+"""
+
+from typing import List
+
+from sqlalchemy import literal_column, or_, select, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+
+from src.core.logging import get_logger
+from src.domain.models import PaperAnalysis, ResearchPaper
+
+logger = get_logger(__name__)
+
+FTS_TABLE = "research_papers_fts"
+
+# bm25() column weights: title, abstract, keywords, summary
+BM25_WEIGHTS = (10.0, 1.0, 5.0, 2.0)
+
+# Trigram matching needs at least three characters per term
+MIN_TRIGRAM_LENGTH = 3
+
+_SQLITE_SUMMARY = (
+    "SELECT coalesce(a.topic_easy, '') || ' ' || coalesce(a.topic_technical, '') || ' ' || "
+    "coalesce(a.easy_summary, '') || ' ' || coalesce(a.technical_summary, '') "
+    "FROM paper_analysis a WHERE a.paper_id = {paper_id}"
+)
+
+_SQLITE_INSERT_ROW = (
+    f"INSERT INTO {FTS_TABLE}(rowid, paper_id, title, abstract, keywords, summary) "
+    "SELECT p.rowid, p.id, p.title, coalesce(p.abstract, ''), coalesce(p.keywords, ''), "
+    f"coalesce(({_SQLITE_SUMMARY.format(paper_id='p.id')}), '') "
+    "FROM research_papers p WHERE {where}"
+)
+
+_SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "paper_id UNINDEXED, title, abstract, keywords, summary, tokenize='trigram')",
+    # Rows are keyed by research_papers.rowid so triggers can replace them without a scan
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON research_papers BEGIN "
+    + _SQLITE_INSERT_ROW.format(where="p.rowid = new.rowid") + "; END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON research_papers BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid; "
+    + _SQLITE_INSERT_ROW.format(where="p.rowid = new.rowid") + "; END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON research_papers BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid; END",
+] + [
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_analysis_{suffix} AFTER {event} ON paper_analysis BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = (SELECT rowid FROM research_papers WHERE id = {ref}.paper_id); "
+    + _SQLITE_INSERT_ROW.format(where=f"p.id = {ref}.paper_id") + "; END"
+    for suffix, event, ref in (("ai", "INSERT", "new"), ("au", "UPDATE", "new"), ("ad", "DELETE", "old"))
+]
+
+# Expressions must match the index definitions exactly for PostgreSQL to use them
+PG_PAPER_VECTOR = (
+    "to_tsvector('simple', coalesce(research_papers.title, '') || ' ' || "
+    "coalesce(research_papers.abstract, '') || ' ' || coalesce(research_papers.keywords::text, ''))"
+)
+PG_ANALYSIS_VECTOR = (
+    "to_tsvector('simple', coalesce(paper_analysis.topic_easy, '') || ' ' || "
+    "coalesce(paper_analysis.topic_technical, '') || ' ' || coalesce(paper_analysis.easy_summary, '') || ' ' || "
+    "coalesce(paper_analysis.technical_summary, ''))"
+)
+
+_PG_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_research_papers_search ON research_papers USING GIN ({PG_PAPER_VECTOR})",
+    f"CREATE INDEX IF NOT EXISTS ix_paper_analysis_search ON paper_analysis USING GIN ({PG_ANALYSIS_VECTOR})",
+]
+
+# Engines on which the FTS table exists (checked once per engine)
+_fts_ready = {}
+
+
+def install_paper_search(engine: Engine) -> bool:
+    """
+    Create the full-text index for the engine's dialect (idempotent).
+
+    On SQLite the FTS table is populated from existing rows when it is
+    first created.
+
+    Args:
+        engine: SQLAlchemy engine (tables must already exist)
+
+    Returns:
+        True if a full-text index is available
+    """
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}
+                ).first() is not None
+                for statement in _SQLITE_DDL:
+                    conn.execute(text(statement))
+                if not exists:
+                    conn.execute(text(_SQLITE_INSERT_ROW.format(where="1")))
+            elif dialect == "postgresql":
+                for statement in _PG_DDL:
+                    conn.execute(text(statement))
+            else:
+                return False
+    except Exception as e:
+        # e.g. SQLite built without FTS5 / trigram (needs 3.34+)
+        logger.warning(f"Full-text paper search unavailable, using ILIKE: {e}")
+        _fts_ready[engine] = False
+        return False
+
+    _fts_ready[engine] = True
+    return True
+
+
+def rebuild_paper_search(engine: Engine):
+    """Repopulate the SQLite FTS table (e.g. after VACUUM renumbers rowids)."""
+    with engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        conn.execute(text(_SQLITE_INSERT_ROW.format(where="1")))
+
+
+def _fts_available(db: Session) -> bool:
+    engine = db.get_bind()
+    if engine not in _fts_ready:
+        with engine.connect() as conn:
+            _fts_ready[engine] = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}
+            ).first() is not None
+    return _fts_ready[engine]
+
+
+def _fts_match_expression(terms: List[str]) -> str:
+    """Quote each term as an FTS5 phrase (all terms must match)."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def apply_topic_search(query: Query, db: Session, topic: str) -> Query:
+    """
+    Filter a ResearchPaper query by topic, best matches first.
+
+    Args:
+        query: Query over ResearchPaper
+        db: Database session (used to pick the dialect)
+        topic: Free-text topic
+
+    Returns:
+        Filtered query ordered by relevance (callers may add tie-breakers)
+    """
+    terms = topic.split()
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "sqlite" and terms and min(map(len, terms)) >= MIN_TRIGRAM_LENGTH and _fts_available(db):
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        matches = (
+            select(
+                literal_column("paper_id").label("paper_id"),
+                literal_column(f"bm25({FTS_TABLE}, 0.0, {weights})").label("rank"),
+            )
+            .select_from(table(FTS_TABLE))
+            .where(text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=_fts_match_expression(terms)))
+            .subquery()
+        )
+        return query.join(matches, matches.c.paper_id == ResearchPaper.id).order_by(matches.c.rank)
+
+    if dialect == "postgresql":
+        def tsquery(name):
+            return f"plainto_tsquery('simple', :{name})"
+
+        return (
+            query.outerjoin(PaperAnalysis, PaperAnalysis.paper_id == ResearchPaper.id)
+            .filter(or_(
+                text(f"{PG_PAPER_VECTOR} @@ {tsquery('topic_paper')}").bindparams(topic_paper=topic),
+                text(f"{PG_ANALYSIS_VECTOR} @@ {tsquery('topic_analysis')}").bindparams(topic_analysis=topic),
+            ))
+            .order_by(text(f"ts_rank({PG_PAPER_VECTOR}, {tsquery('topic_rank')}) DESC").bindparams(topic_rank=topic))
+        )
+
+    # Short terms (below trigram length) or no index: substring scan
+    return query.filter(
+        (ResearchPaper.title.ilike(f"%{topic}%")) |
+        (ResearchPaper.abstract.ilike(f"%{topic}%"))
+    )
@@ -0,0 +1,153 @@
+"""
+SQLite engine profile for concurrent use.
+
+Provides:
+- WAL journal and tuned pragmas applied to every new connection
+- A connection per checkout (QueuePool) for file databases, so threads
+  read concurrently while a single writer commits
+- StaticPool only for in-memory databases, which exist per connection
+- The same profile on aiosqlite for async engines
+"""
+
+import os
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+# Pragmas applied on connect (override via environment variables)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536")),  # negative = KiB
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+}
+
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "10"))
+SQLITE_MAX_OVERFLOW = int(os.getenv("SQLITE_MAX_OVERFLOW", "20"))
+
+
+def is_memory_database(url: str) -> bool:
+    """Return True for SQLite URLs that open a private in-memory database."""
+    parsed = make_url(url)
+    database = parsed.database or ""
+    return database in ("", ":memory:") or parsed.query.get("mode") == "memory"
+
+
+def apply_sqlite_pragmas(dbapi_connection, foreign_keys: bool = False, memory: bool = False):
+    """
+    Apply the production pragmas to a raw sqlite3 connection.
+
+    Args:
+        dbapi_connection: sqlite3 connection
+        foreign_keys: Enable foreign key enforcement
+        memory: In-memory database (WAL and mmap do not apply)
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            if memory and name in ("journal_mode", "mmap_size"):
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+        if foreign_keys:
+            cursor.execute("PRAGMA foreign_keys=ON")
+    finally:
+        cursor.close()
+
+
+def create_sqlite_engine(
+    url: str,
+    foreign_keys: bool = False,
+    pool_size: int = SQLITE_POOL_SIZE,
+    max_overflow: int = SQLITE_MAX_OVERFLOW,
+    **kwargs: Any
+) -> Engine:
+    """
+    Create a SQLite engine configured for concurrent readers.
+
+    File databases get one connection per checkout (at most
+    pool_size + max_overflow open at once). In-memory databases keep a
+    single shared connection, since each connection would otherwise see
+    its own empty database.
+
+    Args:
+        url: SQLite URL
+        foreign_keys: Enable foreign key enforcement on every connection
+        pool_size: Connections kept open for reuse
+        max_overflow: Extra connections allowed under load
+        **kwargs: Passed through to create_engine (e.g. echo)
+
+    Returns:
+        Configured engine
+    """
+    memory = is_memory_database(url)
+    connect_args = {"check_same_thread": False}
+
+    if memory:
+        engine = create_engine(url, connect_args=connect_args, poolclass=StaticPool, **kwargs)
+    else:
+        engine = create_engine(
+            url,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            **kwargs
+        )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, foreign_keys=foreign_keys, memory=memory)
+
+    return engine
+
+
+def create_async_sqlite_engine(
+    url: str,
+    foreign_keys: bool = False,
+    pool_size: int = SQLITE_POOL_SIZE,
+    max_overflow: int = SQLITE_MAX_OVERFLOW,
+    **kwargs: Any
+) -> AsyncEngine:
+    """
+    Create an aiosqlite engine with the same pragmas and pooling as create_sqlite_engine.
+
+    Each aiosqlite connection runs its statements on a dedicated thread, so
+    awaiting a query never occupies the event loop or the request threadpool.
+
+    Args:
+        url: SQLite URL (a plain sqlite:// URL is switched to the aiosqlite driver)
+        foreign_keys: Enable foreign key enforcement on every connection
+        pool_size: Connections kept open for reuse
+        max_overflow: Extra connections allowed under load
+        **kwargs: Passed through to create_async_engine (e.g. echo)
+
+    Returns:
+        Configured async engine
+    """
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    memory = is_memory_database(url)
+
+    if memory:
+        engine = create_async_engine(parsed, poolclass=StaticPool, **kwargs)
+    else:
+        engine = create_async_engine(
+            parsed,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            **kwargs
+        )
+
+    # The adapted aiosqlite connection exposes a blocking DBAPI facade in connect events
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, foreign_keys=foreign_keys, memory=memory)
+
+    return engine
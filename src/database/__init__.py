@@ -6,7 +6,9 @@ from src.database.models import (
     CrawlResult,
     Professor,
     Paper,
-    CrawlMetrics
+    Lab,
+    CrawlMetrics,
+    CrawlBlob
 )
 
 from src.database.db import (
@@ -21,7 +23,9 @@ __all__ = [
     "CrawlResult",
     "Professor",
     "Paper",
+    "Lab",
     "CrawlMetrics",
+    "CrawlBlob",
     "Database",
     "get_db",
     "init_database",
@@ -5,19 +5,29 @@
 1. 데이터베이스 연결 관리
 2. 세션 팩토리
 3. 마이그레이션 및 초기화
+4. 통계 조회 (집계 쿼리 1회 + 짧은 TTL 캐시)
 """
 
+import copy
 import logging
 import os
-from sqlalchemy import create_engine, event, inspect
+import threading
+import time
+from sqlalchemy import create_engine, func, inspect, literal, select, union_all
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 
+from src.core.sqlite import create_sqlite_engine
 from src.database.models import Base, CrawlTask, CrawlResult, Professor, Paper, CrawlMetrics
 
 logger = logging.getLogger(__name__)
 
+# get_db_stats() 캐시 유지 시간 (대시보드 폴링마다 테이블을 세지 않도록)
+DB_STATS_TTL_SECONDS = float(os.getenv("DB_STATS_TTL_SECONDS", "5"))
+
+# 작업 상태별로 보고하는 값 (tasks_<status>)
+TASK_STATUSES = ("pending", "running", "completed", "failed")
+
 
 class Database:
     """데이터베이스 관리"""
@@ -27,7 +37,8 @@ class Database:
         db_url: str = None,
         echo: bool = False,
         pool_size: int = 20,
-        max_overflow: int = 40
+        max_overflow: int = 40,
+        stats_ttl: float = DB_STATS_TTL_SECONDS
     ):
         """
         초기화
@@ -37,6 +48,7 @@ class Database:
             echo: SQL 로깅 여부
             pool_size: 연결 풀 크기
             max_overflow: 풀 오버플로우 허용 수
+            stats_ttl: get_db_stats() 결과 캐시 시간 (초, 0이면 캐시 안 함)
         """
         if db_url is None:
             # 기본값: SQLite
@@ -47,22 +59,18 @@ class Database:
 
         self.db_url = db_url
         self.echo = echo
+        self.stats_ttl = stats_ttl
+        self._stats_cache = None  # (조회 시각, 통계)
+        self._stats_lock = threading.Lock()
 
         # 데이터베이스 엔진 생성
         if "sqlite" in db_url:
-            # SQLite 특수 설정
-            self.engine = create_engine(
+            # SQLite: WAL + pragmas (외래키 포함), 파일 DB는 스레드별 연결 풀
+            self.engine = create_sqlite_engine(
                 db_url,
-                connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
+                foreign_keys=True,
                 echo=echo
             )
-            # SQLite 외래키 활성화
-            @event.listens_for(self.engine, "connect")
-            def set_sqlite_pragma(dbapi_connection, connection_record):
-                cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.close()
         else:
             # PostgreSQL, MySQL 등
             self.engine = create_engine(
@@ -111,20 +119,52 @@ class Database:
         Base.metadata.drop_all(bind=self.engine)
         logger.info("✅ 테이블 삭제 완료")
 
-    def get_db_stats(self) -> dict:
-        """데이터베이스 통계"""
-        with self.session_scope() as session:
-            stats = {
-                "tasks_total": session.query(CrawlTask).count(),
-                "tasks_pending": session.query(CrawlTask).filter_by(status="pending").count(),
-                "tasks_running": session.query(CrawlTask).filter_by(status="running").count(),
-                "tasks_completed": session.query(CrawlTask).filter_by(status="completed").count(),
-                "tasks_failed": session.query(CrawlTask).filter_by(status="failed").count(),
-                "results_total": session.query(CrawlResult).count(),
-                "professors_total": session.query(Professor).count(),
-                "papers_total": session.query(Paper).count(),
-                "metrics_total": session.query(CrawlMetrics).count(),
-            }
+    def get_db_stats(self, max_age: float = None) -> dict:
+        """
+        데이터베이스 통계
+
+        상태별 작업 수(GROUP BY status)와 테이블별 행 수를 UNION ALL 쿼리 한 번으로
+        조회하고, stats_ttl 동안은 캐시된 값을 반환한다.
+
+        Args:
+            max_age: 허용할 캐시 나이 (초, 기본 stats_ttl, 0이면 새로 조회)
+        """
+        max_age = self.stats_ttl if max_age is None else max_age
+        with self._stats_lock:
+            # 동시 요청이 몰려도 조회는 한 번만
+            cached = self._stats_cache
+            if cached is None or time.monotonic() - cached[0] >= max_age:
+                cached = (time.monotonic(), self._query_db_stats())
+                self._stats_cache = cached
+        return copy.copy(cached[1])
+
+    def invalidate_stats(self):
+        """통계 캐시 무효화 (다음 get_db_stats()에서 새로 조회)"""
+        with self._stats_lock:
+            self._stats_cache = None
+
+    def _query_db_stats(self) -> dict:
+        """통계 집계 쿼리 (1회)"""
+        tables = {"results": CrawlResult, "professors": Professor, "papers": Paper, "metrics": CrawlMetrics}
+        counts = union_all(
+            # (구분, 작업 상태, 행 수)
+            select(literal("tasks"), CrawlTask.status, func.count()).group_by(CrawlTask.status),
+            *(
+                select(literal(name), literal(None), func.count()).select_from(model)
+                for name, model in tables.items()
+            )
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(counts).all()
+
+        by_status = {status: n for kind, status, n in rows if kind == "tasks"}
+        totals = {kind: n for kind, _, n in rows if kind != "tasks"}
+
+        stats = {"tasks_total": sum(by_status.values())}
+        for status in TASK_STATUSES:
+            stats[f"tasks_{status}"] = by_status.get(status, 0)
+        for name in tables:
+            stats[f"{name}_total"] = totals.get(name, 0)
         return stats
 
     def close(self):
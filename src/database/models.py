@@ -6,7 +6,9 @@
 2. CrawlResult - 크롤링 결과
 3. Professor - 교수 정보
 4. Paper - 논문 정보
-5. CrawlMetrics - 크롤링 메트릭스
+5. Lab - 연구실 정보
+6. CrawlMetrics - 크롤링 메트릭스
+7. CrawlBlob - 원본 HTML / 추출 텍스트 (압축, 내용 해시 기준 별도 저장)
 """
 
 from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, Text, ForeignKey, UniqueConstraint
@@ -15,9 +17,19 @@ from sqlalchemy.orm import relationship
 from datetime import datetime
 import hashlib
 
+from src.core.blobs import BlobMixin, BlobText
+
 Base = declarative_base()
 
 
+class CrawlBlob(BlobMixin, Base):
+    """크롤링 원문 저장소 (내용 해시 → 압축 데이터)"""
+    __tablename__ = 'crawl_blobs'
+
+    def __repr__(self):
+        return f"<CrawlBlob {self.hash[:12]} ({self.size} bytes, {self.codec})>"
+
+
 class CrawlTask(Base):
     """크롤링 작업"""
     __tablename__ = 'crawl_tasks'
@@ -46,7 +58,7 @@ class CrawlTask(Base):
 
     # 결과 참조
     result_id = Column(String(64), ForeignKey('crawl_results.id'))
-    result = relationship("CrawlResult", back_populates="task", uselist=False)
+    result = relationship("CrawlResult", foreign_keys=[result_id], post_update=True)
 
     # 메트릭스 참조
     metrics = relationship("CrawlMetrics", back_populates="task", cascade="all, delete-orphan")
@@ -72,9 +84,11 @@ class CrawlResult(Base):
     labs_count = Column(Integer, default=0)
     pages_crawled = Column(Integer, default=0)
 
-    # 콘텐츠
-    html_content = Column(Text)  # 원본 HTML (선택사항)
-    extracted_text = Column(Text)  # 추출된 텍스트
+    # 콘텐츠 (행에는 해시만 두고 본문은 crawl_blobs에 압축 저장, 접근 시 로드)
+    html_content_hash = Column(String(64))
+    extracted_text_hash = Column(String(64))
+    html_content = BlobText('html_content_hash', CrawlBlob)  # 원본 HTML (선택사항)
+    extracted_text = BlobText('extracted_text_hash', CrawlBlob)  # 추출된 텍스트
 
     # 메타데이터
     accuracy_score = Column(Float, default=0.0)  # 0-100%
@@ -83,9 +97,10 @@ class CrawlResult(Base):
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
     # 관계
-    task = relationship("CrawlTask", back_populates="result", uselist=False)
+    task = relationship("CrawlTask", foreign_keys=[task_id])
     professors = relationship("Professor", back_populates="crawl_result", cascade="all, delete-orphan")
     papers = relationship("Paper", back_populates="crawl_result", cascade="all, delete-orphan")
+    labs = relationship("Lab", back_populates="crawl_result", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<CrawlResult {self.university_name}: {self.professors_count} profs, {self.papers_count} papers>"
@@ -173,6 +188,39 @@ class Paper(Base):
         return f"<Paper {self.title[:50]}... ({self.published_year})>"
 
 
+class Lab(Base):
+    """연구실 정보"""
+    __tablename__ = 'labs'
+
+    id = Column(String(64), primary_key=True)  # MD5(name + university)
+    crawl_result_id = Column(String(64), ForeignKey('crawl_results.id'), index=True)
+
+    # 기본 정보
+    name = Column(String(300), nullable=False, index=True)
+    university_name = Column(String(100), nullable=False, index=True)
+    department = Column(String(100))
+    description = Column(Text)
+    url = Column(String(500))
+
+    # 분류
+    extraction_method = Column(String(50))
+    confidence_score = Column(Float, default=0.0)  # 0-100%
+
+    # 메타데이터
+    created_at = Column(DateTime, default=datetime.now, index=True)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    # 관계
+    crawl_result = relationship("CrawlResult", back_populates="labs")
+
+    __table_args__ = (
+        UniqueConstraint('name', 'university_name', name='uq_lab'),
+    )
+
+    def __repr__(self):
+        return f"<Lab {self.name[:50]} ({self.university_name})>"
+
+
 class CrawlMetrics(Base):
     """크롤링 메트릭스"""
     __tablename__ = 'crawl_metrics'
@@ -7,6 +7,8 @@ This module defines the database schema for storing:
 - Research Papers with full details
 - Paper Analysis results
 - Users, Reports, and preferences
+- Keyword index for interest matching
+- Compressed out-of-row storage for large texts
 """
 
 from datetime import datetime
@@ -14,12 +16,14 @@ from typing import Optional, List
 import uuid
 from sqlalchemy import (
     Column, String, Text, Integer, DateTime, Date, JSON, ForeignKey,
-    Enum as SQLEnum, UniqueConstraint, Float, Boolean
+    Enum as SQLEnum, UniqueConstraint, Float, Boolean, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import enum
 
+from src.core.blobs import BlobMixin, BlobText
+
 Base = declarative_base()
 
 
@@ -238,6 +242,18 @@ class LabMember(Base):
 
 # ==================== Research Paper Models ====================
 
+class ContentBlob(BlobMixin, Base):
+    """
+    Compressed large texts (paper full texts), keyed by content hash.
+
+    Table: content_blobs
+    """
+    __tablename__ = "content_blobs"
+
+    def __repr__(self):
+        return f"<ContentBlob {self.hash[:12]} ({self.size} bytes, {self.codec})>"
+
+
 class ResearchPaper(Base):
     """
     Stores research paper with full details linked to laboratory.
@@ -260,7 +276,8 @@ class ResearchPaper(Base):
     url = Column(String(500), nullable=True, unique=True, index=True)
     pdf_url = Column(String(500), nullable=True)
     keywords = Column(JSON, default=list, nullable=False)
-    full_text = Column(Text, nullable=True)  # For papers we can access
+    full_text_hash = Column(String(64), nullable=True)  # content_blobs.hash
+    full_text = BlobText("full_text_hash", ContentBlob)  # For papers we can access; loaded on access
     embedding_id = Column(String(100), nullable=True)  # ChromaDB embedding ID
 
     # Metadata
@@ -272,6 +289,12 @@ class ResearchPaper(Base):
     analysis = relationship("PaperAnalysis", back_populates="paper", uselist=False, cascade="all, delete-orphan")
     report_papers = relationship("ReportPaper", back_populates="paper", cascade="all, delete-orphan")
 
+    # Keyset pagination: newest-first listing seeks on (crawled_at, id), optionally per lab
+    __table_args__ = (
+        Index("ix_research_papers_crawled_at_id", "crawled_at", "id"),
+        Index("ix_research_papers_lab_crawled_at_id", "lab_id", "crawled_at", "id"),
+    )
+
     def __repr__(self):
         return f"<ResearchPaper(id={self.id}, title={self.title})>"
 
@@ -392,6 +415,9 @@ class Report(Base):
     papers = relationship("ReportPaper", back_populates="report", cascade="all, delete-orphan")
     professors = relationship("ReportProfessor", back_populates="report", cascade="all, delete-orphan")
 
+    # A user's reports, newest first
+    __table_args__ = (Index("ix_reports_user_sent_at", "user_id", "sent_at"),)
+
     def __repr__(self):
         return f"<Report(id={self.id}, user_id={self.user_id})>"
 
@@ -439,3 +465,59 @@ class ReportProfessor(Base):
     professor = relationship("Professor")
 
     __table_args__ = (UniqueConstraint("report_id", "professor_id", name="uq_report_professor"),)
+
+
+# ==================== Search Index Models ====================
+
+class ProfessorKeyword(Base):
+    """
+    Normalized research keyword → professor index used for interest matching.
+
+    Derived from Professor.research_interests and Laboratory.research_areas
+    by src/services/interest_index.py; safe to drop and rebuild.
+
+    Table: professor_keywords
+    """
+    __tablename__ = "professor_keywords"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    term = Column(String(255), nullable=False)  # Case-folded phrase, word n-gram or alias
+    phrase = Column(String(255), nullable=False)  # Normalized interest the term came from
+    professor_id = Column(String(100), nullable=False, index=True)
+    source = Column(String(20), nullable=False)  # "professor" or "lab"
+    source_id = Column(String(100), nullable=False)  # Professor.id or Laboratory.id
+
+    __table_args__ = (
+        Index("ix_professor_keywords_term_professor", "term", "professor_id"),
+        Index("ix_professor_keywords_source", "source", "source_id"),
+    )
+
+    def __repr__(self):
+        return f"<ProfessorKeyword(term={self.term}, professor_id={self.professor_id})>"
+
+
+# ==================== Snapshot Models ====================
+
+class HierarchySnapshot(Base):
+    """
+    Materialized University → College → Department → Professor → Lab tree.
+
+    Built by src/services/hierarchy_snapshot.py and served by
+    /universities/{id}/tree; safe to drop and rebuild. Writes to the tree's
+    rows bump change_seq in the same transaction, and the next request
+    rebuilds the snapshot when change_seq != built_seq.
+
+    Table: hierarchy_snapshots
+    """
+    __tablename__ = "hierarchy_snapshots"
+
+    university_id = Column(String(100), ForeignKey("universities.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, default=1, nullable=False)  # Bumped when the content changes
+    etag = Column(String(64), nullable=False)  # Content hash of data
+    data = Column(Text, nullable=False)  # Compact JSON tree
+    built_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    change_seq = Column(Integer, default=0, nullable=False)  # Bumped by writes under this university
+    built_seq = Column(Integer, default=0, nullable=False)  # change_seq the data was built from
+
+    def __repr__(self):
+        return f"<HierarchySnapshot(university_id={self.university_id}, version={self.version})>"
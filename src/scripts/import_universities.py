@@ -1,11 +1,12 @@
 
-import csv
 import os
 import sys
 from datetime import datetime
 from sqlalchemy.orm import Session
 from src.core.database import SessionLocal, engine
 from src.domain.models import University, Base
+from src.services.bulk_ingest import IngestReport, bulk_upsert, iter_csv
+from src.services.hierarchy_snapshot import rebuild_snapshots
 
 # Ensure we can import from src
 sys.path.append(os.getcwd())
@@ -25,66 +26,59 @@ def parse_year(date_str):
     except:
         return None
 
-def import_universities(csv_path: str, db: Session):
+# Columns refreshed on universities that already exist
+UPDATE_COLUMNS = ("location", "url", "established_year")
+
+def _university_rows(csv_path: str, existing_ids: dict, report: IngestReport):
+    for i, row in enumerate(iter_csv(csv_path)):
+        if i == 0:
+            print(f"First row keys: {list(row.keys())}")
+        # CSV columns: 학교명,학교 영문명,본분교구분명,대학구분명,학교구분명,설립형태구분명,시도코드,시도명,소재지도로명주소,소재지지번주소,도로명우편번호,소재지우편번호,홈페이지주소,대표전화번호,대표팩스번호,설립일자,기준연도,데이터기준일자,제공기관코드,제공기관명
+        # All campuses are imported (본교 and 분교 alike).
+
+        name_en = row.get('학교 영문명')
+        name_ko = row.get('학교명')
+
+        if not name_en or not name_ko:
+            report.skipped += 1
+            continue
+
+        yield {
+            # Reuse the id of a university already stored under this name
+            # (e.g. created by sync_careernet_data) to avoid a unique name conflict
+            "id": existing_ids.get(name_en) or generate_id(name_en),
+            "name": name_en,
+            "name_ko": name_ko,
+            "location": row.get('소재지도로명주소'),
+            "url": row.get('홈페이지주소'),
+            "established_year": parse_year(row.get('설립일자')),
+        }
+
+def import_universities(csv_path: str, db: Session) -> IngestReport:
+    """
+    Stream the national university CSV into the universities table.
+
+    Rows are upserted by id in batches; existing universities get their
+    location, url and established_year refreshed.
+    """
     print(f"Importing from {csv_path}...")
     
     if not os.path.exists(csv_path):
         print(f"Error: File {csv_path} not found.")
-        return
-
-    count = 0
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            if i == 0:
-                print(f"First row keys: {list(row.keys())}")
-            # CSV columns: 학교명,학교 영문명,본분교구분명,대학구분명,학교구분명,설립형태구분명,시도코드,시도명,소재지도로명주소,소재지지번주소,도로명우편번호,소재지우편번호,홈페이지주소,대표전화번호,대표팩스번호,설립일자,기준연도,데이터기준일자,제공기관코드,제공기관명
-            
-            # Filter: We probably only want "본교" (Main Campus) or maybe all? 
-            # Let's include all for now, but maybe distinguish them later if needed.
-            # actually, let's just import everything.
-
-            name_en = row.get('학교 영문명')
-            name_ko = row.get('학교명')
-            
-            if not name_en or not name_ko:
-                continue
-
-            uni_id = generate_id(name_en)
-            
-            # Check if exists by ID
-            existing = db.query(University).filter(University.id == uni_id).first()
-            
-            # Check if exists by Name (to avoid unique constraint violation)
-            if not existing:
-                existing = db.query(University).filter(University.name == name_en).first()
+        return IngestReport()
 
-            if existing:
-                # Update? Or skip. Let's update basic info.
-                existing.location = row.get('소재지도로명주소')
-                existing.url = row.get('홈페이지주소')
-                existing.established_year = parse_year(row.get('설립일자'))
-            else:
-                uni = University(
-                    id=uni_id,
-                    name=name_en,
-                    name_ko=name_ko,
-                    location=row.get('소재지도로명주소'),
-                    url=row.get('홈페이지주소'),
-                    established_year=parse_year(row.get('설립일자'))
-                )
-                db.add(uni)
-            
-            try:
-                db.flush()
-                count += 1
-            except Exception as e:
-                db.rollback()
-                print(f"Error processing {name_ko} ({name_en}): {e}")
-                continue
-            
+    existing_ids = dict(db.query(University.name, University.id))
+    report = IngestReport()
+    report += bulk_upsert(
+        db, University, _university_rows(csv_path, existing_ids, report),
+        key=["id"], update_columns=UPDATE_COLUMNS
+    )
     db.commit()
-    print(f"Successfully processed {count} universities.")
+    if report.updated:
+        # Snapshots already served by /universities/{id}/tree carry location/url
+        rebuild_snapshots(db)
+    print(f"Successfully processed {report.total} universities ({report}).")
+    return report
 
 if __name__ == "__main__":
     # Create tables if they don't exist
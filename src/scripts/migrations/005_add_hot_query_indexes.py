@@ -0,0 +1,56 @@
+import sqlite3
+
+# (인덱스 이름, 테이블, 컬럼) - src/domain/models.py 정의와 동일해야 함
+INDEXES = [
+    # /papers, /universities/{id}/papers 최신순 + keyset 페이지네이션
+    ("ix_research_papers_crawled_at_id", "research_papers", ("crawled_at", "id")),
+    # /papers?lab_id= 최신순
+    ("ix_research_papers_lab_crawled_at_id", "research_papers", ("lab_id", "crawled_at", "id")),
+    # 사용자별 리포트 최신순
+    ("ix_reports_user_sent_at", "reports", ("user_id", "sent_at")),
+]
+
+
+def _columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def migrate_up(db_connection):
+    """
+    자주 호출되는 API 쿼리용 복합 인덱스 생성
+
+    테이블이 없거나 (구버전 스키마라) 컬럼이 없으면 건너뛴다.
+    """
+    cursor = db_connection.cursor()
+    for name, table, columns in INDEXES:
+        if not set(columns) <= _columns(cursor, table):
+            print(f"  -> Skipping {name}: {table}({', '.join(columns)}) not found")
+            continue
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    db_connection.commit()
+
+
+def migrate_down(db_connection):
+    """
+    복합 인덱스 삭제
+    """
+    cursor = db_connection.cursor()
+    for name, _, _ in INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+    db_connection.commit()
+
+
+if __name__ == '__main__':
+    # 간단한 테스트 실행
+    db_path = 'univ_insight.db'
+    conn = sqlite3.connect(db_path)
+
+    print("Running migrate_up...")
+    migrate_up(conn)
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'ix_%'")
+    print(f"Indexes: {[row[0] for row in cursor.fetchall()]}")
+
+    conn.close()
@@ -0,0 +1,122 @@
+
+import sqlite3
+
+from src.core.blobs import decode_blob, encode_blob
+
+# (테이블, 기존 TEXT 컬럼, 블롭 테이블) - src/domain/models.py, src/database/models.py 정의와 동일해야 함
+BLOB_COLUMNS = [
+    ("research_papers", "full_text", "content_blobs"),
+    ("crawl_results", "html_content", "crawl_blobs"),
+    ("crawl_results", "extracted_text", "crawl_blobs"),
+]
+
+BATCH_SIZE = 500
+
+
+def _columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def _create_blob_table(cursor, blob_table):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {blob_table} (
+            hash VARCHAR(64) NOT NULL PRIMARY KEY,
+            codec VARCHAR(10) NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+    """)
+
+
+def migrate_up(db_connection):
+    """
+    대용량 TEXT 컬럼을 압축 블롭 테이블로 이동
+
+    각 컬럼의 내용을 내용 해시 기준으로 블롭 테이블에 한 번만 저장하고,
+    행에는 <컬럼>_hash만 남긴 뒤 기존 컬럼을 삭제한다.
+    테이블이 없거나 이미 이동된 컬럼은 건너뛴다.
+    """
+    cursor = db_connection.cursor()
+    moved = 0
+    for table, column, blob_table in BLOB_COLUMNS:
+        columns = _columns(cursor, table)
+        if column not in columns:
+            print(f"  -> Skipping {table}.{column}: not found")
+            continue
+
+        _create_blob_table(cursor, blob_table)
+        if f"{column}_hash" not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column}_hash VARCHAR(64)")
+
+        rows = db_connection.execute(f"SELECT rowid, {column} FROM {table} WHERE {column} IS NOT NULL")
+        while True:
+            batch = rows.fetchmany(BATCH_SIZE)
+            if not batch:
+                break
+            blobs = [encode_blob(text) for _, text in batch]
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO {blob_table} (hash, codec, size, data) VALUES (:hash, :codec, :size, :data)",
+                blobs
+            )
+            cursor.executemany(
+                f"UPDATE {table} SET {column}_hash = ? WHERE rowid = ?",
+                [(blob["hash"], rowid) for blob, (rowid, _) in zip(blobs, batch)]
+            )
+            moved += len(batch)
+
+        cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        print(f"  -> {table}.{column} moved to {blob_table}")
+
+    db_connection.commit()
+
+    if moved:
+        # 삭제된 컬럼이 차지하던 페이지 반환
+        db_connection.execute("VACUUM")
+    print(f"  -> {moved} values moved")
+
+
+def migrate_down(db_connection):
+    """
+    블롭 테이블의 내용을 기존 TEXT 컬럼으로 복원
+    """
+    cursor = db_connection.cursor()
+    for table, column, blob_table in BLOB_COLUMNS:
+        columns = _columns(cursor, table)
+        if f"{column}_hash" not in columns:
+            continue
+
+        if column not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+        rows = db_connection.execute(
+            f"SELECT t.rowid, b.codec, b.data FROM {table} t JOIN {blob_table} b ON b.hash = t.{column}_hash"
+        )
+        while True:
+            batch = rows.fetchmany(BATCH_SIZE)
+            if not batch:
+                break
+            cursor.executemany(
+                f"UPDATE {table} SET {column} = ? WHERE rowid = ?",
+                [(decode_blob(codec, data), rowid) for rowid, codec, data in batch]
+            )
+        cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}_hash")
+
+    for blob_table in {blob_table for _, _, blob_table in BLOB_COLUMNS}:
+        cursor.execute(f"DROP TABLE IF EXISTS {blob_table}")
+    db_connection.commit()
+
+
+if __name__ == '__main__':
+    # 간단한 테스트 실행
+    db_path = 'univ_insight.db'
+    conn = sqlite3.connect(db_path)
+
+    print("Running migrate_up...")
+    migrate_up(conn)
+
+    cursor = conn.cursor()
+    for blob_table in ("content_blobs", "crawl_blobs"):
+        cursor.execute(f"SELECT count(*), sum(size), sum(length(data)) FROM {blob_table}")
+        print(f"{blob_table}: {cursor.fetchone()}")
+
+    conn.close()
@@ -0,0 +1,60 @@
+
+import sqlite3
+
+# hierarchy_snapshots 변경 감지 컬럼 - src/domain/models.py HierarchySnapshot 정의와 동일해야 함
+COLUMNS = [
+    ("change_seq", "INTEGER NOT NULL DEFAULT 0"),
+    ("built_seq", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+
+def _columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def migrate_up(db_connection):
+    """
+    hierarchy_snapshots에 change_seq / built_seq 컬럼 추가
+
+    트리에 속한 행이 바뀌면 change_seq가 증가하고, 다음 요청이 스냅샷을 재생성한다.
+    기존 스냅샷은 언제 만들어졌는지 알 수 없으므로 낡음(change_seq = 1)으로 표시한다.
+    테이블이 없으면 건너뛴다 (init_db가 새 정의로 생성).
+    """
+    cursor = db_connection.cursor()
+    columns = _columns(cursor, "hierarchy_snapshots")
+    if not columns:
+        print("  -> Skipping hierarchy_snapshots: not found")
+        return
+
+    for name, definition in COLUMNS:
+        if name not in columns:
+            cursor.execute(f"ALTER TABLE hierarchy_snapshots ADD COLUMN {name} {definition}")
+    cursor.execute("UPDATE hierarchy_snapshots SET change_seq = built_seq + 1")
+    db_connection.commit()
+
+
+def migrate_down(db_connection):
+    """
+    change_seq / built_seq 컬럼 삭제
+    """
+    cursor = db_connection.cursor()
+    columns = _columns(cursor, "hierarchy_snapshots")
+    for name, _ in COLUMNS:
+        if name in columns:
+            cursor.execute(f"ALTER TABLE hierarchy_snapshots DROP COLUMN {name}")
+    db_connection.commit()
+
+
+if __name__ == '__main__':
+    # 간단한 테스트 실행
+    db_path = 'univ_insight.db'
+    conn = sqlite3.connect(db_path)
+
+    print("Running migrate_up...")
+    migrate_up(conn)
+
+    cursor = conn.cursor()
+    print(f"Columns: {sorted(_columns(cursor, 'hierarchy_snapshots'))}")
+
+    conn.close()
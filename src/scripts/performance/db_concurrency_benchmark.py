@@ -0,0 +1,119 @@
+"""
+SQLite 동시 읽기 처리량 벤치마크
+
+기존 설정(StaticPool 단일 연결, rollback journal)과 WAL + 스레드별 연결 풀
+설정을 비교한다. 읽기 스레드 N개가 교수/논문 조회를 반복하는 동안
+쓰기 스레드 1개가 계속 논문을 추가한다.
+
+사용법:
+    python src/scripts/performance/db_concurrency_benchmark.py --readers 8 --seconds 5
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from argparse import ArgumentParser
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.sqlite import create_sqlite_engine
+from src.database.models import Base, Paper, Professor
+
+
+def legacy_engine(url):
+    """변경 전 설정: 모든 스레드가 연결 하나를 공유"""
+    return create_engine(url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+
+def seed(Session, professors=200, papers_per_professor=20):
+    with Session() as session:
+        for i in range(professors):
+            professor = Professor(id=f"prof-{i}", name=f"교수{i}", university_name="벤치대학",
+                                  department=f"학과{i % 20}")
+            professor.papers = [
+                Paper(id=f"paper-{i}-{j}", title=f"논문 {i}-{j}", published_year=2000 + j % 25,
+                      confidence_score=float(j))
+                for j in range(papers_per_professor)
+            ]
+            session.add(professor)
+        session.commit()
+
+
+def run(engine, readers, seconds):
+    """읽기 처리량(쿼리/초)과 쓰기 건수 측정"""
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+    seed(Session)
+
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+    errors = []
+
+    def reader(index):
+        while not stop.is_set():
+            try:
+                with Session() as session:
+                    session.execute(
+                        select(Professor.department, func.count(Paper.id), func.avg(Paper.confidence_score))
+                        .join(Paper, Paper.professor_id == Professor.id)
+                        .group_by(Professor.department)
+                    ).all()
+                reads[index] += 1
+            except Exception as e:
+                errors.append(repr(e))
+
+    def writer():
+        while not stop.is_set():
+            try:
+                with Session() as session:
+                    session.add(Paper(id=uuid.uuid4().hex, title=uuid.uuid4().hex, published_year=2024,
+                                      professor_id="prof-0"))
+                    session.commit()
+                writes[0] += 1
+            except Exception as e:
+                errors.append(repr(e))
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    return {"reads_per_sec": sum(reads) / seconds, "writes": writes[0], "errors": len(errors)}
+
+
+def main():
+    parser = ArgumentParser(description="SQLite 동시 읽기 처리량 벤치마크")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    results = {}
+    for name, factory in (("StaticPool (기존)", legacy_engine), ("WAL + 연결 풀", create_sqlite_engine)):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            results[name] = run(factory(url), args.readers, args.seconds)
+
+    print(f"\n--- 읽기 스레드 {args.readers}개 + 쓰기 스레드 1개, {args.seconds:.0f}초 ---")
+    for name, result in results.items():
+        print(f"{name:<20} 읽기 {result['reads_per_sec']:>8.1f}/초  쓰기 {result['writes']:>6}건  "
+              f"오류 {result['errors']}건")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+API 응답 직렬화 CPU 벤치마크
+
+주요 읽기 라우트(/papers, /papers/{id}/analysis, /departments/{id}/research,
+/reports/{id})와 같은 모양의 응답 본문을 만들고 인코딩하는 데 드는 요청당
+CPU 시간을 비교한다.
+
+- 기존: 요청마다 dict 생성 → jsonable_encoder → 표준 json (FastAPI 기본 경로)
+- dumps(json): src.api.serialization.dumps + 조각 캐시, orjson 없이
+- dumps(orjson): 위와 같고 orjson 사용 (설치되어 있을 때)
+
+조각 캐시는 논문/분석 행을 버전별로 한 번만 인코딩하므로, 캐시가 채워진
+상태(같은 행이 여러 응답에 반복 등장)를 측정한다. DB 조회 시간은 포함하지 않는다.
+
+사용법:
+    python src/scripts/performance/serialization_benchmark.py --requests 2000
+"""
+
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api import serialization
+from src.api.serialization import FragmentCache, dumps
+from src.domain.models import ReportStatus
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+def make_papers(count):
+    return [
+        SimpleNamespace(
+            id=f"paper-{i}", title=f"그래프 신경망을 이용한 분자 구조 예측 {i}",
+            authors=[f"저자{j}" for j in range(6)], lab_id=f"lab-{i % 10}", publication_year=2015 + i % 10,
+            venue="NeurIPS", citation_count=i * 3, keywords=[f"keyword-{j}" for j in range(8)],
+            updated_at=NOW - timedelta(minutes=i)
+        )
+        for i in range(count)
+    ]
+
+
+def make_analysis():
+    return SimpleNamespace(
+        id="analysis-1", analyzed_at=NOW, easy_summary="쉬운 설명 " * 80, technical_summary="Technical " * 120,
+        core_technologies=[f"tech-{i}" for i in range(15)], required_skills=[f"skill-{i}" for i in range(15)],
+        math_concepts=[f"math-{i}" for i in range(10)], application_fields=[f"field-{i}" for i in range(10)],
+        industry_relevance="산업 연관성 " * 40, career_paths=[{"title": f"직무 {i}", "level": i} for i in range(8)],
+        recommended_companies=[f"회사{i}" for i in range(12)], job_roles=[f"role-{i}" for i in range(10)],
+        recommended_subjects=[f"과목{i}" for i in range(12)],
+        action_items={"high_school": [f"활동 {i}" for i in range(10)], "university": [f"과제 {i}" for i in range(10)]},
+        learning_path=[{"step": i, "topic": f"단계 {i}"} for i in range(12)], limitations="한계 " * 40,
+        challenges=[f"challenge-{i}" for i in range(8)]
+    )
+
+
+def paper_item(p):
+    return {
+        "id": p.id, "title": p.title, "authors": p.authors, "lab_id": p.lab_id,
+        "publication_year": p.publication_year, "venue": p.venue, "citation_count": p.citation_count,
+        "keywords": p.keywords
+    }
+
+
+def analysis_item(a):
+    return {
+        name: getattr(a, name)
+        for name in ("easy_summary", "technical_summary", "core_technologies", "required_skills", "math_concepts",
+                     "application_fields", "industry_relevance", "career_paths", "recommended_companies",
+                     "job_roles", "recommended_subjects", "action_items", "learning_path", "limitations",
+                     "challenges")
+    }
+
+
+def build_responses(papers, analysis, fragments):
+    """라우트별 응답 본문 생성 함수 (fragments가 None이면 기존 방식)"""
+    def paper(p):
+        if fragments is None:
+            return paper_item(p)
+        return fragments.encode("paper_summary", p.id, p.updated_at, lambda: paper_item(p))
+
+    def paper_analysis():
+        body = analysis_item(analysis) if fragments is None else fragments.encode(
+            "analysis", analysis.id, analysis.analyzed_at, lambda: analysis_item(analysis))
+        return {"paper_id": papers[0].id, "title": papers[0].title, "authors": papers[0].authors, "analysis": body}
+
+    def department_research():
+        return {
+            "department": {"id": "dept-1", "name": "Computer Science", "name_ko": "컴퓨터공학과", "website": None},
+            "professors": [
+                {"id": f"prof-{i}", "name": f"Prof {i}", "name_ko": f"교수{i}", "email": f"p{i}@example.ac.kr",
+                 "profile_url": None, "research_interests": [f"관심분야{j}" for j in range(5)]}
+                for i in range(40)
+            ],
+            "laboratories": [
+                {"id": f"lab-{i}", "name": f"Lab {i}", "description": "연구실 소개 " * 20, "professor_name": f"Prof {i}"}
+                for i in range(20)
+            ]
+        }
+
+    def report():
+        return {
+            "id": "report-1", "user_id": "user-1", "status": ReportStatus.SENT.value, "sent_at": NOW.isoformat(),
+            "content": "## 맞춤 리포트\n" + "연구 내용을 쉽게 풀어쓴 문단입니다. " * 600, "report_type": "research_path",
+            "papers": [
+                {"paper_id": p.id, "title": p.title, "authors": p.authors, "publication_year": p.publication_year,
+                 "venue": p.venue, "order": i}
+                for i, p in enumerate(papers[:10])
+            ],
+            "professors": [
+                {"professor_id": f"prof-{i}", "name": f"Prof {i}", "name_ko": f"교수{i}",
+                 "relevance_score": 0.9 - i / 100, "reason": "관심 분야가 일치합니다. " * 5}
+                for i in range(10)
+            ]
+        }
+
+    return {
+        "/papers (100건)": lambda: {"total_count": len(papers), "next_cursor": "abc",
+                                   "items": [paper(p) for p in papers]},
+        "/papers/{id}/analysis": paper_analysis,
+        "/departments/{id}/research": department_research,
+        "/reports/{id}": report,
+    }
+
+
+def legacy_render(body):
+    return JSONResponse(content=jsonable_encoder(body)).body
+
+
+def cpu_per_request(build, render, requests):
+    """요청당 CPU 시간 (마이크로초)"""
+    render(build())  # 조각 캐시 채우기
+    start = time.process_time()
+    for _ in range(requests):
+        render(build())
+    return (time.process_time() - start) / requests * 1e6
+
+
+def main():
+    parser = ArgumentParser(description="API 응답 직렬화 CPU 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    papers = make_papers(100)
+    analysis = make_analysis()
+    orjson_module = serialization.orjson
+
+    modes = [("기존", None, legacy_render), ("dumps(json)", False, dumps)]
+    if orjson_module is not None:
+        modes.append(("dumps(orjson)", True, dumps))
+    else:
+        print("orjson이 설치되어 있지 않아 dumps(orjson)은 건너뜁니다")
+
+    results = {}
+    for mode, use_orjson, render in modes:
+        serialization.orjson = orjson_module if use_orjson else None
+        fragments = None if use_orjson is None else FragmentCache()
+        for route, build in build_responses(papers, analysis, fragments).items():
+            results.setdefault(route, {})[mode] = cpu_per_request(build, render, args.requests)
+    serialization.orjson = orjson_module
+
+    names = [mode for mode, _, _ in modes]
+    print(f"\n--- 요청당 CPU 시간 (µs), 요청 {args.requests}회 ---")
+    print(f"{'라우트':<28}" + "".join(f"{name:>16}" for name in names) + f"{'개선':>10}")
+    for route, timings in results.items():
+        speedup = timings["기존"] / timings[names[-1]]
+        print(f"{route:<28}" + "".join(f"{timings[name]:>16.1f}" for name in names) + f"{speedup:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
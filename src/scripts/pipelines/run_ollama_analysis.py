@@ -25,7 +25,9 @@ from src.domain.models import (
 )
 
 # Services
+from src.services.hierarchy_snapshot import register_snapshot_hooks
 from src.services.llm import OllamaLLM
+from src.services.response_cache import register_invalidation_hooks
 from src.core.logging import get_logger, setup_logging
 
 # Schemas
@@ -39,6 +41,10 @@ logger = get_logger(__name__)
 DATABASE_URL = "sqlite:///./univ_insight.db"
 engine = create_engine(DATABASE_URL, echo=False)
 SessionLocal = sessionmaker(bind=engine)
+# 새 분석이 대학 트리의 연구 미리보기에 반영되도록 스냅샷 변경 감지
+register_snapshot_hooks(SessionLocal)
+# 커밋한 분석의 API 응답 캐시 무효화 (공유 저장소를 통해 API 프로세스에 전달)
+register_invalidation_hooks(SessionLocal)
 
 
 def _convert_to_pydantic_schema(orm_paper: ResearchPaper) -> PydanticResearchPaper:
@@ -3,6 +3,8 @@ import sqlite3
 from datetime import datetime
 from typing import List, Dict
 
+from sqlalchemy import MetaData, Table, create_engine
+
 # 상위 디렉토리의 모듈을 import 하기 위해 sys.path에 추가
 import sys
 import os
@@ -11,6 +13,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.services.career_api_client import CareerAPIClient
+from src.services.bulk_ingest import bulk_upsert
 
 
 class SeedGenerator:
@@ -65,6 +68,7 @@ class SeedGenerator:
     def save_seeds_to_db(self, seeds: List[Dict]):
         """
         수집한 Seed를 데이터베이스에 저장합니다. 중복된 데이터는 무시합니다.
+        (university_name, department_name) 기준 일괄 INSERT ... ON CONFLICT DO NOTHING
 
         Args:
             seeds (List[Dict]): 저장할 대학/학과 정보 리스트
@@ -86,40 +90,39 @@ class SeedGenerator:
         except sqlite3.OperationalError:
             pass
 
-        inserted_count = 0
-        skipped_count = 0
-        for seed in seeds:
-            try:
-                cursor.execute("""
-                    INSERT INTO crawl_targets (
-                        university_name, university_name_ko,
-                        college_name,
-                        department_name, department_name_ko,
-                        category, status, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    seed.get("schoolName"),
-                    seed.get("schoolNameKo", seed.get("schoolName")),
-                    seed.get("majorName"),
-                    seed.get("departmentName"),
-                    seed.get("departmentNameKo", seed.get("departmentName")),
-                    seed.get("majorGroup"),
-                    'Ready',
-                    datetime.now(),
-                    datetime.now()
-                ))
-                inserted_count += 1
-            except sqlite3.IntegrityError:
-                # 중복 데이터일 경우 건너뜁니다.
-                skipped_count += 1
-            except Exception as e:
-                print(f"DB 저장 중 오류 발생: {e}")
-                skipped_count += 1
-        
         conn.commit()
         conn.close()
 
-        print(f"💾 DB 저장 완료: {inserted_count}개 신규 저장, {skipped_count}개 중복/오류로 건너뜀.")
+        now = datetime.now()
+        rows = (
+            {
+                "university_name": seed.get("schoolName"),
+                "university_name_ko": seed.get("schoolNameKo", seed.get("schoolName")),
+                "college_name": seed.get("majorName"),
+                "department_name": seed.get("departmentName"),
+                "department_name_ko": seed.get("departmentNameKo", seed.get("departmentName")),
+                "category": seed.get("majorGroup"),
+                "status": 'Ready',
+                "created_at": now,
+                "updated_at": now,
+            }
+            for seed in seeds
+        )
+
+        engine = create_engine(f"sqlite:///{self.db_path}")
+        try:
+            crawl_targets = Table("crawl_targets", MetaData(), autoload_with=engine)
+            with engine.begin() as connection:
+                # 키(학교명, 학과명)가 없는 Seed와 이미 저장된 Seed는 건너뜁니다.
+                report = bulk_upsert(
+                    connection, crawl_targets, rows,
+                    key=["university_name", "department_name"], update_columns=()
+                )
+        finally:
+            engine.dispose()
+
+        print(f"💾 DB 저장 완료: {report.inserted}개 신규 저장, {report.skipped}개 중복/오류로 건너뜀.")
+        return report
 
     def run(self, categories: List[str]):
         """
@@ -10,6 +10,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from src.core.database import SessionLocal, init_db
 from src.domain.models import University, College, Department, UniversityTier
 from src.services.careernet_client import CareerNetClient
+from src.services.bulk_ingest import bulk_upsert
+from src.services.hierarchy_snapshot import rebuild_snapshots
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,117 +44,104 @@ UNIV_ID_MAP = {
 def get_univ_id(name: str) -> str:
     return UNIV_ID_MAP.get(name, f"univ-{slugify(name)}")
 
-def sync_data():
+# Category -> English slug used in college IDs
+CAT_MAP = {
+    "공학계열": "engineering",
+    "자연계열": "natural-science",
+    "의학계열": "medicine",
+    "인문계열": "humanities",
+    "사회계열": "social-sciences",
+    "교육계열": "education",
+    "예체능계열": "arts-sports"
+}
+
+def build_rows(info):
+    """
+    Turn one CareerNet university record into university / college / department rows.
+    Colleges are derived from department categories.
+    """
+    univ_id = get_univ_id(info.name)
+    university = {
+        "id": univ_id,
+        "name": info.name,
+        "name_ko": info.name, # Assuming input name is KO
+        "url": info.url,
+        "location": info.region,
+        "tier": UniversityTier.TOP # Default to TOP for these targets
+    }
+
+    colleges = {}
+    departments = []
+    for dept_info in info.departments:
+        category = dept_info.category or "General"
+
+        # College ID: univ_id + category slug
+        # e.g., seoul-national-univ-col-engineering
+        cat_eng = CAT_MAP.get(category, slugify(category))
+        college_id = f"{univ_id}-col-{cat_eng}"
+        colleges.setdefault(college_id, {
+            "id": college_id,
+            "university_id": univ_id,
+            "name": f"College of {category}", # Placeholder English name
+            "name_ko": f"{category} 대학", # Placeholder Korean name
+        })
+
+        # ID: univ_id + dept slug
+        departments.append({
+            "id": f"{univ_id}-dept-{slugify(dept_info.department_name)}",
+            "college_id": college_id,
+            "name": dept_info.department_name, # Use KO name for both for now if EN unknown
+            "name_ko": dept_info.department_name,
+            "description": f"{dept_info.department_name} at {info.name}"
+        })
+
+    return university, list(colleges.values()), departments
+
+def sync_data(targets=None):
     """
     Syncs University and Department data from CareerNet API (or Mock) to DB.
+
+    All records are fetched first and then written with one batched upsert
+    per table: universities refresh url/location, existing colleges and
+    departments are left untouched.
     """
     db = SessionLocal()
     client = CareerNetClient()
     
     # Target Universities
-    targets = ["서울대학교", "KAIST", "연세대학교", "고려대학교"]
+    targets = targets or ["서울대학교", "KAIST", "연세대학교", "고려대학교"]
     
     try:
         # Ensure tables exist
         init_db()
-        
+
+        universities, colleges, departments = [], [], []
         for univ_name in targets:
             logger.info(f"Syncing {univ_name}...")
             
-            # 1. Fetch Data
             info = client.search_university(univ_name)
             if not info:
                 logger.warning(f"Could not find info for {univ_name}")
                 continue
-                
-            # 2. Upsert University
-            univ_id = get_univ_id(info.name)
-            
-            univ = db.query(University).filter_by(id=univ_id).first()
-            if not univ:
-                univ = University(
-                    id=univ_id,
-                    name=info.name,
-                    name_ko=info.name, # Assuming input name is KO
-                    url=info.url,
-                    location=info.region,
-                    tier=UniversityTier.TOP # Default to TOP for these targets
-                )
-                db.add(univ)
-                logger.info(f"Created University: {univ.name}")
-            else:
-                # Update fields if needed
-                univ.url = info.url
-                univ.location = info.region
-                logger.info(f"Updated University: {univ.name}")
-            
-            db.flush() # To get univ.id if generated (though we set it manually)
-            
-            # 3. Process Departments
-            # Group by Category to create Colleges
-            # Map: Category -> College Object
-            college_map = {}
-            
-            for dept_info in info.departments:
-                category = dept_info.category or "General"
-                
-                # College ID: univ_id + category slug
-                # e.g., seoul-national-univ-col-engineering
-                cat_slug = slugify(category)
-                # English mapping for categories could be better, but using slug for now
-                # "공학계열" -> "gonghak-gyeyeol" (Not pretty, but functional)
-                # Better: Map "공학계열" -> "engineering"
-                
-                CAT_MAP = {
-                    "공학계열": "engineering",
-                    "자연계열": "natural-science",
-                    "의학계열": "medicine",
-                    "인문계열": "humanities",
-                    "사회계열": "social-sciences",
-                    "교육계열": "education",
-                    "예체능계열": "arts-sports"
-                }
-                cat_eng = CAT_MAP.get(category, cat_slug)
-                
-                college_id = f"{univ_id}-col-{cat_eng}"
-                
-                if college_id not in college_map:
-                    # Check DB
-                    college = db.query(College).filter_by(id=college_id).first()
-                    if not college:
-                        college = College(
-                            id=college_id,
-                            university_id=univ.id,
-                            name=f"College of {category}", # Placeholder English name
-                            name_ko=f"{category} 대학", # Placeholder Korean name
-                        )
-                        db.add(college)
-                        logger.info(f"  Created College: {college.name_ko}")
-                    college_map[college_id] = college
-                
-                college = college_map[college_id]
-                
-                # Upsert Department
-                # ID: univ_id + dept slug
-                dept_slug = slugify(dept_info.department_name)
-                dept_id = f"{univ_id}-dept-{dept_slug}"
-                
-                dept = db.query(Department).filter_by(id=dept_id).first()
-                if not dept:
-                    dept = Department(
-                        id=dept_id,
-                        college_id=college.id,
-                        name=dept_info.department_name, # Use KO name for both for now if EN unknown
-                        name_ko=dept_info.department_name,
-                        description=f"{dept_info.department_name} at {univ.name}"
-                    )
-                    db.add(dept)
-                    logger.info(f"    Created Dept: {dept.name}")
-                else:
-                    pass # Already exists
-            
+
+            university, univ_colleges, univ_departments = build_rows(info)
+            universities.append(university)
+            colleges.extend(univ_colleges)
+            departments.extend(univ_departments)
+
+        reports = {
+            "universities": bulk_upsert(db, University, universities, key=["id"], update_columns=["url", "location"]),
+            "colleges": bulk_upsert(db, College, colleges, key=["id"], update_columns=()),
+            "departments": bulk_upsert(db, Department, departments, key=["id"], update_columns=()),
+        }
         db.commit()
+        for name, report in reports.items():
+            logger.info(f"  {name}: {report.to_dict()}")
+
+        # Refresh the precomputed /universities/{id}/tree snapshots
+        rebuild_snapshots(db, [u["id"] for u in universities])
         logger.info("Sync completed successfully!")
+        return reports
         
     except Exception as e:
         logger.error(f"Sync failed: {e}")
@@ -0,0 +1,249 @@
+"""
+워커 풀 자동 스케일링 컨트롤러
+
+주요 기능:
+1. 측정 신호 기반 스케일링 (처리량, 호스트별 동시성 포화, CPU/RSS 여유, 이벤트 루프 지연)
+2. 연속 관측 횟수 기반 히스테리시스 + 스케일 업/다운 쿨다운
+3. 처리량이 늘지 않으면 추가 스케일 업 보류 (포화 감지)
+"""
+
+import asyncio
+import logging
+import os
+import resource
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScalingSignals:
+    """한 번의 스케일링 판단에 쓰는 측정값"""
+    active_workers: int
+    busy_workers: int
+    pending: int
+    dispatchable: int  # 호스트별 동시성 상한을 반영한 즉시 처리 가능 작업 수
+    throughput: float  # 완료 작업/초
+    cpu_percent: float  # 프로세스 CPU 사용률 (코어 수로 정규화)
+    rss_mb: float
+    loop_lag_ms: float
+
+    @property
+    def utilization(self) -> float:
+        return self.busy_workers / max(self.active_workers, 1)
+
+
+@dataclass
+class ScalingDecision:
+    """스케일링 판단 결과"""
+    delta: int  # 양수=추가, 음수=드레인, 0=유지
+    reason: str
+
+
+class ResourceSampler:
+    """CPU/RSS/이벤트 루프 지연 측정 (표준 라이브러리만 사용)"""
+
+    def __init__(self, lag_interval: float = 0.5):
+        """
+        초기화
+
+        Args:
+            lag_interval: 이벤트 루프 지연 측정 간격 (초)
+        """
+        self.lag_interval = lag_interval
+        self.loop_lag_ms = 0.0
+        self._last_cpu = time.process_time()
+        self._last_wall = time.monotonic()
+        self._lag_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """이벤트 루프 지연 측정 시작"""
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = asyncio.create_task(self._lag_loop())
+
+    def stop(self):
+        """측정 중지"""
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+
+    async def _lag_loop(self):
+        """예정 시각보다 늦게 깨어난 만큼을 지연으로 기록 (지수 이동 평균)"""
+        while True:
+            expected = time.monotonic() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            lag_ms = max(time.monotonic() - expected, 0.0) * 1000
+            self.loop_lag_ms = 0.8 * self.loop_lag_ms + 0.2 * lag_ms
+
+    def cpu_percent(self) -> float:
+        """직전 호출 이후 프로세스 CPU 사용률"""
+        cpu, wall = time.process_time(), time.monotonic()
+        used = (cpu - self._last_cpu) / max(wall - self._last_wall, 1e-6)
+        self._last_cpu, self._last_wall = cpu, wall
+        return used / (os.cpu_count() or 1) * 100
+
+    @staticmethod
+    def rss_mb() -> float:
+        """현재 RSS (리눅스가 아니면 최대 RSS로 대체)"""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (OSError, ValueError, IndexError):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class AutoScaler:
+    """
+    측정 신호 기반 스케일링 컨트롤러
+
+    스케일 업은 (1) 즉시 처리 가능한 작업이 워커당 up_backlog개를 넘는 상태가
+    up_samples번 연속 관측되고 (2) CPU/RSS/루프 지연에 여유가 있으며 (3) 직전
+    스케일 업 이후 처리량이 min_gain 이상 늘었을 때만 한다. 스케일 다운은 가동률이
+    down_utilization 아래인 상태가 down_samples번 연속일 때 한 번에 하나씩 드레인한다.
+    """
+
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        up_backlog: float = 2.0,
+        down_utilization: float = 0.3,
+        up_samples: int = 2,
+        down_samples: int = 3,
+        up_cooldown: float = 30.0,
+        down_cooldown: float = 120.0,
+        max_step: int = 4,
+        min_gain: float = 0.1,
+        cpu_limit: float = 85.0,
+        rss_limit_mb: float = 4096.0,
+        lag_limit_ms: float = 200.0,
+    ):
+        """
+        초기화
+
+        Args:
+            min_workers: 최소 워커 수
+            max_workers: 최대 워커 수
+            up_backlog: 스케일 업 기준 워커당 처리 가능 대기 작업 수
+            down_utilization: 스케일 다운 기준 가동률 (작업 중인 워커 비율)
+            up_samples: 스케일 업 전 필요한 연속 관측 횟수
+            down_samples: 스케일 다운 전 필요한 연속 관측 횟수
+            up_cooldown: 스케일 변경 후 다음 스케일 업까지 최소 간격 (초)
+            down_cooldown: 스케일 변경 후 다음 스케일 다운까지 최소 간격 (초)
+            max_step: 한 번에 추가할 최대 워커 수
+            min_gain: 스케일 업 후 기대하는 최소 처리량 증가율 (미달 시 추가 확장 보류)
+            cpu_limit: 이 CPU 사용률(%) 이상이면 스케일 업 안 함
+            rss_limit_mb: 이 RSS(MB) 이상이면 스케일 업 안 함
+            lag_limit_ms: 이 이벤트 루프 지연(ms) 이상이면 스케일 업 안 함
+        """
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.up_backlog = up_backlog
+        self.down_utilization = down_utilization
+        self.up_samples = up_samples
+        self.down_samples = down_samples
+        self.up_cooldown = up_cooldown
+        self.down_cooldown = down_cooldown
+        self.max_step = max_step
+        self.min_gain = min_gain
+        self.cpu_limit = cpu_limit
+        self.rss_limit_mb = rss_limit_mb
+        self.lag_limit_ms = lag_limit_ms
+
+        self.sampler = ResourceSampler()
+        self._up_streak = 0
+        self._down_streak = 0
+        self._last_change = float("-inf")
+        self._throughput_at_scale_up: Optional[float] = None
+        self._last_completed: Optional[int] = None
+        self._last_sample_time: Optional[float] = None
+
+        self.last_signals: Optional[ScalingSignals] = None
+        self.last_decision: Optional[ScalingDecision] = None
+
+    def measure_throughput(self, completed_total: int, now: Optional[float] = None) -> float:
+        """누적 완료 수로부터 직전 측정 이후 처리량(작업/초) 계산"""
+        now = time.monotonic() if now is None else now
+        throughput = 0.0
+        if self._last_completed is not None and now > self._last_sample_time:
+            throughput = (completed_total - self._last_completed) / (now - self._last_sample_time)
+        self._last_completed, self._last_sample_time = completed_total, now
+        return throughput
+
+    def decide(self, signals: ScalingSignals, now: Optional[float] = None) -> ScalingDecision:
+        """측정값으로 스케일링 판단"""
+        now = time.monotonic() if now is None else now
+        self.last_signals = signals
+        decision = self._decide(signals, now)
+        if decision.delta > 0:
+            self._throughput_at_scale_up = signals.throughput
+        if decision.delta != 0:
+            self._last_change = now
+            self._up_streak = self._down_streak = 0
+        self.last_decision = decision
+        return decision
+
+    def _decide(self, s: ScalingSignals, now: float) -> ScalingDecision:
+        backlog_per_worker = s.dispatchable / max(s.active_workers, 1)
+        wants_up = backlog_per_worker > self.up_backlog and s.active_workers < self.max_workers
+        wants_down = (
+            s.utilization < self.down_utilization
+            and s.dispatchable == 0
+            and s.active_workers > self.min_workers
+        )
+        self._up_streak = self._up_streak + 1 if wants_up else 0
+        self._down_streak = self._down_streak + 1 if wants_down else 0
+
+        if s.active_workers < self.min_workers:
+            return ScalingDecision(self.min_workers - s.active_workers, "최소 워커 수 미달")
+
+        if (
+            not wants_up
+            and s.pending / max(s.active_workers, 1) > self.up_backlog
+            and s.active_workers < self.max_workers
+        ):
+            return ScalingDecision(0, "대기 작업이 동시성 상한에 걸린 호스트에 몰려 있음")
+
+        if wants_up:
+            if self._up_streak < self.up_samples:
+                return ScalingDecision(0, f"스케일 업 관측 중 ({self._up_streak}/{self.up_samples})")
+            if now - self._last_change < self.up_cooldown:
+                return ScalingDecision(0, "스케일 업 쿨다운")
+            if s.cpu_percent >= self.cpu_limit:
+                return ScalingDecision(0, f"CPU 여유 없음 ({s.cpu_percent:.0f}%)")
+            if s.rss_mb >= self.rss_limit_mb:
+                return ScalingDecision(0, f"메모리 여유 없음 ({s.rss_mb:.0f}MB)")
+            if s.loop_lag_ms >= self.lag_limit_ms:
+                return ScalingDecision(0, f"이벤트 루프 지연 ({s.loop_lag_ms:.0f}ms)")
+            if (
+                self._throughput_at_scale_up is not None
+                and s.throughput < self._throughput_at_scale_up * (1 + self.min_gain)
+            ):
+                return ScalingDecision(0, f"처리량 정체 ({s.throughput:.2f}/초) - 추가 확장 보류")
+
+            step = min(
+                self.max_step,
+                self.max_workers - s.active_workers,
+                max(int(s.dispatchable // self.up_backlog) - s.active_workers, 1),
+            )
+            return ScalingDecision(step, f"처리 가능 대기 작업 {s.dispatchable}개")
+
+        if wants_down:
+            if self._down_streak < self.down_samples:
+                return ScalingDecision(0, f"스케일 다운 관측 중 ({self._down_streak}/{self.down_samples})")
+            if now - self._last_change < self.down_cooldown:
+                return ScalingDecision(0, "스케일 다운 쿨다운")
+            # 유휴 상태가 되면 처리량 기준점도 초기화
+            self._throughput_at_scale_up = None
+            return ScalingDecision(-1, f"가동률 {s.utilization:.0%}")
+
+        return ScalingDecision(0, "유지")
+
+    def get_stats(self) -> Dict:
+        """최근 측정값과 판단"""
+        return {
+            "signals": asdict(self.last_signals) if self.last_signals else None,
+            "decision": asdict(self.last_decision) if self.last_decision else None,
+        }
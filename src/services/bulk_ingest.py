@@ -0,0 +1,267 @@
+"""
+대량 적재 유틸리티 (CSV/JSON → DB)
+
+주요 기능:
+1. CSV / JSON(배열 또는 JSON Lines) 스트리밍 읽기 (파일 전체를 메모리에 올리지 않음)
+2. 키 기준 일괄 upsert (INSERT ... ON CONFLICT, executemany 배치)
+3. 배치마다 기존 행을 한 번에 조회해 신규/변경/동일 행 구분 (행 단위 존재 확인 없음)
+4. 최초 대량 적재 시 보조 인덱스 생성 지연 (적재 후 재생성)
+5. 적재 결과 보고 (inserted / updated / skipped)
+"""
+
+import csv
+import json
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from sqlalchemy import Table, bindparam, insert, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.services.hierarchy_snapshot import mark_snapshots_stale
+from src.services.response_cache import mark_changed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+JSON_READ_CHUNK = 64 * 1024
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+@dataclass
+class IngestReport:
+    """적재 결과"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0  # 키 누락, 배치 내 중복, 변경 없음, (update 미지정 시) 기존 행
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.skipped
+
+    def __iadd__(self, other: "IngestReport") -> "IngestReport":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.skipped += other.skipped
+        return self
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"inserted": self.inserted, "updated": self.updated, "skipped": self.skipped}
+
+    def __str__(self) -> str:
+        return f"{self.inserted}개 신규, {self.updated}개 갱신, {self.skipped}개 건너뜀"
+
+
+# ===================== 스트리밍 읽기 =====================
+
+def iter_csv(path: str, encoding: str = "utf-8-sig") -> Iterator[Dict[str, str]]:
+    """CSV 파일을 한 행씩 dict로 반환 (공공데이터 CSV의 BOM 처리 포함)"""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_json(path: str, encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    JSON 파일을 한 항목씩 반환
+
+    최상위가 배열이면 원소를, 아니면 JSON Lines(줄마다 하나의 값)로 읽는다.
+    배열도 청크 단위로 디코딩하므로 파일 크기와 무관하게 메모리 사용량이 일정하다.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding=encoding) as f:
+        buffer = f.read(JSON_READ_CHUNK).lstrip()
+        if not buffer.startswith("["):
+            # JSON Lines
+            f.seek(0)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip().lstrip(",").lstrip()
+            if buffer.startswith("]"):
+                return
+            try:
+                value, end = decoder.raw_decode(buffer)
+                # 버퍼 끝까지 읽은 숫자 등은 다음 청크에서 이어질 수 있음
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                # 값이 청크 경계에 걸림 - 더 읽어서 재시도
+                chunk = f.read(JSON_READ_CHUNK)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield value
+            buffer = buffer[end:]
+
+
+def batched(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """size개씩 묶어서 반환"""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ===================== 인덱스 생성 지연 =====================
+
+@contextmanager
+def deferred_indexes(connection, table: Table):
+    """
+    블록 안에서 보조 인덱스를 제거했다가 끝나면 다시 생성
+
+    UNIQUE 인덱스는 ON CONFLICT 대상이 될 수 있으므로 유지한다.
+    빈 테이블에 대량 적재할 때 행마다 인덱스를 갱신하는 비용을 없애는 용도.
+    """
+    indexes = [index for index in table.indexes if not index.unique]
+    for index in indexes:
+        index.drop(connection, checkfirst=True)
+    try:
+        yield
+    finally:
+        for index in indexes:
+            index.create(connection, checkfirst=True)
+        if indexes:
+            logger.info(f"🗂️  {table.name}: 인덱스 {len(indexes)}개 재생성")
+
+
+# ===================== upsert =====================
+
+def _key_of(row: Dict, key: Sequence[str]):
+    return tuple(row.get(name) for name in key)
+
+
+def _existing_rows(connection, table: Table, key: Sequence[str], columns: Sequence[str], keys: List[tuple]):
+    """배치의 키에 해당하는 기존 행 (키 → 비교할 컬럼 값)"""
+    key_cols = [table.c[name] for name in key]
+    condition = key_cols[0].in_([k[0] for k in keys]) if len(key) == 1 else tuple_(*key_cols).in_(keys)
+    query = table.select().with_only_columns(*key_cols, *(table.c[name] for name in columns)).where(condition)
+    return {tuple(row[:len(key)]): tuple(row[len(key):]) for row in connection.execute(query)}
+
+
+def _write(connection, table: Table, key: Sequence[str], update_columns: Sequence[str],
+           new_rows: List[Dict], changed_rows: List[Dict]):
+    insert_fn = _INSERTS.get(connection.dialect.name)
+    if insert_fn is not None:
+        stmt = insert_fn(table)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key),
+                set_={name: stmt.excluded[name] for name in update_columns}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(key))
+        rows = new_rows + changed_rows
+        if rows:
+            connection.execute(stmt, rows)
+        return
+
+    # ON CONFLICT 미지원 DB: 신규는 INSERT, 변경분은 키 조건 UPDATE (각각 executemany)
+    if new_rows:
+        connection.execute(insert(table), new_rows)
+    if changed_rows:
+        stmt = (
+            update(table)
+            .where(*(table.c[name] == bindparam(f"_key_{name}") for name in key))
+            .values({name: bindparam(f"_set_{name}") for name in update_columns})
+        )
+        connection.execute(stmt, [
+            {**{f"_key_{n}": row[n] for n in key}, **{f"_set_{n}": row.get(n) for n in update_columns}}
+            for row in changed_rows
+        ])
+
+
+def bulk_upsert(
+    connection,
+    table: Union[Table, type],
+    rows: Iterable[Dict],
+    key: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    defer_indexes: bool = False
+) -> IngestReport:
+    """
+    키 기준 일괄 upsert
+
+    배치마다 기존 행을 한 번의 IN 조회로 가져와 비교한 뒤,
+    신규 행과 값이 바뀐 행만 INSERT ... ON CONFLICT로 기록한다.
+    커밋은 호출자가 한다 (하나의 트랜잭션으로 적재하는 것이 가장 빠름).
+
+    Args:
+        connection: Connection 또는 Session
+        table: 테이블 또는 ORM 모델
+        rows: 적재할 행 (스트리밍 가능한 iterable)
+        key: 충돌 판정 컬럼 (UNIQUE 또는 PK)
+        update_columns: 기존 행에서 갱신할 컬럼
+            (None: 키를 제외한 행의 모든 컬럼, 빈 값: 기존 행은 건너뜀)
+        batch_size: 배치당 행 수
+        defer_indexes: 적재 동안 보조 인덱스 제거 후 재생성
+
+    Returns:
+        IngestReport
+    """
+    table = getattr(table, "__table__", table)
+    # 세션이면 세션의 트랜잭션에 참여하는 Connection 사용 (응답 캐시는 세션 커밋 시 무효화)
+    session = connection if isinstance(connection, Session) else None
+    connection = session.connection() if session is not None else connection
+    key = list(key)
+    report = IngestReport()
+
+    def run():
+        for batch in batched(rows, batch_size):
+            # 키 누락 행 제외, 배치 내 중복 키는 마지막 행 우선
+            unique: Dict[tuple, Dict] = {}
+            for row in batch:
+                row_key = _key_of(row, key)
+                if any(value is None for value in row_key):
+                    report.skipped += 1
+                    continue
+                if row_key in unique:
+                    report.skipped += 1
+                unique[row_key] = row
+            if not unique:
+                continue
+
+            columns = (
+                [name for name in next(iter(unique.values())) if name not in key]
+                if update_columns is None else list(update_columns)
+            )
+            existing = _existing_rows(connection, table, key, columns, list(unique))
+
+            new_rows, changed_rows = [], []
+            for row_key, row in unique.items():
+                if row_key not in existing:
+                    new_rows.append(row)
+                elif columns and tuple(row.get(name) for name in columns) != existing[row_key]:
+                    changed_rows.append(row)
+                else:
+                    report.skipped += 1
+
+            _write(connection, table, key, columns, new_rows, changed_rows)
+            mark_snapshots_stale(connection, [(table, new_rows + changed_rows)])
+            if session is not None:
+                mark_changed(session, table, new_rows + changed_rows)
+            report.inserted += len(new_rows)
+            report.updated += len(changed_rows)
+
+    if defer_indexes:
+        with deferred_indexes(connection, table):
+            run()
+    else:
+        run()
+
+    logger.info(f"💾 {table.name} 적재 완료: {report}")
+    return report
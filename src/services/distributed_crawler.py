@@ -6,6 +6,8 @@
 2. 워커 풀 관리
 3. 자동 스케일링
 4. 실시간 모니터링
+5. 유실 작업 회수 (임대 만료)
+6. 멀티 프로세스 모드 (CPU 코어별 워커 풀 샤딩)
 """
 
 import asyncio
@@ -15,6 +17,7 @@ from datetime import datetime
 
 from src.services.task_queue import CrawlTask, get_task_queue, TaskPriority
 from src.services.worker_pool import WorkerPool
+from src.services.process_pool import ProcessWorkerPool
 from src.services.monitoring import (
     get_metrics_collector,
     get_health_checker,
@@ -35,6 +38,11 @@ class DistributedCrawler:
         min_workers: int = 1,
         max_workers: int = 10,
         auto_scale_interval: int = 30,
+        reap_interval: int = 30,
+        fair_key: Optional[str] = None,
+        per_key_concurrency: int = 0,
+        freshness_seconds: int = 0,
+        num_processes: int = 1,
     ):
         """
         초기화
@@ -45,18 +53,40 @@ class DistributedCrawler:
             min_workers: 최소 워커 수
             max_workers: 최대 워커 수
             auto_scale_interval: 자동 스케일링 간격 (초)
+            reap_interval: 임대 만료 작업 회수 간격 (초)
+            fair_key: 공정 스케줄링 기준 ("university", "host", None=우선순위 순서만)
+            per_key_concurrency: 대학/호스트별 동시 실행 작업 상한 (0=무제한)
+            freshness_seconds: 같은 URL 재제출 시 완료 결과를 재사용하는 시간 (초, 0=재사용 안 함)
+            num_processes: 워커 프로세스 수 (1=단일 프로세스, 0 이하=CPU 코어 수)
         """
         self.database = database
-        self.task_queue = get_task_queue()
-        self.worker_pool = WorkerPool(
-            self.task_queue,
-            database,
-            num_workers=num_workers,
-            min_workers=min_workers,
-            max_workers=max_workers,
-        )
+        queue_kwargs = {
+            "fair_key": fair_key,
+            "per_key_concurrency": per_key_concurrency,
+            "freshness_seconds": freshness_seconds,
+        }
+
+        if num_processes == 1:
+            self.task_queue = get_task_queue(**queue_kwargs)
+            self.worker_pool = WorkerPool(
+                self.task_queue,
+                database,
+                num_workers=num_workers,
+                min_workers=min_workers,
+                max_workers=max_workers,
+            )
+        else:
+            # 공유 큐 프록시는 initialize()에서 매니저 시작 후 연결
+            self.task_queue = None
+            self.worker_pool = ProcessWorkerPool(
+                database.db_url,
+                num_processes=num_processes,
+                workers_per_process=num_workers,
+                queue_kwargs=queue_kwargs,
+            )
 
         self.auto_scale_interval = auto_scale_interval
+        self.reap_interval = reap_interval
         self.running = False
 
         # 모니터링
@@ -69,6 +99,7 @@ class DistributedCrawler:
     async def initialize(self):
         """초기화"""
         await self.worker_pool.initialize()
+        self.task_queue = self.worker_pool.task_queue
         logger.info("✅ DistributedCrawler 초기화 완료")
 
     async def submit_task(
@@ -121,11 +152,19 @@ class DistributedCrawler:
         # 모니터링 시작
         asyncio.create_task(self._monitoring_loop())
 
-    async def stop(self):
-        """크롤러 중지"""
+        # 유실 작업 회수 시작
+        asyncio.create_task(self._reaper_loop())
+
+    async def stop(self, drain_timeout: float = 60.0):
+        """
+        크롤러 중지 (진행 중 작업을 drain_timeout초까지 마무리한 뒤 종료)
+
+        Args:
+            drain_timeout: 진행 중 작업 완료 대기 기한 (초)
+        """
         self.running = False
         logger.info("⏹️  DistributedCrawler 중지 중...")
-        await self.worker_pool.stop()
+        await self.worker_pool.stop(drain_timeout=drain_timeout)
         logger.info("✅ DistributedCrawler 중지 완료")
 
     async def _auto_scale_loop(self):
@@ -139,6 +178,17 @@ class DistributedCrawler:
             except Exception as e:
                 logger.error(f"❌ 자동 스케일링 오류: {e}")
 
+    async def _reaper_loop(self):
+        """임대 만료 작업 회수 루프"""
+        logger.info(f"♻️  유실 작업 회수 시작 (간격={self.reap_interval}초)")
+
+        while self.running:
+            try:
+                await asyncio.sleep(self.reap_interval)
+                self.task_queue.reclaim_expired_tasks()
+            except Exception as e:
+                logger.error(f"❌ 유실 작업 회수 오류: {e}")
+
     async def _monitoring_loop(self):
         """모니터링 루프"""
         logger.info("📊 모니터링 시작")
@@ -172,6 +222,14 @@ class DistributedCrawler:
         """작업 상태 조회"""
         return self.task_queue.get_task_status(task_id)
 
+    def get_task_result(self, task_id: str) -> Optional[Dict]:
+        """완료된 작업의 보관된 결과 조회 (신선도 윈도우 내)"""
+        return self.task_queue.get_task_result(task_id)
+
+    def get_running_tasks(self) -> List[Dict]:
+        """실행 중인 작업 (워커 ID, 경과 시간 포함)"""
+        return self.task_queue.get_running_tasks_info()
+
     def get_stats(self) -> Dict:
         """통계 조회"""
         worker_pool_stats = self.worker_pool.get_stats()
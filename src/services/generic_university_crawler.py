@@ -14,6 +14,7 @@ crawl4ai의 일반적인 웹 크롤링 기능으로 모든 대학을 지원합
 import asyncio
 import re
 import logging
+import time
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
@@ -27,6 +28,8 @@ except ImportError:
 from src.services.improved_info_extractor import ImprovedInfoExtractor
 from src.services.cache_service import get_cache_service
 from src.services.js_renderer import JSRendererOptimizer
+from src.services.metrics import FETCH_LATENCY
+from src.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -107,13 +110,19 @@ class GenericUniversityCrawler:
                 "<html></html>", url  # 빠른 판단용
             )
 
-            result = await asyncio.wait_for(
-                self.crawler.arun(
-                    url=url,
-                    timeout=self.timeout,
-                ),
-                timeout=self.timeout + 5
-            )
+            host = urlparse(url).netloc
+            started = time.perf_counter()
+            try:
+                with span("fetch", host=host):
+                    result = await asyncio.wait_for(
+                        self.crawler.arun(
+                            url=url,
+                            timeout=self.timeout,
+                        ),
+                        timeout=self.timeout + 5
+                    )
+            finally:
+                FETCH_LATENCY.observe(time.perf_counter() - started, host=host)
 
             if result.success:
                 html = result.html
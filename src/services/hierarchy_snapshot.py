@@ -0,0 +1,450 @@
+"""
+대학 계층 구조 스냅샷 (대학 → 단과대 → 학과 → 교수 → 연구실)
+
+주요 기능:
+1. 대학 하나의 전체 트리를 레벨당 쿼리 1회로 생성 (건수, 연구 미리보기 포함)
+2. 압축 JSON으로 hierarchy_snapshots 테이블에 저장, 내용 해시(ETag)와 버전 관리
+3. 트리에 속한 행이 바뀌면 같은 트랜잭션에서 스냅샷을 낡음으로 표시 (세션 훅, bulk_upsert),
+   낡았거나 없는 스냅샷은 다음 요청 시 재생성
+4. depth / fields 기준 트리 축소 및 결과 캐시 (/universities/{id}/tree)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.domain.models import (
+    College, Department, HierarchySnapshot, Laboratory, PaperAnalysis, Professor, ResearchPaper, University
+)
+
+logger = logging.getLogger(__name__)
+
+# 트리 레벨별 자식 목록 키 (depth=N이면 앞의 N개 레벨까지 포함)
+CHILD_KEYS = ("colleges", "departments", "professors", "laboratories")
+MAX_DEPTH = len(CHILD_KEYS)
+
+PREVIEW_LENGTH = 200
+RENDER_CACHE_SIZE = 256
+
+# 트리에 반영되는 테이블 → (상위 참조 컬럼, 상위 모델) - 대학까지 따라 올라가며 낡은 스냅샷을 찾는다
+PARENT_KEYS = {
+    University.__table__: ("id", University),
+    College.__table__: ("university_id", University),
+    Department.__table__: ("college_id", College),
+    Professor.__table__: ("department_id", Department),
+    Laboratory.__table__: ("department_id", Department),
+    ResearchPaper.__table__: ("lab_id", Laboratory),  # 연구실 논문 수, 연구 미리보기
+    PaperAnalysis.__table__: ("paper_id", ResearchPaper),  # 연구 미리보기
+}
+
+_IN_CHUNK = 500
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _count_by(db: Session, column, keys: List[str]) -> Dict[str, int]:
+    if not keys:
+        return {}
+    return dict(db.query(column, func.count()).filter(column.in_(keys)).group_by(column).all())
+
+
+def _latest_analyses(db: Session, lab_ids: List[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+    """연구실별 가장 최근에 분석된 논문의 (쉬운 주제, 설명)"""
+    if not lab_ids:
+        return {}
+    rows = (
+        db.query(ResearchPaper.lab_id, PaperAnalysis.topic_easy, PaperAnalysis.explanation)
+        .join(PaperAnalysis, PaperAnalysis.paper_id == ResearchPaper.id)
+        .filter(ResearchPaper.lab_id.in_(lab_ids), PaperAnalysis.topic_easy.isnot(None))
+        .order_by(ResearchPaper.crawled_at.desc())
+        .all()
+    )
+    latest = {}
+    for lab_id, topic_easy, explanation in rows:
+        latest.setdefault(lab_id, (topic_easy, explanation))
+    return latest
+
+
+def _research_preview(interests, labs: List[Dict], analyses: Dict) -> Dict:
+    """교수 연구 미리보기 (분석된 논문 → 연구 분야 순으로 대체)"""
+    for lab in labs:
+        if lab["id"] in analyses:
+            topic_easy, explanation = analyses[lab["id"]]
+            if explanation and len(explanation) > PREVIEW_LENGTH:
+                explanation = explanation[:PREVIEW_LENGTH] + "..."
+            return {"topic_easy": topic_easy, "explanation_preview": explanation}
+
+    if interests:
+        return {"topic_easy": ", ".join(interests[:2]), "explanation_preview": "이 분야의 연구를 진행하고 있습니다."}
+
+    return {"topic_easy": "연구 정보 준비 중", "explanation_preview": ""}
+
+
+def build_tree(db: Session, university_id: str) -> Optional[Dict]:
+    """
+    대학 하나의 전체 계층 트리 생성
+
+    레벨마다 IN 조회 한 번, 건수는 GROUP BY로 계산한다 (대학 규모와 무관하게 쿼리 수 고정).
+
+    Args:
+        db: DB 세션
+        university_id: 대학 ID
+
+    Returns:
+        트리 dict (대학이 없으면 None)
+    """
+    university = db.get(University, university_id)
+    if university is None:
+        return None
+
+    colleges = db.query(College).filter(College.university_id == university_id).order_by(College.name).all()
+    departments = (
+        db.query(Department).filter(Department.college_id.in_([c.id for c in colleges]))
+        .order_by(Department.name).all()
+    ) if colleges else []
+    professors = (
+        db.query(Professor).filter(Professor.department_id.in_([d.id for d in departments]))
+        .order_by(Professor.name).all()
+    ) if departments else []
+    laboratories = (
+        db.query(Laboratory).filter(Laboratory.professor_id.in_([p.id for p in professors]))
+        .order_by(Laboratory.name).all()
+    ) if professors else []
+
+    lab_ids = [lab.id for lab in laboratories]
+    paper_counts = _count_by(db, ResearchPaper.lab_id, lab_ids)
+    analyses = _latest_analyses(db, lab_ids)
+
+    labs_by_professor: Dict[str, List[Dict]] = {}
+    for lab in laboratories:
+        labs_by_professor.setdefault(lab.professor_id, []).append({
+            "id": lab.id,
+            "name": lab.name,
+            "name_ko": lab.name_ko,
+            "research_areas": lab.research_areas,
+            "member_count": lab.member_count,
+            "paper_count": paper_counts.get(lab.id, 0),
+        })
+
+    professors_by_department: Dict[str, List[Dict]] = {}
+    for professor in professors:
+        labs = labs_by_professor.get(professor.id, [])
+        professors_by_department.setdefault(professor.department_id, []).append({
+            "id": professor.id,
+            "name": professor.name,
+            "name_ko": professor.name_ko,
+            "title": professor.title,
+            "email": professor.email,
+            "h_index": professor.h_index,
+            "publications_count": professor.publications_count,
+            "research_interests": professor.research_interests,
+            "lab_count": len(labs),
+            "research_preview": _research_preview(professor.research_interests, labs, analyses),
+            "laboratories": labs,
+        })
+
+    departments_by_college: Dict[str, List[Dict]] = {}
+    for department in departments:
+        department_professors = professors_by_department.get(department.id, [])
+        departments_by_college.setdefault(department.college_id, []).append({
+            "id": department.id,
+            "name": department.name,
+            "name_ko": department.name_ko,
+            "faculty_count": department.faculty_count,
+            "website": department.website,
+            "professor_count": len(department_professors),
+            "professors": department_professors,
+        })
+
+    college_nodes = []
+    for college in colleges:
+        college_departments = departments_by_college.get(college.id, [])
+        college_nodes.append({
+            "id": college.id,
+            "name": college.name,
+            "name_ko": college.name_ko,
+            "department_count": len(college_departments),
+            "departments": college_departments,
+        })
+
+    return {
+        "id": university.id,
+        "name": university.name,
+        "name_ko": university.name_ko,
+        "location": university.location,
+        "ranking": university.ranking,
+        "tier": university.tier.name if university.tier else None,
+        "url": university.url,
+        "established_year": university.established_year,
+        "college_count": len(college_nodes),
+        "colleges": college_nodes,
+    }
+
+
+def rebuild_snapshot(db: Session, university_id: str) -> Optional[HierarchySnapshot]:
+    """
+    대학 스냅샷 재생성 (내용이 바뀐 경우에만 버전 증가)
+
+    Returns:
+        저장된 스냅샷 (대학이 없으면 None)
+    """
+    # 트리를 읽기 전의 change_seq - 생성 중에 커밋된 쓰기는 스냅샷을 계속 낡은 상태로 남긴다
+    change_seq = (
+        db.query(HierarchySnapshot.change_seq).filter(HierarchySnapshot.university_id == university_id).scalar()
+    ) or 0
+    tree = build_tree(db, university_id)
+    if tree is None:
+        return None
+
+    data = _dumps(tree)
+    etag = hashlib.sha256(data.encode()).hexdigest()
+
+    snapshot = db.get(HierarchySnapshot, university_id)
+    if snapshot is None:
+        snapshot = HierarchySnapshot(
+            university_id=university_id, version=1, etag=etag, data=data, change_seq=0, built_seq=change_seq
+        )
+        db.add(snapshot)
+    elif snapshot.etag != etag:
+        snapshot.version += 1
+        snapshot.etag = etag
+        snapshot.data = data
+        snapshot.built_at = datetime.utcnow()
+        snapshot.built_seq = change_seq
+    elif snapshot.built_seq != change_seq:
+        # 내용은 그대로 - 최신으로 표시만
+        snapshot.built_seq = change_seq
+    else:
+        return snapshot
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 요청이 먼저 생성함
+        db.rollback()
+        return db.get(HierarchySnapshot, university_id)
+
+    logger.info(f"🌳 계층 스냅샷 갱신: {university_id} v{snapshot.version} ({len(data):,} bytes)")
+    return snapshot
+
+
+def rebuild_snapshots(db: Session, university_ids: Optional[Iterable[str]] = None) -> int:
+    """
+    여러 대학 스냅샷 재생성 (적재/크롤링 완료 후 호출)
+
+    Args:
+        db: DB 세션
+        university_ids: 대상 대학 ID
+            (None이면 스냅샷이 이미 있는 대학 전체 - 나머지는 첫 요청 시 생성)
+
+    Returns:
+        재생성한 스냅샷 수
+    """
+    if university_ids is None:
+        university_ids = [uid for (uid,) in db.query(HierarchySnapshot.university_id)]
+    return sum(1 for uid in university_ids if rebuild_snapshot(db, uid) is not None)
+
+
+def get_snapshot_etag(db: Session, university_id: str) -> Optional[str]:
+    """
+    스냅샷의 ETag만 조회 (조건부 요청은 본문을 읽지 않음)
+
+    스냅샷이 없거나 그 뒤로 트리의 행이 바뀌었으면 재생성한다. 대학이 없으면 None.
+    """
+    row = (
+        db.query(HierarchySnapshot.etag, HierarchySnapshot.change_seq, HierarchySnapshot.built_seq)
+        .filter(HierarchySnapshot.university_id == university_id)
+        .first()
+    )
+    if row is not None and row.change_seq == row.built_seq:
+        return row.etag
+    snapshot = rebuild_snapshot(db, university_id)
+    return snapshot.etag if snapshot else None
+
+
+# ===================== 변경 감지 =====================
+
+def _parent_values(rows: Iterable, column: str) -> Set:
+    """행(dict 또는 ORM 객체)의 상위 참조 값 (ORM 객체는 변경 전 값 포함)"""
+    values = set()
+    for row in rows:
+        if isinstance(row, dict):
+            values.add(row.get(column))
+            continue
+        values.add(getattr(row, column, None))
+        state = inspect(row)
+        if column in state.attrs:
+            values.update(state.attrs[column].history.deleted)
+    values.discard(None)
+    return values
+
+
+def _university_ids(connection, pending: Dict[type, Set]) -> Set:
+    """상위 모델별 ID → 대학 ID (논문 → 연구실 → 학과 → 단과대 순으로 한 단계씩 올라가며 조회)"""
+    for model in (ResearchPaper, Laboratory, Department, College):
+        ids = list(pending.pop(model, ()))
+        column, parent = PARENT_KEYS[model.__table__]
+        for i in range(0, len(ids), _IN_CHUNK):
+            rows = connection.execute(
+                select(getattr(model, column)).where(model.id.in_(ids[i:i + _IN_CHUNK]))
+            )
+            pending.setdefault(parent, set()).update(value for (value,) in rows if value is not None)
+    return pending.get(University, set())
+
+
+def mark_snapshots_stale(connection, changes: Iterable[Tuple[object, Iterable]]):
+    """
+    바뀐 행이 속한 대학의 스냅샷을 낡음으로 표시 (쓰기와 같은 트랜잭션에서 호출)
+
+    Args:
+        connection: 쓰기 트랜잭션의 Connection
+        changes: (테이블 또는 ORM 모델, 바뀐 행) 목록 - 트리와 무관한 테이블은 무시
+    """
+    pending: Dict[type, Set] = {}
+    for table, rows in changes:
+        keys = PARENT_KEYS.get(getattr(table, "__table__", table))
+        if keys is not None:
+            column, parent = keys
+            pending.setdefault(parent, set()).update(_parent_values(rows, column))
+    if not any(pending.values()):
+        return
+    # 스냅샷이 하나도 없으면 상위 조회 생략
+    if connection.execute(select(HierarchySnapshot.university_id).limit(1)).first() is None:
+        return
+
+    university_ids = list(_university_ids(connection, pending))
+    table = HierarchySnapshot.__table__
+    for i in range(0, len(university_ids), _IN_CHUNK):
+        connection.execute(
+            update(table)
+            .where(table.c.university_id.in_(university_ids[i:i + _IN_CHUNK]))
+            .values(change_seq=table.c.change_seq + 1)
+        )
+
+
+def _after_flush(session: Session, flush_context):
+    """flush된 트리 행의 스냅샷을 낡음으로 표시 (history는 아직 flush 이전 상태)"""
+    by_table: Dict[object, List] = {}
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table in PARENT_KEYS:
+            by_table.setdefault(table, []).append(obj)
+    if by_table:
+        mark_snapshots_stale(session.connection(), by_table.items())
+
+
+def register_snapshot_hooks(session_factory):
+    """
+    세션 팩토리(sessionmaker)에 스냅샷 변경 감지 훅 등록
+
+    Args:
+        session_factory: sessionmaker 또는 Session 클래스
+    """
+    if not event.contains(session_factory, "after_flush", _after_flush):
+        event.listen(session_factory, "after_flush", _after_flush)
+
+
+def parse_fields(fields: Optional[str]) -> FrozenSet[str]:
+    """'id,name_ko,paper_count' → frozenset (빈 값이면 전체 필드)"""
+    return frozenset(f.strip() for f in (fields or "").split(",") if f.strip())
+
+
+def variant_etag(etag: str, depth: int, fields: FrozenSet[str]) -> str:
+    """depth / fields 조합별 ETag (전체 트리는 스냅샷 ETag 그대로)"""
+    if depth >= MAX_DEPTH and not fields:
+        return etag
+    variant = hashlib.sha256(f"{etag}:{depth}:{','.join(sorted(fields))}".encode()).hexdigest()
+    return variant[:32]
+
+
+def prune_tree(node: Dict, depth: int, fields: FrozenSet[str], level: int = 0) -> Dict:
+    """
+    depth 레벨까지만 남기고 fields에 있는 필드만 유지
+
+    id와 (남아 있는 레벨의) 자식 목록은 항상 포함된다.
+    """
+    child_key = CHILD_KEYS[level] if level < MAX_DEPTH else None
+    pruned = {
+        key: value for key, value in node.items()
+        if key != child_key and (not fields or key in fields or key == "id")
+    }
+    if child_key and level < depth and child_key in node:
+        pruned[child_key] = [prune_tree(child, depth, fields, level + 1) for child in node[child_key]]
+    return pruned
+
+
+class TreeRenderer:
+    """스냅샷 → 응답 본문 변환 캐시 ((ETag, depth, fields) 기준)"""
+
+    def __init__(self, max_entries: int = RENDER_CACHE_SIZE):
+        """
+        Args:
+            max_entries: 보관할 응답 본문 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, db: Session, university_id: str, etag: str, depth: int, fields: FrozenSet[str]) -> str:
+        """
+        JSON 응답 본문 반환 (전체 트리는 저장된 JSON을 그대로 사용)
+
+        Args:
+            db: DB 세션 (캐시에 없을 때만 스냅샷 본문 조회)
+            university_id: 대학 ID
+            etag: get_snapshot_etag()로 확인한 스냅샷 ETag
+            depth: 포함할 레벨 수 (0=대학 정보만)
+            fields: 남길 필드 (빈 값이면 전체)
+        """
+        key = (university_id, etag, depth, fields)
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                return body
+
+        current_etag, data = (
+            db.query(HierarchySnapshot.etag, HierarchySnapshot.data)
+            .filter(HierarchySnapshot.university_id == university_id)
+            .one()
+        )
+        if depth >= MAX_DEPTH and not fields:
+            body = data
+        else:
+            body = _dumps(prune_tree(json.loads(data), depth, fields))
+
+        if current_etag != etag:
+            # 조회 사이에 재생성됨 - 이번 응답만 사용하고 캐시하지 않음
+            return body
+        with self._lock:
+            self._entries[key] = body
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 렌더러 인스턴스
+_renderer: Optional[TreeRenderer] = None
+
+
+def get_tree_renderer() -> TreeRenderer:
+    """전역 TreeRenderer 인스턴스 획득"""
+    global _renderer
+    if _renderer is None:
+        _renderer = TreeRenderer()
+    return _renderer
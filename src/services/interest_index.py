@@ -0,0 +1,231 @@
+"""
+관심 분야 키워드 역색인 (교수 매칭용)
+
+주요 기능:
+1. 연구 분야 문자열 정규화 (NFKC + casefold, 구두점 제거)
+2. 원문 구절 + 단어 n-gram(1~3) + 한/영 별칭을 professor_keywords 테이블에 색인
+3. 세션 flush 시 Professor / Laboratory 변경분만 자동 재색인
+4. 사용자 관심사 → (term IN ...) GROUP BY 교수 상위 k명 조회
+"""
+
+import logging
+import re
+import unicodedata
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import case, delete, desc, distinct, event, func, insert, inspect
+from sqlalchemy.orm import Session
+
+from src.domain.models import Laboratory, Professor, ProfessorKeyword
+
+logger = logging.getLogger(__name__)
+
+MAX_NGRAM = 3
+MAX_TERM_LENGTH = 255
+
+# 같은 개념으로 취급할 표기 (정규화된 형태로 작성)
+ALIAS_GROUPS: List[Set[str]] = [
+    {"ai", "인공지능", "artificial intelligence"},
+    {"ml", "머신러닝", "기계학습", "machine learning"},
+    {"deep learning", "딥러닝", "심층학습"},
+    {"nlp", "자연어처리", "자연어 처리", "natural language processing"},
+    {"computer vision", "컴퓨터 비전", "컴퓨터비전", "cv"},
+    {"robotics", "로보틱스", "로봇공학", "로봇"},
+    {"reinforcement learning", "강화학습", "rl"},
+    {"data science", "데이터 과학", "데이터과학"},
+    {"big data", "빅데이터"},
+    {"security", "보안", "정보보호", "cybersecurity"},
+    {"blockchain", "블록체인"},
+    {"iot", "사물인터넷", "internet of things"},
+    {"semiconductor", "반도체"},
+    {"bioinformatics", "생물정보학", "바이오인포매틱스"},
+    {"hci", "human computer interaction", "인간 컴퓨터 상호작용"},
+    {"quantum computing", "양자컴퓨팅", "양자 컴퓨팅"},
+    {"economics", "경제학"},
+    {"finance", "금융", "재무"},
+    {"marketing", "마케팅"},
+]
+
+_ALIASES: Dict[str, Set[str]] = {term: group for group in ALIAS_GROUPS for term in group}
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """대소문자/전각/구두점 차이를 없앤 비교용 문자열"""
+    text = unicodedata.normalize("NFKC", str(text)).casefold()
+    return " ".join(_NON_WORD.sub(" ", text).replace("_", " ").split())[:MAX_TERM_LENGTH]
+
+
+def _with_aliases(terms: Iterable[str]) -> Set[str]:
+    expanded = set()
+    for term in terms:
+        expanded.add(term)
+        expanded.update(_ALIASES.get(term, ()))
+    return expanded
+
+
+def index_terms(phrase: str) -> Set[str]:
+    """
+    색인할 키워드 집합
+
+    Args:
+        phrase: 정규화된 연구 분야 구절
+
+    Returns:
+        구절 자체, 단어 n-gram(1~MAX_NGRAM), 각각의 별칭
+    """
+    tokens = phrase.split()
+    terms = {phrase}
+    for n in range(1, min(MAX_NGRAM, len(tokens)) + 1):
+        for i in range(len(tokens) - n + 1):
+            terms.add(" ".join(tokens[i:i + n]))
+    return {term for term in _with_aliases(terms) if len(term) > 1 or not term.isascii()}
+
+
+def query_terms(interest: str) -> Set[str]:
+    """사용자 관심사 하나로 조회할 키워드 (구절 + 별칭)"""
+    phrase = normalize(interest)
+    return _with_aliases({phrase}) if phrase else set()
+
+
+def _phrases(values) -> List[str]:
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    return list(dict.fromkeys(p for p in (normalize(v) for v in values) if p))
+
+
+def _rows(source: str, source_id: str, professor_id: str, values) -> List[Dict]:
+    return [
+        {"term": term, "phrase": phrase, "professor_id": professor_id, "source": source, "source_id": source_id}
+        for phrase in _phrases(values)
+        for term in index_terms(phrase)
+    ]
+
+
+# (source, source_id, professor_id, 연구 분야 목록 또는 None=삭제)
+_Change = Tuple[str, str, Optional[str], Optional[Sequence[str]]]
+
+
+def _apply_changes(connection, changes: List[_Change]):
+    """변경된 엔티티의 색인 행을 교체"""
+    table = ProfessorKeyword.__table__
+    for source in ("professor", "lab"):
+        ids = [source_id for s, source_id, _, _ in changes if s == source]
+        if ids:
+            connection.execute(delete(table).where(table.c.source == source, table.c.source_id.in_(ids)))
+
+    rows = list(chain.from_iterable(
+        _rows(source, source_id, professor_id, values)
+        for source, source_id, professor_id, values in changes
+        if values is not None
+    ))
+    if rows:
+        connection.execute(insert(table), rows)
+
+
+def _changed(obj, *keys: str) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in keys)
+
+
+def _after_flush(session: Session, flush_context):
+    """flush된 Professor / Laboratory의 색인 갱신 (history는 아직 flush 이전 상태)"""
+    changes: List[_Change] = []
+
+    for obj in session.deleted:
+        if isinstance(obj, Professor):
+            changes.append(("professor", obj.id, None, None))
+        elif isinstance(obj, Laboratory):
+            changes.append(("lab", obj.id, None, None))
+
+    for obj in chain(session.new, session.dirty):
+        is_new = obj in session.new
+        if isinstance(obj, Professor) and (is_new or _changed(obj, "research_interests")):
+            changes.append(("professor", obj.id, obj.id, obj.research_interests or []))
+        elif isinstance(obj, Laboratory) and (is_new or _changed(obj, "research_areas", "professor_id")):
+            changes.append(("lab", obj.id, obj.professor_id, obj.research_areas or []))
+
+    if changes:
+        _apply_changes(session.connection(), changes)
+
+
+def register_index_hooks(session_factory):
+    """
+    세션 팩토리(sessionmaker)에 자동 색인 훅 등록
+
+    Args:
+        session_factory: sessionmaker 또는 Session 클래스
+    """
+    if not event.contains(session_factory, "after_flush", _after_flush):
+        event.listen(session_factory, "after_flush", _after_flush)
+
+
+def rebuild_index(db: Session) -> int:
+    """
+    전체 색인 재구축
+
+    Returns:
+        생성된 색인 행 수
+    """
+    changes: List[_Change] = [
+        ("professor", pid, pid, interests)
+        for pid, interests in db.query(Professor.id, Professor.research_interests)
+    ]
+    changes += [
+        ("lab", lid, pid, areas)
+        for lid, pid, areas in db.query(Laboratory.id, Laboratory.professor_id, Laboratory.research_areas)
+    ]
+
+    connection = db.connection()
+    connection.execute(delete(ProfessorKeyword.__table__))
+    _apply_changes(connection, changes)
+    db.commit()
+
+    count = db.query(func.count(ProfessorKeyword.id)).scalar()
+    logger.info(f"🔎 관심 분야 색인 재구축 완료 (교수/연구실 {len(changes)}개, 키워드 {count}개)")
+    return count
+
+
+def ensure_index(db: Session) -> bool:
+    """색인이 비어 있고 교수 데이터가 있으면 재구축 (기존 DB 업그레이드용)"""
+    if db.query(ProfessorKeyword.id).first() is not None or db.query(Professor.id).first() is None:
+        return False
+    rebuild_index(db)
+    return True
+
+
+def match_professors(db: Session, interests: Sequence[str], limit: int = 5) -> List[Tuple[str, int]]:
+    """
+    관심사와 겹치는 연구 분야가 많은 교수 상위 limit명
+
+    점수 = 관심사마다 매칭된 (정규화된) 연구 분야 구절 수의 합
+
+    Args:
+        db: DB 세션
+        interests: 사용자 관심사 목록
+        limit: 반환할 최대 교수 수
+
+    Returns:
+        (professor_id, score) 목록 (점수 내림차순)
+    """
+    term_sets = [terms for terms in (query_terms(i) for i in interests or []) if terms]
+    if not term_sets:
+        return []
+
+    score = sum(
+        func.count(distinct(case((ProfessorKeyword.term.in_(terms), ProfessorKeyword.phrase))))
+        for terms in term_sets
+    ).label("score")
+
+    rows = (
+        db.query(ProfessorKeyword.professor_id, score)
+        .filter(ProfessorKeyword.term.in_(set().union(*term_sets)))
+        .group_by(ProfessorKeyword.professor_id)
+        .order_by(desc("score"), ProfessorKeyword.professor_id)
+        .limit(limit)
+        .all()
+    )
+    return [(professor_id, int(s)) for professor_id, s in rows]
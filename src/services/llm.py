@@ -3,6 +3,8 @@ import re
 from typing import Optional
 import ollama
 from src.domain.schemas import ResearchPaper, AnalysisResult, CareerPath, ActionItem, DeepDive
+from src.services.metrics import LLM_LATENCY
+from src.services.tracing import span
 
 class BaseLLM:
     def analyze(self, paper: ResearchPaper) -> AnalysisResult:
@@ -56,12 +58,13 @@ class OllamaLLM(BaseLLM):
         }}
         """
 
-        response = ollama.chat(model=self.model, messages=[
-            {
-                'role': 'user',
-                'content': prompt,
-            },
-        ])
+        with LLM_LATENCY.time(model=self.model), span("llm", model=self.model):
+            response = ollama.chat(model=self.model, messages=[
+                {
+                    'role': 'user',
+                    'content': prompt,
+                },
+            ])
         
         content = response['message']['content']
         
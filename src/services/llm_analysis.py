@@ -13,6 +13,9 @@ import json
 import re
 from typing import Dict, Optional
 
+from src.services.metrics import LLM_LATENCY
+from src.services.tracing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,17 +53,18 @@ class LLMAnalysisService:
         import subprocess
 
         try:
-            result = subprocess.run(
-                ["curl", "http://localhost:11434/api/generate"],
-                input=json.dumps({
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                }).encode(),
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with LLM_LATENCY.time(model=self.model), span("llm", model=self.model):
+                result = subprocess.run(
+                    ["curl", "http://localhost:11434/api/generate"],
+                    input=json.dumps({
+                        "model": self.model,
+                        "prompt": prompt,
+                        "stream": False,
+                    }).encode(),
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
 
             response = json.loads(result.stdout)
             logger.info("✅ Ollama 응답 수신")
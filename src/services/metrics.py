@@ -0,0 +1,405 @@
+"""
+Prometheus 형식 메트릭 레지스트리
+
+주요 기능:
+1. 카운터 / 게이지 / 고정 버킷 히스토그램 (레이블 지원, 스레드 안전)
+2. 히스토그램 버킷 기반 분위수(p50/p95/p99) 추정
+3. Prometheus 텍스트 노출 형식(0.0.4) 렌더링 → /metrics 엔드포인트
+4. 크롤링 파이프라인 표준 메트릭 (fetch, 추출, 큐 대기, 작업 시간, LLM)
+5. API 요청 메트릭 (라우트별 지연, 응답 크기, 요청당 SQL 문 수)
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 지연 버킷 (초): 5ms ~ 5분
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """메트릭 공통 (이름, 설명, 레이블)"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_str(self, key: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError("Counter can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def drain(self) -> Dict[LabelValues, float]:
+        """누적 값을 꺼내고 0으로 초기화"""
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, float]):
+        """다른 프로세스에서 drain()한 값 합산"""
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0.0) + value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_str(key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_str(key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (관측 O(log 버킷), 메모리는 레이블 조합 × 버킷 수로 고정)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets or self.buckets[-1] != math.inf:
+            self.buckets += (math.inf,)
+        # 레이블 -> [버킷별 개수(누적 아님), 합계, 개수]
+        self._series: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = self._bucket_index(value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def _bucket_index(self, value: float) -> int:
+        low, high = 0, len(self.buckets) - 1
+        while low < high:
+            mid = (low + high) // 2
+            if value <= self.buckets[mid]:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """블록 실행 시간 관측"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _merged(self, labels: Optional[Dict[str, str]]) -> Tuple[List[int], float, int]:
+        """레이블 조건에 맞는 시리즈 합산 (None이면 전체)"""
+        counts, total, count = [0] * len(self.buckets), 0.0, 0
+        with self._lock:
+            for key, (bucket_counts, series_sum, series_count) in self._series.items():
+                if labels and any(key[self.labelnames.index(k)] != str(v) for k, v in labels.items()):
+                    continue
+                counts = [a + b for a, b in zip(counts, bucket_counts)]
+                total += series_sum
+                count += series_count
+        return counts, total, count
+
+    def quantile(self, q: float, **labels) -> float:
+        """
+        버킷 경계 선형 보간으로 분위수 추정 (Prometheus histogram_quantile과 동일한 방식)
+
+        레이블을 일부만 주면 해당하는 시리즈를 합산해 계산한다.
+        """
+        counts, _, count = self._merged(labels)
+        if count == 0:
+            return 0.0
+
+        rank = q * count
+        cumulative = 0
+        for i, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count > 0:
+                upper = self.buckets[i]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if upper == math.inf:
+                    return lower
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-2]
+
+    def drain(self) -> Dict[LabelValues, List]:
+        """누적 시리즈를 꺼내고 초기화"""
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series: Dict[LabelValues, List]):
+        """다른 프로세스에서 drain()한 시리즈 합산 (버킷 경계가 같아야 함)"""
+        with self._lock:
+            for key, (bucket_counts, series_sum, series_count) in series.items():
+                current = self._series.get(key)
+                if current is None:
+                    current = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+                current[0] = [a + b for a, b in zip(current[0], bucket_counts)]
+                current[1] += series_sum
+                current[2] += series_count
+
+    def summary(self, **labels) -> Dict[str, float]:
+        """개수, 평균, p50/p95/p99"""
+        _, total, count = self._merged(labels)
+        return {
+            "count": count,
+            "avg": total / count if count else 0.0,
+            "p50": self.quantile(0.5, **labels),
+            "p95": self.quantile(0.95, **labels),
+            "p99": self.quantile(0.99, **labels),
+        }
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(c), s, n)) for key, (c, s, n) in self._series.items())
+
+        lines = []
+        for key, (bucket_counts, series_sum, series_count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                le = self._label_str(key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_str(key)} {_format_value(series_sum)}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {series_count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리 (이름별 단일 인스턴스)"""
+
+    def __init__(self):
+        """초기화"""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def drain(self) -> List[Tuple]:
+        """
+        카운터/히스토그램 누적분을 꺼내고 초기화 (게이지는 시점 값이므로 제외)
+
+        멀티 프로세스 크롤링의 샤드가 통계 보고와 함께 부모로 보내면
+        부모가 merge()로 자기 레지스트리에 합산한다 (pickle 가능한 튜플 목록).
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        samples = []
+        for metric in metrics:
+            if isinstance(metric, (Counter, Histogram)):
+                values = metric.drain()
+                if values:
+                    buckets = metric.buckets if isinstance(metric, Histogram) else None
+                    samples.append((metric.type_name, metric.name, metric.documentation,
+                                    metric.labelnames, buckets, values))
+        return samples
+
+    def merge(self, samples: List[Tuple]):
+        """다른 레지스트리에서 drain()한 누적분 합산 (없는 메트릭은 생성)"""
+        for type_name, name, documentation, labelnames, buckets, values in samples:
+            if type_name == Counter.type_name:
+                metric = self.counter(name, documentation, labelnames)
+            else:
+                metric = self.histogram(name, documentation, labelnames, buckets=buckets)
+                if metric.buckets != tuple(buckets):
+                    logger.warning(f"⚠️  {name}: 버킷 경계가 달라 합산하지 않음")
+                    continue
+            metric.merge(values)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """전역 메트릭 레지스트리"""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+# ===================== 크롤링 파이프라인 표준 메트릭 =====================
+
+FETCH_LATENCY = get_metrics_registry().histogram(
+    "crawl_fetch_seconds", "Page fetch latency (cache misses only)", ["host"]
+)
+EXTRACTION_TIME = get_metrics_registry().histogram(
+    "crawl_extraction_seconds", "HTML extraction time per page", ["stage"]
+)
+QUEUE_WAIT = get_metrics_registry().histogram(
+    "crawl_queue_wait_seconds", "Time from task submission to first dequeue", ["host"]
+)
+TASK_DURATION = get_metrics_registry().histogram(
+    "crawl_task_duration_seconds", "End-to-end task processing time", ["host", "status"]
+)
+LLM_LATENCY = get_metrics_registry().histogram(
+    "llm_request_seconds", "LLM request latency", ["model"]
+)
+TASKS_TOTAL = get_metrics_registry().counter(
+    "crawl_tasks_total", "Processed crawl tasks", ["status"]
+)
+QUEUE_TASKS = get_metrics_registry().gauge(
+    "crawl_queue_tasks", "Tasks in the crawl queue by state", ["state"]
+)
+WORKERS_ACTIVE = get_metrics_registry().gauge(
+    "crawl_workers_active", "Active crawl workers"
+)
+
+# ===================== API 요청 메트릭 =====================
+
+HTTP_REQUEST_LATENCY = get_metrics_registry().histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route", "status"]
+)
+HTTP_RESPONSE_SIZE = get_metrics_registry().histogram(
+    "http_response_size_bytes", "HTTP response body size by route template", ["route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+)
+DB_STATEMENTS_PER_REQUEST = get_metrics_registry().histogram(
+    "db_statements_per_request", "SQL statements executed per HTTP request", ["route"],
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+)
+
+
+def update_crawler_gauges(queue_stats: Dict, active_workers: int):
+    """큐/워커 게이지 갱신 (스크레이프 시점 값)"""
+    for state in ("pending", "running", "completed", "failed"):
+        QUEUE_TASKS.set(queue_stats.get(state, 0), state=state)
+    WORKERS_ACTIVE.set(active_workers)
@@ -12,7 +12,10 @@ import logging
 import time
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import deque
+
+from src.services.metrics import TASK_DURATION
+from src.services.timeseries import TimeSeriesStore
 
 logger = logging.getLogger(__name__)
 
@@ -30,13 +33,8 @@ class MetricsCollector:
         self.window_size = window_size
         self.metrics_history: deque = deque(maxlen=1000)  # 최근 1000개 메트릭
 
-        # 시간별 집계
-        self.hourly_stats = defaultdict(lambda: {
-            "tasks_processed": 0,
-            "tasks_failed": 0,
-            "total_time": 0.0,
-            "errors": []
-        })
+        # 분/시간/일 롤업 (고정 크기 링 버퍼, 오류는 유형별 개수만 보관)
+        self.timeseries = TimeSeriesStore()
 
         logger.info(f"🚀 MetricsCollector 초기화 (윈도우={window_size}초)")
 
@@ -50,16 +48,7 @@ class MetricsCollector:
             "error": error,
         }
         self.metrics_history.append(metric)
-
-        # 시간별 집계
-        hour = datetime.now().strftime("%Y-%m-%d %H:00")
-        if success:
-            self.hourly_stats[hour]["tasks_processed"] += 1
-            self.hourly_stats[hour]["total_time"] += duration
-        else:
-            self.hourly_stats[hour]["tasks_failed"] += 1
-            if error:
-                self.hourly_stats[hour]["errors"].append(error)
+        self.timeseries.record(success, duration, error)
 
     def get_current_metrics(self) -> Dict:
         """현재 메트릭 조회"""
@@ -80,25 +69,30 @@ class MetricsCollector:
             "min_duration": min(m["duration"] for m in successful) if successful else 0,
             "max_duration": max(m["duration"] for m in successful) if successful else 0,
             "latest_errors": [m["error"] for m in failed[-5:]],
+            **self._duration_percentiles(),
+        }
+
+    @staticmethod
+    def _duration_percentiles() -> Dict:
+        """성공 작업 처리 시간 분위수 (누적 히스토그램 기준)"""
+        summary = TASK_DURATION.summary(status="completed")
+        return {
+            "p50_duration": summary["p50"],
+            "p95_duration": summary["p95"],
+            "p99_duration": summary["p99"],
         }
 
+    def get_minute_stats(self, minutes: int = 60) -> Dict:
+        """분별 통계"""
+        return self.timeseries.get_stats("minute", minutes, "%Y-%m-%d %H:%M")
+
     def get_hourly_stats(self, hours: int = 24) -> Dict:
         """시간별 통계"""
-        stats = {}
-        for hour_str, hour_data in sorted(self.hourly_stats.items())[-hours:]:
-            processed = hour_data["tasks_processed"]
-            failed = hour_data["tasks_failed"]
-            total = processed + failed
-
-            stats[hour_str] = {
-                "processed": processed,
-                "failed": failed,
-                "total": total,
-                "success_rate": processed / total * 100 if total > 0 else 0,
-                "avg_duration": hour_data["total_time"] / processed if processed > 0 else 0,
-            }
+        return self.timeseries.get_stats("hour", hours, "%Y-%m-%d %H:00")
 
-        return stats
+    def get_daily_stats(self, days: int = 30) -> Dict:
+        """일별 통계"""
+        return self.timeseries.get_stats("day", days, "%Y-%m-%d")
 
     def _empty_metrics(self) -> Dict:
         """빈 메트릭"""
@@ -111,6 +105,7 @@ class MetricsCollector:
             "min_duration": 0,
             "max_duration": 0,
             "latest_errors": [],
+            **self._duration_percentiles(),
         }
 
 
@@ -232,6 +227,24 @@ class RealtimeDashboard:
                 "total": queue_stats["total"],
             },
             "hourly_stats": hourly,
+            "stage_breakdown": self._stage_breakdown(worker_pool_stats["workers"]["stats"]),
+        }
+
+    @staticmethod
+    def _stage_breakdown(worker_stats: List[Dict]) -> Dict:
+        """전체 워커의 단계별 누적 시간(초)과 비율"""
+        totals: Dict[str, float] = {}
+        for stats in worker_stats:
+            for stage, seconds in stats.get("stage_times", {}).items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+
+        grand_total = sum(totals.values())
+        return {
+            stage: {
+                "seconds": round(seconds, 3),
+                "percent": seconds / grand_total * 100 if grand_total > 0 else 0,
+            }
+            for stage, seconds in sorted(totals.items(), key=lambda item: item[1], reverse=True)
         }
 
     def print_dashboard(self, dashboard_data: Dict):
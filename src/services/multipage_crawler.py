@@ -11,6 +11,8 @@ from datetime import datetime
 
 from src.services.generic_university_crawler import GenericUniversityCrawler
 from src.services.improved_info_extractor import ImprovedInfoExtractor
+from src.services.metrics import EXTRACTION_TIME
+from src.services.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +51,12 @@ class MultipageCrawler:
         elapsed = (datetime.now() - self.start_time).total_seconds()
         logger.info(f"✅ 크롤러 종료 (소요 시간: {elapsed:.1f}초)")
 
+    @traced("crawl_department")
     async def crawl_department(
         self,
         dept_url: str,
-        dept_name: str = ""
+        dept_name: str = "",
+        result: Optional[Dict] = None
     ) -> Dict:
         """
         학과 페이지 크롤링 (다중 페이지)
@@ -66,6 +70,8 @@ class MultipageCrawler:
         Args:
             dept_url: 학과 페이지 URL
             dept_name: 학과명
+            result: 결과를 채워 넣을 딕셔너리 (호출자가 넘기면 중간에 취소되어도
+                그때까지 추출한 부분 결과가 남는다)
 
         Returns:
             {
@@ -82,7 +88,9 @@ class MultipageCrawler:
         logger.info(f"📚 {dept_name} 다중 페이지 크롤링 시작")
         logger.info(f"{'='*70}")
 
-        result = {
+        if result is None:
+            result = {}
+        result.update({
             "department": dept_name,
             "url": dept_url,
             "professors": [],
@@ -91,7 +99,7 @@ class MultipageCrawler:
             "professor_pages": [],
             "pages_crawled": 0,
             "extraction_stats": {}
-        }
+        })
 
         # 방문 체크
         if dept_url in self.visited_urls:
@@ -112,16 +120,17 @@ class MultipageCrawler:
             result["pages_crawled"] += 1
 
             # 정보 추출
-            extractor = ImprovedInfoExtractor(html, dept_url, dept_url)
+            with EXTRACTION_TIME.time(stage="department"), span("extract", stage="department"):
+                extractor = ImprovedInfoExtractor(html, dept_url, dept_url)
 
-            # 학과 페이지에서 직접 추출
-            result["professors"].extend(extractor.extract_professors())
-            result["labs"].extend(extractor.extract_labs())
-            result["papers"].extend(extractor.extract_papers())
+                # 학과 페이지에서 직접 추출
+                result["professors"].extend(extractor.extract_professors())
+                result["labs"].extend(extractor.extract_labs())
+                result["papers"].extend(extractor.extract_papers())
 
-            # 단계 2: 교수 페이지 링크 발견
-            logger.info(f"\n🔗 [단계 2] 교수 페이지 링크 발견")
-            professor_links = extractor.extract_professor_links()
+                # 단계 2: 교수 페이지 링크 발견
+                logger.info(f"\n🔗 [단계 2] 교수 페이지 링크 발견")
+                professor_links = extractor.extract_professor_links()
 
             if professor_links:
                 logger.info(f"   ✅ {len(professor_links)}개 교수 페이지 링크 발견")
@@ -147,18 +156,20 @@ class MultipageCrawler:
                                 self.visited_urls.add(prof_url)
                                 result["pages_crawled"] += 1
 
-                                prof_extractor = ImprovedInfoExtractor(
-                                    prof_html, prof_url, prof_url
-                                )
+                                with EXTRACTION_TIME.time(stage="professor"), span("extract", stage="professor"):
+                                    prof_extractor = ImprovedInfoExtractor(
+                                        prof_html, prof_url, prof_url
+                                    )
+
+                                    # 교수 페이지에서 논문 추출
+                                    papers = prof_extractor.extract_papers()
+                                    profs = prof_extractor.extract_professors()
 
-                                # 교수 페이지에서 논문 추출
-                                papers = prof_extractor.extract_papers()
                                 if papers:
                                     result["papers"].extend(papers)
                                     logger.info(f"      📚 {len(papers)}개 논문 추출")
 
                                 # 교수 페이지에서 추가 정보
-                                profs = prof_extractor.extract_professors()
                                 if profs:
                                     result["professors"].extend(profs)
 
@@ -175,13 +186,7 @@ class MultipageCrawler:
             logger.error(f"❌ 다중 페이지 크롤링 중 오류: {e}")
 
         # 통계 계산
-        result["extraction_stats"] = {
-            "professors_count": len(set(p.get("name", "") for p in result["professors"] if p.get("name"))),
-            "labs_count": len(set(l.get("name", "") for l in result["labs"] if l.get("name"))),
-            "papers_count": len(set(p.get("title", "") for p in result["papers"] if p.get("title"))),
-            "total_extracted": len(result["professors"]) + len(result["labs"]) + len(result["papers"]),
-            "pages_crawled": result["pages_crawled"],
-        }
+        self.update_extraction_stats(result)
 
         logger.info(f"\n{'='*70}")
         logger.info(f"✅ 크롤링 완료 ({result['pages_crawled']}개 페이지)")
@@ -192,6 +197,18 @@ class MultipageCrawler:
 
         return result
 
+    @staticmethod
+    def update_extraction_stats(result: Dict) -> Dict:
+        """추출 통계 계산 (부분 결과에도 사용)"""
+        result["extraction_stats"] = {
+            "professors_count": len(set(p.get("name", "") for p in result["professors"] if p.get("name"))),
+            "labs_count": len(set(l.get("name", "") for l in result["labs"] if l.get("name"))),
+            "papers_count": len(set(p.get("title", "") for p in result["papers"] if p.get("title"))),
+            "total_extracted": len(result["professors"]) + len(result["labs"]) + len(result["papers"]),
+            "pages_crawled": result["pages_crawled"],
+        }
+        return result
+
     async def crawl_multiple_departments(
         self,
         departments: List[Tuple[str, str]],  # [(url, name), ...]
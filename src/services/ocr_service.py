@@ -17,6 +17,8 @@ from urllib.parse import urlparse, urljoin
 from io import BytesIO
 import re
 
+from src.services.tracing import span
+
 try:
     from paddleocr import PaddleOCR
 except ImportError:
@@ -90,9 +92,10 @@ class OCRService:
 
             # OCR 수행 (동기 처리를 스레드 풀에서 실행)
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._ocr_image, image_data
-            )
+            with span("ocr"):
+                result = await loop.run_in_executor(
+                    None, self._ocr_image, image_data
+                )
 
             text = result if result else ""
 
@@ -0,0 +1,384 @@
+"""
+멀티 프로세스 워커 풀 (CPU 코어별 샤딩)
+
+주요 기능:
+1. CPU 코어당 하나의 프로세스, 프로세스마다 독립 이벤트 루프 + N개 비동기 워커
+2. 매니저 프로세스가 호스팅하는 공유 작업 큐 (모든 프로세스가 같은 큐 사용)
+3. 자식 프로세스 → 부모 감독자로 주기적 통계 보고 및 집계
+4. 비정상 종료된 프로세스 자동 재시작
+5. 크롤링 결과는 부모의 단일 ResultWriter로 모아 저장 (DB 파일당 writer 하나)
+6. 샤드 메트릭(카운터/히스토그램)을 통계 보고와 함께 부모 레지스트리로 합산 (/metrics)
+
+트레이스는 각 샤드가 상속받은 TRACING_EXPORTER 설정으로 직접 내보낸다.
+"""
+
+import asyncio
+import copy
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from multiprocessing.managers import BaseManager
+from typing import Dict, Optional
+
+from src.database.db import Database
+from src.services import task_queue as task_queue_module
+from src.services.metrics import get_metrics_registry
+from src.services.result_writer import ResultWriter, get_result_writer
+
+logger = logging.getLogger(__name__)
+
+
+class QueueManager(BaseManager):
+    """공유 작업 큐를 호스팅하는 매니저"""
+
+
+QueueManager.register("get_task_queue", callable=task_queue_module.get_task_queue)
+
+
+def _init_shared_queue(queue_kwargs: Dict):
+    """매니저 프로세스에서 전역 작업 큐 생성"""
+    task_queue_module.get_task_queue(**queue_kwargs)
+
+
+class _ResultQueueSink:
+    """샤드 프로세스의 writer 대신 결과를 부모로 보내는 단계 (ResultWriter와 같은 인터페이스)"""
+
+    def __init__(self, results_queue):
+        self.results_queue = results_queue
+        self.stats = {"forwarded": 0}
+
+    def try_submit(self, task, result: Dict, on_failed=None) -> bool:
+        """부모로 전달 (큐가 가득 차면 False, 저장 실패는 부모가 공유 큐에 직접 반영)"""
+        try:
+            # 직렬화는 피더 스레드에서 나중에 일어나므로 제출 시점 상태를 복사해 둔다
+            self.results_queue.put_nowait((copy.copy(task), result))
+        except queue.Full:
+            return False
+        self.stats["forwarded"] += 1
+        return True
+
+    def stop(self, timeout: float = 30.0):
+        """버퍼에 남은 결과를 모두 부모로 보낸 뒤 종료"""
+        self.results_queue.close()
+        self.results_queue.join_thread()
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats)
+
+
+def _shard_main(
+    shard_id: int,
+    manager_address,
+    authkey: bytes,
+    db_url: str,
+    workers_per_process: int,
+    stats_queue,
+    results_queue,
+    stop_event,
+    stats_interval: float,
+    drain_timeout,
+):
+    """자식 프로세스 진입점: 공유 큐에 연결해 비동기 워커 풀 실행"""
+    # 무거운 크롤러 의존성은 자식 프로세스에서만 로드
+    from src.services.worker_pool import WorkerPool
+
+    logging.basicConfig(level=logging.INFO, format=f"[shard-{shard_id}] %(levelname)s %(name)s: %(message)s")
+
+    manager = QueueManager(address=manager_address, authkey=authkey)
+    manager.connect()
+    shared_queue = manager.get_task_queue()
+    registry = get_metrics_registry()
+
+    def report(pool):
+        stats = pool.get_stats()
+        stats_queue.put({
+            "shard_id": shard_id,
+            "pid": os.getpid(),
+            "workers": stats["workers"]["stats"],
+            "forwarded": stats.get("writer", {}).get("forwarded", 0),
+            "metrics": registry.drain(),
+            "timestamp": time.time(),
+        })
+
+    async def run():
+        pool = WorkerPool(
+            shared_queue,
+            Database(db_url=db_url),
+            num_workers=workers_per_process,
+            min_workers=workers_per_process,
+            max_workers=workers_per_process,
+            writer=_ResultQueueSink(results_queue),
+        )
+        await pool.initialize()
+        await pool.start()
+
+        while not stop_event.is_set():
+            report(pool)
+            await asyncio.sleep(stats_interval)
+
+        await pool.stop(drain_timeout=drain_timeout.value)
+        # 드레인 중 쌓인 메트릭까지 보고
+        report(pool)
+
+    asyncio.run(run())
+
+
+class ProcessWorkerPool:
+    """
+    프로세스별로 샤딩된 워커 풀
+
+    WorkerPool과 같은 인터페이스(initialize/start/stop/auto_scale/get_stats)를 제공하므로
+    DistributedCrawler에서 그대로 교체해 사용할 수 있다. task_queue는 매니저 프로세스의
+    공유 큐에 대한 프록시이다.
+
+    샤드는 DB에 직접 쓰지 않고 결과를 results_queue로 보내며, 부모의 writer 하나가
+    모든 샤드의 결과를 저장한다 (SQLite 파일에 writer 스레드가 여러 개 생기지 않도록).
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        num_processes: int = 0,
+        workers_per_process: int = 3,
+        queue_kwargs: Optional[Dict] = None,
+        stats_interval: float = 5.0,
+        max_restarts: int = 10,
+        max_pending_results: int = 1000,
+    ):
+        """
+        초기화
+
+        Args:
+            db_url: 데이터베이스 URL (각 프로세스가 자체 연결 생성)
+            num_processes: 프로세스 수 (0 이하면 CPU 코어 수)
+            workers_per_process: 프로세스당 비동기 워커 수
+            queue_kwargs: 공유 InMemoryTaskQueue 생성 인자
+            stats_interval: 자식 프로세스 통계 보고 간격 (초)
+            max_restarts: 프로세스별 최대 자동 재시작 횟수
+            max_pending_results: 샤드 → 부모 결과 큐 최대 크기 (작업 단위)
+        """
+        self.db_url = db_url
+        self.num_processes = num_processes if num_processes > 0 else (os.cpu_count() or 1)
+        self.workers_per_process = workers_per_process
+        self.queue_kwargs = queue_kwargs or {}
+        self.stats_interval = stats_interval
+        self.max_restarts = max_restarts
+
+        # asyncio/스레드를 쓰는 부모에서 fork하면 잠금 상태가 복제되므로 spawn 사용
+        self.ctx = multiprocessing.get_context("spawn")
+        self.authkey = os.urandom(16)
+        self.manager: Optional[QueueManager] = None
+        self.task_queue = None
+        self.writer: Optional[ResultWriter] = None
+
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.restart_counts: Dict[int, int] = {}
+        self.shard_stats: Dict[int, Dict] = {}
+        self.stats_queue = self.ctx.Queue()
+        self.results_queue = self.ctx.Queue(maxsize=max_pending_results)
+        self.stop_event = self.ctx.Event()
+        self._drain_timeout = self.ctx.Value("d", 60.0)
+        self._supervisor: Optional[threading.Thread] = None
+        self._forwarder: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._shards_stopped = threading.Event()
+
+        logger.info(
+            f"🚀 ProcessWorkerPool 초기화 (프로세스={self.num_processes}, "
+            f"프로세스당 워커={workers_per_process})"
+        )
+
+    # WorkerPool 호환 속성
+    @property
+    def min_workers(self) -> int:
+        return self.num_processes * self.workers_per_process
+
+    @property
+    def max_workers(self) -> int:
+        return self.num_processes * self.workers_per_process
+
+    async def initialize(self):
+        """공유 큐 매니저 및 결과 writer 시작"""
+        self.manager = QueueManager(address=("127.0.0.1", 0), authkey=self.authkey, ctx=self.ctx)
+        self.manager.start(_init_shared_queue, (self.queue_kwargs,))
+        self.task_queue = self.manager.get_task_queue()
+        self.writer = get_result_writer(Database(db_url=self.db_url))
+        self.writer.start()
+        logger.info(f"✅ 공유 작업 큐 시작 ({self.manager.address})")
+
+    async def start(self):
+        """샤드 프로세스 및 감독자 시작"""
+        self.stop_event.clear()
+        self._stopping.clear()
+        self._shards_stopped.clear()
+        self._forwarder = threading.Thread(target=self._forward_results, name="process-pool-results", daemon=True)
+        self._forwarder.start()
+        for shard_id in range(self.num_processes):
+            self._spawn(shard_id)
+
+        self._supervisor = threading.Thread(target=self._supervise, name="process-pool-supervisor", daemon=True)
+        self._supervisor.start()
+        logger.info(f"✅ {self.num_processes}개 샤드 프로세스 시작")
+
+    async def stop(self, drain_timeout: float = 60.0):
+        """샤드 프로세스 드레인/종료 후 남은 결과 저장, 매니저 종료"""
+        logger.info("⏹️  ProcessWorkerPool 중지 중...")
+        self._drain_timeout.value = drain_timeout
+        self._stopping.set()
+        self.stop_event.set()
+
+        # 샤드가 드레인 기한 + 결과 전달 시간 안에 끝나지 않으면 강제 종료
+        await asyncio.to_thread(self._join_all, drain_timeout + self.stats_interval + 30)
+        if self._supervisor is not None:
+            self._supervisor.join(timeout=5)
+        self._collect_reports()
+
+        # 샤드가 보낸 결과를 모두 writer에 넘긴 뒤 저장 (완료 보고에 공유 큐가 필요하므로 매니저보다 먼저)
+        self._shards_stopped.set()
+        if self._forwarder is not None:
+            await asyncio.to_thread(self._forwarder.join)
+        if self.writer is not None:
+            await asyncio.to_thread(self.writer.stop)
+        if self.manager is not None:
+            self.manager.shutdown()
+            self.manager = None
+
+        logger.info("✅ ProcessWorkerPool 중지 완료")
+
+    async def auto_scale(self):
+        """프로세스 수는 코어 수에 고정 (프로세스 내부 워커 수로 조정)"""
+        logger.debug("ProcessWorkerPool: 프로세스 단위 자동 스케일링 없음")
+
+    def get_stats(self) -> Dict:
+        """모든 프로세스의 워커 통계 집계"""
+        worker_stats = []
+        for shard_id, shard in sorted(self.shard_stats.items()):
+            for stats in shard["workers"]:
+                worker_stats.append({**stats, "shard_id": shard_id, "pid": shard["pid"]})
+
+        completed = sum(w["tasks_completed"] for w in worker_stats)
+        failed = sum(w["tasks_failed"] for w in worker_stats)
+        alive = sum(1 for p in self.processes.values() if p.is_alive())
+
+        return {
+            "workers": {
+                "active": len(worker_stats),
+                "min": self.min_workers,
+                "max": self.max_workers,
+                "stats": worker_stats,
+            },
+            "processes": {
+                "configured": self.num_processes,
+                "alive": alive,
+                "restarts": dict(self.restart_counts),
+                "shards": {
+                    shard_id: {
+                        "pid": shard["pid"],
+                        "workers": len(shard["workers"]),
+                        "results_forwarded": shard.get("forwarded", 0),
+                        "last_report": datetime.fromtimestamp(shard["timestamp"]).isoformat(),
+                    }
+                    for shard_id, shard in self.shard_stats.items()
+                },
+            },
+            "queue": self.task_queue.get_stats() if self.task_queue is not None else {},
+            "writer": self.writer.get_stats() if self.writer is not None else {},
+            "pool_health": {
+                "status": "healthy" if alive > 0 else "unhealthy",
+                "utilization": completed / max(completed + failed, 1),
+            },
+        }
+
+    # ===================== 내부 메서드 =====================
+
+    def _spawn(self, shard_id: int):
+        """샤드 프로세스 생성"""
+        process = self.ctx.Process(
+            target=_shard_main,
+            args=(
+                shard_id,
+                self.manager.address,
+                self.authkey,
+                self.db_url,
+                self.workers_per_process,
+                self.stats_queue,
+                self.results_queue,
+                self.stop_event,
+                self.stats_interval,
+                self._drain_timeout,
+            ),
+            name=f"crawl-shard-{shard_id}",
+            daemon=True,
+        )
+        process.start()
+        self.processes[shard_id] = process
+        logger.info(f"➕ 샤드 프로세스 시작: shard-{shard_id} (pid={process.pid})")
+
+    def _handle_report(self, report: Dict):
+        """샤드 통계 보고 반영 (메트릭 누적분은 이 프로세스의 레지스트리에 합산)"""
+        get_metrics_registry().merge(report.pop("metrics", []))
+        self.shard_stats[report["shard_id"]] = report
+
+    def _collect_reports(self):
+        """종료된 샤드가 마지막으로 보낸 보고 수집"""
+        while True:
+            try:
+                self._handle_report(self.stats_queue.get(timeout=0.1))
+            except (queue.Empty, EOFError, OSError):
+                return
+
+    def _forward_results(self):
+        """샤드 결과를 부모의 writer로 전달 (writer 큐가 가득 차면 대기)"""
+        while not (self._shards_stopped.is_set() and self.results_queue.empty()):
+            try:
+                task, result = self.results_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            while not self.writer.try_submit(task, result, on_failed=self._requeue_unsaved):
+                time.sleep(0.01)
+
+    def _requeue_unsaved(self, task, error: str):
+        """저장에 실패한 샤드 작업의 완료 표시 취소 (writer 스레드에서 공유 큐 프록시 호출)"""
+        self.task_queue.mark_unsaved(task.task_id, error)
+
+    def _supervise(self):
+        """통계 수집 및 비정상 종료 프로세스 재시작"""
+        while not self._stopping.is_set():
+            try:
+                self._handle_report(self.stats_queue.get(timeout=1.0))
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                break
+
+            for shard_id, process in list(self.processes.items()):
+                if process.is_alive() or self._stopping.is_set():
+                    continue
+
+                self.shard_stats.pop(shard_id, None)
+                restarts = self.restart_counts.get(shard_id, 0)
+                if restarts >= self.max_restarts:
+                    logger.error(f"❌ shard-{shard_id} 재시작 한도 초과 (exit={process.exitcode})")
+                    self.processes.pop(shard_id)
+                    continue
+
+                logger.warning(f"⚠️  shard-{shard_id} 비정상 종료 (exit={process.exitcode}) → 재시작")
+                self.restart_counts[shard_id] = restarts + 1
+                self._spawn(shard_id)
+
+    def _join_all(self, timeout: float):
+        """모든 샤드 프로세스 종료 대기 (시간 초과 시 강제 종료)"""
+        deadline = time.monotonic() + timeout
+        for process in self.processes.values():
+            process.join(timeout=max(deadline - time.monotonic(), 0))
+        for shard_id, process in self.processes.items():
+            if process.is_alive():
+                logger.warning(f"⚠️  shard-{shard_id} 종료 시간 초과 → 강제 종료")
+                process.terminate()
+                process.join(timeout=5)
@@ -0,0 +1,204 @@
+"""
+온디맨드 프로파일러 (샘플링 CPU 프로파일 / 힙 스냅샷)
+
+주요 기능:
+1. sys._current_frames() 기반 전체 스레드 샘플링 → flamegraph용 collapsed stack
+2. tracemalloc 상위 할당 위치 조회 및 스냅샷 간 차이 비교
+3. 요청이 있을 때만 동작 (유휴 시 오버헤드 없음, 동시 실행 1개로 제한)
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_PROFILE_SECONDS = 60.0
+MIN_INTERVAL_SECONDS = 0.001
+MAX_SNAPSHOTS = 5
+
+
+class ProfilerBusyError(RuntimeError):
+    """다른 프로파일링이 이미 실행 중"""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """전체 스레드 스택 샘플링 프로파일러"""
+
+    def __init__(self):
+        """초기화"""
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float = 10.0, interval: float = 0.01, max_depth: int = 128) -> Dict[str, int]:
+        """
+        지정 시간 동안 모든 스레드의 스택을 주기적으로 수집
+
+        Args:
+            seconds: 샘플링 시간 (최대 MAX_PROFILE_SECONDS)
+            interval: 샘플 간격 (초)
+            max_depth: 스택 최대 깊이
+
+        Returns:
+            collapsed stack("스레드;바깥 함수;...;안쪽 함수") -> 샘플 수
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("profiler is already running")
+
+        try:
+            seconds = min(max(seconds, interval), MAX_PROFILE_SECONDS)
+            interval = max(interval, MIN_INTERVAL_SECONDS)
+            own_thread = threading.get_ident()
+            deadline = time.monotonic() + seconds
+            stacks: Counter = Counter()
+            samples = 0
+
+            logger.info(f"🔬 샘플링 프로파일 시작 ({seconds:.0f}초, 간격 {interval * 1000:.0f}ms)")
+            while time.monotonic() < deadline:
+                thread_names = {t.ident: t.name for t in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_thread:
+                        continue
+                    labels = []
+                    while frame is not None and len(labels) < max_depth:
+                        labels.append(_frame_label(frame))
+                        frame = frame.f_back
+                    labels.append(thread_names.get(thread_id, f"thread-{thread_id}"))
+                    stacks[";".join(reversed(labels))] += 1
+                samples += 1
+                time.sleep(interval)
+
+            logger.info(f"✅ 샘플링 프로파일 완료 ({samples}회 샘플, 고유 스택 {len(stacks)}개)")
+            return dict(stacks)
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def to_collapsed(stacks: Dict[str, int]) -> str:
+        """flamegraph.pl / speedscope 입력 형식"""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items(), key=lambda x: -x[1]))
+
+
+class HeapProfiler:
+    """tracemalloc 기반 힙 스냅샷 관리"""
+
+    def __init__(self):
+        """초기화"""
+        self.snapshots: "OrderedDict[str, tracemalloc.Snapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 25):
+        """할당 추적 시작 (추적 중에는 할당마다 오버헤드 발생)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info(f"🧠 tracemalloc 시작 (프레임 {frames}개)")
+
+    def stop(self):
+        """할당 추적 종료 및 스냅샷 삭제"""
+        with self._lock:
+            self.snapshots.clear()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("⏹️  tracemalloc 종료")
+
+    def take_snapshot(self) -> str:
+        """
+        스냅샷 저장 (최근 MAX_SNAPSHOTS개만 보관)
+
+        Returns:
+            스냅샷 ID
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        snapshot_id = uuid.uuid4().hex[:8]
+        with self._lock:
+            self.snapshots[snapshot_id] = snapshot
+            while len(self.snapshots) > MAX_SNAPSHOTS:
+                self.snapshots.popitem(last=False)
+        return snapshot_id
+
+    def _get(self, snapshot_id: str) -> tracemalloc.Snapshot:
+        snapshot = self.snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise KeyError(snapshot_id)
+        return snapshot
+
+    def top(self, snapshot_id: str, limit: int = 20, key_type: str = "lineno") -> List[Dict]:
+        """스냅샷의 상위 할당 위치"""
+        stats = self._get(snapshot_id).statistics(key_type)
+        return [
+            {
+                "location": str(stat.traceback[0]),
+                "size_kb": round(stat.size / 1024, 1),
+                "count": stat.count,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def diff(self, base_id: str, target_id: str, limit: int = 20, key_type: str = "lineno") -> List[Dict]:
+        """두 스냅샷 간 할당 증감 (증가량 큰 순)"""
+        stats = self._get(target_id).compare_to(self._get(base_id), key_type)
+        return [
+            {
+                "location": str(stat.traceback[0]),
+                "size_kb": round(stat.size / 1024, 1),
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def get_status(self) -> Dict:
+        """추적 상태"""
+        current, peak = tracemalloc.get_traced_memory() if self.tracing else (0, 0)
+        return {
+            "tracing": self.tracing,
+            "traced_current_kb": round(current / 1024, 1),
+            "traced_peak_kb": round(peak / 1024, 1),
+            "snapshots": list(self.snapshots),
+        }
+
+
+# 전역 인스턴스
+_sampling_profiler: Optional[SamplingProfiler] = None
+_heap_profiler: Optional[HeapProfiler] = None
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """전역 샘플링 프로파일러"""
+    global _sampling_profiler
+    if _sampling_profiler is None:
+        _sampling_profiler = SamplingProfiler()
+    return _sampling_profiler
+
+
+def get_heap_profiler() -> HeapProfiler:
+    """전역 힙 프로파일러"""
+    global _heap_profiler
+    if _heap_profiler is None:
+        _heap_profiler = HeapProfiler()
+    return _heap_profiler
@@ -6,9 +6,12 @@ Redis 기반 분산 작업 큐
 2. 우선순위 기반 스케줄링
 3. 작업 상태 중앙 관리
 4. 자동 재시도 및 실패 처리
+5. 작업 임대(lease) 및 하트비트 기반 유실 작업 회수
+6. 정규화 URL 기반 중복 제출 방지 (idempotency)
 """
 
 import json
+import time
 import logging
 import hashlib
 from typing import Optional, Dict, List
@@ -27,6 +30,29 @@ from src.services.task_queue import CrawlTask, TaskStatus, TaskPriority
 
 logger = logging.getLogger(__name__)
 
+# 임대 해제: 실행 정보의 worker_id가 보고한 워커와 같을 때만 실행 정보/임대 삭제
+# 0=다른 워커 소유(또는 회수됨), 1=해제할 임대 없음, 2=임대 해제
+# KEYS[1]=실행 정보 해시, KEYS[2]=임대 ZSET, ARGV[1]=task_id, ARGV[2]=worker_id (빈 값이면 확인 안 함)
+_RELEASE_LEASE = """
+if ARGV[2] ~= '' and redis.call('HGET', KEYS[1], 'worker_id') ~= ARGV[2] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+return 1 + redis.call('ZREM', KEYS[2], ARGV[1])
+"""
+
+# idempotency 키 인계 (compare-and-set): 키가 아직 expected(재사용 불가 작업)를 가리키거나
+# 만료되었을 때만 새 task_id로 교체. 교체했으면 nil, 다른 제출자가 먼저 인계했으면 그 task_id 반환
+# KEYS[1]=idempotency 키, ARGV[1]=expected task_id, ARGV[2]=새 task_id, ARGV[3]=만료(초)
+_TAKE_OVER_IDEMPOTENCY_KEY = """
+local current = redis.call('GET', KEYS[1])
+if current and current ~= ARGV[1] then
+    return current
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return false
+"""
+
 
 class RedisTaskQueue:
     """Redis 기반 분산 작업 큐"""
@@ -35,7 +61,9 @@ class RedisTaskQueue:
         self,
         redis_url: str = "redis://localhost:6379/0",
         ttl_hours: int = 24,
-        fallback_to_memory: bool = True
+        fallback_to_memory: bool = True,
+        lease_seconds: int = 120,
+        freshness_seconds: int = 0
     ):
         """
         초기화
@@ -44,18 +72,26 @@ class RedisTaskQueue:
             redis_url: Redis 연결 URL
             ttl_hours: 작업 TTL (시간)
             fallback_to_memory: Redis 미연결 시 메모리 폴백
+            lease_seconds: 작업 임대 시간 (초). 하트비트가 없으면 만료 후 회수
+            freshness_seconds: 완료된 작업 결과를 중복 제출에 재사용하는 시간 (초, 0=재사용 안 함)
         """
         self.redis_url = redis_url
         self.ttl_hours = ttl_hours
+        self.lease_seconds = lease_seconds
+        self.freshness_seconds = freshness_seconds
         self.fallback_to_memory = fallback_to_memory
         self.redis: Optional[Redis] = None
         self.memory_fallback = {} if fallback_to_memory else None
+        self.memory_idempotency: Dict[str, str] = {}  # 폴백용 idempotency_key -> task_id
 
         # Redis 키 프리픽스
         self.prefix = "crawl:"
         self.queue_key = f"{self.prefix}queue"
         self.task_key = f"{self.prefix}task:"
         self.result_key = f"{self.prefix}result:"
+        self.running_key = f"{self.prefix}running:"
+        self.lease_key = f"{self.prefix}leases"  # ZSET: task_id -> 임대 만료 시각 (epoch)
+        self.idem_key = f"{self.prefix}idem:"  # idempotency_key -> 최근 task_id
 
         logger.info(f"🚀 RedisTaskQueue 초기화 ({redis_url})")
 
@@ -83,11 +119,22 @@ class RedisTaskQueue:
             logger.info("✅ Redis 연결 해제")
 
     async def enqueue(self, task: CrawlTask) -> str:
-        """작업 큐에 추가"""
+        """
+        작업 큐에 추가
+
+        Returns:
+            task_id. 중복 제출이면 기존 작업의 task_id
+        """
         task_json = self._serialize_task(task)
 
         if self.redis:
             try:
+                # 중복 제출 확인
+                existing_id = await self._claim_idempotency_key(task)
+                if existing_id:
+                    logger.info(f"♊ 중복 작업 제출 → 기존 작업 반환: {existing_id[:8]}...")
+                    return existing_id
+
                 # 작업 저장
                 await self.redis.set(
                     f"{self.task_key}{task.task_id}",
@@ -113,8 +160,58 @@ class RedisTaskQueue:
         else:
             return self._enqueue_memory(task, task_json)
 
+    async def _claim_idempotency_key(self, task: CrawlTask) -> Optional[str]:
+        """
+        idempotency 키 선점
+
+        Returns:
+            재사용할 기존 task_id. 새 작업으로 키를 선점했으면 None
+        """
+        key = f"{self.idem_key}{task.idempotency_key}"
+        expire = int(self.ttl_hours * 3600)
+
+        existing_id = await self.redis.get(key)
+        if existing_id:
+            existing_id = existing_id.decode() if isinstance(existing_id, bytes) else existing_id
+            if await self._is_reusable(existing_id):
+                return existing_id
+            # 실패/오래된 작업의 키 인계 - 동시에 재제출한 쪽은 먼저 인계한 작업을 받는다
+            winner = await self.redis.eval(
+                _TAKE_OVER_IDEMPOTENCY_KEY, keys=[key], args=[existing_id, task.task_id, expire]
+            )
+            return winner.decode() if isinstance(winner, bytes) else winner
+
+        claimed = await self.redis.set(key, task.task_id, expire=expire, exist=self.redis.SET_IF_NOT_EXIST)
+        if claimed:
+            return None
+
+        # 동시에 다른 제출자가 선점
+        winner = await self.redis.get(key)
+        return winner.decode() if isinstance(winner, bytes) else winner
+
+    async def _is_reusable(self, task_id: str) -> bool:
+        """기존 작업이 대기/실행 중이거나 신선도 윈도우 안에 완료되었는지"""
+        status = await self.get_task_status(task_id)
+        if status in (TaskStatus.PENDING.value, TaskStatus.RUNNING.value):
+            return True
+
+        if status == TaskStatus.COMPLETED.value and self.freshness_seconds > 0:
+            completed_at = await self.redis.get(f"{self.prefix}completed:{task_id}")
+            if completed_at:
+                completed_at = completed_at.decode() if isinstance(completed_at, bytes) else completed_at
+                age = datetime.now() - datetime.fromisoformat(completed_at)
+                return age <= timedelta(seconds=self.freshness_seconds)
+
+        return False
+
     def _enqueue_memory(self, task: CrawlTask, task_json: str) -> str:
         """메모리에 작업 저장 (폴백)"""
+        existing_id = self.memory_idempotency.get(task.idempotency_key)
+        if existing_id in self.memory_fallback:
+            logger.info(f"♊ 중복 작업 제출 (메모리) → 기존 작업 반환: {existing_id[:8]}...")
+            return existing_id
+
+        self.memory_idempotency[task.idempotency_key] = task.task_id
         self.memory_fallback[task.task_id] = {
             "task": task,
             "json": task_json,
@@ -143,12 +240,19 @@ class RedisTaskQueue:
 
                 task = self._deserialize_task(task_json)
                 task.status = TaskStatus.RUNNING.value
+                task.worker_id = worker_id
+                task.started_at = datetime.now()
 
-                # 워커 정보 저장
+                # 워커 정보 및 임대 저장
                 await self.redis.hset(
-                    f"{self.prefix}running:{task_id}",
+                    f"{self.running_key}{task_id}",
                     "worker_id", worker_id,
-                    "started_at", datetime.now().isoformat()
+                    "started_at", task.started_at.isoformat()
+                )
+                await self.redis.zadd(
+                    self.lease_key,
+                    time.time() + self.lease_seconds,
+                    task_id
                 )
 
                 # 큐에서 제거
@@ -181,16 +285,157 @@ class RedisTaskQueue:
 
         return task
 
-    async def mark_completed(self, task_id: str) -> bool:
-        """작업 완료 표시"""
+    async def heartbeat(self, task_id: str, worker_id: str) -> bool:
+        """
+        작업 임대 연장
+
+        Returns:
+            임대를 연장했으면 True, 작업이 이미 회수되었거나 다른 워커 소유면 False
+        """
+        if not self.redis:
+            return True
+
+        try:
+            owner = await self.redis.hget(f"{self.running_key}{task_id}", "worker_id")
+            if isinstance(owner, bytes):
+                owner = owner.decode()
+            if owner != worker_id:
+                return False
+
+            await self.redis.zadd(self.lease_key, time.time() + self.lease_seconds, task_id)
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ 하트비트 실패: {task_id[:8]}... {e}")
+            return False
+
+    async def reclaim_expired_tasks(self) -> List[str]:
+        """
+        임대가 만료된 실행 중 작업 회수
+
+        워커가 죽어 하트비트가 끊긴 작업을 retry_count를 올려 다시 큐에 넣고,
+        재시도 한도를 넘은 작업은 실패 처리한다.
+
+        Returns:
+            회수된 작업 ID 목록
+        """
+        if not self.redis:
+            return []
+
+        reclaimed = []
+        try:
+            expired_ids = await self.redis.zrangebyscore(self.lease_key, 0, time.time())
+            for raw_id in expired_ids:
+                task_id = raw_id.decode() if isinstance(raw_id, bytes) else raw_id
+
+                # 다른 리퍼가 먼저 회수한 경우 건너뜀
+                if not await self.redis.zrem(self.lease_key, task_id):
+                    continue
+
+                running = await self.redis.hgetall(f"{self.running_key}{task_id}") or {}
+                worker_id = running.get(b"worker_id", running.get("worker_id", b""))
+                if isinstance(worker_id, bytes):
+                    worker_id = worker_id.decode()
+                await self.redis.delete(f"{self.running_key}{task_id}")
+
+                task_json = await self.redis.get(f"{self.task_key}{task_id}")
+                if not task_json:
+                    continue
+
+                task = self._deserialize_task(task_json)
+                if task.retry_count < task.max_retries:
+                    task.retry_count += 1
+                    task.status = TaskStatus.RETRYING.value
+                    await self.redis.set(
+                        f"{self.task_key}{task_id}",
+                        self._serialize_task(task),
+                        expire=int(self.ttl_hours * 3600)
+                    )
+                    await self.redis.zadd(self.queue_key, -task.priority, task_id)
+                    logger.warning(
+                        f"⏰ 임대 만료 → 재큐잉: {task_id[:8]}... "
+                        f"(워커: {worker_id}, 시도 {task.retry_count}/{task.max_retries})"
+                    )
+                else:
+                    await self.mark_failed(task_id, error=f"lease expired (worker={worker_id})")
+
+                reclaimed.append(task_id)
+
+        except Exception as e:
+            logger.error(f"❌ 유실 작업 회수 실패: {e}")
+
+        if reclaimed:
+            logger.info(f"♻️  {len(reclaimed)}개 유실 작업 회수")
+        return reclaimed
+
+    async def get_running_tasks_info(self) -> List[Dict]:
+        """실행 중인 작업의 워커 ID, 경과 시간, 임대 잔여 시간"""
+        if not self.redis:
+            return []
+
+        try:
+            now = time.time()
+            leases = await self.redis.zrange(self.lease_key, 0, -1, withscores=True)
+            running = []
+            for raw_id, expires_at in leases:
+                task_id = raw_id.decode() if isinstance(raw_id, bytes) else raw_id
+                info = await self.redis.hgetall(f"{self.running_key}{task_id}") or {}
+                info = {
+                    (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+                    for k, v in info.items()
+                }
+                started_at = info.get("started_at")
+                age = (datetime.now() - datetime.fromisoformat(started_at)).total_seconds() if started_at else 0.0
+                running.append({
+                    "task_id": task_id,
+                    "worker_id": info.get("worker_id", ""),
+                    "age_seconds": age,
+                    "lease_remaining_seconds": expires_at - now,
+                })
+            return running
+
+        except Exception as e:
+            logger.error(f"❌ 실행 중 작업 조회 실패: {e}")
+            return []
+
+    async def _release_lease(self, task_id: str, worker_id: Optional[str]) -> int:
+        """
+        임대 해제 (worker_id가 주어지면 그 워커가 임대를 가지고 있을 때만, 원자적으로)
+
+        Returns:
+            0=다른 워커 소유라 반영하지 않음, 1=해제할 임대 없음, 2=임대 해제
+        """
+        released = int(await self.redis.eval(
+            _RELEASE_LEASE,
+            keys=[f"{self.running_key}{task_id}", self.lease_key],
+            args=[task_id, worker_id or ""]
+        ))
+        if not released:
+            logger.warning(f"⚠️  임대 없는 워커의 보고 무시: {task_id[:8]}... (워커: {worker_id})")
+        return released
+
+    async def mark_completed(
+        self,
+        task_id: str,
+        result: Optional[Dict] = None,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """작업 완료 표시 (신선도 윈도우가 켜져 있으면 결과 보관, worker_id가 주어지면 임대 확인)"""
         if self.redis:
             try:
+                if not await self._release_lease(task_id, worker_id):
+                    return False
                 await self.redis.set(
                     f"{self.prefix}completed:{task_id}",
                     datetime.now().isoformat(),
                     expire=int(self.ttl_hours * 3600)
                 )
-                await self.redis.delete(f"{self.prefix}running:{task_id}")
+                if result is not None and self.freshness_seconds > 0:
+                    await self.redis.set(
+                        f"{self.result_key}{task_id}",
+                        json.dumps(result, ensure_ascii=False, default=str),
+                        expire=self.freshness_seconds
+                    )
                 await self.redis.delete(f"{self.task_key}{task_id}")
                 logger.info(f"✅ 작업 완료: {task_id[:8]}...")
                 return True
@@ -199,16 +444,43 @@ class RedisTaskQueue:
                 return False
         return True
 
-    async def mark_failed(self, task_id: str, error: str = "") -> bool:
-        """작업 실패 표시"""
+    async def release(self, task_id: str, worker_id: Optional[str] = None) -> bool:
+        """실행 중 작업 반납 (재시도 횟수를 올리지 않고 대기열 복귀, worker_id가 주어지면 임대 확인)"""
+        if not self.redis:
+            return False
+
+        try:
+            if await self._release_lease(task_id, worker_id) < 2:
+                return False
+
+            task_json = await self.redis.get(f"{self.task_key}{task_id}")
+            if not task_json:
+                return False
+            task = self._deserialize_task(task_json)
+            task.status = TaskStatus.PENDING.value
+            await self.redis.set(
+                f"{self.task_key}{task_id}",
+                self._serialize_task(task),
+                expire=int(self.ttl_hours * 3600)
+            )
+            await self.redis.zadd(self.queue_key, -task.priority, task_id)
+            logger.info(f"↩️  작업 반납: {task_id[:8]}...")
+            return True
+        except Exception as e:
+            logger.error(f"❌ 작업 반납 실패: {e}")
+            return False
+
+    async def mark_failed(self, task_id: str, error: str = "", worker_id: Optional[str] = None) -> bool:
+        """작업 실패 표시 (worker_id가 주어지면 임대를 가진 워커일 때만)"""
         if self.redis:
             try:
+                if not await self._release_lease(task_id, worker_id):
+                    return False
                 await self.redis.hset(
                     f"{self.prefix}failed:{task_id}",
                     "error", error,
                     "timestamp", datetime.now().isoformat()
                 )
-                await self.redis.delete(f"{self.prefix}running:{task_id}")
                 logger.error(f"❌ 작업 실패: {task_id[:8]}... {error}")
                 return True
             except Exception as e:
@@ -216,12 +488,28 @@ class RedisTaskQueue:
                 return False
         return True
 
+    async def get_task_result(self, task_id: str) -> Optional[Dict]:
+        """완료된 작업의 보관된 결과 조회"""
+        if not self.redis:
+            return None
+
+        try:
+            result_json = await self.redis.get(f"{self.result_key}{task_id}")
+            if not result_json:
+                return None
+            if isinstance(result_json, bytes):
+                result_json = result_json.decode()
+            return json.loads(result_json)
+        except Exception as e:
+            logger.error(f"❌ 결과 조회 실패: {e}")
+            return None
+
     async def get_task_status(self, task_id: str) -> Optional[str]:
         """작업 상태 조회"""
         if self.redis:
             try:
                 # 실행 중 확인
-                if await self.redis.exists(f"{self.prefix}running:{task_id}"):
+                if await self.redis.exists(f"{self.running_key}{task_id}"):
                     return TaskStatus.RUNNING.value
 
                 # 완료 확인
@@ -248,7 +536,7 @@ class RedisTaskQueue:
         if self.redis:
             try:
                 pending = await self.redis.zcard(self.queue_key)
-                running = await self.redis.dbsize()  # 근사값
+                running = await self.redis.zcard(self.lease_key)
                 return {
                     "pending": pending,
                     "running": running,
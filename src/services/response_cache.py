@@ -0,0 +1,451 @@
+"""
+API 응답 캐시 (ETag / 304, 쓰기 기반 무효화)
+
+주요 기능:
+1. 라우트 + 파라미터 키로 JSON 응답 본문과 강한 ETag 보관 (프로세스 내 LRU)
+2. 공유 저장소 (로컬 SQLite 파일, 기본 사용) - 여러 API 워커와 적재/분석 스크립트가 공유
+   별도 프로세스인 적재/분석 스크립트의 커밋은 이 저장소를 통해서만 API 캐시를 무효화한다
+3. 엔티티 태그("professor:<id>") 기준 무효화 - 커밋된 변경만 반영
+4. 세션 커밋 훅으로 ORM / bulk_upsert 쓰기를 자동 무효화 (변경 엔티티 + 상위 엔티티)
+
+무효화 순서 보장:
+    응답 계산 전에 epoch를 기록하고, 그 뒤에 무효화된 태그가 있는 항목은 버린다.
+    (계산 중에 커밋된 쓰기가 있으면 방금 만든 응답도 캐시에서 바로 무효)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.domain.models import (
+    College, Department, Laboratory, LabMember, PaperAnalysis, Professor, Report, ReportPaper,
+    ReportProfessor, ResearchPaper, University, User
+)
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2048"))
+# 태그로 잡히지 않는 변경(예: 상위 엔티티 이름)까지 결국 반영되도록 두는 최대 수명
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "600"))
+# 공유 저장소 경로 (빈 값이나 "off"면 프로세스 내 캐시만 사용 - 다른 프로세스의 쓰기는 TTL 후에야 반영)
+RESPONSE_CACHE_STORE = os.getenv("RESPONSE_CACHE_STORE", "./response_cache.db")
+
+# 테이블별 무효화 태그: (종류, 컬럼) - 컬럼이 None이면 종류 자체가 컬렉션 태그
+# 변경된 엔티티와, 자식 목록/건수를 보여주는 상위 엔티티를 함께 무효화한다.
+INVALIDATION_RULES = {
+    University.__table__: [("university", "id"), ("universities", None)],
+    College.__table__: [("college", "id"), ("university", "university_id")],
+    Department.__table__: [("department", "id"), ("college", "college_id")],
+    Professor.__table__: [("professor", "id"), ("department", "department_id")],
+    Laboratory.__table__: [("laboratory", "id"), ("professor", "professor_id"), ("department", "department_id")],
+    LabMember.__table__: [("laboratory", "lab_id")],
+    ResearchPaper.__table__: [("paper", "id"), ("laboratory", "lab_id"), ("papers", None)],
+    PaperAnalysis.__table__: [("paper", "paper_id"), ("papers", None), ("analyses", None)],
+    User.__table__: [("user", "id")],
+    Report.__table__: [("report", "id"), ("user", "user_id")],
+    ReportPaper.__table__: [("report", "report_id")],
+    ReportProfessor.__table__: [("report", "report_id")],
+}
+
+_PENDING_KEY = "response_cache_tags"
+_STORE_PRUNE_EVERY = 200  # 공유 저장소 정리 주기 (put 횟수)
+
+
+def entity_tag(kind: str, entity_id) -> str:
+    """엔티티 태그 ("laboratory:<id>")"""
+    return f"{kind}:{entity_id}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """캐시된 응답"""
+    body: bytes
+    etag: str
+    tags: FrozenSet[str]
+    epoch: int  # 응답 계산을 시작할 때의 epoch
+    created_at: float
+
+
+class _MemoryClock:
+    """프로세스 내 무효화 기록 (공유 저장소가 없을 때)"""
+
+    def __init__(self):
+        self._epoch = 0
+        self._invalidated: Dict[str, Tuple[int, float]] = {}  # 태그 → (epoch, 시각)
+        self._lock = threading.Lock()
+
+    def epoch(self) -> int:
+        return self._epoch
+
+    def invalidate(self, tags: Iterable[str], ttl: float):
+        now = time.time()
+        with self._lock:
+            self._epoch += 1
+            for tag in tags:
+                self._invalidated[tag] = (self._epoch, now)
+            if len(self._invalidated) > RESPONSE_CACHE_SIZE * 8:
+                # TTL보다 오래된 무효화 이전에 만든 응답은 이미 만료됨
+                self._invalidated = {t: v for t, v in self._invalidated.items() if now - v[1] < ttl}
+
+    def is_stale(self, entry: CachedResponse) -> bool:
+        invalidated = self._invalidated
+        return any(invalidated.get(tag, (0,))[0] > entry.epoch for tag in entry.tags)
+
+
+class SharedResponseStore:
+    """
+    로컬 SQLite 파일 기반 공유 저장소
+
+    응답 본문과 무효화 기록(태그별 epoch)을 보관하므로, 같은 호스트의 다른
+    API 워커가 만든 응답을 재사용하고 적재/분석 스크립트의 무효화를 반영한다.
+    """
+
+    def __init__(self, path: str, max_entries: int = RESPONSE_CACHE_SIZE * 4):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 보관할 최대 응답 수
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._puts = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS clock (id INTEGER PRIMARY KEY CHECK (id = 1), epoch INTEGER NOT NULL);
+                INSERT OR IGNORE INTO clock (id, epoch) VALUES (1, 0);
+                CREATE TABLE IF NOT EXISTS invalidations (
+                    tag TEXT PRIMARY KEY, epoch INTEGER NOT NULL, invalidated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL,
+                    tags TEXT NOT NULL, epoch INTEGER NOT NULL, created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_responses_created_at ON responses (created_at);
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def epoch(self) -> int:
+        return self._connect().execute("SELECT epoch FROM clock WHERE id = 1").fetchone()[0]
+
+    def invalidate(self, tags: Iterable[str], ttl: float):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("UPDATE clock SET epoch = epoch + 1 WHERE id = 1")
+            epoch = conn.execute("SELECT epoch FROM clock WHERE id = 1").fetchone()[0]
+            conn.executemany(
+                "INSERT INTO invalidations (tag, epoch, invalidated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (tag) DO UPDATE SET epoch = excluded.epoch, invalidated_at = excluded.invalidated_at",
+                [(tag, epoch, now) for tag in tags]
+            )
+            conn.execute("DELETE FROM invalidations WHERE invalidated_at < ?", (now - ttl,))
+
+    def is_stale(self, entry: CachedResponse) -> bool:
+        tags = list(entry.tags)
+        if not tags:
+            return False
+        conn = self._connect()
+        # SQLite 바인드 변수 제한을 넘지 않도록 나눠서 조회
+        for i in range(0, len(tags), 500):
+            chunk = tags[i:i + 500]
+            row = conn.execute(
+                f"SELECT 1 FROM invalidations WHERE epoch > ? AND tag IN ({','.join('?' * len(chunk))}) LIMIT 1",
+                (entry.epoch, *chunk)
+            ).fetchone()
+            if row:
+                return True
+        return False
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        row = self._connect().execute(
+            "SELECT body, etag, tags, epoch, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, etag, tags, epoch, created_at = row
+        return CachedResponse(bytes(body), etag, frozenset(json.loads(tags)), epoch, created_at)
+
+    def put(self, key: str, entry: CachedResponse, ttl: float):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, tags, epoch, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, entry.etag, entry.body, json.dumps(sorted(entry.tags)), entry.epoch, entry.created_at)
+            )
+            self._puts += 1
+            if self._puts % _STORE_PRUNE_EVERY == 0:
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - ttl,))
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+
+    def delete(self, key: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """API 응답 캐시 (프로세스 내 LRU + 선택적 공유 저장소)"""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_SIZE,
+        ttl: float = RESPONSE_CACHE_TTL,
+        store: Optional[SharedResponseStore] = None
+    ):
+        """
+        Args:
+            max_entries: 프로세스 내에 보관할 응답 수
+            ttl: 응답 최대 수명 (초)
+            store: 공유 저장소 (None이면 프로세스 내 캐시만 사용)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self._clock = store if store is not None else _MemoryClock()
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "shared_hits": 0, "misses": 0, "invalidations": 0, "store_errors": 0}
+
+    @staticmethod
+    def make_key(route: str, params: Dict) -> str:
+        """라우트 이름 + (검증된) 파라미터로 만든 캐시 키"""
+        return json.dumps([route, sorted(params.items())], ensure_ascii=False, default=str, separators=(",", ":"))
+
+    def epoch(self) -> int:
+        """현재 epoch (응답 계산 전에 기록해서 put()에 전달)"""
+        try:
+            return self._clock.epoch()
+        except sqlite3.Error as e:
+            self._store_error(e)
+            return -1  # 저장소 장애 시 이 응답은 무효로 취급
+
+    def _valid(self, entry: CachedResponse) -> bool:
+        if entry.epoch < 0 or time.time() - entry.created_at >= self.ttl:
+            return False
+        try:
+            return not self._clock.is_stale(entry)
+        except sqlite3.Error as e:
+            self._store_error(e)
+            return False
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """유효한 캐시 응답 조회 (없거나 무효화되었으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            if self._valid(entry):
+                self.stats["hits"] += 1
+                return entry
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+
+        if self.store is not None:
+            try:
+                entry = self.store.get(key)
+            except sqlite3.Error as e:
+                self._store_error(e)
+                entry = None
+            if entry is not None and self._valid(entry):
+                self._remember(key, entry)
+                self.stats["shared_hits"] += 1
+                return entry
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, body: bytes, tags: Iterable[str], epoch: int) -> CachedResponse:
+        """
+        응답 저장
+
+        Args:
+            key: make_key()로 만든 키
+            body: JSON 응답 본문
+            tags: 응답에 포함된 엔티티/컬렉션 태그
+            epoch: 응답 계산 전에 epoch()로 얻은 값
+
+        Returns:
+            CachedResponse (ETag = 본문 해시)
+        """
+        entry = CachedResponse(
+            body=body,
+            etag=sha256(body).hexdigest()[:32],
+            tags=frozenset(tags),
+            epoch=epoch,
+            created_at=time.time()
+        )
+        if epoch < 0:
+            return entry
+
+        self._remember(key, entry)
+        if self.store is not None:
+            try:
+                self.store.put(key, entry, self.ttl)
+            except sqlite3.Error as e:
+                self._store_error(e)
+        return entry
+
+    def _remember(self, key: str, entry: CachedResponse):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str):
+        """태그가 붙은 응답 무효화 (이미 계산 중인 응답 포함)"""
+        if not tags:
+            return
+        try:
+            self._clock.invalidate(set(tags), self.ttl)
+        except sqlite3.Error as e:
+            self._store_error(e)
+            return
+        self.stats["invalidations"] += 1
+        logger.debug(f"🧹 응답 캐시 무효화: {len(tags)}개 태그")
+
+    def clear(self):
+        """프로세스 내 캐시와 공유 저장소의 응답 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            try:
+                self.store.clear()
+            except sqlite3.Error as e:
+                self._store_error(e)
+
+    def _store_error(self, error: Exception):
+        self.stats["store_errors"] += 1
+        logger.warning(f"⚠️ 응답 캐시 공유 저장소 오류 (캐시 없이 처리): {error}")
+
+    def get_stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            size = len(self._entries)
+        return {**self.stats, "size": size, "shared_store": self.store.path if self.store else None}
+
+
+# 전역 캐시 인스턴스
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """전역 ResponseCache 인스턴스 획득 (RESPONSE_CACHE_STORE가 꺼져 있지 않으면 공유 저장소 사용)"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                enabled = RESPONSE_CACHE_STORE and RESPONSE_CACHE_STORE.lower() != "off"
+                store = SharedResponseStore(RESPONSE_CACHE_STORE) if enabled else None
+                _response_cache = ResponseCache(store=store)
+    return _response_cache
+
+
+# ===================== 쓰기 기반 무효화 =====================
+
+def row_tags(table, rows: Iterable) -> Set[str]:
+    """
+    변경된 행(dict 또는 ORM 객체)의 무효화 태그
+
+    Args:
+        table: 테이블 또는 ORM 모델
+        rows: 변경된 행
+    """
+    rules = INVALIDATION_RULES.get(getattr(table, "__table__", table))
+    if not rules:
+        return set()
+
+    tags = set()
+    for row in rows:
+        get = row.get if isinstance(row, dict) else (lambda name, obj=row: getattr(obj, name, None))
+        for kind, column in rules:
+            if column is None:
+                tags.add(kind)
+            elif get(column) is not None:
+                tags.add(entity_tag(kind, get(column)))
+    return tags
+
+
+def _moved_from_tags(obj) -> Set[str]:
+    """상위 엔티티가 바뀐 ORM 객체의 이전 상위 태그 (예: 교수의 이전 학과)"""
+    tags = set()
+    state = inspect(obj)
+    for kind, column in INVALIDATION_RULES.get(obj.__table__, []):
+        if column is not None and column in state.attrs:
+            tags.update(entity_tag(kind, old) for old in state.attrs[column].history.deleted if old is not None)
+    return tags
+
+
+def mark_changed(session: Session, table, rows: Iterable):
+    """
+    커밋 시 무효화할 행 기록 (Core 일괄 쓰기용, ORM 변경은 훅이 자동 기록)
+
+    커밋 전에 무효화하면 그 사이에 이전 데이터로 응답이 다시 캐시될 수 있으므로
+    세션에 모아 두었다가 커밋 후 한 번에 무효화한다.
+    """
+    tags = row_tags(table, rows)
+    if tags:
+        session.info.setdefault(_PENDING_KEY, set()).update(tags)
+
+
+def _after_flush(session: Session, flush_context):
+    tags = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not hasattr(obj, "__table__") or obj.__table__ not in INVALIDATION_RULES:
+            continue
+        tags.update(row_tags(obj.__table__, [obj]))
+        tags.update(_moved_from_tags(obj))
+
+
+def _after_commit(session: Session):
+    tags = session.info.pop(_PENDING_KEY, None)
+    if tags:
+        get_response_cache().invalidate(*tags)
+
+
+def _after_rollback(session: Session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_invalidation_hooks(session_factory):
+    """
+    세션 팩토리(sessionmaker)에 응답 캐시 무효화 훅 등록
+
+    Args:
+        session_factory: sessionmaker 또는 Session 클래스
+    """
+    for name, hook in (("after_flush", _after_flush), ("after_commit", _after_commit),
+                       ("after_soft_rollback", _after_rollback)):
+        if not event.contains(session_factory, name, hook):
+            event.listen(session_factory, name, hook)
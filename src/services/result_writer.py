@@ -0,0 +1,375 @@
+"""
+크롤링 결과 일괄 저장 서비스 (워커 → DB 쓰기 단계)
+
+주요 기능:
+1. 제한된 크기의 큐로 워커와 DB 쓰기 분리 (워커는 DB를 기다리지 않음)
+2. 교수/연구실은 자연 키(uq_professor, uq_lab), 논문은 자연 키에서 만든 id 기준 upsert
+3. executemany 방식 일괄 INSERT 및 N행 / T밀리초 단위 그룹 커밋
+4. DB 파일당 단일 writer 스레드 (SQLite 잠금 경합 방지)
+5. 그룹 커밋 실패 시 작업별 커밋으로 문제 작업만 격리하고 제출자에게 통보
+"""
+
+import copy
+import hashlib
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.database.db import Database
+from src.database.models import CrawlTask as DBCrawlTask, CrawlResult, Professor, Paper, Lab
+from src.services.task_queue import CrawlTask
+from src.services.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+# 저장에 실패한 작업과 오류 메시지를 받는 콜백 (writer 스레드에서 호출됨)
+FailureHandler = Callable[[CrawlTask, str], None]
+PendingItem = Tuple[CrawlTask, Dict, Optional[FailureHandler]]
+
+
+def _md5(*parts) -> str:
+    return hashlib.md5("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def _parse_year(value) -> Optional[int]:
+    try:
+        return int(str(value)[:4])
+    except (TypeError, ValueError):
+        return None
+
+
+def _confidence(item: Dict) -> float:
+    """추출기 신뢰도(0-1)를 0-100% 점수로 변환"""
+    return float(item.get("confidence", 0.0)) * 100
+
+
+class ResultWriter:
+    """크롤링 결과 일괄 저장 (DB 파일당 하나)"""
+
+    def __init__(
+        self,
+        database: Database,
+        max_pending: int = 1000,
+        batch_rows: int = 500,
+        flush_interval_ms: int = 200
+    ):
+        """
+        초기화
+
+        Args:
+            database: 데이터베이스
+            max_pending: 쓰기 대기 큐 최대 크기 (작업 단위)
+            batch_rows: 이 행 수가 모이면 즉시 커밋
+            flush_interval_ms: 행 수가 모자라도 이 시간이 지나면 커밋
+        """
+        self.database = database
+        self.batch_rows = batch_rows
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.pending: "queue.Queue[PendingItem]" = queue.Queue(maxsize=max_pending)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self.closed = False
+
+        self.stats = {
+            "tasks_written": 0,
+            "rows_written": 0,
+            "batches": 0,
+            "errors": 0,
+            "tasks_failed": 0,
+            "last_batch_ms": 0.0,
+        }
+
+        dialect = database.engine.dialect.name
+        self._insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialect)
+        if self._insert is None:
+            logger.warning(f"⚠️  {dialect}: ON CONFLICT 미지원 - 행 단위 merge로 저장")
+
+        logger.info(
+            f"🚀 ResultWriter 초기화 (batch={batch_rows}행/{flush_interval_ms}ms, 큐={max_pending})"
+        )
+
+    # ===================== 공개 API =====================
+
+    def start(self):
+        """writer 스레드 시작"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+            self._thread.start()
+        logger.info("✅ ResultWriter 시작")
+
+    def try_submit(self, task: CrawlTask, result: Dict, on_failed: Optional[FailureHandler] = None) -> bool:
+        """
+        결과 저장 요청 (대기하지 않음)
+
+        Args:
+            task: 작업
+            result: 크롤링 결과
+            on_failed: 작업별 재저장까지 실패하면 writer 스레드에서 호출할 콜백
+
+        Returns:
+            큐에 넣었으면 True, 큐가 가득 찼으면 False
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        try:
+            # 큐가 완료 처리 후 작업의 임대 정보를 지우므로 제출 시점 상태를 복사해 둔다
+            self.pending.put_nowait((copy.copy(task), result, on_failed))
+            return True
+        except queue.Full:
+            return False
+
+    def stop(self, timeout: float = 30.0):
+        """남은 결과를 모두 저장한 뒤 writer 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self.closed = True
+        with _writers_lock:
+            if _writers.get(self.database.db_url) is self:
+                del _writers[self.database.db_url]
+        logger.info(f"⏹️  ResultWriter 종료 (미저장 {self.pending.qsize()}건)")
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            **self.stats,
+            "queued": self.pending.qsize(),
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+    # ===================== writer 스레드 =====================
+
+    def _run(self):
+        """큐에서 결과를 모아 그룹 커밋"""
+        while not (self._stop_event.is_set() and self.pending.empty()):
+            try:
+                first = self.pending.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            rows = self._row_count(first[1])
+            deadline = time.monotonic() + self.flush_interval
+            while rows < self.batch_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                rows += self._row_count(item[1])
+
+            self._flush(batch)
+
+    @staticmethod
+    def _row_count(result: Dict) -> int:
+        return 2 + len(result.get("professors", [])) + len(result.get("papers", [])) + len(result.get("labs", []))
+
+    def _flush(self, batch: List[PendingItem]):
+        """배치를 하나의 트랜잭션으로 저장 (실패하면 작업별로 다시 저장해 문제 작업만 격리)"""
+        started = time.perf_counter()
+        try:
+            written = self._write(batch)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"❌ 결과 일괄 저장 오류 ({len(batch)}개 작업): {e} → 작업별로 재시도")
+            written, batch = self._write_each(batch)
+            if not batch:
+                return
+
+        self.stats["batches"] += 1
+        self.stats["tasks_written"] += len(batch)
+        self.stats["rows_written"] += written
+        self.stats["last_batch_ms"] = (time.perf_counter() - started) * 1000
+        logger.debug(f"💾 {len(batch)}개 작업 / {written}행 저장 ({self.stats['last_batch_ms']:.1f}ms)")
+
+    def _write(self, batch: List[PendingItem]) -> int:
+        """배치를 한 트랜잭션으로 upsert하고 쓴 행 수 반환"""
+        tables = self._build_rows(batch)
+        with get_tracer().root_span("persist.batch", tasks=len(batch)), self.database.session_scope() as session:
+            written = 0
+            for model, key, rows in tables:
+                if rows:
+                    self._upsert(session, model, key, rows)
+                    written += len(rows)
+        return written
+
+    def _write_each(self, batch: List[PendingItem]) -> Tuple[int, List[PendingItem]]:
+        """작업마다 따로 커밋 (저장된 행 수와 저장된 작업 반환, 실패한 작업은 제출자에게 통보)"""
+        written, saved = 0, []
+        for item in batch:
+            try:
+                written += self._write([item])
+                saved.append(item)
+            except Exception as e:
+                self._report_failure(item, e)
+        return written, saved
+
+    def _report_failure(self, item: PendingItem, error: Exception):
+        """저장하지 못한 작업을 제출자에게 통보 (큐에서 재시도/실패로 되돌리도록)"""
+        task, _, on_failed = item
+        self.stats["tasks_failed"] += 1
+        logger.error(f"❌ 결과 저장 실패: {task.task_id[:8]}... {error}")
+        if on_failed is None:
+            return
+        try:
+            on_failed(task, str(error))
+        except Exception as e:
+            logger.warning(f"⚠️  저장 실패 통보 오류: {task.task_id[:8]}... {e}")
+
+    def _build_rows(self, batch: List[PendingItem]) -> List[Tuple[type, List[str], List[Dict]]]:
+        """결과를 테이블별 행으로 변환 (배치 내 자연 키 중복은 마지막 값 사용)"""
+        now = datetime.now()
+        tasks, results = {}, {}
+        professors, papers, labs = {}, {}, {}
+
+        for task, result, _ in batch:
+            stats = result.get("extraction_stats", {})
+            result_id = _md5(task.task_id, task.url)
+            partial = bool(result.get("partial"))
+
+            tasks[task.task_id] = {
+                "id": task.task_id,
+                "url": task.url,
+                "university_name": task.university_name,
+                "department_name": task.department_name,
+                "status": "partial" if partial else "completed",
+                "priority": task.priority,
+                "created_at": task.created_at,
+                "started_at": task.started_at,
+                "completed_at": None if partial else now,
+                "retry_count": task.retry_count,
+                "max_retries": task.max_retries,
+                "use_cache": task.use_cache,
+                "use_ocr": task.use_ocr,
+                "parallel_crawl": task.parallel_crawl,
+                "timeout_seconds": task.timeout_seconds,
+            }
+            results[result_id] = {
+                "id": result_id,
+                "task_id": task.task_id,
+                "url": task.url,
+                "university_name": task.university_name,
+                "professors_count": stats.get("professors_count", 0),
+                "papers_count": stats.get("papers_count", 0),
+                "labs_count": stats.get("labs_count", 0),
+                "pages_crawled": stats.get("pages_crawled", result.get("pages_crawled", 0)),
+                "created_at": now,
+                "updated_at": now,
+            }
+
+            department = task.department_name or result.get("department", "")
+            for prof in result.get("professors", []):
+                name = (prof.get("name") or "").strip()[:100]
+                if not name:
+                    continue
+                email = (prof.get("email") or "").strip()[:100]
+                key = (name, email, task.university_name)
+                professors[key] = {
+                    "id": _md5(*key),
+                    "crawl_result_id": result_id,
+                    "name": name,
+                    "email": email,
+                    "university_name": task.university_name,
+                    "department": department[:100],
+                    "title": (prof.get("title") or "")[:50] or None,
+                    "phone": (prof.get("phone") or "")[:20] or None,
+                    "confidence_score": _confidence(prof),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+
+            for paper in result.get("papers", []):
+                title = (paper.get("title") or "").strip()[:500]
+                if not title:
+                    continue
+                year = _parse_year(paper.get("year"))
+                key = (title, year)
+                authors = paper.get("authors")
+                papers[key] = {
+                    "id": _md5(*key),
+                    "crawl_result_id": result_id,
+                    "title": title,
+                    "authors": authors if isinstance(authors, str) or authors is None else ", ".join(authors),
+                    "published_year": year,
+                    "conference": (paper.get("venue") or "")[:200] or None,
+                    "url": (paper.get("url") or "")[:500] or None,
+                    "confidence_score": _confidence(paper),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+
+            for lab in result.get("labs", []):
+                name = (lab.get("name") or "").strip()[:300]
+                if not name:
+                    continue
+                key = (name, task.university_name)
+                labs[key] = {
+                    "id": _md5(*key),
+                    "crawl_result_id": result_id,
+                    "name": name,
+                    "university_name": task.university_name,
+                    "department": department[:100],
+                    "description": lab.get("description"),
+                    "url": (lab.get("url") or "")[:500] or None,
+                    "extraction_method": lab.get("extraction_method"),
+                    "confidence_score": _confidence(lab),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+
+        # crawl_results.task_id -> crawl_tasks.id 외래키 때문에 작업을 먼저 저장
+        return [
+            (DBCrawlTask, ["id"], list(tasks.values())),
+            (CrawlResult, ["id"], list(results.values())),
+            (Professor, ["name", "email", "university_name"], list(professors.values())),
+            # id = md5(제목, 연도): 연도가 NULL이면 uq_paper가 일치하지 않으므로 id로 충돌 판정
+            (Paper, ["id"], list(papers.values())),
+            (Lab, ["name", "university_name"], list(labs.values())),
+        ]
+
+    def _upsert(self, session, model, key: List[str], rows: List[Dict]):
+        """자연 키 기준 일괄 upsert (executemany)"""
+        if self._insert is None:
+            for row in rows:
+                session.merge(model(**row))
+            return
+
+        stmt = self._insert(model.__table__)
+        # 최초 생성 정보(id, created_at)와 자연 키는 유지하고 나머지만 갱신
+        preserved = set(key) | {"id", "created_at"}
+        update_cols = {
+            name: stmt.excluded[name]
+            for name in rows[0]
+            if name not in preserved
+        }
+        stmt = stmt.on_conflict_do_update(index_elements=key, set_=update_cols)
+        session.execute(stmt, rows)
+
+
+# ===================== DB 파일당 단일 writer =====================
+
+_writers: Dict[str, ResultWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_result_writer(database: Database, **kwargs) -> ResultWriter:
+    """데이터베이스(URL)별 전역 ResultWriter 획득"""
+    with _writers_lock:
+        writer = _writers.get(database.db_url)
+        if writer is None or writer.closed:
+            writer = ResultWriter(database, **kwargs)
+            _writers[database.db_url] = writer
+        return writer
@@ -6,15 +6,20 @@
 2. 작업 상태 추적
 3. 우선순위 기반 작업 할당
 4. 작업 재시도
+5. 작업 임대(lease) 및 하트비트 기반 유실 작업 회수
+6. 대학/호스트별 공정 스케줄링 (라운드로빈 + 우선순위 에이징)
+7. 정규화 URL 기반 중복 제출 방지 (idempotency)
 """
 
 import logging
 import hashlib
 import heapq
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict, defaultdict, deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,31 @@ class TaskPriority(Enum):
     CRITICAL = 2
 
 
+# 정규화 시 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "fbclid", "gclid"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화 (중복 작업 판별용)
+
+    스킴/호스트 소문자화, 기본 포트·프래그먼트·추적 파라미터 제거,
+    쿼리 파라미터 정렬, 경로 끝 슬래시 제거
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if parsed.port and not ((scheme == "http" and parsed.port == 80) or (scheme == "https" and parsed.port == 443)):
+        host = f"{host}:{parsed.port}"
+
+    path = parsed.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS
+    ))
+    return urlunparse((scheme, host, path, "", query, ""))
+
+
 @dataclass
 class CrawlTask:
     """크롤링 작업"""
@@ -55,12 +85,32 @@ class CrawlTask:
     parallel_crawl: bool = False
     timeout_seconds: int = 30
 
+    # 임대 정보 (실행 중인 워커 추적)
+    worker_id: str = field(default="")
+    started_at: Optional[datetime] = field(default=None)
+    lease_expires_at: Optional[datetime] = field(default=None)
+
+    # 완료 정보 (신선도 윈도우 내 중복 제출 시 재사용)
+    completed_at: Optional[datetime] = field(default=None)
+    result: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
     def __post_init__(self):
         if not self.task_id:
             # URL과 타임스탬프로 고유 ID 생성
             hash_input = f"{self.url}{self.created_at.isoformat()}"
             self.task_id = hashlib.md5(hash_input.encode()).hexdigest()
 
+    @property
+    def crawl_profile(self) -> str:
+        """크롤 결과에 영향을 주는 설정"""
+        return f"ocr={int(self.use_ocr)};parallel={int(self.parallel_crawl)}"
+
+    @property
+    def idempotency_key(self) -> str:
+        """정규화 URL + 크롤 프로필 기반 중복 판별 키"""
+        hash_input = f"{canonicalize_url(self.url)}|{self.crawl_profile}"
+        return hashlib.md5(hash_input.encode()).hexdigest()
+
     def __lt__(self, other):
         """우선순위 큐 비교 (높은 우선순위가 먼저)"""
         if self.priority != other.priority:
@@ -71,84 +121,376 @@ class CrawlTask:
         return f"<CrawlTask {self.task_id[:8]}... {self.university_name}>"
 
 
-class InMemoryTaskQueue:
-    """메모리 기반 작업 큐"""
+FAIR_KEYS = ("university", "host")
 
-    def __init__(self, max_size: int = 10000):
+
+class InMemoryTaskQueue:
+    """
+    메모리 기반 작업 큐
+
+    같은 URL(정규화 기준)과 크롤 프로필의 작업이 대기/실행 중이면 기존 task_id를
+    돌려주고, freshness_seconds 안에 완료된 작업이 있으면 그 결과를 재사용한다.
+
+    fair_key를 지정하면 같은 우선순위 안에서 대학(university) 또는 호스트(host)별로
+    라운드로빈하여 한 대학의 대량 제출이 다른 대학을 굶기지 않도록 한다.
+    대기 시간이 aging_seconds 지날 때마다 우선순위가 한 단계씩 올라가므로
+    LOW 작업도 결국 처리된다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        lease_seconds: int = 120,
+        fair_key: Optional[str] = None,
+        aging_seconds: int = 300,
+        per_key_concurrency: int = 0,
+        freshness_seconds: int = 0
+    ):
         """
         초기화
 
         Args:
             max_size: 최대 큐 크기
+            lease_seconds: 작업 임대 시간 (초). 하트비트가 없으면 만료 후 회수
+            fair_key: 공정 스케줄링 기준 ("university", "host", None=우선순위 순서만)
+            aging_seconds: 공정 모드에서 우선순위를 한 단계 올리는 대기 시간 (초)
+            per_key_concurrency: 공정 모드에서 대학/호스트별 동시 실행 작업 상한 (0=무제한)
+            freshness_seconds: 완료된 작업 결과를 중복 제출에 재사용하는 시간 (초, 0=재사용 안 함)
         """
+        if fair_key is not None and fair_key not in FAIR_KEYS:
+            raise ValueError(f"fair_key must be one of {FAIR_KEYS} or None, got {fair_key!r}")
+
         self.max_size = max_size
+        self.lease_seconds = lease_seconds
+        self.fair_key = fair_key
+        self.aging_seconds = aging_seconds
+        self.per_key_concurrency = per_key_concurrency
+        self.freshness_seconds = freshness_seconds
         self.pending_queue = []  # 우선순위 큐
+        self.fair_levels: Dict[int, "OrderedDict[str, deque]"] = {}  # priority -> key -> FIFO (공정 모드)
+        self.fair_pending_count = 0
+        self.running_per_key: Dict[str, int] = defaultdict(int)
         self.running_tasks: Dict[str, CrawlTask] = {}  # task_id -> Task
         self.completed_tasks: Dict[str, CrawlTask] = {}  # task_id -> Task
         self.failed_tasks: Dict[str, CrawlTask] = {}  # task_id -> Task
         self.task_registry: Dict[str, CrawlTask] = {}  # task_id -> Task (모든 상태)
+        self.idempotency_index: Dict[str, str] = {}  # idempotency_key -> 최근 task_id
 
-        logger.info(f"🚀 InMemoryTaskQueue 초기화 (max_size={max_size})")
+        logger.info(
+            f"🚀 InMemoryTaskQueue 초기화 (max_size={max_size}, lease={lease_seconds}초, "
+            f"fair={fair_key or 'off'})"
+        )
 
     def enqueue(self, task: CrawlTask) -> str:
-        """작업 큐에 추가"""
+        """
+        작업 큐에 추가
+
+        Returns:
+            task_id. 중복 제출이면 기존 작업의 task_id, 큐가 가득 차면 None
+        """
+        existing = self.find_duplicate(task)
+        if existing is not None:
+            logger.info(f"♊ 중복 작업 제출 → 기존 작업 반환: {existing.task_id[:8]}... ({existing.status})")
+            return existing.task_id
+
         if len(self.task_registry) >= self.max_size:
             logger.warning(f"⚠️  큐 크기 초과: {len(self.task_registry)}/{self.max_size}")
             return None
 
         task.status = TaskStatus.PENDING.value
-        heapq.heappush(self.pending_queue, task)
+        self._push_pending(task)
         self.task_registry[task.task_id] = task
+        self.idempotency_index[task.idempotency_key] = task.task_id
 
         logger.info(f"📝 작업 추가: {task.task_id[:8]}... {task.university_name}")
         return task.task_id
 
-    def dequeue(self) -> Optional[CrawlTask]:
-        """대기 중인 다음 작업 획득"""
-        while self.pending_queue:
-            task = heapq.heappop(self.pending_queue)
-            if task.status == TaskStatus.PENDING.value:
-                task.status = TaskStatus.RUNNING.value
-                self.running_tasks[task.task_id] = task
-                logger.info(f"🏃 작업 시작: {task.task_id[:8]}... {task.university_name}")
+    def find_duplicate(self, task: CrawlTask) -> Optional[CrawlTask]:
+        """
+        같은 정규화 URL + 크롤 프로필의 기존 작업 조회
+
+        대기/재시도/실행 중인 작업, 또는 신선도 윈도우 안에 완료된 작업을 반환한다.
+        """
+        existing_id = self.idempotency_index.get(task.idempotency_key)
+        existing = self.task_registry.get(existing_id) if existing_id else None
+        if existing is None:
+            return None
+
+        if existing.status in (TaskStatus.PENDING.value, TaskStatus.RETRYING.value, TaskStatus.RUNNING.value):
+            return existing
+
+        if (
+            existing.status == TaskStatus.COMPLETED.value
+            and self.freshness_seconds > 0
+            and existing.completed_at is not None
+            and datetime.now() - existing.completed_at <= timedelta(seconds=self.freshness_seconds)
+        ):
+            return existing
+
+        return None
+
+    def dequeue(self, worker_id: str = "default") -> Optional[CrawlTask]:
+        """대기 중인 다음 작업 획득 (임대 시작)"""
+        task = self._pop_pending()
+        if task is None:
+            return None
+
+        now = datetime.now()
+        task.status = TaskStatus.RUNNING.value
+        task.worker_id = worker_id
+        task.started_at = now
+        task.lease_expires_at = now + timedelta(seconds=self.lease_seconds)
+        self.running_tasks[task.task_id] = task
+        self.running_per_key[self._task_key(task)] += 1
+        logger.info(f"🏃 작업 시작: {task.task_id[:8]}... {task.university_name} (워커: {worker_id})")
+        return task
+
+    # ===================== 대기열 내부 구현 =====================
+
+    @staticmethod
+    def _is_dispatchable(task: CrawlTask) -> bool:
+        return task.status in (TaskStatus.PENDING.value, TaskStatus.RETRYING.value)
+
+    def _task_key(self, task: CrawlTask) -> str:
+        """공정 스케줄링 키 (대학 이름 또는 호스트)"""
+        if self.fair_key == "host":
+            return urlparse(task.url).netloc.lower() or task.university_name
+        return task.university_name
+
+    def _push_pending(self, task: CrawlTask):
+        """대기열에 작업 추가"""
+        if self.fair_key is None:
+            heapq.heappush(self.pending_queue, task)
+            return
+
+        buckets = self.fair_levels.setdefault(task.priority, OrderedDict())
+        buckets.setdefault(self._task_key(task), deque()).append(task)
+        self.fair_pending_count += 1
+
+    def _pop_pending(self) -> Optional[CrawlTask]:
+        """대기열에서 다음 작업 꺼내기"""
+        if self.fair_key is None:
+            while self.pending_queue:
+                task = heapq.heappop(self.pending_queue)
+                if self._is_dispatchable(task):
+                    return task
+            return None
+
+        # 에이징 적용 우선순위가 높은 레벨부터, 동률이면 더 오래 기다린 레벨부터
+        now = datetime.now()
+        ranked = sorted(
+            self.fair_levels.items(),
+            key=lambda item: self._aged_rank(item[0], item[1], now),
+            reverse=True
+        )
+        for priority, buckets in ranked:
+            task = self._pop_round_robin(buckets)
+            if not buckets:
+                del self.fair_levels[priority]
+            if task is not None:
                 return task
+        return None
+
+    def _aged_rank(self, priority: int, buckets: "OrderedDict[str, deque]", now: datetime) -> Tuple[int, float]:
+        """에이징이 반영된 (우선순위, 대기 시간)"""
+        oldest = min((q[0].created_at for q in buckets.values() if q), default=now)
+        waited = (now - oldest).total_seconds()
+        return priority + int(waited // self.aging_seconds), waited
+
+    def _pop_round_robin(self, buckets: "OrderedDict[str, deque]") -> Optional[CrawlTask]:
+        """같은 우선순위 안에서 키별 라운드로빈으로 작업 꺼내기"""
+        for _ in range(len(buckets)):
+            key, bucket = next(iter(buckets.items()))
+
+            while bucket and not self._is_dispatchable(bucket[0]):
+                bucket.popleft()
+                self.fair_pending_count -= 1
+            if not bucket:
+                del buckets[key]
+                continue
+
+            if self.per_key_concurrency and self.running_per_key[key] >= self.per_key_concurrency:
+                buckets.move_to_end(key)
+                continue
+
+            task = bucket.popleft()
+            self.fair_pending_count -= 1
+            if bucket:
+                buckets.move_to_end(key)
+            else:
+                del buckets[key]
+            return task
 
         return None
 
-    def mark_completed(self, task_id: str) -> bool:
-        """작업 완료 표시"""
+    def _pending_size(self) -> int:
+        if self.fair_key is None:
+            return len(self.pending_queue)
+        return self.fair_pending_count
+
+    def heartbeat(self, task_id: str, worker_id: str) -> bool:
+        """
+        작업 임대 연장
+
+        Returns:
+            임대를 연장했으면 True, 작업이 이미 회수되었거나 다른 워커 소유면 False
+        """
+        task = self.running_tasks.get(task_id)
+        if task is None or task.worker_id != worker_id:
+            return False
+
+        task.lease_expires_at = datetime.now() + timedelta(seconds=self.lease_seconds)
+        return True
+
+    def reclaim_expired_tasks(self) -> List[str]:
+        """
+        임대가 만료된 실행 중 작업 회수
+
+        워커가 죽어 하트비트가 끊긴 작업을 재시도 횟수를 올려 다시 큐에 넣고,
+        재시도 한도를 넘은 작업은 실패 처리한다.
+
+        Returns:
+            회수된 작업 ID 목록
+        """
+        now = datetime.now()
+        expired = [
+            task for task in self.running_tasks.values()
+            if task.lease_expires_at is not None and task.lease_expires_at <= now
+        ]
+
+        reclaimed = []
+        for task in expired:
+            logger.warning(
+                f"⏰ 임대 만료: {task.task_id[:8]}... "
+                f"(워커: {task.worker_id}, {(now - task.started_at).total_seconds():.0f}초 경과)"
+            )
+            self.mark_failed(task.task_id, error=f"lease expired (worker={task.worker_id})")
+            reclaimed.append(task.task_id)
+
+        if reclaimed:
+            logger.info(f"♻️  {len(reclaimed)}개 유실 작업 회수")
+        return reclaimed
+
+    def _release_lease(self, task: CrawlTask):
+        """임대 정보 해제"""
+        if self.running_tasks.pop(task.task_id, None) is not None:
+            key = self._task_key(task)
+            self.running_per_key[key] -= 1
+            if self.running_per_key[key] <= 0:
+                del self.running_per_key[key]
+        task.worker_id = ""
+        task.started_at = None
+        task.lease_expires_at = None
+
+    def _holds_lease(self, task_id: str, worker_id: Optional[str]) -> bool:
+        """worker_id가 작업의 임대를 가지고 있는지 (None이면 확인하지 않음)"""
+        if worker_id is None:
+            return True
+        task = self.running_tasks.get(task_id)
+        if task is None or task.worker_id != worker_id:
+            logger.warning(f"⚠️  임대 없는 워커의 보고 무시: {task_id[:8]}... (워커: {worker_id})")
+            return False
+        return True
+
+    def mark_completed(
+        self,
+        task_id: str,
+        result: Optional[Dict[str, Any]] = None,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """
+        작업 완료 표시 (신선도 윈도우가 켜져 있으면 결과 보관)
+
+        Args:
+            task_id: 작업 ID
+            result: 크롤링 결과
+            worker_id: 보고하는 워커 (주어지면 임대를 가진 워커일 때만 반영)
+        """
         if task_id not in self.task_registry:
             logger.warning(f"⚠️  작업을 찾을 수 없음: {task_id}")
             return False
+        if not self._holds_lease(task_id, worker_id):
+            return False
 
         task = self.task_registry[task_id]
         task.status = TaskStatus.COMPLETED.value
-
-        if task_id in self.running_tasks:
-            del self.running_tasks[task_id]
+        task.completed_at = datetime.now()
+        if self.freshness_seconds > 0:
+            task.result = result
+        self._release_lease(task)
 
         self.completed_tasks[task_id] = task
         logger.info(f"✅ 작업 완료: {task_id[:8]}...")
         return True
 
-    def mark_failed(self, task_id: str, error: str = "") -> bool:
-        """작업 실패 표시"""
-        if task_id not in self.task_registry:
+    def release(self, task_id: str, worker_id: Optional[str] = None) -> bool:
+        """
+        실행 중 작업 반납 (재시도 횟수를 올리지 않고 대기열 복귀)
+
+        종료 드레인 기한 안에 끝내지 못한 작업처럼 작업 자체의 실패가 아닌 경우에 사용한다.
+        worker_id가 주어지면 임대를 가진 워커일 때만 반납한다.
+        """
+        task = self.running_tasks.get(task_id)
+        if task is None or not self._holds_lease(task_id, worker_id):
+            return False
+
+        self._release_lease(task)
+        task.status = TaskStatus.PENDING.value
+        self._push_pending(task)
+        logger.info(f"↩️  작업 반납: {task_id[:8]}...")
+        return True
+
+    def mark_failed(self, task_id: str, error: str = "", worker_id: Optional[str] = None) -> bool:
+        """
+        작업 실패 표시
+
+        Args:
+            task_id: 작업 ID
+            error: 실패 사유
+            worker_id: 보고하는 워커 (주어지면 임대를 가진 워커일 때만 반영 - 회수 뒤
+                늦게 도착한 보고가 재시도 횟수를 다시 올리거나 작업을 중복 재큐잉하지 않도록)
+
+        Returns:
+            재시도 대기열에 넣었으면 True, 최종 실패했거나 반영하지 않았으면 False
+        """
+        if task_id not in self.task_registry or not self._holds_lease(task_id, worker_id):
             return False
 
         task = self.task_registry[task_id]
+        self._release_lease(task)
+        return self._retry_or_fail(task, error)
+
+    def mark_unsaved(self, task_id: str, error: str = "") -> bool:
+        """
+        완료 보고 뒤 결과 저장에 실패한 작업을 재시도 대기열(또는 최종 실패)로 되돌림
+
+        워커는 결과를 writer에 넘긴 직후 완료를 보고하므로, writer가 나중에 저장에
+        실패하면 이 메서드로 완료 표시를 취소한다. 완료 상태가 아닌 작업은 건드리지 않는다.
+
+        Returns:
+            재시도 대기열에 넣었으면 True, 최종 실패했거나 반영하지 않았으면 False
+        """
+        task = self.completed_tasks.pop(task_id, None)
+        if task is None:
+            logger.warning(f"⚠️  완료되지 않은 작업의 저장 실패 보고 무시: {task_id[:8]}...")
+            return False
 
-        # 재시도 가능 여부 확인
+        task.completed_at = None
+        task.result = None
+        logger.warning(f"💾 결과 저장 실패 → 완료 취소: {task_id[:8]}... {error}")
+        return self._retry_or_fail(task, error)
+
+    def _retry_or_fail(self, task: CrawlTask, error: str) -> bool:
+        """재시도 횟수가 남았으면 재시도 대기열로, 아니면 최종 실패 처리"""
+        task_id = task.task_id
         if task.retry_count < task.max_retries:
             task.retry_count += 1
             task.status = TaskStatus.RETRYING.value
-            heapq.heappush(self.pending_queue, task)
+            self._push_pending(task)
             logger.warning(f"🔄 작업 재시도: {task_id[:8]}... (시도 {task.retry_count}/{task.max_retries})")
             return True
         else:
             task.status = TaskStatus.FAILED.value
-            if task_id in self.running_tasks:
-                del self.running_tasks[task_id]
             self.failed_tasks[task_id] = task
             logger.error(f"❌ 작업 실패: {task_id[:8]}... {error}")
             return False
@@ -159,31 +501,88 @@ class InMemoryTaskQueue:
             return None
         return self.task_registry[task_id].status
 
+    def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """완료된 작업의 보관된 결과 조회"""
+        task = self.task_registry.get(task_id)
+        return task.result if task else None
+
     def get_stats(self) -> Dict:
         """큐 통계"""
         return {
-            "pending": len(self.pending_queue),
+            "pending": self._pending_size(),
             "running": len(self.running_tasks),
             "completed": len(self.completed_tasks),
             "failed": len(self.failed_tasks),
             "total": len(self.task_registry),
         }
 
+    def get_dispatch_capacity(self) -> int:
+        """
+        지금 바로 꺼낼 수 있는 대기 작업 수
+
+        대학/호스트별 동시 실행 상한에 걸린 작업은 워커를 늘려도 처리되지 않으므로 제외한다.
+        """
+        if self.fair_key is None or not self.per_key_concurrency:
+            return self._pending_size()
+
+        pending_per_key: Dict[str, int] = defaultdict(int)
+        for buckets in self.fair_levels.values():
+            for key, bucket in buckets.items():
+                pending_per_key[key] += len(bucket)
+
+        return sum(
+            min(count, max(self.per_key_concurrency - self.running_per_key.get(key, 0), 0))
+            for key, count in pending_per_key.items()
+        )
+
     def get_queued_tasks(self, limit: int = 10) -> List[CrawlTask]:
         """대기 중인 작업 목록"""
-        return [t for t in self.pending_queue[:limit] if t.status == TaskStatus.PENDING.value]
+        if self.fair_key is None:
+            return [t for t in self.pending_queue[:limit] if t.status == TaskStatus.PENDING.value]
+
+        queued = []
+        for priority in sorted(self.fair_levels, reverse=True):
+            for bucket in self.fair_levels[priority].values():
+                for task in bucket:
+                    if task.status == TaskStatus.PENDING.value:
+                        queued.append(task)
+                    if len(queued) >= limit:
+                        return queued
+        return queued
 
     def get_running_tasks(self) -> List[CrawlTask]:
         """실행 중인 작업 목록"""
         return list(self.running_tasks.values())
 
+    def get_running_tasks_info(self) -> List[Dict]:
+        """실행 중인 작업의 워커 ID, 경과 시간, 임대 잔여 시간"""
+        now = datetime.now()
+        return [
+            {
+                "task_id": task.task_id,
+                "url": task.url,
+                "university_name": task.university_name,
+                "worker_id": task.worker_id,
+                "retry_count": task.retry_count,
+                "age_seconds": (now - task.started_at).total_seconds() if task.started_at else 0.0,
+                "lease_remaining_seconds": (
+                    (task.lease_expires_at - now).total_seconds() if task.lease_expires_at else 0.0
+                ),
+            }
+            for task in self.running_tasks.values()
+        ]
+
     def clear(self):
         """모든 작업 초기화"""
         self.pending_queue.clear()
+        self.fair_levels.clear()
+        self.fair_pending_count = 0
+        self.running_per_key.clear()
         self.running_tasks.clear()
         self.completed_tasks.clear()
         self.failed_tasks.clear()
         self.task_registry.clear()
+        self.idempotency_index.clear()
         logger.info("🗑️  모든 작업 초기화")
 
     def health_check(self) -> Dict:
@@ -199,9 +598,19 @@ class InMemoryTaskQueue:
 _queue_instance: Optional[InMemoryTaskQueue] = None
 
 
-def get_task_queue(max_size: int = 10000) -> InMemoryTaskQueue:
+def get_task_queue(
+    max_size: int = 10000,
+    fair_key: Optional[str] = None,
+    per_key_concurrency: int = 0,
+    freshness_seconds: int = 0
+) -> InMemoryTaskQueue:
     """전역 작업 큐 인스턴스 획득"""
     global _queue_instance
     if _queue_instance is None:
-        _queue_instance = InMemoryTaskQueue(max_size=max_size)
+        _queue_instance = InMemoryTaskQueue(
+            max_size=max_size,
+            fair_key=fair_key,
+            per_key_concurrency=per_key_concurrency,
+            freshness_seconds=freshness_seconds,
+        )
     return _queue_instance
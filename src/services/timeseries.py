@@ -0,0 +1,153 @@
+"""
+고정 메모리 시계열 저장소 (링 버퍼 롤업)
+
+주요 기능:
+1. 분/시간/일 단위 고정 크기 링 버퍼 (오래된 구간은 자동으로 덮어씀)
+2. 오류는 문자열을 모두 보관하지 않고 오류 유형별 개수 + 최근 샘플 몇 개만 유지
+3. 조회는 요청한 버킷 수에 비례 (O(buckets))
+4. 구간은 로컬 시각 기준으로 정렬 (일 버킷 = 로컬 자정부터, 레이블도 로컬 시각)
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# 롤업 이름 -> (버킷 길이(초), 버킷 수)
+DEFAULT_ROLLUPS = {
+    "minute": (60, 120),     # 2시간
+    "hour": (3600, 72),      # 3일
+    "day": (86400, 90),      # 90일
+}
+
+MAX_ERROR_CLASSES = 20
+ERROR_SAMPLES = 3
+OTHER_ERRORS = "other"
+
+_ERROR_DETAIL = re.compile(r"[:(\[].*$")
+
+
+def _wall_clock(timestamp: float) -> float:
+    """UTC 에포크 초 → 로컬 벽시계 초 (그 시점의 UTC 오프셋 적용, 서머타임 포함)"""
+    return timestamp + time.localtime(timestamp).tm_gmtoff
+
+
+def classify_error(error: str) -> str:
+    """오류 문자열을 유형으로 축약 (예: "deadline exceeded (30s)" → "deadline exceeded")"""
+    error_class = _ERROR_DETAIL.sub("", error or "").strip()
+    return error_class[:80] or "unknown"
+
+
+class _Bucket:
+    """한 구간의 집계값"""
+
+    __slots__ = ("start", "processed", "failed", "total_time", "error_counts", "error_samples")
+
+    def __init__(self):
+        self.reset(-1)
+
+    def reset(self, start: int):
+        self.start = start
+        self.processed = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self.error_counts: Dict[str, int] = {}
+        self.error_samples: deque = deque(maxlen=ERROR_SAMPLES)
+
+    def add_error(self, error: str):
+        error_class = classify_error(error)
+        # "other"용 한 칸을 남겨 유형 수가 MAX_ERROR_CLASSES를 넘지 않도록 함
+        if error_class not in self.error_counts and len(self.error_counts) >= MAX_ERROR_CLASSES - 1:
+            error_class = OTHER_ERRORS
+        self.error_counts[error_class] = self.error_counts.get(error_class, 0) + 1
+        self.error_samples.append(error[:300])
+
+
+class RollupSeries:
+    """고정 길이 구간의 링 버퍼 (구간은 입력 시각의 resolution 배수에 정렬)"""
+
+    def __init__(self, resolution: int, size: int):
+        """
+        초기화
+
+        Args:
+            resolution: 버킷 길이 (초)
+            size: 버킷 수 (보관 기간 = resolution × size)
+        """
+        self.resolution = resolution
+        self.size = size
+        self.buckets = [_Bucket() for _ in range(size)]
+
+    def _bucket(self, timestamp: float) -> _Bucket:
+        start = int(timestamp // self.resolution) * self.resolution
+        bucket = self.buckets[(start // self.resolution) % self.size]
+        if bucket.start != start:
+            bucket.reset(start)
+        return bucket
+
+    def record(self, timestamp: float, success: bool, duration: float, error: str = ""):
+        bucket = self._bucket(timestamp)
+        if success:
+            bucket.processed += 1
+            bucket.total_time += duration
+        else:
+            bucket.failed += 1
+            if error:
+                bucket.add_error(error)
+
+    def recent(self, count: int, now: float) -> List[_Bucket]:
+        """최근 count개 구간 중 기록이 있는 버킷 (오래된 순)"""
+        current = int(now // self.resolution) * self.resolution
+        result = []
+        for i in range(min(count, self.size) - 1, -1, -1):
+            start = current - i * self.resolution
+            bucket = self.buckets[(start // self.resolution) % self.size]
+            if bucket.start == start:
+                result.append(bucket)
+        return result
+
+
+class TimeSeriesStore:
+    """분/시간/일 롤업을 함께 갱신하는 시계열 저장소 (메모리 사용량 고정)"""
+
+    def __init__(self, rollups: Optional[Dict[str, tuple]] = None):
+        """
+        초기화
+
+        Args:
+            rollups: 롤업 이름 -> (버킷 길이(초), 버킷 수)
+        """
+        self.rollups = {
+            name: RollupSeries(resolution, size)
+            for name, (resolution, size) in (rollups or DEFAULT_ROLLUPS).items()
+        }
+        self._lock = threading.Lock()
+
+    def record(self, success: bool, duration: float, error: str = "", timestamp: Optional[float] = None):
+        """작업 결과 기록"""
+        timestamp = _wall_clock(time.time() if timestamp is None else timestamp)
+        with self._lock:
+            for series in self.rollups.values():
+                series.record(timestamp, success, duration, error)
+
+    def get_stats(self, rollup: str, count: int, time_format: str, now: Optional[float] = None) -> Dict:
+        """롤업 구간별 통계 (키: time_format으로 포맷한 구간 시작 로컬 시각)"""
+        now = _wall_clock(time.time() if now is None else now)
+        stats = {}
+        with self._lock:
+            for bucket in self.rollups[rollup].recent(count, now):
+                total = bucket.processed + bucket.failed
+                # 버킷 시작은 벽시계 초이므로 UTC로 포맷하면 로컬 시각 레이블이 된다
+                label = datetime.fromtimestamp(bucket.start, timezone.utc).strftime(time_format)
+                stats[label] = {
+                    "processed": bucket.processed,
+                    "failed": bucket.failed,
+                    "total": total,
+                    "success_rate": bucket.processed / total * 100 if total > 0 else 0,
+                    "avg_duration": bucket.total_time / bucket.processed if bucket.processed > 0 else 0,
+                    "errors": dict(bucket.error_counts),
+                    "error_samples": list(bucket.error_samples),
+                }
+        return stats
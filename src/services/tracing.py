@@ -0,0 +1,320 @@
+"""
+경량 트레이싱 (단계별 스팬)
+
+주요 기능:
+1. span() 컨텍스트 매니저 / traced() 데코레이터 (비활성화 시 거의 비용 없음)
+2. contextvars 기반 부모-자식 스팬 연결 (asyncio 태스크 간 전파)
+3. 루트 스팬(작업, 리포트 생성)별 단계 자체 시간 집계 (fetch/extract/ocr/persist/llm)
+4. JSON-lines 파일 또는 OTLP/HTTP JSON 수집기로 내보내기
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+import uuid
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """실행 구간 하나"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent", "root", "attributes",
+                 "start_ns", "end_ns", "stage_times", "child_time", "_started", "_token")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.root = parent.root if parent else self
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.attributes = attributes
+        self.stage_times: Dict[str, float] = {}  # 루트 스팬에만 채워짐 (스팬 이름 -> 자체 시간 합계)
+        self.child_time = 0.0
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self._started = time.perf_counter()
+        self._token = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9 if self.end_ns else time.perf_counter() - self._started
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+            **({"stages": self.stage_times} if self.parent is None else {}),
+        }
+
+
+class _NoopSpan:
+    """비활성화 상태용 스팬 (모든 연산 무시)"""
+
+    stage_times: Dict[str, float] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _SpanContext:
+    """스팬 시작/종료 컨텍스트 매니저"""
+
+    __slots__ = ("tracer", "span")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self.span._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        span.end_ns = span.start_ns + int((time.perf_counter() - span._started) * 1e9)
+        _current_span.reset(span._token)
+        if exc_type is not None:
+            span.attributes["error"] = exc_type.__name__
+        # 자식 스팬 시간을 뺀 자체 시간으로 집계해야 단계별 합이 전체 시간과 맞는다
+        duration = span.duration
+        if span.parent is not None:
+            span.parent.child_time += duration
+        stages = span.root.stage_times
+        stages[span.name] = stages.get(span.name, 0.0) + max(duration - span.child_time, 0.0)
+        self.tracer._export(span)
+        return False
+
+
+class JsonLinesExporter:
+    """스팬을 로컬 JSON-lines 파일에 추가"""
+
+    def __init__(self, path: str):
+        """
+        초기화
+
+        Args:
+            path: 출력 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n" for span in spans)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def shutdown(self):
+        pass
+
+
+class OTLPHttpExporter:
+    """OTLP/HTTP JSON 형식으로 수집기에 전송 (배치, 백그라운드 스레드)"""
+
+    def __init__(self, endpoint: str = "http://localhost:4318/v1/traces", service_name: str = "univ-insight",
+                 batch_size: int = 256, flush_interval: float = 5.0):
+        """
+        초기화
+
+        Args:
+            endpoint: OTLP/HTTP traces 엔드포인트
+            service_name: resource의 service.name
+            batch_size: 이 개수가 모이면 즉시 전송
+            flush_interval: 최대 전송 간격 (초)
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: List[Span] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, spans: List[Span]):
+        with self._lock:
+            self._buffer.extend(spans)
+            if len(self._buffer) >= self.batch_size:
+                self._wakeup.set()
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+        if not spans:
+            return
+        body = json.dumps(self._encode(spans), default=str).encode()
+        request = urllib.request.Request(self.endpoint, data=body, headers={"Content-Type": "application/json"})
+        try:
+            urllib.request.urlopen(request, timeout=5).close()
+        except Exception as e:
+            logger.warning(f"⚠️  스팬 전송 실패 ({len(spans)}개 유실): {e}")
+
+    def _encode(self, spans: List[Span]) -> Dict:
+        def attrs(values: Dict[str, Any]) -> List[Dict]:
+            return [{"key": k, "value": {"stringValue": str(v)}} for k, v in values.items()]
+
+        return {"resourceSpans": [{
+            "resource": {"attributes": attrs({"service.name": self.service_name})},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [
+                    {
+                        "traceId": span.trace_id,
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent.span_id if span.parent else "",
+                        "name": span.name,
+                        "kind": 1,
+                        "startTimeUnixNano": str(span.start_ns),
+                        "endTimeUnixNano": str(span.end_ns),
+                        "attributes": attrs(span.attributes),
+                    }
+                    for span in spans
+                ],
+            }],
+        }]}
+
+    def shutdown(self):
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+        self.flush()
+
+
+class Tracer:
+    """스팬 생성 및 내보내기"""
+
+    def __init__(self, enabled: bool = True, exporter=None):
+        """
+        초기화
+
+        Args:
+            enabled: False면 span()이 공유 no-op 객체를 반환 (단계 집계도 중단)
+            exporter: 종료된 스팬을 받을 exporter (None이면 내보내지 않고 단계 집계만)
+        """
+        self.enabled = enabled
+        self.exporter = exporter
+
+    def span(self, name: str, **attributes):
+        """스팬 컨텍스트 매니저"""
+        if not self.enabled:
+            return _NOOP
+        return _SpanContext(self, Span(name, _current_span.get(), attributes))
+
+    def root_span(self, name: str, **attributes):
+        """현재 컨텍스트와 무관한 새 트레이스 시작"""
+        if not self.enabled:
+            return _NOOP
+        return _SpanContext(self, Span(name, None, attributes))
+
+    def _export(self, span: Span):
+        if self.exporter is not None:
+            try:
+                self.exporter.export([span])
+            except Exception as e:
+                logger.warning(f"⚠️  스팬 내보내기 실패: {e}")
+
+    def shutdown(self):
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def current_span() -> Optional[Span]:
+    """현재 활성 스팬"""
+    return _current_span.get()
+
+
+# 전역 트레이서
+_tracer: Optional[Tracer] = None
+
+
+def _exporter_from_env():
+    """TRACING_EXPORTER=jsonl:<경로> 또는 otlp:<엔드포인트>"""
+    spec = os.getenv("TRACING_EXPORTER", "")
+    kind, _, target = spec.partition(":")
+    if kind == "jsonl":
+        return JsonLinesExporter(target or "./traces.jsonl")
+    if kind == "otlp":
+        return OTLPHttpExporter(target or "http://localhost:4318/v1/traces")
+    return None
+
+
+def get_tracer() -> Tracer:
+    """전역 트레이서 (TRACING_ENABLED=0이면 비활성화)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(
+            enabled=os.getenv("TRACING_ENABLED", "1") not in ("0", "false", "False"),
+            exporter=_exporter_from_env(),
+        )
+    return _tracer
+
+
+def configure_tracer(enabled: bool = True, exporter=None) -> Tracer:
+    """전역 트레이서 교체"""
+    global _tracer
+    if _tracer is not None:
+        _tracer.shutdown()
+    _tracer = Tracer(enabled=enabled, exporter=exporter)
+    return _tracer
+
+
+def span(name: str, **attributes):
+    """전역 트레이서로 스팬 시작"""
+    return get_tracer().span(name, **attributes)
+
+
+def traced(name: Optional[str] = None):
+    """함수 실행을 스팬으로 기록하는 데코레이터 (동기/비동기 모두 지원)"""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with get_tracer().span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
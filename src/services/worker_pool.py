@@ -5,33 +5,49 @@
 1. 워커 풀 생성 및 관리
 2. 작업 할당 및 처리
 3. 워커 모니터링
-4. 자동 스케일링
+4. 자동 스케일링 (측정 신호 기반, 드레인 방식 축소)
+5. 작업별 제한 시간(timeout_seconds) 적용 및 부분 결과 보존
+6. 종료 시 기한 내 드레인 (미완료 작업은 부분 결과 저장 후 반납)
 """
 
 import asyncio
 import logging
+import time
 import uuid
-from typing import Optional, Dict, List, Callable, Awaitable
+from urllib.parse import urlparse
+from typing import Optional, Dict, List, Set, Callable, Awaitable
 from datetime import datetime
 from dataclasses import dataclass, field
 
 from src.services.task_queue import CrawlTask, InMemoryTaskQueue, TaskStatus
 from src.services.multipage_crawler import MultipageCrawler
+from src.services.result_writer import ResultWriter, get_result_writer
+from src.services.autoscaler import AutoScaler, ScalingSignals
+from src.services.metrics import QUEUE_WAIT, TASK_DURATION, TASKS_TOTAL
+from src.services.monitoring import get_metrics_collector
+from src.services.tracing import Span, get_tracer, span
 from src.database.db import Database
 
 logger = logging.getLogger(__name__)
 
 
+class LeaseLost(Exception):
+    """작업 임대를 잃음 (회수되어 다른 워커에 재할당되었을 수 있음)"""
+
+
 @dataclass
 class WorkerStats:
     """워커 통계"""
     worker_id: str
-    status: str  # idle, running
+    status: str  # idle, running, draining
     tasks_completed: int = 0
     tasks_failed: int = 0
     total_processing_time: float = 0.0
     current_task: Optional[str] = None
     current_task_start: Optional[datetime] = None
+    tasks_timed_out: int = 0
+    last_error: str = ""
+    stage_times: Dict[str, float] = field(default_factory=dict)  # 단계 -> 누적 자체 시간 (초)
 
     def get_processing_time(self) -> float:
         """현재 작업 처리 시간"""
@@ -51,7 +67,9 @@ class Worker:
         worker_id: str,
         task_queue: InMemoryTaskQueue,
         database: Database,
-        crawler: Optional[MultipageCrawler] = None
+        crawler: Optional[MultipageCrawler] = None,
+        heartbeat_interval: float = 30.0,
+        writer: Optional[ResultWriter] = None
     ):
         """
         초기화
@@ -61,13 +79,20 @@ class Worker:
             task_queue: 작업 큐
             database: 데이터베이스
             crawler: 크롤러 인스턴스
+            heartbeat_interval: 작업 임대 하트비트 간격 (초)
+            writer: 결과 저장 단계 (기본: DB별 전역 writer)
         """
         self.worker_id = worker_id
         self.task_queue = task_queue
         self.database = database
         self.crawler = crawler or MultipageCrawler()
+        self.writer = writer or get_result_writer(database)
+        self.heartbeat_interval = heartbeat_interval
         self.stats = WorkerStats(worker_id=worker_id, status="idle")
+        self.metrics_collector = get_metrics_collector()
+        self.tracer = get_tracer()
         self.running = False
+        self.draining = False
 
         logger.info(f"🚀 Worker 초기화: {worker_id}")
 
@@ -85,22 +110,35 @@ class Worker:
 
         while self.running:
             # 작업 획득
-            task = self.task_queue.dequeue()
+            task = self.task_queue.dequeue(worker_id=self.worker_id)
             if not task:
                 # 대기 중인 작업 없음
                 await asyncio.sleep(1)
                 continue
 
             # 작업 처리
-            success = await self._process_task(task)
-
-            # 결과 저장
-            if success:
-                self.task_queue.mark_completed(task.task_id)
+            started = time.perf_counter()
+            timed_out_before = self.stats.tasks_timed_out
+            lease_lost = False
+            try:
+                result = await self._process_task(task)
+            except LeaseLost:
+                result, lease_lost = None, True
+            duration = time.perf_counter() - started
+
+            # 결과 저장 (임대를 잃은 작업은 이제 다른 워커 소유 - 완료/실패를 보고하지 않음)
+            if lease_lost:
+                status = "lease_lost"
+            elif result is not None:
+                self.task_queue.mark_completed(task.task_id, result=result, worker_id=self.worker_id)
                 self.stats.tasks_completed += 1
+                status = "completed"
             else:
-                self.task_queue.mark_failed(task.task_id)
+                self.task_queue.mark_failed(task.task_id, self.stats.last_error, worker_id=self.worker_id)
                 self.stats.tasks_failed += 1
+                status = "timeout" if self.stats.tasks_timed_out > timed_out_before else "failed"
+
+            self._record_metrics(task, duration, status)
 
             tasks_processed += 1
             if max_tasks > 0 and tasks_processed >= max_tasks:
@@ -109,73 +147,150 @@ class Worker:
         logger.info(f"⏹️  Worker 중지: {self.worker_id}")
         self.running = False
 
-    async def _process_task(self, task: CrawlTask) -> bool:
-        """작업 처리"""
+    def _record_metrics(self, task: CrawlTask, duration: float, status: str):
+        """작업 처리 메트릭 기록"""
+        TASK_DURATION.observe(duration, host=urlparse(task.url).netloc, status=status)
+        TASKS_TOTAL.inc(status=status)
+        self.metrics_collector.record_task_completion(
+            task.task_id, duration, success=status == "completed",
+            error="" if status == "completed" else self.stats.last_error
+        )
+
+    async def _process_task(self, task: CrawlTask) -> Optional[Dict]:
+        """작업 처리 (작업 단위 루트 스팬으로 단계별 시간 집계)"""
+        task_span = None
+        try:
+            with self.tracer.root_span("task", task_id=task.task_id, url=task.url) as task_span:
+                return await self._execute_task(task)
+        finally:
+            self._merge_stage_times(task_span)
+
+    def _merge_stage_times(self, task_span: Optional[Span]):
+        """작업 스팬의 단계별 시간을 워커 누적값에 합산"""
+        if task_span is None:
+            return
+        for stage, seconds in task_span.stage_times.items():
+            self.stats.stage_times[stage] = self.stats.stage_times.get(stage, 0.0) + seconds
+
+    async def _execute_task(self, task: CrawlTask) -> Optional[Dict]:
+        """작업 처리 (성공 시 크롤링 결과, 실패 시 None)"""
+        if task.retry_count == 0 and task.started_at is not None:
+            QUEUE_WAIT.observe(
+                (task.started_at - task.created_at).total_seconds(),
+                host=urlparse(task.url).netloc
+            )
+
         self.stats.status = "running"
         self.stats.current_task = task.task_id
         self.stats.current_task_start = datetime.now()
+        partial: Dict = {}
+        logger.info(f"📝 작업 처리 중: {task.task_id[:8]}... {task.university_name}")
 
-        try:
-            logger.info(f"📝 작업 처리 중: {task.task_id[:8]}... {task.university_name}")
-
-            # 크롤링 수행
-            result = await self.crawler.crawl_department(
+        # 크롤링 수행 (제한 시간 초과 시 취소, partial에 그때까지의 결과가 남음)
+        crawl = asyncio.ensure_future(asyncio.wait_for(
+            self.crawler.crawl_department(
                 task.url,
-                task.department_name or task.university_name
-            )
+                task.department_name or task.university_name,
+                result=partial
+            ),
+            timeout=task.timeout_seconds or None
+        ))
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat_loop(task, crawl, lease_lost))
 
-            # 결과 저장
-            self._save_result(task, result)
+        try:
+            result = await crawl
+
+            # 결과 저장 (writer 단계로 전달) - 그 사이 회수된 작업의 결과는 저장하지 않음
+            if not self.task_queue.heartbeat(task.task_id, self.worker_id):
+                raise LeaseLost(task.task_id)
+            await self._save_result(task, result)
 
             processing_time = (datetime.now() - self.stats.current_task_start).total_seconds()
             self.stats.total_processing_time += processing_time
 
             logger.info(f"✅ 작업 완료: {task.task_id[:8]}... ({processing_time:.1f}초)")
-            return True
+            return result
+
+        except asyncio.TimeoutError:
+            self.stats.tasks_timed_out += 1
+            self.stats.last_error = f"deadline exceeded ({task.timeout_seconds}s)"
+            logger.warning(f"⏰ 작업 제한 시간 초과: {task.task_id[:8]}... ({task.timeout_seconds}초)")
+            await self._save_partial(task, partial)
+            return None
+
+        except asyncio.CancelledError:
+            if lease_lost.is_set() and not asyncio.current_task().cancelling():
+                # 하트비트가 임대 상실을 확인하고 크롤링을 취소함
+                raise LeaseLost(task.task_id) from None
+            # 종료 드레인 기한 초과: 부분 결과를 저장하고 재시도 횟수 증가 없이 반납
+            logger.warning(f"↩️  작업 중단 (종료): {task.task_id[:8]}... → 반납")
+            self._checkpoint_partial(task, partial)
+            self.task_queue.release(task.task_id, worker_id=self.worker_id)
+            raise
+
+        except LeaseLost:
+            raise
 
         except Exception as e:
+            self.stats.last_error = str(e)
             logger.error(f"❌ 작업 처리 오류: {task.task_id[:8]}... {e}")
-            return False
+            return None
 
         finally:
-            self.stats.status = "idle"
+            heartbeat.cancel()
+            crawl.cancel()
+            self.stats.status = "draining" if self.draining else "idle"
             self.stats.current_task = None
             self.stats.current_task_start = None
 
-    def _save_result(self, task: CrawlTask, result: Dict):
-        """결과를 데이터베이스에 저장"""
-        try:
-            with self.database.session_scope() as session:
-                # CrawlTask 저장
-                from src.database import CrawlTask as DBCrawlTask
-                from src.database import CrawlResult
-
-                db_task = DBCrawlTask(
-                    id=task.task_id,
-                    url=task.url,
-                    university_name=task.university_name,
-                    department_name=task.department_name,
-                    status="completed"
-                )
-                session.add(db_task)
-                session.flush()
-
-                # CrawlResult 저장
-                result_id = f"{task.task_id}_{hash(str(result))}"
-                db_result = CrawlResult(
-                    id=result_id,
-                    task_id=task.task_id,
-                    url=task.url,
-                    university_name=task.university_name,
-                    professors_count=result.get("extraction_stats", {}).get("professors_count", 0),
-                    papers_count=result.get("extraction_stats", {}).get("papers_count", 0),
-                    labs_count=result.get("extraction_stats", {}).get("labs_count", 0),
-                    pages_crawled=result.get("extraction_stats", {}).get("pages_crawled", 0),
-                )
-                session.add(db_result)
-
-        except Exception as e:
-            logger.error(f"❌ 결과 저장 오류: {e}")
+    async def _heartbeat_loop(self, task: CrawlTask, crawl: asyncio.Future, lease_lost: asyncio.Event):
+        """작업 처리 중 주기적으로 임대 연장 (임대를 잃으면 크롤링 취소)"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            if not self.task_queue.heartbeat(task.task_id, self.worker_id):
+                logger.warning(f"⚠️  임대 상실: {task.task_id[:8]}... (다른 워커에 재할당되었을 수 있음) → 크롤링 취소")
+                lease_lost.set()
+                crawl.cancel()
+                return
+
+    async def _save_result(self, task: CrawlTask, result: Dict):
+        """결과를 writer 큐에 전달 (큐가 가득 차면 이벤트 루프를 막지 않고 재시도)"""
+        loop = asyncio.get_running_loop()
+
+        def on_failed(failed: CrawlTask, error: str):
+            # writer 스레드에서 호출되므로 큐 갱신은 이벤트 루프에서
+            loop.call_soon_threadsafe(self.task_queue.mark_unsaved, failed.task_id, error)
+
+        with span("persist"):
+            while not self.writer.try_submit(task, result, on_failed=on_failed):
+                await asyncio.sleep(0.05)
+
+    @staticmethod
+    def _finalize_partial(partial: Dict) -> Optional[Dict]:
+        """중단된 크롤링의 부분 결과 정리 (저장할 내용이 없으면 None)"""
+        if not partial.get("pages_crawled"):
+            return None
+        partial["partial"] = True
+        return MultipageCrawler.update_extraction_stats(partial)
+
+    async def _save_partial(self, task: CrawlTask, partial: Dict):
+        """제한 시간 초과 작업의 부분 결과 저장"""
+        if self._finalize_partial(partial) is not None:
+            await self._save_result(task, partial)
+            logger.info(f"💾 부분 결과 저장: {task.task_id[:8]}... ({partial['pages_crawled']}개 페이지)")
+
+    def _checkpoint_partial(self, task: CrawlTask, partial: Dict):
+        """취소 중에는 대기할 수 없으므로 writer 큐에 넣을 수 있을 때만 부분 결과 저장"""
+        if self._finalize_partial(partial) is not None and not self.writer.try_submit(task, partial):
+            logger.warning(f"⚠️  writer 큐 가득 참 - 부분 결과 유실: {task.task_id[:8]}...")
+
+    def drain(self):
+        """현재 작업을 마친 뒤 더 이상 작업을 받지 않도록 설정"""
+        self.draining = True
+        self.running = False
+        if self.stats.status == "idle":
+            self.stats.status = "draining"
 
     async def stop(self):
         """워커 중지"""
@@ -190,9 +305,11 @@ class Worker:
             "status": self.stats.status,
             "tasks_completed": self.stats.tasks_completed,
             "tasks_failed": self.stats.tasks_failed,
+            "tasks_timed_out": self.stats.tasks_timed_out,
             "total_processing_time": self.stats.total_processing_time,
             "current_task": self.stats.current_task,
             "current_task_duration": self.stats.get_processing_time(),
+            "stage_times": {stage: round(seconds, 3) for stage, seconds in self.stats.stage_times.items()},
         }
 
 
@@ -205,7 +322,9 @@ class WorkerPool:
         database: Database,
         num_workers: int = 3,
         min_workers: int = 1,
-        max_workers: int = 10
+        max_workers: int = 10,
+        autoscaler: Optional[AutoScaler] = None,
+        writer: Optional[ResultWriter] = None
     ):
         """
         초기화
@@ -216,6 +335,8 @@ class WorkerPool:
             num_workers: 초기 워커 수
             min_workers: 최소 워커 수
             max_workers: 최대 워커 수
+            autoscaler: 스케일링 컨트롤러 (기본: 기본 임계값의 AutoScaler)
+            writer: 결과 저장 단계 (기본: DB별 전역 writer)
         """
         self.task_queue = task_queue
         self.database = database
@@ -225,6 +346,12 @@ class WorkerPool:
 
         self.workers: Dict[str, Worker] = {}
         self.worker_tasks: Dict[str, asyncio.Task] = {}
+        self.draining_workers: Dict[str, Worker] = {}
+        self.retire_tasks: Set[asyncio.Task] = set()
+        self.retired_completed = 0  # 드레인되어 빠진 워커의 완료 수 (처리량 누적용)
+        self.started = False
+        self.writer = writer or get_result_writer(database)
+        self.autoscaler = autoscaler or AutoScaler(min_workers, max_workers)
 
         logger.info(f"🚀 WorkerPool 초기화 (워커={num_workers}, 범위={min_workers}-{max_workers})")
 
@@ -241,10 +368,12 @@ class WorkerPool:
             return None
 
         worker_id = f"worker_{uuid.uuid4().hex[:8]}"
-        worker = Worker(worker_id, self.task_queue, self.database)
+        worker = Worker(worker_id, self.task_queue, self.database, writer=self.writer)
         await worker.initialize()
 
         self.workers[worker_id] = worker
+        if self.started:
+            self.worker_tasks[worker_id] = asyncio.create_task(worker.run())
         logger.info(f"➕ 워커 추가: {worker_id} (총 {len(self.workers)}개)")
 
         return worker_id
@@ -264,6 +393,31 @@ class WorkerPool:
         logger.info(f"➖ 워커 제거: {worker_id} (남은 워커 {len(self.workers)}개)")
         return True
 
+    def drain_worker(self, worker_id: str) -> bool:
+        """워커 드레인 (현재 작업 완료 후 종료, 작업 도중 크롤러를 닫지 않음)"""
+        worker = self.workers.pop(worker_id, None)
+        if worker is None:
+            return False
+
+        worker.drain()
+        self.draining_workers[worker_id] = worker
+        retire = asyncio.create_task(self._retire_worker(worker_id, worker))
+        self.retire_tasks.add(retire)
+        retire.add_done_callback(self.retire_tasks.discard)
+        logger.info(f"🚰 워커 드레인: {worker_id} (남은 워커 {len(self.workers)}개)")
+        return True
+
+    async def _retire_worker(self, worker_id: str, worker: Worker):
+        """드레인된 워커의 현재 작업이 끝나면 크롤러 정리"""
+        run_task = self.worker_tasks.get(worker_id)
+        if run_task is not None:
+            await asyncio.gather(run_task, return_exceptions=True)
+            self.worker_tasks.pop(worker_id, None)
+        await worker.stop()
+        self.retired_completed += worker.stats.tasks_completed
+        self.draining_workers.pop(worker_id, None)
+        logger.info(f"➖ 드레인 완료: {worker_id}")
+
     async def start(self):
         """워커 풀 시작"""
         logger.info(f"🚀 WorkerPool 시작 ({len(self.workers)}개 워커)")
@@ -272,47 +426,94 @@ class WorkerPool:
             task = asyncio.create_task(worker.run())
             self.worker_tasks[worker_id] = task
 
+        self.started = True
+        self.autoscaler.sampler.start()
         logger.info("✅ 모든 워커 시작됨")
 
-    async def stop(self):
-        """워커 풀 중지"""
-        logger.info("⏹️  WorkerPool 중지 중...")
+    async def stop(self, drain_timeout: float = 60.0):
+        """
+        워커 풀 중지
+
+        새 작업 획득을 멈추고 진행 중 작업이 끝나기를 drain_timeout초까지 기다린다.
+        기한 안에 끝나지 않은 작업은 취소되어 부분 결과를 저장한 뒤 큐에 반납된다.
 
-        # 모든 워커 중지
+        Args:
+            drain_timeout: 진행 중 작업 완료 대기 기한 (초, 0=즉시 취소)
+        """
+        logger.info("⏹️  WorkerPool 중지 중...")
+        self.started = False
+        self.autoscaler.sampler.stop()
+
+        # 새 작업 획득 중단
+        for worker in self.workers.values():
+            worker.drain()
+
+        # 진행 중 작업 완료 대기 (드레인 중인 워커 포함)
+        running = [task for task in self.worker_tasks.values() if not task.done()]
+        if running:
+            logger.info(f"🚰 진행 중 작업 드레인 대기 ({len(running)}개 워커, 기한 {drain_timeout}초)")
+            _, unfinished = await asyncio.wait(running, timeout=drain_timeout) if drain_timeout > 0 else ((), running)
+
+            if unfinished:
+                logger.warning(f"⏰ 드레인 기한 초과: {len(unfinished)}개 작업 중단 → 부분 결과 저장 후 반납")
+                for task in unfinished:
+                    task.cancel()
+                await asyncio.gather(*unfinished, return_exceptions=True)
+
+        # 크롤러 정리
         for worker_id in list(self.workers.keys()):
             await self.remove_worker(worker_id)
+        if self.retire_tasks:
+            await asyncio.gather(*self.retire_tasks, return_exceptions=True)
 
-        # 작업 완료 대기
-        if self.worker_tasks:
-            await asyncio.gather(*self.worker_tasks.values(), return_exceptions=True)
+        # 남은 결과 저장
+        await asyncio.to_thread(self.writer.stop)
 
         logger.info("✅ WorkerPool 중지 완료")
 
-    async def auto_scale(self):
-        """자동 스케일링"""
+    def collect_signals(self) -> ScalingSignals:
+        """스케일링 판단용 측정값 수집"""
         stats = self.task_queue.get_stats()
-        pending_tasks = stats["pending"]
-        active_workers = len(self.workers)
-
-        # 작업/워커 비율 계산
-        tasks_per_worker = pending_tasks / max(active_workers, 1)
+        get_capacity = getattr(self.task_queue, "get_dispatch_capacity", None)
+        completed_total = self.retired_completed + sum(
+            w.stats.tasks_completed for w in (*self.workers.values(), *self.draining_workers.values())
+        )
+        sampler = self.autoscaler.sampler
+
+        return ScalingSignals(
+            active_workers=len(self.workers),
+            busy_workers=sum(1 for w in self.workers.values() if w.stats.status == "running"),
+            pending=stats["pending"],
+            dispatchable=get_capacity() if get_capacity else stats["pending"],
+            throughput=self.autoscaler.measure_throughput(completed_total),
+            cpu_percent=sampler.cpu_percent(),
+            rss_mb=sampler.rss_mb(),
+            loop_lag_ms=sampler.loop_lag_ms,
+        )
 
-        logger.info(f"📊 스케일링 분석: {pending_tasks} 작업, {active_workers} 워커, 비율={tasks_per_worker:.1f}")
-
-        # 스케일 업: 작업이 많을 때
-        if tasks_per_worker > 5 and active_workers < self.max_workers:
-            new_workers_count = min(int(tasks_per_worker / 2), self.max_workers - active_workers)
-            for _ in range(new_workers_count):
+    async def auto_scale(self):
+        """자동 스케일링 (측정 신호 + 히스테리시스/쿨다운)"""
+        signals = self.collect_signals()
+        decision = self.autoscaler.decide(signals)
+
+        logger.info(
+            f"📊 스케일링 분석: 처리가능 {signals.dispatchable}/{signals.pending} 작업, "
+            f"워커 {signals.busy_workers}/{signals.active_workers}, "
+            f"처리량={signals.throughput:.2f}/초, CPU={signals.cpu_percent:.0f}%, "
+            f"RSS={signals.rss_mb:.0f}MB, 루프지연={signals.loop_lag_ms:.0f}ms → {decision.reason}"
+        )
+
+        if decision.delta > 0:
+            for _ in range(decision.delta):
                 await self.add_worker()
-            logger.info(f"⬆️  스케일 업: {new_workers_count}개 워커 추가")
+            logger.info(f"⬆️  스케일 업: {decision.delta}개 워커 추가")
 
-        # 스케일 다운: 작업이 적을 때
-        elif tasks_per_worker < 1 and active_workers > self.min_workers:
-            workers_to_remove = min(active_workers - self.min_workers, int(active_workers * 0.5))
-            worker_ids = list(self.workers.keys())[:workers_to_remove]
-            for worker_id in worker_ids:
-                await self.remove_worker(worker_id)
-            logger.info(f"⬇️  스케일 다운: {workers_to_remove}개 워커 제거")
+        elif decision.delta < 0:
+            # 유휴 워커를 우선 드레인
+            candidates = sorted(self.workers.values(), key=lambda w: w.stats.status == "running")
+            for worker in candidates[:-decision.delta]:
+                self.drain_worker(worker.worker_id)
+            logger.info(f"⬇️  스케일 다운: {-decision.delta}개 워커 드레인")
 
     def get_stats(self) -> Dict:
         """통계 반환"""
@@ -322,11 +523,14 @@ class WorkerPool:
         return {
             "workers": {
                 "active": len(self.workers),
+                "draining": len(self.draining_workers),
                 "min": self.min_workers,
                 "max": self.max_workers,
                 "stats": worker_stats,
             },
             "queue": queue_stats,
+            "writer": self.writer.get_stats(),
+            "autoscaler": self.autoscaler.get_stats(),
             "pool_health": {
                 "status": "healthy" if len(self.workers) > 0 else "unhealthy",
                 "utilization": sum(w["tasks_completed"] for w in worker_stats) / max(sum(w["tasks_completed"] for w in worker_stats) + sum(w["tasks_failed"] for w in worker_stats), 1),
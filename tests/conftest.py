@@ -8,6 +8,11 @@ Provides:
 - Test data fixtures
 """
 
+import os
+
+# Keep tests off the shared response cache file (set before the app is imported)
+os.environ.setdefault("RESPONSE_CACHE_STORE", "off")
+
 import pytest
 import json
 from datetime import datetime, timedelta
@@ -17,9 +22,11 @@ from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from typing import Generator
 
-from src.core.database import get_db
+from src.core.database import get_async_db, get_db
 from src.domain.models import Base
 from src.api.main import app
+from src.api.serialization import fragment_cache
+from src.services.response_cache import get_response_cache
 
 
 # ==================== Database Fixtures ====================
@@ -51,15 +58,37 @@ def db_session(test_db_engine) -> Generator[Session, None, None]:
     connection.close()
 
 
+class SyncBackedAsyncSession:
+    """Serves async routes from the test's sync session (same transaction and data)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.session, *args, **kwargs)
+
+    async def commit(self):
+        self.session.commit()
+
+
 @pytest.fixture
 def override_get_db(db_session):
-    """Override FastAPI database dependency."""
+    """Override FastAPI database dependencies (sync and async)."""
     def get_db_override():
         yield db_session
 
+    async def get_async_db_override():
+        yield SyncBackedAsyncSession(db_session)
+
     app.dependency_overrides[get_db] = get_db_override
+    app.dependency_overrides[get_async_db] = get_async_db_override
+    # Cached responses from another test's data must not leak in
+    get_response_cache().clear()
+    fragment_cache.clear()
     yield
     app.dependency_overrides.clear()
+    get_response_cache().clear()
+    fragment_cache.clear()
 
 
 # ==================== FastAPI Test Client Fixture ====================
@@ -0,0 +1,253 @@
+"""
+Query-plan regression suite for hot API routes.
+
+Seeds a synthetic database, calls the v1 route handlers (and the crawl-DB
+statistics behind the v2 API) directly, captures every SELECT they issue,
+and runs each one under EXPLAIN QUERY PLAN. A full SCAN of a large table,
+or a paged query that sorts large-table rows in a temp b-tree, fails the
+test unless it is listed in ALLOWED_SCANS / ALLOWED_SORTS with a reason.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from src.api import routes
+from src.api.pagination import count_cache
+from src.core.search import install_paper_search
+from src.database.db import Database
+from src.database import models as crawl_models
+from src.domain.models import (
+    Base, University, College, Department, Professor, Laboratory, LabMember, LabMemberRole,
+    ResearchPaper, PaperAnalysis, User, UserRole, Report, ReportPaper, ReportProfessor
+)
+from src.services.hierarchy_snapshot import build_tree
+from src.services.interest_index import match_professors, rebuild_index
+
+pytestmark = [pytest.mark.integration, pytest.mark.db]
+
+# Tables with at least this many rows count as large
+LARGE_TABLE_ROWS = 1000
+
+# (route, table) -> why a full scan is acceptable there
+ALLOWED_SCANS = {
+    ("plan_b", "laboratories"): "inequality on university; EXISTS probes stop after LIMIT 5 matches",
+}
+
+# route -> why sorting a large table's rows is acceptable there
+ALLOWED_SORTS = {
+    "list_papers_by_topic": "ordered by BM25 rank, computed per match",
+    "report_matching": "ordered by aggregated match score",
+}
+
+_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(.*)$")
+_ACCESS = re.compile(r"^(?:SCAN|SEARCH) (?:TABLE )?(\w+)")
+_COUNT = re.compile(r"\bcount\(", re.IGNORECASE)
+
+N_UNIVERSITIES, N_COLLEGES, N_DEPARTMENTS = 20, 100, 500
+N_PROFESSORS, N_PAPERS, N_USERS, N_REPORTS = 5000, 20000, 500, 2000
+
+
+def _seed(conn):
+    now = datetime(2025, 1, 1)
+    conn.execute(insert(University), [
+        {"id": f"u{i}", "name": f"University {i}", "name_ko": f"대학{i}", "ranking": i} for i in range(N_UNIVERSITIES)
+    ])
+    conn.execute(insert(College), [
+        {"id": f"c{i}", "university_id": f"u{i % N_UNIVERSITIES}", "name": f"College {i}", "name_ko": f"단과{i}"}
+        for i in range(N_COLLEGES)
+    ])
+    conn.execute(insert(Department), [
+        {"id": f"d{i}", "college_id": f"c{i % N_COLLEGES}", "name": f"Dept {i}", "name_ko": f"학과{i}"}
+        for i in range(N_DEPARTMENTS)
+    ])
+    conn.execute(insert(Professor), [
+        {"id": f"p{i}", "department_id": f"d{i % N_DEPARTMENTS}", "name": f"Prof {i}", "name_ko": f"교수{i}",
+         "research_interests": ["machine learning" if i % 3 else "robotics", f"topic {i % 50}"]}
+        for i in range(N_PROFESSORS)
+    ])
+    conn.execute(insert(Laboratory), [
+        {"id": f"l{i}", "professor_id": f"p{i}", "department_id": f"d{i % N_DEPARTMENTS}",
+         "name": f"Lab {i}", "name_ko": f"연구실{i}", "research_areas": ["deep learning"]}
+        for i in range(N_PROFESSORS)
+    ])
+    conn.execute(insert(LabMember), [
+        {"id": f"m{i}", "lab_id": f"l{i % N_PROFESSORS}", "name": f"M{i}", "name_ko": f"학생{i}",
+         "role": LabMemberRole.PHD_STUDENT}
+        for i in range(2 * N_PROFESSORS)
+    ])
+    conn.execute(insert(ResearchPaper), [
+        {"id": f"x{i}", "lab_id": f"l{i % N_PROFESSORS}", "title": f"Transformer study {i}",
+         "abstract": f"Abstract {i} about graph learning", "url": f"https://example.org/{i}",
+         "publication_year": 2000 + i % 25, "crawled_at": now - timedelta(minutes=i)}
+        for i in range(N_PAPERS)
+    ])
+    conn.execute(insert(PaperAnalysis), [
+        {"id": f"a{i}", "paper_id": f"x{i}", "easy_summary": "쉬운 요약", "topic_easy": "주제"}
+        for i in range(0, N_PAPERS, 4)
+    ])
+    conn.execute(insert(User), [
+        {"id": f"user{i}", "name": f"User {i}", "role": UserRole.STUDENT, "interests": ["machine learning"]}
+        for i in range(N_USERS)
+    ])
+    conn.execute(insert(Report), [
+        {"id": f"r{i}", "user_id": f"user{i % N_USERS}", "content": "c", "sent_at": now - timedelta(hours=i)}
+        for i in range(N_REPORTS)
+    ])
+    conn.execute(insert(ReportPaper), [
+        {"id": f"rp{i}", "report_id": f"r{i // 3}", "paper_id": f"x{i}", "order_index": i % 3}
+        for i in range(3 * N_REPORTS)
+    ])
+    conn.execute(insert(ReportProfessor), [
+        {"id": f"rf{i}", "report_id": f"r{i // 3}", "professor_id": f"p{i}"} for i in range(3 * N_REPORTS)
+    ])
+
+
+class _Capture:
+    """Collects SELECT statements (with parameters) executed on an engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+    def take(self):
+        statements, self.statements = self.statements, []
+        return statements
+
+
+def _plan(engine, statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return [row[-1] for row in rows]
+
+
+def _large_tables(engine):
+    with engine.connect() as conn:
+        names = [row[0] for row in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+            "AND sql NOT LIKE 'CREATE VIRTUAL%' AND name NOT LIKE '%_fts_%'"
+        ))]
+        return {name for name in names
+                if conn.execute(text(f'SELECT count(*) FROM "{name}"')).scalar() >= LARGE_TABLE_ROWS}
+
+
+def _full_scans(engine, capture, route, large_tables):
+    """Return (table, plan line, statement) for every disallowed scan or sort."""
+    problems = []
+    for statement, parameters in capture.take():
+        is_limited = " LIMIT " in statement.upper()
+        is_count = bool(_COUNT.search(statement)) and not is_limited
+        plan = _plan(engine, statement, parameters)
+        touched = {m.group(1) for m in map(_ACCESS.match, plan) if m} & large_tables
+        for line in plan:
+            # A paged query sorting large-table rows is missing a composite index
+            if line == "USE TEMP B-TREE FOR ORDER BY" and is_limited and touched and route not in ALLOWED_SORTS:
+                problems.append((", ".join(sorted(touched)), line, " ".join(statement.split())[:300]))
+                continue
+            match = _SCAN.match(line)
+            if not match or match.group(1) not in large_tables:
+                continue
+            # COUNT(*) over a covering index is expected; list counts and DB stats are cached
+            if is_count and "COVERING INDEX" in match.group(2):
+                continue
+            # Walking an index in ORDER BY order stops after LIMIT rows
+            if is_limited and "USING INDEX" in match.group(2) and not is_count:
+                continue
+            if (route, match.group(1)) in ALLOWED_SCANS:
+                continue
+            problems.append((match.group(1), line, " ".join(statement.split())[:300]))
+    return problems
+
+
+@pytest.fixture(scope="module")
+def domain_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("plans") / "api.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        _seed(conn)
+    install_paper_search(engine)
+    session = sessionmaker(bind=engine)()
+    rebuild_index(session)
+
+    capture = _Capture(engine)
+    yield engine, session, capture, _large_tables(engine)
+    session.close()
+    engine.dispose()
+
+
+# route name -> call against the seeded data (sync route bodies; defaults passed explicitly, as FastAPI would)
+HOT_ROUTES = {
+    "list_universities": lambda db: routes.list_universities.sync(db=db),
+    "get_university": lambda db: routes.get_university.sync("u1", db=db),
+    "university_tree_snapshot": lambda db: build_tree(db, "u1"),
+    "get_college": lambda db: routes.get_college.sync("c1", db=db),
+    "get_department": lambda db: routes.get_department.sync("d1", db=db),
+    "get_professor": lambda db: routes.get_professor.sync("p1", db=db),
+    "get_laboratory": lambda db: routes.get_laboratory.sync("l1", db=db),
+    "get_user_profile": lambda db: routes.get_user_profile.sync("user1", db=db),
+    "list_papers": lambda db: routes.list_research_papers.sync(
+        lab_id=None, topic=None, limit=20, offset=0, cursor=None, exact_count=True, db=db),
+    "list_papers_by_lab": lambda db: routes.list_research_papers.sync(
+        lab_id="l1", topic=None, limit=20, offset=0, cursor=None, exact_count=True, db=db),
+    "list_papers_by_topic": lambda db: routes.list_research_papers.sync(
+        lab_id=None, topic="transformer", limit=20, offset=0, cursor=None, exact_count=True, db=db),
+    "list_papers_next_page": lambda db: routes.list_research_papers.sync(
+        lab_id=None, topic=None, limit=20, offset=0, exact_count=False, db=db,
+        cursor=routes.list_research_papers.sync(lab_id=None, topic=None, limit=20, offset=0, cursor=None,
+                                                exact_count=False, db=db)["next_cursor"]),
+    "get_paper": lambda db: routes.get_research_paper.sync("x1", db=db),
+    "university_papers": lambda db: routes.get_university_papers.sync(
+        "u1", limit=20, offset=0, cursor=None, exact_count=True, db=db),
+    "department_research": lambda db: routes.get_department_research.sync("d1", db=db),
+    "paper_analysis": lambda db: routes.get_paper_analysis.sync("x4", db=db),
+    "get_report": lambda db: routes.get_report.sync("r1", db=db),
+    "plan_b": lambda db: routes.get_plan_b_suggestions.sync("l1", db=db),
+    "report_matching": lambda db: match_professors(db, ["machine learning", "로봇공학"], limit=5),
+    "user_reports": lambda db: db.query(Report).filter(Report.user_id == "user1")
+                                 .order_by(Report.sent_at.desc()).limit(10).all(),
+}
+
+
+class TestHotQueryPlans:
+    """Every hot query must be served by an index"""
+
+    @pytest.mark.parametrize("route", sorted(HOT_ROUTES))
+    def test_v1_route_has_no_full_scan(self, domain_db, route):
+        """Test that the route's statements do not scan large tables"""
+        engine, session, capture, large_tables = domain_db
+        count_cache.clear()
+        capture.take()
+
+        HOT_ROUTES[route](session)
+        session.rollback()
+
+        assert capture.statements, f"{route} issued no queries"
+        assert _full_scans(engine, capture, route, large_tables) == []
+
+    def test_v2_db_stats_use_status_index(self, tmp_path):
+        """Test that the crawl DB statistics behind /api/v2 are one indexed, cached query"""
+        database = Database(db_url=f"sqlite:///{tmp_path / 'crawl.db'}")
+        database.init_db()
+        with database.engine.begin() as conn:
+            conn.execute(insert(crawl_models.CrawlTask), [
+                {"id": f"t{i}", "url": f"https://example.org/{i}", "university_name": "U",
+                 "status": ("pending", "running", "completed", "failed")[i % 4]}
+                for i in range(5000)
+            ])
+        capture = _Capture(database.engine)
+
+        stats = database.get_db_stats()
+        assert database.get_db_stats() == stats
+
+        assert stats["tasks_total"] == 5000 and stats["tasks_failed"] == 1250
+        assert len(capture.statements) == 1
+        assert _full_scans(database.engine, capture, "db_stats", _large_tables(database.engine)) == []
@@ -0,0 +1,129 @@
+"""
+Unit tests for the hierarchy query layer: statement counts per endpoint stay
+bounded no matter how many children an entity has.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api import queries
+from src.core.query_stats import instrument_engine, track_queries
+from src.domain.models import (
+    Base, University, College, Department, Professor, Laboratory, LabMember, LabMemberRole,
+    ResearchPaper, PaperAnalysis, User, UserRole, Report, ReportPaper, ReportProfessor
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    instrument_engine(engine, slow_query_ms=10_000)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    _seed(session)
+    yield session
+    session.close()
+
+
+def _seed(session, colleges=2, departments=3, professors=3, labs=2, papers=4):
+    for u in range(2):
+        university = University(id=f"u{u}", name=f"Univ {u}", name_ko=f"대학{u}", ranking=u)
+        session.add(university)
+        for c in range(colleges):
+            college = College(id=f"u{u}c{c}", name=f"College {c}", name_ko=f"단과{c}", university=university)
+            session.add(college)
+            for d in range(departments):
+                dept = Department(id=f"{college.id}d{d}", name=f"Dept {d}", name_ko=f"학과{d}", college=college)
+                session.add(dept)
+                for p in range(professors):
+                    prof = Professor(id=f"{dept.id}p{p}", name=f"Prof {p}", name_ko=f"교수{p}", department=dept,
+                                     research_interests=["AI"])
+                    session.add(prof)
+                    for l in range(labs):
+                        lab = Laboratory(id=f"{prof.id}l{l}", name=f"Lab {l}", name_ko=f"연구실{l}",
+                                         professor=prof, department=dept)
+                        session.add(lab)
+                        lab.members = [LabMember(id=f"{lab.id}m{m}", name="m", name_ko="m",
+                                                 role=LabMemberRole.PHD_STUDENT) for m in range(2)]
+                        for n in range(papers):
+                            paper = ResearchPaper(id=f"{lab.id}x{n}", title=f"Paper {n}", laboratory=lab,
+                                                  url=f"https://example.org/{lab.id}/{n}")
+                            paper.analysis = PaperAnalysis(easy_summary="s", topic_easy="t", explanation="e")
+                            session.add(paper)
+    user = User(id="user", name="User", role=UserRole.STUDENT)
+    report = Report(id="r1", user=user, content="c")
+    report.papers = [ReportPaper(paper_id=f"u0c0d0p0l0x{n}", order_index=n) for n in range(papers)]
+    report.professors = [ReportProfessor(professor_id=f"u0c0d0p{p}") for p in range(professors)]
+    session.add(report)
+    session.commit()
+    session.expire_all()
+
+
+def _statements(db, fn):
+    with track_queries("test") as stats:
+        fn()
+    db.expire_all()
+    return stats.statements
+
+
+class TestHierarchyQueries:
+    """Tests for per-endpoint statement bounds"""
+
+    def test_university_and_college(self, db):
+        """Test that child counts come from one GROUP BY instead of per-child loads"""
+        def university():
+            uni = queries.load_university(db, "u0")
+            counts = queries.count_by(db, Department.college_id, [c.id for c in uni.colleges])
+            assert [counts[c.id] for c in uni.colleges] == [3, 3]
+
+        def college():
+            college = queries.load_college(db, "u0c0")
+            counts = queries.count_by(db, Professor.department_id, [d.id for d in college.departments])
+            assert college.university.name_ko and [counts[d.id] for d in college.departments] == [3, 3, 3]
+
+        assert _statements(db, university) <= 3
+        assert _statements(db, college) <= 3
+
+    def test_department_with_research_preview(self, db):
+        """Test that professors, labs, papers and analyses load in a fixed number of queries"""
+        def department():
+            dept = queries.load_department(db, "u0c0d0")
+            first_papers = [lab.papers[0].id for p in dept.professors for lab in p.laboratories if lab.papers]
+            analyses = queries.load_analyses(db, first_papers)
+            assert dept.college.university.name_ko
+            assert len(analyses) == 6
+            for p in dept.professors:
+                assert len(p.laboratories) == 2
+
+        assert _statements(db, department) <= 5
+
+    def test_professor_laboratory_report_plan_b(self, db):
+        """Test the remaining detail endpoints"""
+        def professor():
+            prof = queries.load_professor(db, "u0c0d0p0")
+            analyses = queries.load_analyses(db, [x.id for lab in prof.laboratories for x in lab.papers[:3]])
+            assert prof.department.name_ko and len(analyses) == 6
+            assert [len(lab.papers) for lab in prof.laboratories] == [4, 4]
+
+        def laboratory():
+            lab = queries.load_laboratory(db, "u0c0d0p0l0")
+            assert lab.professor.name_ko and lab.department.name_ko
+            assert len(lab.members) == 2 and len(lab.papers) == 4
+
+        def report():
+            report = queries.load_report(db, "r1")
+            assert [rp.paper.title for rp in report.papers]
+            assert [rp.professor.name_ko for rp in report.professors]
+
+        def plan_b():
+            lab = queries.load_laboratory_with_university(db, "u0c0d0p0l0")
+            labs = queries.find_plan_b_labs(db, lab)
+            assert len(labs) == 5
+            assert all(l.department.college.university.id == "u1" and l.professor.name_ko for l in labs)
+
+        assert _statements(db, professor) <= 4
+        assert _statements(db, laboratory) <= 3
+        assert _statements(db, report) <= 3
+        assert _statements(db, plan_b) <= 2
@@ -0,0 +1,111 @@
+"""
+Unit tests for the async database path.
+"""
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core import database
+from src.core.database import async_session_route, get_async_db, get_db, to_async_url
+from src.core.sqlite import create_async_sqlite_engine
+from src.domain.models import Base, University
+from src.services import response_cache
+from src.services.response_cache import ResponseCache
+
+# The async driver is optional for processes that only use the sync engine
+pytest.importorskip("aiosqlite")
+
+
+@async_session_route
+def get_university_name(uni_id: str, db: Session = Depends(get_db)):
+    university = db.query(University).filter(University.id == uni_id).first()
+    if not university:
+        raise HTTPException(status_code=404, detail="University not found")
+    return {"name": university.name, "colleges": len(university.colleges)}
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_async_sqlite_engine(f"sqlite:///{tmp_path / 'async.db'}")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(text("INSERT INTO universities (id, name, name_ko, tier, crawled_at) "
+                                    "VALUES ('u1', 'Test University', '테스트대학교', 'TOP', '2024-01-01')"))
+
+    async def get_async_db_override():
+        async with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.get("/universities/{uni_id}")(get_university_name)
+    app.dependency_overrides[get_async_db] = get_async_db_override
+    with TestClient(app) as test_client:
+        test_client.portal.call(setup)
+        yield test_client
+        test_client.portal.call(engine.dispose)
+
+
+class TestAsyncSessionRoute:
+    """Tests for serving sync route bodies from the async engine"""
+
+    def test_route_runs_on_async_session(self, client):
+        """Test that the body (including a lazy load) runs through the async session"""
+        response = client.get("/universities/u1")
+
+        assert response.status_code == 200
+        assert response.json() == {"name": "Test University", "colleges": 0}
+
+    def test_http_errors_propagate(self, client):
+        """Test that HTTPException raised in the sync body reaches the client"""
+        assert client.get("/universities/missing").status_code == 404
+
+    def test_sync_body_is_still_callable(self):
+        """Test that the undecorated function is exposed for sync sessions"""
+        assert get_university_name.sync.__name__ == "get_university_name"
+
+
+class TestAsyncEngine:
+    """Tests for the async engine configuration"""
+
+    def test_async_driver_urls(self):
+        """Test that sync URLs map to their async drivers"""
+        assert to_async_url("sqlite:///./univ_insight.db") == "sqlite+aiosqlite:///./univ_insight.db"
+        assert to_async_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+
+    async def test_async_commits_run_write_hooks(self, tmp_path, monkeypatch):
+        """Test that writes through get_async_db invalidate cached responses like sync writes"""
+        cache = ResponseCache()
+        monkeypatch.setattr(response_cache, "_response_cache", cache)
+        monkeypatch.setattr(database, "ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'hooks.db'}")
+        monkeypatch.setattr(database, "_async_engine", None)
+        monkeypatch.setattr(database, "_async_session_factory", None)
+        engine = database.get_async_engine()
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            cache.put("get_university:u1", b"{}", {"university:u1"}, cache.epoch())
+
+            async for db in get_async_db():
+                db.add(University(id="u1", name="Test University", name_ko="테스트대학교"))
+                await db.commit()
+
+            assert cache.get("get_university:u1") is None
+        finally:
+            await engine.dispose()
+
+    async def test_pragmas_applied_to_async_connections(self, tmp_path):
+        """Test that async connections get WAL and foreign keys like the sync engine"""
+        engine = create_async_sqlite_engine(f"sqlite:///{tmp_path / 'wal.db'}", foreign_keys=True)
+        try:
+            async with engine.connect() as conn:
+                assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+                assert (await conn.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+        finally:
+            await engine.dispose()
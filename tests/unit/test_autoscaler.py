@@ -0,0 +1,84 @@
+"""
+Unit tests for the worker pool autoscaling controller.
+"""
+
+from src.services.autoscaler import AutoScaler, ScalingSignals
+
+
+def _signals(**overrides) -> ScalingSignals:
+    values = dict(active_workers=2, busy_workers=2, pending=20, dispatchable=20, throughput=1.0,
+                  cpu_percent=10.0, rss_mb=200.0, loop_lag_ms=1.0)
+    values.update(overrides)
+    return ScalingSignals(**values)
+
+
+def _scaler(**kwargs) -> AutoScaler:
+    params = dict(min_workers=1, max_workers=10, up_samples=2, down_samples=2,
+                  up_cooldown=30, down_cooldown=60)
+    params.update(kwargs)
+    return AutoScaler(**params)
+
+
+class TestAutoScaler:
+    """Tests for signal-driven scaling decisions"""
+
+    def test_scale_up_requires_consecutive_samples(self):
+        """Test that one backlog spike does not add workers"""
+        scaler = _scaler()
+
+        assert scaler.decide(_signals(), now=100).delta == 0
+        decision = scaler.decide(_signals(), now=110)
+
+        assert decision.delta > 0
+        assert decision.delta <= scaler.max_step
+
+    def test_cooldown_blocks_back_to_back_scale_up(self):
+        """Test that a second scale-up waits for the cooldown"""
+        scaler = _scaler(up_samples=1, min_gain=0)
+        assert scaler.decide(_signals(), now=100).delta > 0
+
+        assert scaler.decide(_signals(active_workers=6, busy_workers=6, pending=40, dispatchable=40),
+                              now=110).delta == 0
+        assert scaler.decide(_signals(active_workers=6, busy_workers=6, pending=40, dispatchable=40),
+                              now=140).delta > 0
+
+    def test_saturated_host_does_not_scale_up(self):
+        """Test that backlog stuck behind a per-host concurrency cap adds no workers"""
+        scaler = _scaler(up_samples=1)
+
+        decision = scaler.decide(_signals(pending=50, dispatchable=0), now=100)
+
+        assert decision.delta == 0
+        assert "동시성" in decision.reason
+
+    def test_resource_headroom_blocks_scale_up(self):
+        """Test that CPU, RSS and loop lag limits veto scale-up"""
+        for overrides in ({"cpu_percent": 95.0}, {"rss_mb": 8192.0}, {"loop_lag_ms": 500.0}):
+            scaler = _scaler(up_samples=1)
+            assert scaler.decide(_signals(**overrides), now=100).delta == 0
+
+    def test_throughput_plateau_holds_further_scale_up(self):
+        """Test that scale-up stops when the last one did not raise throughput"""
+        scaler = _scaler(up_samples=1, up_cooldown=0)
+        assert scaler.decide(_signals(throughput=1.0), now=100).delta > 0
+
+        decision = scaler.decide(_signals(active_workers=6, busy_workers=6, pending=60, dispatchable=60,
+                                          throughput=1.02), now=200)
+
+        assert decision.delta == 0
+        assert "처리량" in decision.reason
+
+    def test_scale_down_drains_one_worker_after_idle_streak(self):
+        """Test that scale-down is gradual and needs a sustained idle pool"""
+        scaler = _scaler()
+        idle = _signals(active_workers=4, busy_workers=0, pending=0, dispatchable=0)
+
+        assert scaler.decide(idle, now=100).delta == 0
+        assert scaler.decide(idle, now=110).delta == -1
+
+    def test_measure_throughput(self):
+        """Test completed-tasks-per-second calculation"""
+        scaler = _scaler()
+
+        assert scaler.measure_throughput(10, now=0) == 0.0
+        assert scaler.measure_throughput(30, now=10) == 2.0
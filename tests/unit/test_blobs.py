@@ -0,0 +1,112 @@
+"""
+Unit tests for compressed out-of-row text storage.
+"""
+
+import importlib.util
+import os
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from src.core.blobs import CODEC_ZLIB, content_hash, delete_orphan_blobs
+from src.domain.models import Base, ContentBlob, ResearchPaper
+
+MIGRATION_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "src", "scripts", "migrations", "006_move_large_text_to_blobs.py"
+)
+
+FULL_TEXT = "Transformers for graph learning. " * 500
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    # One shared in-memory connection, so separate sessions see the same data
+    return sessionmaker(bind=engine.connect())
+
+
+def _paper(i, full_text=FULL_TEXT):
+    return ResearchPaper(id=f"x{i}", title=f"Paper {i}", url=f"https://example.org/{i}", full_text=full_text)
+
+
+class TestBlobText:
+    """Tests for the out-of-row text attribute"""
+
+    def test_text_stored_compressed_once_and_loaded_on_access(self, session_factory):
+        """Test that identical texts share one compressed blob and load lazily"""
+        with session_factory() as db:
+            db.add_all([_paper(1), _paper(2), _paper(3, full_text=None)])
+            db.commit()
+
+            blob = db.query(ContentBlob).one()
+            assert blob.hash == content_hash(FULL_TEXT)
+            assert blob.codec == CODEC_ZLIB
+            assert len(blob.data) < len(FULL_TEXT) / 10
+            row = db.execute(text("SELECT * FROM research_papers WHERE id = 'x1'")).mappings().one()
+            assert "full_text" not in row
+
+        with session_factory() as db:
+            paper = db.get(ResearchPaper, "x1")
+            assert "_blob_cache" not in paper.__dict__
+            assert paper.full_text == FULL_TEXT
+            assert db.get(ResearchPaper, "x3").full_text is None
+
+    def test_reassigning_text_and_orphan_cleanup(self, session_factory):
+        """Test that replaced texts leave an orphan blob that cleanup removes"""
+        with session_factory() as db:
+            db.add(_paper(1))
+            db.commit()
+            db.get(ResearchPaper, "x1").full_text = "Revised text"
+            db.commit()
+
+            assert db.query(ContentBlob).count() == 2
+            assert delete_orphan_blobs(db, ContentBlob, ResearchPaper.full_text_hash) == 1
+            db.commit()
+            assert db.get(ResearchPaper, "x1").full_text == "Revised text"
+
+    def test_detached_instance_raises(self, session_factory):
+        """Test that reading an unloaded text outside a session fails loudly"""
+        with session_factory() as db:
+            db.add(_paper(1))
+            db.commit()
+        with session_factory(expire_on_commit=False) as db:
+            paper = db.get(ResearchPaper, "x1")
+
+        with pytest.raises(DetachedInstanceError):
+            paper.full_text
+
+
+class TestBlobMigration:
+    """Tests for moving existing TEXT columns into the blob table"""
+
+    def test_migrate_up_and_down(self, tmp_path):
+        """Test that existing texts move to content_blobs and back"""
+        spec = importlib.util.spec_from_file_location("migration_006", MIGRATION_PATH)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        conn = sqlite3.connect(tmp_path / "legacy.db")
+        conn.execute("CREATE TABLE research_papers (id TEXT PRIMARY KEY, title TEXT, full_text TEXT)")
+        conn.executemany("INSERT INTO research_papers VALUES (?, ?, ?)",
+                         [("x1", "A", FULL_TEXT), ("x2", "B", FULL_TEXT), ("x3", "C", None)])
+        conn.commit()
+
+        migration.migrate_up(conn)
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(research_papers)")}
+        assert "full_text" not in columns
+        assert conn.execute("SELECT count(*) FROM content_blobs").fetchone() == (1,)
+        assert conn.execute("SELECT full_text_hash FROM research_papers WHERE id = 'x2'").fetchone() == (
+            content_hash(FULL_TEXT),
+        )
+
+        migration.migrate_down(conn)
+
+        assert conn.execute("SELECT full_text FROM research_papers ORDER BY id").fetchall() == [
+            (FULL_TEXT,), (FULL_TEXT,), (None,)
+        ]
+        conn.close()
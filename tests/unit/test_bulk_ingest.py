@@ -0,0 +1,87 @@
+"""
+Unit tests for the bulk ingest utility.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.models import Base, College, Department, University
+from src.services import bulk_ingest
+from src.services.bulk_ingest import bulk_upsert, iter_json
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _university(i, url="https://example.ac.kr"):
+    return {"id": f"u{i}", "name": f"University {i}", "name_ko": f"대학{i}", "url": url}
+
+
+class TestBulkUpsert:
+    """Tests for key-based batched upserts"""
+
+    def test_reports_inserted_updated_and_skipped(self, db):
+        """Test that re-running an ingest only writes new or changed rows"""
+        first = bulk_upsert(db, University, (_university(i) for i in range(10)),
+                            key=["id"], update_columns=["url"], batch_size=3)
+        db.commit()
+        assert first.to_dict() == {"inserted": 10, "updated": 0, "skipped": 0}
+
+        rows = [_university(i, url="https://new.ac.kr" if i < 2 else "https://example.ac.kr") for i in range(12)]
+        rows.append({"id": None, "name": "No key", "name_ko": "키 없음"})
+        second = bulk_upsert(db, University, rows, key=["id"], update_columns=["url"], batch_size=4)
+        db.commit()
+
+        assert second.to_dict() == {"inserted": 2, "updated": 2, "skipped": 9}
+        assert db.query(University).count() == 12
+        assert db.get(University, "u1").url == "https://new.ac.kr"
+
+    def test_empty_update_columns_leaves_existing_rows(self, db):
+        """Test that existing rows are skipped, and duplicate keys in a batch count once"""
+        db.add(University(id="u1", name="University 1", name_ko="원래 이름"))
+        db.commit()
+
+        report = bulk_upsert(db, University, [_university(1), _university(2), _university(2)],
+                             key=["id"], update_columns=())
+        db.commit()
+
+        assert report.to_dict() == {"inserted": 1, "updated": 0, "skipped": 2}
+        assert db.get(University, "u1").name_ko == "원래 이름"
+
+    def test_deferred_indexes_are_recreated(self, db):
+        """Test that secondary indexes dropped for the load exist again afterwards"""
+        db.add(University(id="u1", name="University 1", name_ko="대학1"))
+        db.add(College(id="c1", university_id="u1", name="College", name_ko="단과대학"))
+        rows = ({"id": f"d{i}", "college_id": "c1", "name": f"Dept {i}", "name_ko": f"학과{i}"} for i in range(50))
+
+        report = bulk_upsert(db, Department, rows, key=["id"], defer_indexes=True)
+        db.commit()
+
+        assert report.inserted == 50
+        indexes = {index["name"] for index in inspect(db.get_bind()).get_indexes("departments")}
+        assert "ix_departments_college_id" in indexes
+
+
+class TestStreamingReaders:
+    """Tests for the CSV/JSON readers"""
+
+    def test_json_array_values_across_chunk_boundaries(self, tmp_path, monkeypatch):
+        """Test that a JSON array is decoded correctly when values span read chunks"""
+        monkeypatch.setattr(bulk_ingest, "JSON_READ_CHUNK", 5)
+        values = [{"name": "대학" * (i % 4), "n": i * 1001} for i in range(30)] + [123456789]
+        array_path = tmp_path / "rows.json"
+        array_path.write_text(json.dumps(values, indent=2, ensure_ascii=False), encoding="utf-8")
+        lines_path = tmp_path / "rows.jsonl"
+        lines_path.write_text("\n".join(json.dumps(v) for v in values) + "\n", encoding="utf-8")
+
+        assert list(iter_json(str(array_path))) == values
+        assert list(iter_json(str(lines_path))) == values
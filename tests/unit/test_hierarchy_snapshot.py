@@ -0,0 +1,117 @@
+"""
+Unit tests for precomputed university hierarchy snapshots.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.models import (
+    Base, College, Department, Laboratory, PaperAnalysis, Professor, ResearchPaper, University
+)
+from src.services.bulk_ingest import bulk_upsert
+from src.services.hierarchy_snapshot import (
+    TreeRenderer, get_snapshot_etag, parse_fields, rebuild_snapshot, register_snapshot_hooks, variant_etag
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        University(id="u1", name="Test University", name_ko="테스트대학교"),
+        College(id="c1", university_id="u1", name="Engineering", name_ko="공과대학"),
+        Department(id="d1", college_id="c1", name="Computer Science", name_ko="컴퓨터공학과"),
+        Professor(id="p1", department_id="d1", name="Kim", name_ko="김교수", research_interests=["AI", "Vision"]),
+        Professor(id="p2", department_id="d1", name="Lee", name_ko="이교수", research_interests=["Robotics"]),
+        Laboratory(id="l1", professor_id="p1", department_id="d1", name="AI Lab", name_ko="인공지능연구실"),
+        ResearchPaper(id="x1", lab_id="l1", title="Paper 1", url="https://example.org/1"),
+        ResearchPaper(id="x2", lab_id="l1", title="Paper 2", url="https://example.org/2"),
+        PaperAnalysis(id="a1", paper_id="x1", easy_summary="요약", topic_easy="쉬운 AI", explanation="설명"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestSnapshotBuild:
+    """Tests for building and versioning snapshots"""
+
+    def test_tree_includes_counts_and_previews(self, db):
+        """Test that the snapshot holds the full tree with counts and research previews"""
+        tree = json.loads(rebuild_snapshot(db, "u1").data)
+
+        department = tree["colleges"][0]["departments"][0]
+        kim, lee = department["professors"]
+        assert tree["college_count"] == 1
+        assert department["professor_count"] == 2
+        assert kim["laboratories"][0]["paper_count"] == 2
+        assert kim["research_preview"]["topic_easy"] == "쉬운 AI"
+        assert lee["research_preview"]["topic_easy"] == "Robotics"
+
+    def test_version_bumps_only_when_content_changes(self, db):
+        """Test that rebuilding unchanged data keeps the version and ETag"""
+        first = rebuild_snapshot(db, "u1")
+        etag, version = first.etag, first.version
+
+        assert rebuild_snapshot(db, "u1").version == version
+
+        db.add(Laboratory(id="l2", professor_id="p2", department_id="d1", name="Robot Lab", name_ko="로봇연구실"))
+        db.commit()
+        changed = rebuild_snapshot(db, "u1")
+
+        assert changed.version == version + 1
+        assert changed.etag != etag
+
+    def test_missing_snapshot_built_on_demand(self, db):
+        """Test that the ETag lookup builds a missing snapshot and ignores unknown universities"""
+        assert get_snapshot_etag(db, "u1") == rebuild_snapshot(db, "u1").etag
+        assert get_snapshot_etag(db, "missing") is None
+
+
+    def test_committed_writes_rebuild_on_next_request(self, db):
+        """Test that ORM and bulk writes under a university mark its snapshot stale"""
+        register_snapshot_hooks(db)
+
+        def professor_count():
+            etag = get_snapshot_etag(db, "u1")
+            tree = json.loads(TreeRenderer().render(db, "u1", etag, 4, frozenset()))
+            return etag, tree["colleges"][0]["departments"][0]["professor_count"]
+
+        etag, count = professor_count()
+        assert (get_snapshot_etag(db, "u1"), count) == (etag, 2)
+
+        db.add(Professor(id="p3", department_id="d1", name="Park", name_ko="박교수"))
+        db.commit()
+        after_orm = professor_count()
+        bulk_upsert(db, Professor, [{"id": "p4", "department_id": "d1", "name": "Choi", "name_ko": "최교수"}],
+                    key=["id"])
+        db.commit()
+        after_bulk = professor_count()
+        db.add(PaperAnalysis(id="a2", paper_id="x2", easy_summary="요약", topic_easy="새 주제"))
+        db.commit()
+
+        assert after_orm[1] == 3 and after_orm[0] != etag
+        assert after_bulk[1] == 4
+        assert get_snapshot_etag(db, "u1") != after_bulk[0]
+
+
+class TestTreeRenderer:
+    """Tests for depth/fields variants of the snapshot"""
+
+    def test_depth_and_fields_prune_tree(self, db):
+        """Test that depth cuts child levels and fields keep ids plus the requested keys"""
+        etag = get_snapshot_etag(db, "u1")
+        fields = parse_fields("name_ko, professor_count")
+
+        body = json.loads(TreeRenderer().render(db, "u1", etag, 2, fields))
+
+        department = body["colleges"][0]["departments"][0]
+        assert body == {"id": "u1", "name_ko": "테스트대학교", "colleges": body["colleges"]}
+        assert department == {"id": "d1", "name_ko": "컴퓨터공학과", "professor_count": 2}
+        assert variant_etag(etag, 2, fields) != etag
+        assert variant_etag(etag, 4, frozenset()) == etag
@@ -0,0 +1,87 @@
+"""
+Unit tests for the professor keyword index used by report generation.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.domain.models import Base, College, Department, Laboratory, Professor, ProfessorKeyword, University
+from src.services.interest_index import (
+    ensure_index, index_terms, match_professors, normalize, register_index_hooks
+)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all([
+            University(id="u", name="U", name_ko="대학"),
+            College(id="c", university_id="u", name="C", name_ko="단과"),
+            Department(id="d", college_id="c", name="D", name_ko="학과"),
+        ])
+        db.commit()
+    return factory
+
+
+def _professor(pid, interests):
+    return Professor(id=pid, department_id="d", name=pid, name_ko=pid, research_interests=interests)
+
+
+class TestTerms:
+    """Tests for normalization and term expansion"""
+
+    def test_normalize_and_ngrams(self):
+        """Test case folding, punctuation stripping, n-grams and aliases"""
+        assert normalize("  Deep-Learning (Vision) ") == "deep learning vision"
+        terms = index_terms("large language models")
+        assert {"large language models", "language models", "language", "models"} <= terms
+        assert "인공지능" in index_terms("ai")
+        assert "machine learning" in index_terms("머신러닝 응용")
+
+
+class TestMatching:
+    """Tests for index maintenance and top-k lookup"""
+
+    def test_hooks_keep_index_in_sync(self, session_factory):
+        """Test that inserts, updates and deletes are reflected in the index"""
+        register_index_hooks(session_factory)
+        with session_factory() as db:
+            db.add_all([
+                _professor("p1", ["Machine Learning", "Computer Vision"]),
+                _professor("p2", ["자연어처리"]),
+                _professor("p3", ["Operating Systems"]),
+            ])
+            db.add(Laboratory(id="l3", professor_id="p3", department_id="d", name="L", name_ko="L",
+                              research_areas=["Deep Learning systems"]))
+            db.commit()
+
+            assert match_professors(db, ["machine learning", "vision"]) == [("p1", 2)]
+            assert match_professors(db, ["NLP"]) == [("p2", 1)]
+            assert match_professors(db, ["deep learning"]) == [("p3", 1)]
+
+            db.get(Professor, "p2").research_interests = ["Robotics"]
+            db.commit()
+            assert match_professors(db, ["nlp"]) == []
+            assert match_professors(db, ["로봇공학"]) == [("p2", 1)]
+
+            db.delete(db.get(Professor, "p3"))
+            db.commit()
+            assert match_professors(db, ["deep learning"]) == []
+            assert db.query(ProfessorKeyword).filter_by(source_id="l3").count() == 0
+
+    def test_ensure_index_backfills_existing_rows(self, session_factory):
+        """Test that an empty index is rebuilt from existing professors"""
+        with session_factory() as db:
+            db.add_all([_professor(f"p{i}", ["AI"] * (i % 2) + ["Security"]) for i in range(10)])
+            db.commit()
+            assert match_professors(db, ["ai"]) == []
+
+            assert ensure_index(db) is True
+            assert ensure_index(db) is False
+            top = match_professors(db, ["인공지능", "보안"], limit=3)
+            assert top == [("p1", 2), ("p3", 2), ("p5", 2)]
@@ -0,0 +1,70 @@
+"""
+Unit tests for the Prometheus-style metrics registry.
+"""
+
+import pytest
+
+from src.services.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Tests for fixed-bucket histograms"""
+
+    def test_quantiles_interpolate_within_buckets(self):
+        """Test that p50/p99 come from bucket boundaries"""
+        histogram = Histogram("task_seconds", "Task time", buckets=(1, 2, 5, 10))
+        for _ in range(98):
+            histogram.observe(1.5)
+        histogram.observe(8)
+        histogram.observe(8)
+
+        assert 1 < histogram.quantile(0.5) <= 2
+        assert 5 < histogram.quantile(0.99) <= 10
+
+    def test_summary_filters_by_partial_labels(self):
+        """Test that a subset of labels aggregates matching series"""
+        histogram = Histogram("fetch_seconds", "Fetch time", ["host", "status"], buckets=(1, 10))
+        histogram.observe(0.5, host="a.ac.kr", status="completed")
+        histogram.observe(5, host="b.ac.kr", status="completed")
+        histogram.observe(5, host="a.ac.kr", status="failed")
+
+        summary = histogram.summary(status="completed")
+
+        assert summary["count"] == 2
+        assert summary["avg"] == pytest.approx(2.75)
+
+    def test_rejects_wrong_labels(self):
+        """Test that label names are validated"""
+        histogram = Histogram("fetch_seconds", "Fetch time", ["host"])
+
+        with pytest.raises(ValueError):
+            histogram.observe(1.0, stage="fetch")
+
+
+class TestMetricsRegistry:
+    """Tests for the registry and text exposition"""
+
+    def test_render_prometheus_text_format(self):
+        """Test cumulative buckets, sum and count lines"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("crawl_fetch_seconds", "Fetch latency", ["host"], buckets=(0.1, 1))
+        histogram.observe(0.05, host="cse.snu.ac.kr")
+        histogram.observe(0.5, host="cse.snu.ac.kr")
+        registry.counter("crawl_tasks_total", "Tasks", ["status"]).inc(status="completed")
+
+        text = registry.render()
+
+        assert "# TYPE crawl_fetch_seconds histogram" in text
+        assert 'crawl_fetch_seconds_bucket{host="cse.snu.ac.kr",le="0.1"} 1' in text
+        assert 'crawl_fetch_seconds_bucket{host="cse.snu.ac.kr",le="+Inf"} 2' in text
+        assert 'crawl_fetch_seconds_count{host="cse.snu.ac.kr"} 2' in text
+        assert 'crawl_tasks_total{status="completed"} 1' in text
+
+    def test_same_name_returns_same_metric(self):
+        """Test that re-registering returns the existing metric and rejects conflicts"""
+        registry = MetricsRegistry()
+        counter = registry.counter("crawl_tasks_total", "Tasks", ["status"])
+
+        assert registry.counter("crawl_tasks_total", "Tasks", ["status"]) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("crawl_tasks_total", "Tasks", ["status"])
@@ -0,0 +1,86 @@
+"""
+Unit tests for keyset pagination and the count cache.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text, tuple_
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.pagination import CountCache, decode_cursor, paginate_papers
+from src.core.query_stats import instrument_engine, track_queries
+from src.domain.models import Base, ResearchPaper
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    instrument_engine(engine, slow_query_ms=10_000)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    base = datetime(2024, 1, 1)
+    # Timestamps repeat every 3 papers so the id tie-breaker matters
+    session.add_all([
+        ResearchPaper(id=f"p{i:02d}", title=f"Paper {i}", url=f"https://example.org/{i}",
+                      crawled_at=base + timedelta(minutes=i // 3))
+        for i in range(25)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestKeysetPagination:
+    """Tests for cursor paging over (crawled_at, id)"""
+
+    def test_cursor_walk_matches_offset_order(self, db):
+        """Test that following next_cursor visits every row once, newest first"""
+        expected = [p.id for p in db.query(ResearchPaper).order_by(
+            ResearchPaper.crawled_at.desc(), ResearchPaper.id.desc())]
+
+        seen, cursor = [], None
+        while True:
+            papers, cursor = paginate_papers(db.query(ResearchPaper), limit=4, cursor=cursor)
+            seen += [p.id for p in papers]
+            if cursor is None:
+                break
+
+        assert seen == expected
+        offset_page, _ = paginate_papers(db.query(ResearchPaper), limit=4, offset=8)
+        assert [p.id for p in offset_page] == expected[8:12]
+
+    def test_cursor_page_uses_index(self, db):
+        """Test that a cursor page is an index seek, not a sort over the table"""
+        _, cursor = paginate_papers(db.query(ResearchPaper), limit=4)
+        query = db.query(ResearchPaper).order_by(ResearchPaper.crawled_at.desc(), ResearchPaper.id.desc())
+        sql = str(query.filter(tuple_(ResearchPaper.crawled_at, ResearchPaper.id) < tuple_(*decode_cursor(cursor)))
+                  .limit(5).statement.compile(compile_kwargs={"literal_binds": True}))
+        plan = " ".join(row[-1] for row in db.execute(text("EXPLAIN QUERY PLAN " + sql)))
+
+        assert "ix_research_papers_crawled_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_invalid_cursor_rejected(self, db):
+        """Test that a garbage cursor is a 400"""
+        with pytest.raises(HTTPException) as exc:
+            paginate_papers(db.query(ResearchPaper), limit=4, cursor="not-a-cursor")
+        assert exc.value.status_code == 400
+
+
+class TestCountCache:
+    """Tests for cached total counts"""
+
+    def test_count_is_cached_until_exact(self, db):
+        """Test that repeated calls reuse the count and exact=True refreshes it"""
+        cache = CountCache(ttl=60)
+        assert cache.get_count("papers", db.query(ResearchPaper)) == 25
+
+        db.add(ResearchPaper(id="new", title="New", url="https://example.org/new"))
+        db.commit()
+        with track_queries() as stats:
+            assert cache.get_count("papers", db.query(ResearchPaper)) == 25
+        assert stats.statements == 0
+        assert cache.get_count("papers", db.query(ResearchPaper), exact=True) == 26
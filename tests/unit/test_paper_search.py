@@ -0,0 +1,63 @@
+"""
+Unit tests for full-text paper topic search.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.search import FTS_TABLE, apply_topic_search, install_paper_search
+from src.domain.models import Base, PaperAnalysis, ResearchPaper
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(ResearchPaper(id="existing", title="Graph neural networks", url="https://example.org/0"))
+    session.commit()
+    assert install_paper_search(engine)
+    yield session
+    session.close()
+
+
+def _search(db, topic):
+    return [p.id for p in apply_topic_search(db.query(ResearchPaper), db, topic).all()]
+
+
+class TestPaperSearch:
+    """Tests for the FTS5 index and ranked topic filter"""
+
+    def test_existing_rows_are_indexed(self, db):
+        """Test that rows present before installation are searchable"""
+        assert _search(db, "neural") == ["existing"]
+
+    def test_ranked_match_and_trigger_sync(self, db):
+        """Test BM25 ranking, Korean trigram matching and trigger maintenance"""
+        db.add_all([
+            ResearchPaper(id="abstract", title="Systems paper", abstract="a note on transformer inference",
+                          url="https://example.org/1"),
+            ResearchPaper(id="title", title="Transformer models for 자연어처리", url="https://example.org/2"),
+        ])
+        db.commit()
+        assert _search(db, "transformer") == ["title", "abstract"]
+        assert _search(db, "자연어처") == ["title"]
+
+        db.add(PaperAnalysis(paper_id="abstract", easy_summary="로봇 팔 제어를 쉽게 설명합니다"))
+        db.commit()
+        assert _search(db, "제어를 설명합니다") == ["abstract"]
+
+        db.get(ResearchPaper, "title").title = "Renamed"
+        db.delete(db.get(ResearchPaper, "existing"))
+        db.commit()
+        assert _search(db, "transformer") == ["abstract"]
+        assert _search(db, "neural") == []
+        assert db.execute(text(f"SELECT count(*) FROM {FTS_TABLE}")).scalar() == 2
+
+    def test_short_terms_fall_back_to_substring(self, db):
+        """Test that terms shorter than a trigram still match via ILIKE"""
+        db.add(ResearchPaper(id="ai", title="AI 보안 연구", url="https://example.org/3"))
+        db.commit()
+        assert _search(db, "보안") == ["ai"]
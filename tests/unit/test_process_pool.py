@@ -0,0 +1,95 @@
+"""
+Unit tests for the multi-process worker pool.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.metrics import MetricsRegistry, get_metrics_registry
+from src.services.process_pool import ProcessWorkerPool, QueueManager, _ResultQueueSink
+from src.services.task_queue import CrawlTask
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessWorkerPool("sqlite://", num_processes=2, workers_per_process=3,
+                             queue_kwargs={"fair_key": "university"})
+    asyncio.run(pool.initialize())
+    yield pool
+    asyncio.run(pool.stop(drain_timeout=5))
+
+
+class TestProcessWorkerPool:
+    """Tests for the shared queue and stats aggregation"""
+
+    def test_shared_queue_is_visible_to_other_processes(self, pool):
+        """Test that a task enqueued by the parent can be leased through another connection"""
+        task_id = pool.task_queue.enqueue(CrawlTask(url="https://cse.snu.ac.kr/faculty",
+                                                    university_name="Seoul National University"))
+
+        client = QueueManager(address=pool.manager.address, authkey=pool.authkey)
+        client.connect()
+        shard_queue = client.get_task_queue()
+        task = shard_queue.dequeue(worker_id="shard-1_worker_0")
+
+        assert task.task_id == task_id
+        assert pool.task_queue.get_running_tasks_info()[0]["worker_id"] == "shard-1_worker_0"
+        assert pool.task_queue.enqueue(CrawlTask(url="https://cse.snu.ac.kr/faculty/",
+                                                 university_name="Seoul National University")) == task_id
+
+    def test_stats_are_aggregated_across_shards(self, pool):
+        """Test that per-process worker stats are merged into one view"""
+        worker = {"tasks_completed": 2, "tasks_failed": 0}
+        pool.shard_stats = {
+            0: {"shard_id": 0, "pid": 100, "workers": [worker, worker], "forwarded": 2, "timestamp": 0},
+            1: {"shard_id": 1, "pid": 101, "workers": [worker], "forwarded": 1, "timestamp": 0},
+        }
+
+        stats = pool.get_stats()
+
+        assert stats["workers"]["active"] == 3
+        assert stats["workers"]["max"] == 6
+        assert {w["shard_id"] for w in stats["workers"]["stats"]} == {0, 1}
+        assert stats["processes"]["configured"] == 2
+        assert stats["processes"]["shards"][0]["results_forwarded"] == 2
+
+    def test_shard_results_go_to_the_parent_writer(self, pool, monkeypatch):
+        """Test that shard results are handed to the single writer in the parent"""
+        submitted = []
+        monkeypatch.setattr(pool.writer, "try_submit",
+                            lambda task, result, on_failed: submitted.append((task.url, result)) or True)
+        forwarder = threading.Thread(target=pool._forward_results)
+        forwarder.start()
+
+        sink = _ResultQueueSink(pool.results_queue)
+        assert sink.try_submit(CrawlTask(url="https://cse.snu.ac.kr/faculty", university_name="SNU"),
+                               {"professors": []})
+        deadline = time.monotonic() + 5
+        while not submitted and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pool._shards_stopped.set()
+        forwarder.join(timeout=5)
+
+        assert submitted == [("https://cse.snu.ac.kr/faculty", {"professors": []})]
+        assert sink.get_stats() == {"forwarded": 1}
+
+    def test_shard_metrics_are_merged_into_parent_registry(self, pool):
+        """Test that counters and histograms drained in a shard show up in the parent's /metrics"""
+        shard_registry = MetricsRegistry()
+        shard_registry.counter("crawl_tasks_total", "Processed crawl tasks", ["status"]).inc(3, status="completed")
+        shard_registry.histogram("crawl_task_duration_seconds", "End-to-end task processing time",
+                                 ["host", "status"]).observe(0.2, host="cse.snu.ac.kr", status="completed")
+        counter = get_metrics_registry().get("crawl_tasks_total")
+        histogram = get_metrics_registry().get("crawl_task_duration_seconds")
+        before = counter.get(status="completed"), histogram.summary(host="cse.snu.ac.kr")["count"]
+
+        pool._handle_report({"shard_id": 0, "pid": 100, "workers": [], "timestamp": 0,
+                             "metrics": shard_registry.drain()})
+
+        assert counter.get(status="completed") == before[0] + 3
+        assert histogram.summary(host="cse.snu.ac.kr")["count"] == before[1] + 1
+        assert shard_registry.drain() == []
+        assert "metrics" not in pool.shard_stats[0]
@@ -0,0 +1,81 @@
+"""
+Unit tests for the on-demand sampling profiler and heap snapshots.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.services.profiler import HeapProfiler, ProfilerBusyError, SamplingProfiler
+
+
+def _busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler:
+    """Tests for collapsed-stack sampling"""
+
+    def test_profile_captures_other_threads(self):
+        """Test that stacks of running threads are collected in collapsed format"""
+        stop = threading.Event()
+        thread = threading.Thread(target=_busy_loop, args=(stop,), name="busy")
+        thread.start()
+        try:
+            profiler = SamplingProfiler()
+            stacks = profiler.profile(seconds=0.2, interval=0.005)
+        finally:
+            stop.set()
+            thread.join()
+
+        busy = [stack for stack in stacks if stack.startswith("busy;")]
+        assert busy
+        assert any("_busy_loop (test_profiler.py" in stack for stack in busy)
+        assert all(";profile (profiler.py" not in stack for stack in stacks)
+
+        line = profiler.to_collapsed(stacks).splitlines()[0]
+        assert int(line.rsplit(" ", 1)[1]) >= 1
+
+    def test_concurrent_profile_rejected(self):
+        """Test that only one profile can run at a time"""
+        profiler = SamplingProfiler()
+        thread = threading.Thread(target=profiler.profile, args=(0.3, 0.01))
+        thread.start()
+        time.sleep(0.05)
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profiler.profile(0.1)
+        finally:
+            thread.join()
+        assert not profiler.running
+
+
+class TestHeapProfiler:
+    """Tests for tracemalloc snapshots"""
+
+    def test_snapshot_diff_and_stop(self):
+        """Test that allocations between snapshots show up in the diff"""
+        heap = HeapProfiler()
+        heap.start(frames=5)
+        try:
+            base = heap.take_snapshot()
+            retained = [bytearray(1024) for _ in range(2000)]
+            target = heap.take_snapshot()
+
+            diff = heap.diff(base, target, limit=5)
+            assert diff[0]["size_diff_kb"] > 1000
+            assert "test_profiler.py" in diff[0]["location"]
+            assert heap.top(target, limit=3)
+        finally:
+            heap.stop()
+
+        assert not heap.tracing
+        assert heap.get_status()["snapshots"] == []
+        assert len(retained) == 2000
+
+    def test_snapshot_requires_tracing(self):
+        """Test that snapshots fail while tracemalloc is idle"""
+        with pytest.raises(RuntimeError):
+            HeapProfiler().take_snapshot()
@@ -0,0 +1,74 @@
+"""
+Unit tests for request latency middleware and SQL statement accounting.
+"""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.core.middleware import request_metrics_middleware
+from src.core.query_stats import instrument_engine, track_queries
+from src.services.metrics import DB_STATEMENTS_PER_REQUEST, HTTP_REQUEST_LATENCY
+
+
+def _engine(slow_query_ms: float = 10_000):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    return instrument_engine(engine, slow_query_ms=slow_query_ms)
+
+
+def _app(engine) -> FastAPI:
+    app = FastAPI()
+    app.middleware("http")(request_metrics_middleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    return app
+
+
+class TestRequestMetricsMiddleware:
+    """Tests for per-route request metrics"""
+
+    def test_counts_statements_per_request(self):
+        """Test that statements run in a sync handler are attributed to the request"""
+        client = TestClient(_app(_engine()))
+
+        response = client.get("/items/3")
+
+        assert response.headers["X-DB-Statements"] == "3"
+        assert float(response.headers["X-Response-Time-ms"]) >= 0
+
+    def test_metrics_use_route_template(self):
+        """Test that path parameters do not become label values"""
+        client = TestClient(_app(_engine()))
+        before = HTTP_REQUEST_LATENCY.summary(route="/items/{item_id}")["count"]
+
+        client.get("/items/1")
+        client.get("/items/2")
+
+        assert HTTP_REQUEST_LATENCY.summary(route="/items/{item_id}")["count"] == before + 2
+        assert DB_STATEMENTS_PER_REQUEST.summary(route="/items/{item_id}")["count"] >= 2
+
+
+class TestSlowQueryLog:
+    """Tests for the SQLAlchemy slow-query hook"""
+
+    def test_slow_query_is_logged_with_route(self, caplog):
+        """Test that queries over the threshold are logged with the active route"""
+        engine = _engine(slow_query_ms=0)
+
+        with caplog.at_level(logging.WARNING, logger="src.core.query_stats"):
+            with track_queries(route="/api/v1/departments/d1") as stats:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+
+        assert stats.statements == 1
+        assert stats.slow_queries == 1
+        assert "/api/v1/departments/d1" in caplog.text
@@ -0,0 +1,133 @@
+"""
+Unit tests for the API response cache.
+"""
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.http_cache import cached_response, response_tags
+from src.domain.models import Base, College, Department, University
+from src.services import response_cache
+from src.services.bulk_ingest import bulk_upsert
+from src.services.response_cache import ResponseCache, SharedResponseStore, register_invalidation_hooks
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache()
+    monkeypatch.setattr(response_cache, "_response_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def session_factory(cache):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    register_invalidation_hooks(factory)
+    with factory() as db:
+        db.add_all([
+            University(id="u1", name="Test University", name_ko="테스트대학교"),
+            College(id="c1", university_id="u1", name="Engineering", name_ko="공과대학"),
+        ])
+        db.commit()
+    return factory
+
+
+@pytest.fixture
+def client(session_factory):
+    def get_session():
+        with session_factory() as db:
+            yield db
+
+    @cached_response("university")
+    def get_university(uni_id: str, db: Session = Depends(get_session)):
+        university = db.get(University, uni_id)
+        if university is None:
+            raise HTTPException(status_code=404, detail="University not found")
+        return {
+            "id": university.id,
+            "colleges": [{"id": c.id, "department_count": len(c.departments)} for c in university.colleges],
+        }
+
+    app = FastAPI()
+    app.get("/universities/{uni_id}")(get_university)
+    return TestClient(app)
+
+
+class TestCachedResponse:
+    """Tests for serving routes from the cache"""
+
+    def test_etag_and_not_modified(self, client, cache):
+        """Test that repeated requests are cache hits and If-None-Match answers 304"""
+        first = client.get("/universities/u1")
+        second = client.get("/universities/u1", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["etag"] == first.headers["etag"]
+        assert cache.stats["hits"] == 1
+        assert client.get("/universities/missing").status_code == 404
+        assert client.get("/universities/missing").status_code == 404
+        assert cache.stats["hits"] == 1
+
+    def test_committed_child_write_invalidates_parent(self, client, session_factory):
+        """Test that adding a department refreshes the university listing its college"""
+        before = client.get("/universities/u1")
+
+        with session_factory() as db:
+            db.add(Department(id="d1", college_id="c1", name="CS", name_ko="컴퓨터공학과"))
+            db.commit()
+        after = client.get("/universities/u1")
+
+        assert after.json()["colleges"][0]["department_count"] == 1
+        assert after.headers["etag"] != before.headers["etag"]
+
+    def test_bulk_upsert_invalidates_on_commit(self, client, session_factory, cache):
+        """Test that Core bulk writes through a session invalidate only after commit"""
+        client.get("/universities/u1")
+        invalidations = cache.stats["invalidations"]
+
+        with session_factory() as db:
+            bulk_upsert(db, Department, [{"id": "d1", "college_id": "c1", "name": "CS", "name_ko": "컴공"}], key=["id"])
+            assert cache.stats["invalidations"] == invalidations
+            db.commit()
+
+        assert cache.stats["invalidations"] == invalidations + 1
+        assert client.get("/universities/u1").json()["colleges"][0]["department_count"] == 1
+
+
+class TestResponseCache:
+    """Tests for cache entries, tags and the shared store"""
+
+    def test_write_during_computation_discards_entry(self):
+        """Test that an entry computed across an invalidation is not served"""
+        cache = ResponseCache()
+        epoch = cache.epoch()
+        cache.invalidate("professor:p1")
+        cache.put("key", b"{}", {"professor:p1"}, epoch)
+
+        assert cache.get("key") is None
+
+    def test_shared_store_between_processes(self, tmp_path):
+        """Test that a second cache reuses stored responses and sees its invalidations"""
+        path = str(tmp_path / "responses.db")
+        api = ResponseCache(store=SharedResponseStore(path))
+        writer = ResponseCache(store=SharedResponseStore(path))
+
+        api.put("key", b'{"id":"l1"}', {"laboratory:l1"}, api.epoch())
+        assert writer.get("key").body == b'{"id":"l1"}'
+
+        writer.invalidate("laboratory:l1")
+        assert api.get("key") is None
+
+    def test_response_tags(self):
+        """Test that tags cover the entity, referenced parents and listed children"""
+        body = {"id": "p1", "department_id": "d1", "laboratories": [{"id": "l1", "members": [{"id": "m1"}]}],
+                "research_explanations": [{"paper_id": "x1"}]}
+
+        assert response_tags("professor", body) == {"professor:p1", "department:d1", "laboratory:l1", "paper:x1"}
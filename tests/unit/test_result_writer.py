@@ -0,0 +1,121 @@
+"""
+Unit tests for the batched crawl result writer.
+"""
+
+from src.database.db import Database
+from src.database.models import CrawlResult, CrawlTask as DBCrawlTask, Lab, Paper, Professor
+from src.services.result_writer import ResultWriter
+from src.services.task_queue import CrawlTask
+
+
+def _result(professors=(), papers=(), labs=()):
+    return {
+        "professors": list(professors),
+        "papers": list(papers),
+        "labs": list(labs),
+        "extraction_stats": {
+            "professors_count": len(professors),
+            "papers_count": len(papers),
+            "labs_count": len(labs),
+            "pages_crawled": 1,
+        },
+    }
+
+
+class TestResultWriter:
+    """Tests for ResultWriter"""
+
+    def _database(self, tmp_path):
+        database = Database(db_url=f"sqlite:///{tmp_path / 'crawl.db'}")
+        database.init_db()
+        return database
+
+    def test_writes_tasks_results_and_entities(self, tmp_path):
+        """Test that a submitted result is persisted with its entities"""
+        database = self._database(tmp_path)
+        writer = ResultWriter(database, flush_interval_ms=20)
+        task = CrawlTask(url="https://cse.snu.ac.kr/faculty", university_name="SNU")
+
+        assert writer.try_submit(task, _result(
+            professors=[{"name": "Kim", "email": "kim@snu.ac.kr", "confidence": 0.8}],
+            papers=[{"title": "Efficient Transformers", "year": "2024", "confidence": 0.85}],
+            labs=[{"name": "Vision Lab", "description": "CV", "confidence": 0.8}],
+        ))
+        writer.stop()
+
+        with database.session_scope() as session:
+            assert session.query(DBCrawlTask).count() == 1
+            assert session.query(CrawlResult).count() == 1
+            assert session.query(Professor).one().confidence_score == 80.0
+            assert session.query(Paper).one().published_year == 2024
+            assert session.query(Lab).one().name == "Vision Lab"
+        assert writer.get_stats()["tasks_written"] == 1
+
+    def test_upserts_on_natural_keys(self, tmp_path):
+        """Test that re-crawled professors and papers are updated, not duplicated"""
+        database = self._database(tmp_path)
+        writer = ResultWriter(database, flush_interval_ms=20)
+        prof = {"name": "Kim", "email": "kim@snu.ac.kr", "confidence": 0.5}
+        paper = {"title": "Efficient Transformers", "year": "2024", "confidence": 0.5}
+
+        writer.try_submit(CrawlTask(url="https://a.snu.ac.kr", university_name="SNU"),
+                          _result(professors=[prof], papers=[paper]))
+        writer.try_submit(CrawlTask(url="https://b.snu.ac.kr", university_name="SNU"),
+                          _result(professors=[{**prof, "title": "Professor", "confidence": 0.9}],
+                                  papers=[{**paper, "confidence": 0.9}]))
+        writer.stop()
+
+        with database.session_scope() as session:
+            professor = session.query(Professor).one()
+            assert professor.title == "Professor"
+            assert professor.confidence_score == 90.0
+            assert session.query(Paper).count() == 1
+            assert session.query(CrawlResult).count() == 2
+
+    def test_paper_without_year_written_twice(self, tmp_path):
+        """Test that a year-less paper is upserted instead of failing the group commit"""
+        database = self._database(tmp_path)
+        writer = ResultWriter(database, flush_interval_ms=20)
+        paper = {"title": "Untitled Draft", "confidence": 0.5}
+
+        writer.try_submit(CrawlTask(url="https://a.snu.ac.kr", university_name="SNU"), _result(papers=[paper]))
+        writer.stop()
+        writer = ResultWriter(database, flush_interval_ms=20)
+        writer.try_submit(CrawlTask(url="https://b.snu.ac.kr", university_name="SNU"),
+                          _result(papers=[{**paper, "confidence": 0.9}]))
+        writer.stop()
+
+        assert writer.get_stats()["errors"] == 0
+        with database.session_scope() as session:
+            assert session.query(DBCrawlTask).count() == 2
+            assert session.query(Paper).one().confidence_score == 90.0
+
+    def test_failed_batch_isolates_the_bad_task(self, tmp_path):
+        """Test that one unwritable result does not drop the rest of its group commit"""
+        database = self._database(tmp_path)
+        writer = ResultWriter(database, flush_interval_ms=200)
+        failed = []
+        good = CrawlTask(url="https://a.snu.ac.kr", university_name="SNU")
+        bad = CrawlTask(url="https://b.snu.ac.kr", university_name="SNU")
+
+        writer.try_submit(good, _result(labs=[{"name": "Vision Lab", "confidence": 0.8}]),
+                          on_failed=lambda task, error: failed.append(task.task_id))
+        writer.try_submit(bad, _result(professors=[{"name": "Kim", "confidence": "high"}]),
+                          on_failed=lambda task, error: failed.append(task.task_id))
+        writer.stop()
+
+        assert failed == [bad.task_id]
+        with database.session_scope() as session:
+            assert [t.id for t in session.query(DBCrawlTask)] == [good.task_id]
+            assert session.query(Lab).count() == 1
+        stats = writer.get_stats()
+        assert (stats["errors"], stats["tasks_failed"], stats["tasks_written"]) == (1, 1, 1)
+
+    def test_try_submit_does_not_block_when_full(self, tmp_path):
+        """Test that a full queue is reported instead of blocking the worker"""
+        database = self._database(tmp_path)
+        writer = ResultWriter(database, max_pending=1)
+        writer.start = lambda: None  # keep the writer thread from draining the queue
+
+        assert writer.try_submit(CrawlTask(url="https://a.ac.kr", university_name="A"), _result()) is True
+        assert writer.try_submit(CrawlTask(url="https://b.ac.kr", university_name="B"), _result()) is False
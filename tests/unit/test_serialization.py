@@ -0,0 +1,84 @@
+"""
+Unit tests for the fast JSON serialization path.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api import serialization
+from src.api.http_cache import response_tags
+from src.api.serialization import Fragment, FragmentCache, dumps
+from src.domain.models import ReportStatus
+
+PAYLOAD = {
+    "id": "r1",
+    "status": ReportStatus.SENT,
+    "sent_at": datetime(2024, 3, 1, 9, 30, 15, 250),
+    "published": date(2024, 2, 29),
+    "content": "연구 요약 \"quoted\"\n",
+    "scores": [0.5, 1, None, True],
+    "nested": {"tags": ("a", "b"), "empty": {}},
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+class TestDumps:
+    """Tests for dumps() with and without orjson"""
+
+    def test_matches_json_response(self, encoder):
+        """Test that the output equals FastAPI's jsonable_encoder + JSONResponse body"""
+        assert dumps(PAYLOAD) == JSONResponse(content=jsonable_encoder(PAYLOAD)).body
+
+    def test_fragments_embedded_verbatim(self, encoder):
+        """Test that fragments are spliced in and their values still yield tags"""
+        items = [Fragment(dumps(value), value) for value in ({"id": "x1", "lab_id": "l1"}, {"id": "x2"})]
+        body = {"total_count": 2, "items": items, "note": "\x00not a fragment"}
+
+        assert dumps(body) == dumps({"total_count": 2, "items": [item.value for item in items],
+                                     "note": "\x00not a fragment"})
+        assert response_tags("paper", body) == {"paper:x1", "paper:x2", "laboratory:l1"}
+
+
+class TestFragmentCache:
+    """Tests for caching encoded rows by version"""
+
+    def test_reuse_until_version_changes(self):
+        """Test that a row is encoded once per version and uncached without one"""
+        cache = FragmentCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"id": "x1", "title": f"v{len(builds)}"}
+
+        first = cache.encode("paper_summary", "x1", 1, build)
+        assert cache.encode("paper_summary", "x1", 1, build) is first
+        assert cache.encode("paper_summary", "x1", 2, build).data == b'{"id":"x1","title":"v2"}'
+        cache.encode("paper_summary", "x1", None, build)
+        cache.encode("paper_summary", "x1", None, build)
+
+        assert len(builds) == 4
+        assert cache.get_stats()["size"] == 2
+
+    def test_lru_eviction(self):
+        """Test that the least recently used fragment is evicted first"""
+        cache = FragmentCache(max_entries=2)
+        for i in range(2):
+            cache.encode("analysis", f"a{i}", 1, lambda: {})
+        cache.encode("analysis", "a0", 1, lambda: {})
+        cache.encode("analysis", "a2", 1, lambda: {})
+
+        assert cache.stats == {"hits": 1, "misses": 3}
+        assert list(cache._entries) == [("analysis", "a0", 1), ("analysis", "a2", 1)]
@@ -0,0 +1,41 @@
+"""
+Unit tests for the SQLite engine profile.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from src.core.sqlite import create_sqlite_engine, is_memory_database
+
+
+class TestSqliteEngine:
+    """Tests for pragmas and pool selection"""
+
+    def test_file_database_uses_wal_and_pool(self, tmp_path):
+        """Test that file databases get WAL, tuned pragmas and a real pool"""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'app.db'}", foreign_keys=True)
+        assert isinstance(engine.pool, QueuePool)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+            # Concurrent checkouts get their own sqlite3 connection
+            with engine.connect() as other:
+                assert other.connection.dbapi_connection is not conn.connection.dbapi_connection
+        engine.dispose()
+
+    def test_memory_database_shares_one_connection(self):
+        """Test that in-memory databases keep a single shared connection"""
+        assert is_memory_database("sqlite://")
+        assert is_memory_database("sqlite:///:memory:")
+        assert not is_memory_database("sqlite:///./univ_insight.db")
+
+        engine = create_sqlite_engine("sqlite://")
+        assert isinstance(engine.pool, StaticPool)
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 0
@@ -0,0 +1,251 @@
+"""
+Unit tests for the in-memory crawl task queue.
+"""
+
+from datetime import datetime, timedelta
+
+from src.services.task_queue import CrawlTask, InMemoryTaskQueue, TaskStatus, canonicalize_url
+
+
+def _task(url: str = "https://example.ac.kr/faculty", university: str = "Test University", **kwargs) -> CrawlTask:
+    return CrawlTask(url=url, university_name=university, **kwargs)
+
+
+class TestTaskLeases:
+    """Tests for lease heartbeats and stale-task reclamation"""
+
+    def test_dequeue_records_worker_and_lease(self):
+        """Test that dequeue assigns the task to the calling worker"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        queue.enqueue(_task())
+
+        task = queue.dequeue(worker_id="worker_a")
+
+        assert task.worker_id == "worker_a"
+        assert task.started_at is not None
+        assert task.lease_expires_at > datetime.now()
+
+        info = queue.get_running_tasks_info()
+        assert len(info) == 1
+        assert info[0]["worker_id"] == "worker_a"
+        assert info[0]["age_seconds"] >= 0
+
+    def test_heartbeat_extends_lease_only_for_owner(self):
+        """Test that only the owning worker can extend a lease"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        queue.enqueue(_task())
+        task = queue.dequeue(worker_id="worker_a")
+        task.lease_expires_at = datetime.now() + timedelta(seconds=1)
+
+        assert queue.heartbeat(task.task_id, "worker_b") is False
+        assert queue.heartbeat(task.task_id, "worker_a") is True
+        assert task.lease_expires_at > datetime.now() + timedelta(seconds=30)
+
+    def test_expired_lease_is_requeued_with_retry_bump(self):
+        """Test that a task held by a dead worker goes back to the queue"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        queue.enqueue(_task())
+        task = queue.dequeue(worker_id="worker_a")
+        task.lease_expires_at = datetime.now() - timedelta(seconds=1)
+
+        reclaimed = queue.reclaim_expired_tasks()
+
+        assert reclaimed == [task.task_id]
+        assert task.retry_count == 1
+        assert queue.get_running_tasks() == []
+
+        retried = queue.dequeue(worker_id="worker_b")
+        assert retried is task
+        assert retried.worker_id == "worker_b"
+
+    def test_live_lease_is_not_reclaimed(self):
+        """Test that tasks with a valid lease are left alone"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        queue.enqueue(_task())
+        queue.dequeue(worker_id="worker_a")
+
+        assert queue.reclaim_expired_tasks() == []
+        assert len(queue.get_running_tasks()) == 1
+
+    def test_stale_worker_report_is_ignored_after_reclaim(self):
+        """Test that a worker whose lease was reclaimed cannot complete, fail or release the task"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        queue.enqueue(_task())
+        task = queue.dequeue(worker_id="worker_a")
+        task.lease_expires_at = datetime.now() - timedelta(seconds=1)
+        queue.reclaim_expired_tasks()
+        assert queue.dequeue(worker_id="worker_b") is task
+
+        assert queue.mark_failed(task.task_id, "late", worker_id="worker_a") is False
+        assert queue.mark_completed(task.task_id, worker_id="worker_a") is False
+        assert queue.release(task.task_id, worker_id="worker_a") is False
+
+        assert task.retry_count == 1
+        assert queue.dequeue(worker_id="worker_c") is None
+        assert queue.heartbeat(task.task_id, "worker_b") is True
+        assert queue.mark_completed(task.task_id, worker_id="worker_b") is True
+
+    def test_unsaved_completion_is_retried(self):
+        """Test that a completed task whose result was not persisted goes back for a retry"""
+        queue = InMemoryTaskQueue()
+        queue.enqueue(_task())
+        task = queue.dequeue(worker_id="worker_a")
+        queue.mark_completed(task.task_id, worker_id="worker_a")
+
+        assert queue.mark_unsaved(task.task_id, "disk I/O error") is True
+        assert task.status == TaskStatus.RETRYING.value
+        assert task.retry_count == 1
+        assert queue.get_stats()["completed"] == 0
+        assert queue.dequeue(worker_id="worker_b") is task
+        assert queue.mark_unsaved(task.task_id) is False
+
+    def test_release_requeues_without_retry_bump(self):
+        """Test that a task released on shutdown goes back as pending"""
+        queue = InMemoryTaskQueue()
+        queue.enqueue(_task())
+        task = queue.dequeue(worker_id="worker_a")
+
+        assert queue.release(task.task_id) is True
+        assert task.retry_count == 0
+        assert task.status == TaskStatus.PENDING.value
+        assert queue.release(task.task_id) is False
+        assert queue.dequeue(worker_id="worker_b") is task
+
+    def test_expired_lease_without_retries_fails_task(self):
+        """Test that reclamation respects max_retries"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        queue.enqueue(_task(max_retries=0))
+        task = queue.dequeue(worker_id="worker_a")
+        task.lease_expires_at = datetime.now() - timedelta(seconds=1)
+
+        queue.reclaim_expired_tasks()
+
+        assert queue.get_task_status(task.task_id) == TaskStatus.FAILED.value
+        assert queue.dequeue() is None
+
+
+class TestFairScheduling:
+    """Tests for per-university / per-host fair scheduling"""
+
+    def test_round_robin_across_universities(self):
+        """Test that a bulk submission from one university does not starve others"""
+        queue = InMemoryTaskQueue(fair_key="university")
+        for i in range(5):
+            queue.enqueue(_task(url=f"https://big.ac.kr/{i}", university="Big University"))
+        queue.enqueue(_task(url="https://small.ac.kr/0", university="Small University"))
+
+        first = queue.dequeue()
+        second = queue.dequeue()
+
+        assert {first.university_name, second.university_name} == {"Big University", "Small University"}
+        assert queue.get_stats()["pending"] == 4
+
+    def test_priority_still_wins_within_fair_mode(self):
+        """Test that higher priority levels are served first"""
+        queue = InMemoryTaskQueue(fair_key="host")
+        queue.enqueue(_task(url="https://a.ac.kr/low", priority=-1))
+        queue.enqueue(_task(url="https://b.ac.kr/high", priority=1))
+
+        assert queue.dequeue().url == "https://b.ac.kr/high"
+
+    def test_aging_promotes_waiting_low_priority_tasks(self):
+        """Test that a LOW task that waited long enough beats fresh NORMAL tasks"""
+        queue = InMemoryTaskQueue(fair_key="host", aging_seconds=60)
+        queue.enqueue(_task(url="https://a.ac.kr/old", priority=-1,
+                            created_at=datetime.now() - timedelta(seconds=150)))
+        queue.enqueue(_task(url="https://b.ac.kr/new", priority=0))
+
+        assert queue.dequeue().url == "https://a.ac.kr/old"
+
+    def test_per_host_concurrency_cap(self):
+        """Test that a host at its concurrency cap is skipped"""
+        queue = InMemoryTaskQueue(fair_key="host", per_key_concurrency=1)
+        queue.enqueue(_task(url="https://a.ac.kr/1"))
+        queue.enqueue(_task(url="https://a.ac.kr/2"))
+
+        running = queue.dequeue()
+        assert queue.dequeue() is None
+
+        queue.mark_completed(running.task_id)
+        assert queue.dequeue().url == "https://a.ac.kr/2"
+
+    def test_dispatch_capacity_excludes_capped_hosts(self):
+        """Test that tasks blocked by the per-host cap are not counted as dispatchable"""
+        queue = InMemoryTaskQueue(fair_key="host", per_key_concurrency=1)
+        for i in range(3):
+            queue.enqueue(_task(url=f"https://a.ac.kr/{i}"))
+        queue.enqueue(_task(url="https://b.ac.kr/0"))
+
+        assert queue.get_dispatch_capacity() == 2
+        queue.dequeue()
+        assert queue.get_dispatch_capacity() == 1
+
+    def test_retry_goes_back_into_fair_queue(self):
+        """Test that failed tasks are re-queued in fair mode"""
+        queue = InMemoryTaskQueue(fair_key="university")
+        queue.enqueue(_task())
+        task = queue.dequeue()
+
+        queue.mark_failed(task.task_id, "boom")
+
+        assert queue.dequeue() is task
+
+
+class TestIdempotentSubmission:
+    """Tests for canonical-URL idempotent submission"""
+
+    def test_canonicalize_url(self):
+        """Test that equivalent URLs share one canonical form"""
+        assert canonicalize_url("HTTPS://CSE.SNU.ac.kr:443/people/faculty/?b=2&a=1&utm_source=x#top") == \
+            "https://cse.snu.ac.kr/people/faculty?a=1&b=2"
+        assert canonicalize_url("http://example.com:8080") == "http://example.com:8080/"
+
+    def test_duplicate_pending_submission_returns_existing_id(self):
+        """Test that re-submitting a pending URL does not create a second task"""
+        queue = InMemoryTaskQueue()
+        first_id = queue.enqueue(_task(url="https://cse.snu.ac.kr/faculty"))
+        second_id = queue.enqueue(_task(url="https://cse.snu.ac.kr/faculty/#list"))
+
+        assert second_id == first_id
+        assert queue.get_stats()["total"] == 1
+
+    def test_duplicate_running_submission_returns_existing_id(self):
+        """Test that re-submitting a running URL returns the running task"""
+        queue = InMemoryTaskQueue()
+        first_id = queue.enqueue(_task())
+        queue.dequeue()
+
+        assert queue.enqueue(_task()) == first_id
+
+    def test_different_profile_is_not_a_duplicate(self):
+        """Test that the crawl profile is part of the key"""
+        queue = InMemoryTaskQueue()
+        first_id = queue.enqueue(_task())
+
+        assert queue.enqueue(_task(use_ocr=True)) != first_id
+
+    def test_completed_within_freshness_window_returns_result(self):
+        """Test that a fresh completed result is reused"""
+        queue = InMemoryTaskQueue(freshness_seconds=3600)
+        first_id = queue.enqueue(_task())
+        queue.dequeue()
+        queue.mark_completed(first_id, result={"professors": 3})
+
+        assert queue.enqueue(_task()) == first_id
+        assert queue.get_task_result(first_id) == {"professors": 3}
+
+    def test_completed_outside_freshness_window_is_recrawled(self):
+        """Test that stale or disabled results lead to a new task"""
+        queue = InMemoryTaskQueue(freshness_seconds=60)
+        first_id = queue.enqueue(_task())
+        queue.dequeue()
+        queue.mark_completed(first_id)
+        queue.task_registry[first_id].completed_at = datetime.now() - timedelta(seconds=120)
+
+        assert queue.enqueue(_task()) != first_id
+
+        no_reuse = InMemoryTaskQueue()
+        task_id = no_reuse.enqueue(_task())
+        no_reuse.dequeue()
+        no_reuse.mark_completed(task_id)
+        assert no_reuse.enqueue(_task()) != task_id
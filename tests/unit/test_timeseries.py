@@ -0,0 +1,99 @@
+"""
+Unit tests for the fixed-memory metrics time-series store.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.services.monitoring import MetricsCollector
+from src.services.timeseries import RollupSeries, TimeSeriesStore, classify_error, MAX_ERROR_CLASSES
+
+
+class TestRollupSeries:
+    """Tests for ring-buffer rollups"""
+
+    def test_old_buckets_are_overwritten(self):
+        """Test that memory stays fixed as time moves past the buffer"""
+        series = RollupSeries(resolution=60, size=3)
+        for minute in range(10):
+            series.record(minute * 60, success=True, duration=1.0)
+
+        recent = series.recent(10, now=9 * 60)
+
+        assert len(series.buckets) == 3
+        assert [b.start for b in recent] == [420, 480, 540]
+
+    def test_errors_are_counted_by_class_with_bounded_samples(self):
+        """Test that error strings are aggregated instead of appended forever"""
+        series = RollupSeries(resolution=3600, size=2)
+        for i in range(100):
+            series.record(10, success=False, duration=0, error=f"deadline exceeded ({i}s)")
+        for i in range(MAX_ERROR_CLASSES + 5):
+            series.record(10, success=False, duration=0, error=f"error type {i}")
+
+        bucket = series.recent(1, now=10)[0]
+
+        assert bucket.error_counts["deadline exceeded"] == 100
+        assert len(bucket.error_counts) == MAX_ERROR_CLASSES
+        assert bucket.error_counts["other"] == 7
+        assert len(bucket.error_samples) == 3
+
+
+@pytest.fixture
+def kolkata_tz(monkeypatch):
+    """Run with a half-hour UTC offset so day and hour buckets differ from UTC ones"""
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestTimeSeriesStore:
+    """Tests for minute/hour/day rollups"""
+
+    def test_one_record_updates_every_rollup(self):
+        """Test that a record lands in the minute, hour and day series"""
+        store = TimeSeriesStore()
+        store.record(True, 2.0, timestamp=1_700_000_000)
+        store.record(False, 0.0, error="timeout: cse.snu.ac.kr", timestamp=1_700_000_030)
+
+        for rollup in ("minute", "hour", "day"):
+            stats = list(store.get_stats(rollup, 5, "%Y-%m-%d %H:%M", now=1_700_000_030).values())
+            assert stats[0]["processed"] == 1
+            assert stats[0]["failed"] == 1
+            assert stats[0]["errors"] == {"timeout": 1}
+
+    def test_buckets_follow_local_time(self, kolkata_tz):
+        """Test that day buckets start at local midnight and hour buckets on the local hour"""
+        store = TimeSeriesStore()
+        for hour, minute in ((10, 15), (10, 45), (23, 50)):
+            store.record(True, 1.0, timestamp=datetime(2024, 3, 1, hour, minute).timestamp())
+        now = datetime(2024, 3, 2, 0, 10).timestamp()
+        store.record(True, 1.0, timestamp=now)
+
+        days = store.get_stats("day", 2, "%Y-%m-%d", now=now)
+        hours = store.get_stats("hour", 24, "%Y-%m-%d %H:00", now=now)
+
+        assert {label: day["processed"] for label, day in days.items()} == {"2024-03-01": 3, "2024-03-02": 1}
+        assert hours["2024-03-01 10:00"]["processed"] == 2
+        assert list(hours)[-1] == "2024-03-02 00:00"
+
+    def test_classify_error(self):
+        """Test error class extraction"""
+        assert classify_error("lease expired (worker=worker_a)") == "lease expired"
+        assert classify_error("") == "unknown"
+
+    def test_metrics_collector_hourly_stats(self):
+        """Test that MetricsCollector reads hourly stats from the rollups"""
+        collector = MetricsCollector()
+        collector.record_task_completion("t1", 3.0)
+        collector.record_task_completion("t2", 0.0, success=False, error="deadline exceeded (30s)")
+
+        hour = list(collector.get_hourly_stats(hours=1).values())[0]
+
+        assert hour["total"] == 2
+        assert hour["avg_duration"] == 3.0
+        assert hour["errors"] == {"deadline exceeded": 1}
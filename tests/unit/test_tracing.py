@@ -0,0 +1,72 @@
+"""
+Unit tests for lightweight tracing spans.
+"""
+
+import asyncio
+import json
+
+from src.services.tracing import JsonLinesExporter, Tracer, configure_tracer, current_span, traced
+
+
+class TestTracer:
+    """Tests for span nesting and stage aggregation"""
+
+    def test_stage_times_use_self_time(self):
+        """Test that nested spans are not double-counted in the root breakdown"""
+        tracer = Tracer()
+
+        with tracer.root_span("task") as root:
+            with tracer.span("crawl_department"):
+                with tracer.span("fetch"):
+                    pass
+                with tracer.span("extract"):
+                    pass
+
+        assert set(root.stage_times) == {"task", "crawl_department", "fetch", "extract"}
+        assert abs(sum(root.stage_times.values()) - root.duration) < 1e-3
+
+    def test_disabled_tracer_returns_noop(self):
+        """Test that a disabled tracer records nothing"""
+        tracer = Tracer(enabled=False)
+
+        with tracer.span("fetch") as span:
+            span.set_attribute("host", "cse.snu.ac.kr")
+            assert current_span() is None
+
+        assert span.stage_times == {}
+
+    def test_context_propagates_into_asyncio_tasks(self):
+        """Test that spans opened inside wait_for attach to the outer root"""
+        tracer = Tracer()
+
+        async def crawl():
+            with tracer.span("fetch"):
+                await asyncio.sleep(0)
+
+        async def scenario():
+            with tracer.root_span("task") as root:
+                await asyncio.wait_for(crawl(), timeout=1)
+            return root
+
+        root = asyncio.run(scenario())
+
+        assert "fetch" in root.stage_times
+
+    def test_jsonl_exporter_and_decorator(self, tmp_path):
+        """Test that traced functions are exported as JSON lines"""
+        path = tmp_path / "traces.jsonl"
+        configure_tracer(exporter=JsonLinesExporter(str(path)))
+
+        @traced("create_report")
+        def create_report():
+            return "ok"
+
+        try:
+            assert create_report() == "ok"
+        finally:
+            configure_tracer()
+
+        record = json.loads(path.read_text(encoding="utf-8").splitlines()[0])
+        assert record["name"] == "create_report"
+        assert record["parent_id"] is None
+        assert "create_report" in record["stages"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for crawl workers and the worker pool lifecycle.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.database.db import Database
+from src.services.result_writer import ResultWriter
+from src.services.task_queue import CrawlTask, InMemoryTaskQueue, TaskStatus
+from src.services.worker_pool import Worker, WorkerPool
+
+
+class SlowCrawler:
+    """Crawler stub that records one page and then hangs"""
+
+    def __init__(self, hang_seconds: float = 10.0):
+        self.hang_seconds = hang_seconds
+        self.closed = False
+
+    async def initialize(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def crawl_department(self, url, name, result=None):
+        result.update({"department": name, "url": url, "labs": [], "papers": [], "pages_crawled": 1,
+                       "professors": [{"name": "홍길동", "email": "hong@example.ac.kr", "confidence": 0.9}]})
+        await asyncio.sleep(self.hang_seconds)
+        return result
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = Database(db_url=f"sqlite:///{tmp_path / 'crawl.db'}")
+    db.init_db()
+    return db
+
+
+def _task(**kwargs) -> CrawlTask:
+    return CrawlTask(url="https://cse.example.ac.kr/faculty", university_name="Example University", **kwargs)
+
+
+class TestTaskDeadlines:
+    """Tests for timeout_seconds enforcement"""
+
+    def test_timed_out_task_keeps_partial_result_and_retries(self, database):
+        """Test that a hung crawl is cancelled, its partial result saved and the task retried"""
+        queue = InMemoryTaskQueue()
+        writer = ResultWriter(database, flush_interval_ms=20)
+        worker = Worker("worker_a", queue, database, crawler=SlowCrawler(), writer=writer)
+        task_id = queue.enqueue(_task(timeout_seconds=0.1))
+
+        asyncio.run(worker.run(max_tasks=1))
+        writer.stop()
+
+        assert worker.stats.tasks_timed_out == 1
+        assert queue.get_task_status(task_id) == TaskStatus.RETRYING.value
+        assert writer.get_stats()["tasks_written"] == 1
+        assert database.get_db_stats()["professors_total"] == 1
+        assert "persist" in worker.get_stats()["stage_times"]
+
+
+class TestLeaseLoss:
+    """Tests for workers whose task lease is reclaimed"""
+
+    def test_lost_lease_cancels_crawl_without_reporting(self, database):
+        """Test that a worker stops crawling and reports nothing once another worker owns the task"""
+        queue = InMemoryTaskQueue(lease_seconds=60)
+        writer = ResultWriter(database, flush_interval_ms=20)
+        crawler = SlowCrawler()
+        worker = Worker("worker_a", queue, database, crawler=crawler, writer=writer, heartbeat_interval=0.05)
+        task_id = queue.enqueue(_task())
+
+        async def scenario():
+            run = asyncio.create_task(worker.run(max_tasks=1))
+            await asyncio.sleep(0.02)
+            queue.running_tasks[task_id].lease_expires_at = datetime.now() - timedelta(seconds=1)
+            queue.reclaim_expired_tasks()
+            assert queue.dequeue(worker_id="worker_b").task_id == task_id
+            await asyncio.wait_for(run, timeout=2)
+
+        asyncio.run(scenario())
+        writer.stop()
+
+        assert queue.get_running_tasks()[0].worker_id == "worker_b"
+        assert queue.task_registry[task_id].retry_count == 1
+        assert worker.stats.tasks_completed == worker.stats.tasks_failed == 0
+        assert writer.get_stats()["tasks_written"] == 0
+
+
+class TestGracefulDrain:
+    """Tests for WorkerPool.stop drain behaviour"""
+
+    def test_unfinished_task_is_released_after_drain_deadline(self, database):
+        """Test that shutdown re-queues in-flight work instead of dropping it"""
+        queue = InMemoryTaskQueue()
+
+        async def scenario():
+            pool = WorkerPool(queue, database, num_workers=0, min_workers=0)
+            worker = Worker("worker_a", queue, database, crawler=SlowCrawler(), writer=pool.writer)
+            pool.workers[worker.worker_id] = worker
+            task_id = queue.enqueue(_task(timeout_seconds=0))
+
+            await pool.start()
+            await asyncio.sleep(0.1)
+            await pool.stop(drain_timeout=0.1)
+            return worker, task_id
+
+        worker, task_id = asyncio.run(scenario())
+
+        assert worker.crawler.closed is True
+        assert queue.get_task_status(task_id) == TaskStatus.PENDING.value
+        assert queue.task_registry[task_id].retry_count == 0